@@ -0,0 +1 @@
+"""Micro-benchmarks for the trading bot's hot paths"""
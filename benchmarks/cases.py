@@ -0,0 +1,210 @@
+# benchmarks/cases.py
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from benchmarks.data import FakeExchange, make_candles
+from trading_bot.analysis import indicators
+from trading_bot.distributed.shm_ring import SharedMemoryRing
+from trading_bot.models.data_models import Position, PositionTracker, Signal
+from trading_bot.models.position_book import PositionBook
+from trading_bot.strategies.biased_spot_ma_crossover import BiasedSpotMACrossover
+from trading_bot.strategies.moving_average_crossover_futures import MovingAverageCrossoverFutures
+from trading_bot.strategies.moving_average_crossover_spot import MovingAverageCrossoverSpot
+from trading_bot.utils.event_codec import decode_event, encode_event
+from trading_bot.utils.events import Event, EventBus, EventType, PriceUpdate
+from trading_bot.utils.journal import EventJournal
+from trading_bot.utils.queued_events import QueuedEventBus
+from trading_bot.utils.symbol_utils import normalize_symbol
+
+# Each case is a factory doing the setup work once and returning the
+# zero-argument callable that is timed.
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+INDICATOR_SIZES = [100, 1_000, 10_000]
+SUBSCRIBER_COUNTS = [1, 10, 100]
+TRACKER_SIZES = [10, 100]
+BOOK_SIZES = [100, 1_000]
+
+def benchmark(name: str):
+    """Register a benchmark case factory under the given name"""
+    def decorator(factory):
+        CASES[name] = factory
+        return factory
+    return decorator
+
+def _register_indicator_cases() -> None:
+    for size in INDICATOR_SIZES:
+        def sma_case(size=size):
+            data = make_candles(size)
+            return lambda: indicators.sma(data, 20)
+
+        def ema_case(size=size):
+            data = make_candles(size)
+            return lambda: indicators.ema(data, 20)
+
+        def calculate_case(size=size):
+            data = make_candles(size)
+            config = [
+                {'name': 'sma', 'params': {'period': 10, 'column': 'close'}, 'output_column': 'sma_10'},
+                {'name': 'sma', 'params': {'period': 50, 'column': 'close'}, 'output_column': 'sma_50'},
+                {'name': 'ema', 'params': {'period': 20, 'column': 'close'}, 'output_column': 'ema_20'},
+            ]
+            return lambda: indicators.calculate_indicators(data, config)
+
+        benchmark(f"indicators.sma[{size}]")(sma_case)
+        benchmark(f"indicators.ema[{size}]")(ema_case)
+        benchmark(f"indicators.calculate_indicators[{size}]")(calculate_case)
+
+@benchmark("strategy.ma_crossover_spot.generate_signals[500]")
+def spot_strategy_case():
+    strategy = MovingAverageCrossoverSpot(short_period=20, long_period=50)
+    data = make_candles(500)
+    return lambda: strategy.generate_signals(data)
+
+@benchmark("strategy.ma_crossover_futures.generate_signals[500]")
+def futures_strategy_case():
+    strategy = MovingAverageCrossoverFutures(short_period=20, long_period=50, leverage=2)
+    data = make_candles(500)
+    return lambda: strategy.generate_signals(data)
+
+@benchmark("strategy.biased_spot_ma_crossover.generate_signals[500]")
+def biased_strategy_case():
+    strategy = BiasedSpotMACrossover(
+        buy_short_period=10, buy_long_period=30,
+        sell_short_period=50, sell_long_period=200
+    )
+    data = make_candles(500)
+    return lambda: strategy.generate_signals(data)
+
+def _register_event_bus_cases() -> None:
+    for count in SUBSCRIBER_COUNTS:
+        def publish_case(count=count):
+            bus = EventBus(max_subscribers=count)
+            for _ in range(count):
+                bus.subscribe(EventType.PRICE_UPDATE, lambda event: None)
+            event = Event(EventType.PRICE_UPDATE, {'symbol': 'BTC/USDT', 'price': 100.0})
+            return lambda: bus.publish(event)
+
+        benchmark(f"EventBus.publish[{count} subscribers]")(publish_case)
+
+@benchmark("EventBus.publish[PriceUpdate, 4 subscribers]")
+def typed_publish_case():
+    # Building the slotted event is part of the cost of every tick
+    bus = EventBus()
+    for _ in range(4):
+        bus.subscribe(EventType.PRICE_UPDATE, lambda event: None)
+    def run():
+        bus.publish(Event(EventType.PRICE_UPDATE, PriceUpdate('BTC/USDT', 100.0, 1.7e9), 1.7e9))
+    return run
+
+@benchmark("QueuedEventBus.publish[1 subscriber]")
+def queued_publish_case():
+    # Cost on the publishing thread; the worker drains concurrently
+    bus = QueuedEventBus(workers=1, queue_size=100_000)
+    bus.subscribe(EventType.PRICE_UPDATE, lambda event: None)
+    event = Event(EventType.PRICE_UPDATE, {'symbol': 'BTC/USDT', 'price': 100.0})
+    return lambda: bus.publish(event)
+
+def _register_tracker_cases() -> None:
+    for size in TRACKER_SIZES:
+        def update_case(size=size):
+            # PositionTracker persists to ./logs, keep that out of the working tree
+            workdir = tempfile.mkdtemp(prefix="bench_tracker_")
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            try:
+                tracker = PositionTracker(exchange=FakeExchange(n_spot=size, n_futures=size // 10))
+            finally:
+                os.chdir(cwd)
+            tracker._update_interval = timedelta(0)  # Disable the throttle
+            return tracker.update_positions
+
+        benchmark(f"PositionTracker.update_positions[{size} positions]")(update_case)
+
+def _position_book(size: int) -> PositionBook:
+    book = PositionBook()
+    for i in range(size):
+        book.add(Position(symbol=f"C{i}/USDT", side='long' if i % 2 else 'short', amount=1.0,
+                          entry_price=100.0, current_price=100.0))
+    return book
+
+def _register_book_cases() -> None:
+    for size in BOOK_SIZES:
+        def update_prices_case(size=size):
+            book = _position_book(size)
+            tickers = [
+                {f"C{i}/USDT": {'last': 100.0 + (i + step) % 7 - 3} for i in range(size)}
+                for step in range(4)
+            ]
+            def run():
+                for snapshot in tickers:
+                    book.update_prices(snapshot)
+            return run
+
+        def breaching_case(size=size):
+            book = _position_book(size)
+            book.update_prices({f"C{i}/USDT": {'last': 80.0 + i % 40} for i in range(size)})
+            return lambda: book.breaching(0.25)
+
+        benchmark(f"PositionBook.update_prices[{size} positions, 4 snapshots]")(update_prices_case)
+        benchmark(f"PositionBook.breaching[{size} positions]")(breaching_case)
+
+@benchmark("symbol_utils.normalize_symbol")
+def normalize_symbol_case():
+    symbols: List[str] = ['BTC/USDT', 'ETHUSDT', 'SOL-USDT', 'BTC:USDT', 'DOGE']
+    def run():
+        for symbol in symbols:
+            normalize_symbol(symbol)
+    return run
+
+@benchmark("Position.update_price")
+def position_update_price_case():
+    position = Position(symbol='BTC/USDT', side='long', amount=1.0,
+                        entry_price=100.0, current_price=100.0)
+    prices = [99.0, 101.0, 100.5, 98.0]
+    def run():
+        for price in prices:
+            position.update_price(price)
+    return run
+
+def _signal_event() -> Event:
+    signal = Signal(symbol='BTC/USDT', timestamp=datetime(2024, 1, 1), signal_type='buy',
+                    price=42000.0, strategy_name='MA_Crossover_Spot_20_50', params={'short_ma': 41950.0})
+    return Event(EventType.SIGNAL_GENERATED, signal)
+
+@benchmark("event_codec.encode_event[signal]")
+def encode_event_case():
+    event = _signal_event()
+    return lambda: encode_event(event)
+
+@benchmark("event_codec.decode_event[signal]")
+def decode_event_case():
+    message = encode_event(_signal_event())
+    return lambda: decode_event(message)
+
+@benchmark("SharedMemoryRing.put+get[signal]")
+def ring_round_trip_case():
+    # Same-process round trip: the cost of the transport itself, without a context switch
+    ring = SharedMemoryRing(slots=64)
+    # Unlinked right away: the mapping stays usable and nothing is left in /dev/shm
+    ring.unlink()
+    message = encode_event(_signal_event())
+    def run():
+        ring.put_nowait(message)
+        ring.get_nowait()
+    return run
+
+@benchmark("EventJournal.append[signal]")
+def journal_append_case():
+    # Batched syncs as configured by default; segments rotate during long runs
+    journal = EventJournal(tempfile.mkdtemp(prefix="bench_journal_"), segment_size=16 * 1024 * 1024,
+                           max_segments=2)
+    event = _signal_event()
+    return lambda: journal.append(event)
+
+_register_indicator_cases()
+_register_event_bus_cases()
+_register_tracker_cases()
+_register_book_cases()
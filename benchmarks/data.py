@@ -0,0 +1,78 @@
+# benchmarks/data.py
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from trading_bot.data.synthetic import TIMEFRAME_MS, SyntheticMarketGenerator
+
+def make_candles(n: int, symbol: str = 'BTC/USDT', seed: int = 0,
+                 start_price: float = 100.0, timeframe_ms: int = 60_000) -> pd.DataFrame:
+    """
+    Generate an OHLCV DataFrame in the layout returned by
+    CCXTProvider.get_historical_data using SyntheticMarketGenerator
+
+    Args:
+        n: Number of candles
+        symbol: Symbol written to the 'symbol' column
+        seed: Random seed
+        start_price: Price of the first candle
+        timeframe_ms: Candle spacing in milliseconds
+
+    Returns:
+        DataFrame with columns: timestamp, open, high, low, close, volume, symbol
+    """
+    timeframe = next(tf for tf, ms in TIMEFRAME_MS.items() if ms == timeframe_ms)
+    generator = SyntheticMarketGenerator(seed=seed, timeframe=timeframe,
+                                         price_range=(start_price, start_price))
+    return generator.generate([symbol], n)[symbol]
+
+def make_symbols(n: int) -> List[str]:
+    """Generate n distinct spot symbols"""
+    return [f"C{i:04d}/USDT" for i in range(n)]
+
+class FakeExchange:
+    """
+    Minimal stand-in for the ccxt calls made by PositionTracker.
+
+    Every call returns prebuilt responses so a benchmark measures the
+    tracker's own work rather than the network.
+    """
+
+    id = 'fake'
+
+    def __init__(self, n_spot: int = 10, n_futures: int = 0, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        spot_symbols = make_symbols(n_spot)
+        self._prices: Dict[str, float] = {
+            symbol: float(price) for symbol, price in zip(spot_symbols, rng.uniform(1, 1000, n_spot))
+        }
+        self._balance: Dict[str, Any] = {'USDT': {'free': 10_000.0, 'used': 0.0, 'total': 10_000.0}}
+        for symbol in spot_symbols:
+            base = symbol.split('/')[0]
+            amount = float(rng.uniform(1, 10))
+            self._balance[base] = {'free': amount, 'used': 0.0, 'total': amount}
+        self._positions: List[Dict[str, Any]] = []
+        for i in range(n_futures):
+            price = float(rng.uniform(1, 1000))
+            self._positions.append({
+                'symbol': f"F{i:04d}/USDT:USDT",
+                'contracts': float(rng.uniform(1, 10)),
+                'entryPrice': price,
+                'markPrice': price * 1.01,
+                'side': 'long',
+                'unrealizedPnl': 0.0,
+            })
+
+    def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return self._positions
+
+    def fetch_balance(self) -> Dict[str, Any]:
+        return self._balance
+
+    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        return {'symbol': symbol, 'last': self._prices.get(symbol, 1.0)}
+
+    def fetch_my_trades(self, symbol: str, since: Optional[int] = None,
+                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return []
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# benchmarks/importtime.py - Measure import times with python -X importtime
+#
+#   python benchmarks/importtime.py run                  # report the default modules
+#   python benchmarks/importtime.py run --save-baseline  # record benchmarks/import_baseline.json
+#   python benchmarks/importtime.py compare -t 0.25      # exit 1 on a slower import or a forbidden module
+#   python benchmarks/importtime.py run -m trading_bot.aio --top 30
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_baseline.json")
+
+# Modules measured by default: the bot entry point and the worker node
+DEFAULT_MODULES = ['trading_bot.main', 'trading_bot.distributed.node']
+
+# Heavy dependencies each module must not import; they are loaded once the
+# bot actually needs them (pandas when components are built, ccxt when a
+# live exchange is created)
+FORBIDDEN_IMPORTS = {
+    'trading_bot.main': ['ccxt', 'pandas', 'numpy', 'asyncio'],
+    'trading_bot.distributed.node': ['ccxt'],
+}
+
+# Written to stderr right before the measured import, separating it from
+# what the interpreter imports at startup
+_MARKER = '-- measured import --'
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse the stderr of python -X importtime
+
+    Args:
+        output: Lines of the form 'import time: self [us] | cumulative | name';
+            when it contains the marker line, only the lines after it count
+
+    Returns:
+        List of (module, self us, cumulative us, nesting depth) in import order
+    """
+    lines = output.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1:]
+    rows = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header line
+            continue
+        # One space after the separator, then two per nesting level
+        name = fields[2][1:].rstrip()
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        rows.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return rows
+
+def measure_import(module: str, runs: int = 5) -> Dict[str, Any]:
+    """
+    Import a module in fresh interpreters and keep the fastest run
+
+    Args:
+        module: Module to import
+        runs: Number of interpreters to start
+
+    Returns:
+        Dictionary with the total import time in seconds, the imported
+        modules and the self time per top-level package
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get('PYTHONPATH')])))
+    best: Optional[List[Tuple[str, int, int, int]]] = None
+    best_total = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c',
+             f'import sys; sys.stderr.write({_MARKER!r} + "\\n"); import {module}'],
+            env=env, cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+        rows = parse_importtime(completed.stderr)
+        # Top-level entries: the module's parent packages and the module itself
+        total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+        if best_total is None or total < best_total:
+            best, best_total = rows, total
+
+    packages: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in best:
+        packages[name.split('.')[0]] += self_us
+    return {
+        'total_s': best_total / 1e6,
+        'modules': {name: {'self_s': self_us / 1e6, 'cumulative_s': cumulative / 1e6}
+                    for name, self_us, cumulative, _ in best},
+        'packages': {name: us / 1e6 for name, us in packages.items()},
+    }
+
+def forbidden_imports(module: str, result: Dict[str, Any]) -> List[str]:
+    """Heavy dependencies the module imported although FORBIDDEN_IMPORTS rules them out"""
+    return [name for name in FORBIDDEN_IMPORTS.get(module, []) if name in result['modules']]
+
+def print_report(module: str, result: Dict[str, Any], top: int) -> None:
+    """Print the total, the slowest packages and the slowest imports of a module"""
+    print(f"\n{module}: {result['total_s'] * 1e3:.1f} ms, {len(result['modules'])} modules")
+    packages = sorted(result['packages'].items(), key=lambda item: item[1], reverse=True)
+    print(f"  {'package (self time)':<50} {'ms':>8}")
+    for name, seconds in packages[:top]:
+        print(f"  {name:<50} {seconds * 1e3:>8.1f}")
+    modules = sorted(result['modules'].items(), key=lambda item: item[1]['cumulative_s'], reverse=True)
+    print(f"  {'module (cumulative)':<50} {'ms':>8}")
+    for name, timing in modules[:top]:
+        print(f"  {name:<50} {timing['cumulative_s'] * 1e3:>8.1f}")
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Measure trading bot import times')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for command, help_text in (('run', 'Measure imports and optionally save results'),
+                               ('compare', 'Measure imports and compare against a baseline')):
+        sub = subparsers.add_parser(command, help=help_text)
+        sub.add_argument('-m', '--module', action='append', default=None,
+                         help=f'Module to import (repeatable, default: {", ".join(DEFAULT_MODULES)})')
+        sub.add_argument('--runs', type=int, default=5,
+                         help='Fresh interpreters per module; the fastest is kept')
+        sub.add_argument('--top', type=int, default=15,
+                         help='Packages and modules listed per report')
+
+    subparsers.choices['run'].add_argument('--save-baseline', action='store_true',
+                                           help=f'Write results to {DEFAULT_BASELINE}')
+    subparsers.choices['compare'].add_argument('-b', '--baseline', type=str, default=DEFAULT_BASELINE,
+                                               help='Baseline results file')
+    subparsers.choices['compare'].add_argument('-t', '--threshold', type=float, default=0.25,
+                                               help='Allowed slowdown before flagging a regression (0.25 = 25%%)')
+    return parser.parse_args()
+
+def main() -> int:
+    """Main function"""
+    args = parse_args()
+    modules = args.module or DEFAULT_MODULES
+
+    results = {}
+    violations = 0
+    for module in modules:
+        result = measure_import(module, runs=args.runs)
+        results[module] = result
+        print_report(module, result, args.top)
+        forbidden = forbidden_imports(module, result)
+        if forbidden:
+            print(f"  FORBIDDEN: importing {module} loads {', '.join(forbidden)}")
+            violations += 1
+
+    document = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': {module: {'total_s': result['total_s']} for module, result in results.items()},
+    }
+
+    if args.command == 'run':
+        if args.save_baseline:
+            with open(DEFAULT_BASELINE, 'w') as f:
+                json.dump(document, f, indent=2, sort_keys=True)
+            print(f"\nResults written to {DEFAULT_BASELINE}")
+        return 1 if violations else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline file not found: {args.baseline}", file=sys.stderr)
+        return 2
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+
+    regressions = 0
+    print(f"\n{'module':<50} {'baseline':>10} {'current':>10} {'change':>8}")
+    for module, result in document['results'].items():
+        base = baseline.get('results', {}).get(module)
+        if base is None:
+            print(f"{module:<50} {'-':>10} {result['total_s'] * 1e3:>8.1f}ms      new")
+            continue
+        change = result['total_s'] / base['total_s'] - 1.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{module:<50} {base['total_s'] * 1e3:>8.1f}ms {result['total_s'] * 1e3:>8.1f}ms "
+              f"{change * 100:>+7.1f}%{flag}")
+
+    if regressions or violations:
+        print(f"\n{regressions} import(s) regressed by more than {args.threshold * 100:.0f}%, "
+              f"{violations} module(s) load forbidden dependencies")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# benchmarks/run.py - Run micro-benchmarks and compare them against a baseline
+#
+#   python benchmarks/run.py run --save-baseline     # record benchmarks/baseline.json
+#   python benchmarks/run.py compare -t 0.2          # exit 1 if any case is >20% slower
+#   python benchmarks/run.py run -k 'indicators.*'   # run a subset
+import argparse
+import fnmatch
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def time_callable(func: Callable[[], object], min_time: float = 0.2, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Time a callable the way timeit does: calibrate a loop count so one
+    measurement takes at least min_time, then repeat the measurement
+
+    Args:
+        func: Zero-argument callable to time
+        min_time: Minimum duration of one measurement in seconds
+        repeat: Number of measurements
+
+    Returns:
+        Dictionary with per-call best/mean time in seconds and the loop count
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 10_000_000:
+            break
+        # Aim directly for min_time instead of doubling from 1
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+
+    return {
+        'best_s': min(timings),
+        'mean_s': sum(timings) / len(timings),
+        'loops': number,
+    }
+
+def run_benchmarks(pattern: Optional[str] = None, min_time: float = 0.2, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Run all registered benchmark cases matching a glob pattern
+
+    Args:
+        pattern: Glob pattern on case names (None = all cases)
+        min_time: Minimum duration of one measurement in seconds
+        repeat: Number of measurements per case
+
+    Returns:
+        Results document with metadata and per-case timings
+    """
+    from benchmarks.cases import CASES
+
+    results = {}
+    for name, factory in CASES.items():
+        if pattern and not fnmatch.fnmatch(name, pattern):
+            continue
+        func = factory()
+        result = time_callable(func, min_time=min_time, repeat=repeat)
+        results[name] = result
+        print(f"{name:<60} {format_seconds(result['best_s']):>12} (mean {format_seconds(result['mean_s'])})")
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """
+    Compare results against a baseline and print a report
+
+    Args:
+        current: Results document from run_benchmarks
+        baseline: Baseline results document
+        threshold: Allowed slowdown as a fraction (0.2 = 20% slower)
+
+    Returns:
+        Number of cases that regressed beyond the threshold
+    """
+    regressions = 0
+    print(f"\n{'case':<60} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            print(f"{name:<60} {'-':>12} {format_seconds(result['best_s']):>12}      new")
+            continue
+        change = result['best_s'] / base['best_s'] - 1.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<60} {format_seconds(base['best_s']):>12} "
+            f"{format_seconds(result['best_s']):>12} {change * 100:>+7.1f}%{flag}"
+        )
+    return regressions
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a unit suited to its magnitude"""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.3f} us"
+    return f"{seconds * 1e9:.1f} ns"
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Run trading bot micro-benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for command, help_text in (('run', 'Run benchmarks and optionally save results'),
+                               ('compare', 'Run benchmarks and compare against a baseline')):
+        sub = subparsers.add_parser(command, help=help_text)
+        sub.add_argument('-k', '--filter', type=str, default=None,
+                         help='Glob pattern selecting benchmark cases')
+        sub.add_argument('--min-time', type=float, default=0.2,
+                         help='Minimum duration of one measurement in seconds')
+        sub.add_argument('--repeat', type=int, default=5,
+                         help='Number of measurements per case')
+
+    subparsers.choices['run'].add_argument('-o', '--output', type=str, default=None,
+                                           help='Write results to this JSON file')
+    subparsers.choices['run'].add_argument('--save-baseline', action='store_true',
+                                           help=f'Write results to {DEFAULT_BASELINE}')
+    subparsers.choices['compare'].add_argument('-b', '--baseline', type=str, default=DEFAULT_BASELINE,
+                                               help='Baseline results file')
+    subparsers.choices['compare'].add_argument('-t', '--threshold', type=float, default=0.2,
+                                               help='Allowed slowdown before flagging a regression (0.2 = 20%%)')
+    return parser.parse_args()
+
+def main() -> int:
+    """Main function"""
+    args = parse_args()
+
+    # Measure the code paths, not the log handlers
+    logging.disable(logging.CRITICAL)
+
+    results = run_benchmarks(args.filter, min_time=args.min_time, repeat=args.repeat)
+
+    if args.command == 'run':
+        output = DEFAULT_BASELINE if args.save_baseline else args.output
+        if output:
+            with open(output, 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            print(f"\nResults written to {output}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline file not found: {args.baseline}", file=sys.stderr)
+        return 2
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+
+    regressions = compare_results(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{regressions} benchmark(s) regressed by more than {args.threshold * 100:.0f}%")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,7 +12,13 @@ from pathlib import Path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
+from dotenv import load_dotenv
+
 from trading_bot.main import TradingBot
+from trading_bot.utils.config import Config
+from trading_bot.utils.clock import SimulatedClock, set_clock
+from trading_bot.data.providers.ccxt_provider import CCXTProvider
+from trading_bot.simulation.cassette import RecordingExchange, ReplayExchange
 
 def parse_args():
     """Parse command line arguments"""
@@ -21,8 +27,57 @@ def parse_args():
                        help='Path to configuration file')
     parser.add_argument('-t', '--runtime', type=int, default=300,
                        help='How long to run the bot before stopping (seconds)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', type=str, default=None, metavar='CASSETTE',
+                      help='Record every exchange request and response to this cassette file')
+    mode.add_argument('--replay', type=str, default=None, metavar='CASSETTE',
+                      help='Replay a recorded cassette at full speed instead of connecting to the exchange')
+    parser.add_argument('--strict', action='store_true',
+                        help='With --replay, fail requests that were not recorded instead of repeating responses')
     return parser.parse_args()
 
+def create_recording_exchange(config_path: str, cassette_path: str) -> RecordingExchange:
+    """Connect to the configured exchange and wrap it in a recorder"""
+    load_dotenv()
+    config = Config(config_path)
+    exchange = CCXTProvider.create_exchange(
+        config.get_strict('exchange.id'),
+        api_key=os.environ.get('EXCHANGE_API_KEY'),
+        secret=os.environ.get('EXCHANGE_SECRET'),
+        params=config.get('exchange.params', {}),
+    )
+    return RecordingExchange(exchange, cassette_path)
+
+def replay_session(config_path: str, cassette_path: str, strict: bool = False):
+    """Run the bot against a recorded cassette on a simulated clock"""
+    replay = ReplayExchange(cassette_path, strict=strict)
+    clock = SimulatedClock(replay.start_time)
+    replay.clock = clock
+    previous_clock = set_clock(clock)
+    try:
+        bot = TradingBot(config_path, exchange=replay)
+        logging.info(f"Replaying {replay.total_entries} exchange calls from {cassette_path}")
+        
+        wall_start = time.perf_counter()
+        bot_thread = threading.Thread(target=bot.run)
+        bot_thread.daemon = True
+        bot_thread.start()
+        
+        # The bot's loop sleeps on the simulated clock, so it runs as fast as it can;
+        # stop once the recording is used up or its end time has passed
+        while bot_thread.is_alive() and not replay.exhausted and clock.time() <= replay.end_time:
+            time.sleep(0.01)
+        bot.running = False
+        bot_thread.join(timeout=10)
+        
+        wall = time.perf_counter() - wall_start
+        sim = clock.time() - replay.start_time
+        logging.info(f"Replayed {sim:.0f}s of trading in {wall:.2f}s ({sim / wall if wall > 0 else 0:.0f}x)")
+        logging.info(f"Served {replay.total_entries - replay.remaining}/{replay.total_entries} recorded calls, "
+                     f"unmatched requests: {dict(replay.misses) or 'none'}")
+    finally:
+        set_clock(previous_clock)
+
 def setup_debug_environment():
     """Set up environment for debugging"""
     # Create logs directory if it doesn't exist
@@ -54,13 +109,23 @@ def main():
         logging.error(f"Config file not found: {config_path}")
         return
     
+    if args.replay:
+        try:
+            replay_session(config_path, args.replay, strict=args.strict)
+        except Exception as e:
+            logging.error(f"Error replaying session: {str(e)}", exc_info=True)
+        return
+    
     # Run the bot
+    recorder = None
     try:
         logging.info(f"Starting trading bot with config: {config_path}")
         logging.info(f"Will run for {args.runtime} seconds before stopping")
         
-        # Create the bot
-        bot = TradingBot(config_path)
+        # Create the bot, recording its exchange traffic if requested
+        if args.record:
+            recorder = create_recording_exchange(config_path, args.record)
+        bot = TradingBot(config_path, exchange=recorder)
         
         # Start the bot in a separate thread
         bot.running = True
@@ -91,6 +156,10 @@ def main():
             bot.running = False
             if 'bot_thread' in locals() and bot_thread.is_alive():
                 bot_thread.join(timeout=5)
+    
+    finally:
+        if recorder is not None:
+            recorder.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,203 @@
+# tests/test_aio.py
+import asyncio
+import logging
+import threading
+
+import pytest
+import yaml
+
+from trading_bot.aio import AsyncEventBus, AsyncExchange, AsyncTradingBot, SyncExchangeBridge, run_in_thread
+from trading_bot.aio.exchange import EXCHANGE_METHODS
+from trading_bot.simulation.exchange import SimulatedExchange
+from trading_bot.simulation.harness import ThroughputHarness, build_config
+from trading_bot.utils.clock import SimulatedClock, set_clock
+from trading_bot.utils.events import Event, EventType
+
+class FakeAsyncExchange:
+    """ccxt.async_support stand-in that records how many calls overlap"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.markets = {'ETH/USDT': {'symbol': 'ETH/USDT'}}
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [[0, 1.0, 1.0, 1.0, 1.0, 1.0]]
+
+    async def fetch_ticker(self, symbol):
+        return {'symbol': symbol, 'last': 100.0}
+
+    async def close(self):
+        pass
+
+class FakeSyncExchange:
+    """Blocking exchange stand-in that records the calling thread"""
+
+    def __init__(self):
+        self.threads = []
+
+    def fetch_ticker(self, symbol):
+        self.threads.append(threading.get_ident())
+        return {'symbol': symbol, 'last': 100.0}
+
+class NativeSimulatedExchange:
+    """SimulatedExchange behind coroutine methods, as a ccxt.async_support exchange would be"""
+
+    def __init__(self, exchange):
+        self._exchange = exchange
+
+    def __getattr__(self, name):
+        attribute = getattr(self._exchange, name)
+        if name not in EXCHANGE_METHODS:
+            return attribute
+
+        async def method(*args, **kwargs):
+            return attribute(*args, **kwargs)
+        return method
+
+    async def close(self):
+        pass
+
+def test_run_in_thread_passes_arguments_to_a_worker_thread():
+    def call(*args, **kwargs):
+        return threading.get_ident(), args, kwargs
+
+    async def main():
+        return await run_in_thread(call, 1, 2, key='value')
+
+    thread, args, kwargs = asyncio.run(main())
+
+    assert thread != threading.get_ident()
+    assert args == (1, 2)
+    assert kwargs == {'key': 'value'}
+
+def test_native_exchange_calls_are_bounded_by_max_concurrency():
+    fake = FakeAsyncExchange()
+    exchange = AsyncExchange(fake, max_concurrency=3)
+
+    async def main():
+        return await asyncio.gather(*(exchange.fetch_ohlcv('ETH/USDT') for _ in range(10)))
+
+    results = asyncio.run(main())
+
+    assert exchange.is_native
+    assert len(results) == 10
+    assert fake.peak == 3
+
+def test_sync_exchange_calls_run_off_the_loop_thread():
+    fake = FakeSyncExchange()
+    exchange = AsyncExchange(fake, sync_workers=2)
+
+    async def main():
+        ticker = await exchange.fetch_ticker('ETH/USDT')
+        await exchange.close()
+        return ticker
+
+    assert asyncio.run(main())['last'] == 100.0
+    assert not exchange.is_native
+    assert fake.threads and fake.threads[0] != threading.get_ident()
+
+def test_bridge_forwards_worker_calls_and_rejects_loop_calls():
+    exchange = AsyncExchange(FakeAsyncExchange())
+    bridge = SyncExchangeBridge(exchange)
+
+    async def main():
+        bridge.bind(asyncio.get_running_loop())
+        loop = asyncio.get_running_loop()
+        ticker = await loop.run_in_executor(None, bridge.fetch_ticker, 'ETH/USDT')
+        with pytest.raises(RuntimeError):
+            bridge.fetch_ticker('ETH/USDT')
+        bridge.bind(None)
+        return ticker
+
+    assert asyncio.run(main())['symbol'] == 'ETH/USDT'
+    assert bridge.load_markets() == {'ETH/USDT': {'symbol': 'ETH/USDT'}}
+    with pytest.raises(RuntimeError):
+        bridge.fetch_ticker('ETH/USDT')
+
+def test_event_bus_awaits_subscribers_in_order():
+    bus = AsyncEventBus()
+    handled = []
+
+    async def slow(event):
+        await asyncio.sleep(0.01)
+        handled.append(('slow', event.data))
+
+    def fast(event):
+        handled.append(('fast', event.data))
+
+    bus.subscribe(EventType.PRICE_UPDATE, slow)
+    bus.subscribe(EventType.PRICE_UPDATE, fast)
+
+    async def main():
+        bus.bind(asyncio.get_running_loop())
+        await bus.publish_async(Event(EventType.PRICE_UPDATE, 1))
+        bus.publish(Event(EventType.PRICE_UPDATE, 2))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, bus.publish, Event(EventType.PRICE_UPDATE, 3))
+        await bus.drain()
+        bus.bind(None)
+
+    asyncio.run(main())
+
+    assert handled == [('slow', 1), ('fast', 1), ('slow', 2), ('fast', 2), ('slow', 3), ('fast', 3)]
+
+class ErrorRecorder(logging.Handler):
+    """Collects error records; the bot's logging setup replaces pytest's handlers"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_strategy_exchange_calls_reach_a_native_exchange(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump(build_config(['ETH/USDT'], '1m', 'biased', 'spot')))
+    clock = SimulatedClock()
+    simulated = SimulatedExchange.from_synthetic(['ETH/USDT'], n_candles=600, balances={'USDT': 1000.0},
+                                                 clock=clock)
+    clock.set_time(simulated.now_ms / 1000)
+    exchange = NativeSimulatedExchange(simulated)
+    errors = ErrorRecorder()
+    previous_clock = set_clock(clock)
+    try:
+        bot = AsyncTradingBot(str(config_path), log_level='WARNING', exchange=exchange)
+        logging.getLogger().addHandler(errors)
+
+        async def main():
+            await bot.start_async()
+            try:
+                # Without a tracked position the biased strategy asks the exchange for balances
+                await bot.run_once_async(clock.time())
+            finally:
+                await bot.shutdown_async()
+
+        asyncio.run(main())
+    finally:
+        logging.getLogger().removeHandler(errors)
+        set_clock(previous_clock)
+
+    assert bot.async_exchange.is_native
+    assert errors.messages == []
+
+def test_async_runtime_places_the_same_orders_as_sync(tmp_path):
+    (tmp_path / 'sync').mkdir()
+    (tmp_path / 'async').mkdir()
+    harness = dict(timeframe='1m', seed=3)
+    sync = ThroughputHarness(10, workdir=str(tmp_path / 'sync'), **harness).run()
+    run = ThroughputHarness(10, runtime='async', workdir=str(tmp_path / 'async'), **harness).run()
+
+    assert sync['orders'] > 0
+    assert run['orders'] == sync['orders']
+    assert run['loops'] == sync['loops']
+
+def test_unknown_runtime_is_rejected():
+    with pytest.raises(ValueError):
+        ThroughputHarness(1, runtime='trio')
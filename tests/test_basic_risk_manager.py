@@ -0,0 +1,60 @@
+# tests/test_basic_risk_manager.py
+from datetime import datetime
+
+import pytest
+
+from trading_bot.models.data_models import PositionTracker, Signal
+from trading_bot.risk.basic_risk_manager import BasicRiskManager
+
+class FakeExchange:
+    """Spot account holding 2 ETH at a price of 100"""
+
+    def fetch_balance(self):
+        return {'ETH': {'free': 2.0}, 'USDT': {'free': 1000.0}}
+
+    def fetch_ticker(self, symbol):
+        return {'symbol': symbol, 'last': 100.0}
+
+def _signal(symbol, signal_type):
+    return Signal(symbol, datetime(2024, 1, 1), signal_type, 100.0, 'test')
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    # The tracker persists positions under ./logs
+    monkeypatch.chdir(tmp_path)
+    tracker = PositionTracker(FakeExchange())
+    yield tracker
+    tracker.close()
+
+def test_get_position_reads_snapshot(tracker):
+    risk_manager = BasicRiskManager(tracker.exchange, max_open_trades=5, position_tracker=tracker)
+    tracker.apply_fill('BTC/USDT', 'buy', 1.0, 50.0)
+    snapshot = tracker.snapshot()
+    tracker.apply_fill('BTC/USDT', 'buy', 1.0, 70.0)
+
+    assert risk_manager.get_position('BTC/USDT', snapshot).amount == 1.0
+
+def test_get_position_falls_back_to_balance_for_symbol_missing_from_snapshot(tracker):
+    risk_manager = BasicRiskManager(tracker.exchange, max_open_trades=5, position_tracker=tracker)
+
+    position = risk_manager.get_position('ETH/USDT', tracker.snapshot())
+
+    assert position is not None
+    assert position.amount == 2.0
+    assert position.current_price == 100.0
+
+def test_validate_signal_rejects_buy_for_holding_missing_from_snapshot(tracker):
+    risk_manager = BasicRiskManager(tracker.exchange, max_open_trades=5, position_tracker=tracker)
+    snapshot = tracker.snapshot()
+
+    valid, reason = risk_manager.validate_signal(_signal('ETH/USDT', 'buy'), snapshot)
+
+    assert not valid
+    assert 'ETH/USDT' in reason
+
+def test_validate_signal_accepts_close_and_new_buys(tracker):
+    risk_manager = BasicRiskManager(tracker.exchange, max_open_trades=5, position_tracker=tracker)
+    snapshot = tracker.snapshot()
+
+    assert risk_manager.validate_signal(_signal('ETH/USDT', 'close'), snapshot)[0]
+    assert risk_manager.validate_signal(_signal('BTC/USDT', 'buy'), snapshot)[0]
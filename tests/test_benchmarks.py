@@ -0,0 +1,37 @@
+# tests/test_benchmarks.py
+import pytest
+
+from benchmarks.run import compare_results, format_seconds, time_callable
+
+def _results(**timings):
+    return {'results': {name: {'best_s': best, 'mean_s': best, 'loops': 1} for name, best in timings.items()}}
+
+def test_time_callable_calibrates_loop_count():
+    calls = []
+
+    result = time_callable(lambda: calls.append(None), min_time=0.01, repeat=3)
+
+    assert result['loops'] > 1
+    assert len(calls) >= result['loops'] * 3
+    assert 0 < result['best_s'] <= result['mean_s']
+
+def test_compare_counts_cases_slower_than_threshold():
+    baseline = _results(fast=1.0, steady=1.0, slow=1.0)
+    current = _results(fast=0.5, steady=1.1, slow=1.5, new=2.0)
+
+    assert compare_results(current, baseline, threshold=0.2) == 1
+    assert compare_results(current, baseline, threshold=0.05) == 2
+
+@pytest.mark.parametrize('seconds, text', [
+    (2.0, '2.000 s'), (0.0025, '2.500 ms'), (3e-6, '3.000 us'), (4e-9, '4.0 ns'),
+])
+def test_format_seconds_picks_unit(seconds, text):
+    assert format_seconds(seconds) == text
+
+def test_every_case_builds_a_callable(tmp_path, monkeypatch):
+    # Cases that persist positions write under ./logs
+    monkeypatch.chdir(tmp_path)
+    from benchmarks.cases import CASES
+
+    for name, factory in CASES.items():
+        assert callable(factory()), name
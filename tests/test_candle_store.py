@@ -0,0 +1,56 @@
+# tests/test_candle_store.py
+import pandas as pd
+import pytest
+
+from trading_bot.data.candle_store import CandleStore
+
+def _candles(start, count, close=100.0):
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime([(start + i) * 60_000 for i in range(count)], unit='ms'),
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0,
+    })
+
+def test_update_keeps_at_most_max_candles():
+    store = CandleStore(max_candles=5)
+
+    store.update('ETH/USDT', '1m', _candles(0, 4))
+    merged = store.update('ETH/USDT', '1m', _candles(4, 4))
+
+    assert len(merged) == 5
+    assert merged['timestamp'].iloc[0] == pd.Timestamp(3 * 60_000, unit='ms')
+    assert merged['timestamp'].is_monotonic_increasing
+
+def test_update_replaces_candle_with_same_timestamp():
+    store = CandleStore(max_candles=10)
+
+    store.update('ETH/USDT', '1m', _candles(0, 3, close=100.0))
+    merged = store.update('ETH/USDT', '1m', _candles(2, 1, close=105.0))
+
+    assert len(merged) == 3
+    assert list(merged['close']) == [100.0, 100.0, 105.0]
+
+def test_least_recently_updated_series_is_evicted():
+    store = CandleStore(max_candles=10, max_series=2)
+
+    store.update('ETH/USDT', '1m', _candles(0, 1))
+    store.update('BTC/USDT', '1m', _candles(0, 1))
+    store.update('ETH/USDT', '1m', _candles(1, 1))
+    store.update('SOL/USDT', '1m', _candles(0, 1))
+
+    assert store.get('BTC/USDT', '1m') is None
+    assert sorted(store.keys()) == [('ETH/USDT', '1m'), ('SOL/USDT', '1m')]
+
+def test_memory_usage_counts_rows():
+    store = CandleStore(max_candles=10)
+    store.update('ETH/USDT', '1m', _candles(0, 3))
+    store.update('ETH/USDT', '5m', _candles(0, 2))
+
+    usage = store.memory_usage()
+
+    assert usage['series'] == 2
+    assert usage['rows'] == 5
+    assert usage['bytes'] > 0
+
+def test_max_candles_must_be_positive():
+    with pytest.raises(ValueError):
+        CandleStore(max_candles=0)
@@ -0,0 +1,86 @@
+# tests/test_cassette.py
+import ccxt
+import pytest
+
+from trading_bot.simulation.cassette import CassetteMiss, RecordingExchange, ReplayExchange
+from trading_bot.simulation.exchange import SimulatedExchange
+from trading_bot.utils.clock import SimulatedClock
+
+START = 1_700_000_000_000
+MINUTE = 60_000
+
+def _exchange(clock):
+    candles = [[START + i * MINUTE, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0] for i in range(10)]
+    return SimulatedExchange({'ETH/USDT': candles}, balances={'USDT': 1000.0}, start_time=START, clock=clock)
+
+def _record(path):
+    """Record a short session and return the live responses"""
+    clock = SimulatedClock(START / 1000)
+    recorder = RecordingExchange(_exchange(clock), str(path), clock=clock)
+    responses = {'markets': recorder.load_markets()}
+    responses['first'] = recorder.fetch_ticker('ETH/USDT')
+    clock.advance(120)
+    responses['second'] = recorder.fetch_ticker('ETH/USDT')
+    responses['ohlcv'] = recorder.fetch_ohlcv('ETH/USDT', '1m', limit=3)
+    with pytest.raises(ccxt.InsufficientFunds):
+        recorder.create_order('ETH/USDT', 'market', 'buy', 1000.0)
+    recorder.close()
+    return responses
+
+def test_replay_serves_recorded_responses_in_order(tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    live = _record(path)
+
+    replay = ReplayExchange(str(path))
+
+    assert replay.load_markets() == live['markets']
+    assert replay.symbols == ['ETH/USDT']
+    assert replay.fetch_ticker('ETH/USDT') == live['first']
+    assert replay.fetch_ticker('ETH/USDT') == live['second']
+    assert replay.fetch_ohlcv('ETH/USDT', '1m', limit=3) == live['ohlcv']
+    with pytest.raises(ccxt.InsufficientFunds):
+        replay.create_order('ETH/USDT', 'market', 'buy', 1000.0)
+    assert replay.exhausted
+    assert replay.end_time == replay.start_time + 120
+
+def test_replay_repeats_last_response_unless_strict(tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    live = _record(path)
+
+    replay = ReplayExchange(str(path))
+    replay.fetch_ticker('ETH/USDT')
+    replay.fetch_ticker('ETH/USDT')
+    assert replay.fetch_ticker('ETH/USDT') == live['second']
+    assert replay.misses['fetch_ticker'] == 1
+    with pytest.raises(CassetteMiss):
+        replay.fetch_ticker('BTC/USDT')
+
+    strict = ReplayExchange(str(path), strict=True)
+    strict.fetch_ticker('ETH/USDT')
+    strict.fetch_ticker('ETH/USDT')
+    with pytest.raises(CassetteMiss):
+        strict.fetch_ticker('ETH/USDT')
+
+def test_replay_moves_simulated_clock_to_recorded_times(tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    _record(path)
+    clock = SimulatedClock(0.0)
+
+    replay = ReplayExchange(str(path), clock=clock)
+    replay.fetch_ticker('ETH/USDT')
+    assert clock.time() == START / 1000
+    replay.fetch_ticker('ETH/USDT')
+    assert clock.time() == START / 1000 + 120
+    assert replay.milliseconds() == START + 120_000
+
+def test_recording_without_footer_still_replays(tmp_path):
+    path = tmp_path / 'cut.jsonl.gz'
+    clock = SimulatedClock(START / 1000)
+    recorder = RecordingExchange(_exchange(clock), str(path), clock=clock)
+    ticker = recorder.fetch_ticker('ETH/USDT')
+    recorder._file.close()
+
+    replay = ReplayExchange(str(path))
+
+    assert replay.fetch_ticker('ETH/USDT') == ticker
+    assert replay.end_time == START / 1000
@@ -0,0 +1,72 @@
+# tests/test_clock.py
+import time
+
+import pytest
+
+from trading_bot.models.data_models import Position
+from trading_bot.simulation.exchange import SimulatedExchange
+from trading_bot.utils.clock import RealClock, ReplayClock, SimulatedClock, get_clock, set_clock
+from trading_bot.utils.events import Event, EventType
+
+START = 1_700_000_000.0
+
+@pytest.fixture
+def clock():
+    clock = SimulatedClock(START)
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+def test_simulated_clock_only_moves_when_driven():
+    clock = SimulatedClock(START)
+
+    clock.sleep(30)
+    assert clock.time() == START + 30
+    clock.advance(0.5)
+    clock.set_time(START + 100)
+    clock.sleep(-5)
+
+    assert clock.time() == START + 100
+    assert clock.milliseconds() == int((START + 100) * 1000)
+
+def test_set_clock_returns_previous_clock(clock):
+    assert get_clock() is clock
+    restored = set_clock(RealClock())
+    try:
+        assert restored is clock
+    finally:
+        set_clock(clock)
+
+def test_events_and_positions_read_the_active_clock(clock):
+    clock.advance(60)
+
+    event = Event(EventType.STARTUP, {})
+    position = Position(symbol='ETH/USDT', side='long', amount=1.0, entry_price=1.0, current_price=1.0)
+
+    assert event.timestamp == START + 60
+    assert position.entry_time.timestamp() == pytest.approx(START + 60)
+
+def test_simulated_exchange_follows_its_clock():
+    clock = SimulatedClock(START)
+    candles = [[int(START * 1000) + i * 60_000, 100.0, 100.0, 100.0, 100.0, 1.0] for i in range(10)]
+    exchange = SimulatedExchange({'ETH/USDT': candles}, start_time=int(START * 1000), clock=clock)
+
+    clock.advance(120)
+
+    assert exchange.milliseconds() == int(START * 1000) + 120_000
+    ohlcv = exchange.fetch_ohlcv('ETH/USDT', '1m', limit=10)
+    assert ohlcv[-1][0] == int(START * 1000) + 120_000
+
+def test_replay_clock_runs_faster_than_wall_time():
+    clock = ReplayClock(START, speed=1000.0)
+
+    wall_start = time.monotonic()
+    clock.sleep(50)
+    wall = time.monotonic() - wall_start
+
+    assert wall < 1.0
+    assert clock.time() - START >= 50
+
+def test_replay_clock_requires_positive_speed():
+    with pytest.raises(ValueError):
+        ReplayClock(START, speed=0)
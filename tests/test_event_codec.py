@@ -0,0 +1,86 @@
+# tests/test_event_codec.py
+import struct
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.models.data_models import Signal
+from trading_bot.utils.event_codec import EventCodecError, decode_event, decode_value, encode_event, encode_value
+from trading_bot.utils.events import Event, EventType
+
+def _round_trip(event):
+    decoded = decode_event(encode_event(event))
+    assert decoded.type == event.type
+    assert decoded.timestamp == event.timestamp
+    return decoded.data
+
+def test_signal_round_trips():
+    signal = Signal(
+        symbol='ETH/USDT',
+        timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        signal_type='buy',
+        price=101.5,
+        strategy_name='ma_crossover',
+        params={'fast': 5, 'slow': 20},
+        strength=0.75
+    )
+
+    assert _round_trip(Event(EventType.SIGNAL_GENERATED, signal, 1_700_000_000.5)) == signal
+
+def test_nested_values_round_trip():
+    data = {
+        'id': 'abc',
+        'amount': 1.25,
+        'filled': 3,
+        'big': 1 << 70,
+        'flags': [True, False, None],
+        'pair': ('ETH', b'\x00\x01'),
+        'nested': {'when': datetime(2024, 5, 6, 7, 8, 9)},
+    }
+
+    decoded = _round_trip(Event(EventType.ORDER_FILLED, data, 5.0))
+
+    assert decoded == dict(data, pair=['ETH', b'\x00\x01'])
+
+def test_values_without_native_encoding_are_pickled():
+    data = {'tags': {'a', 'b'}, 1: 'int key'}
+
+    assert _round_trip(Event(EventType.ERROR, data, 5.0)) == data
+
+def test_malformed_messages_are_rejected():
+    message = encode_event(Event(EventType.STARTUP, {'a': 'b'}, 5.0))
+
+    with pytest.raises(EventCodecError):
+        decode_event(message[:13])
+    with pytest.raises(EventCodecError):
+        decode_event(bytes([255]) + message[1:])
+    with pytest.raises(EventCodecError):
+        decode_event(message[:1] + bytes([250]) + message[2:])
+    with pytest.raises(EventCodecError):
+        decode_event(struct.pack('<BBd', message[0], message[1], 5.0) + b'?')
+
+@pytest.mark.parametrize('data', ['a string', b'some bytes', {'tags': {'a'}}])
+def test_truncated_messages_are_rejected(data):
+    message = encode_event(Event(EventType.ERROR, data, 5.0))
+
+    with pytest.raises(EventCodecError):
+        decode_event(message[:-1])
+
+def test_values_round_trip_without_pickle():
+    value = {'when': pd.Timestamp('2024-01-02 03:04:05.123456'), 'count': np.int64(7), 'price': np.float64(1.5)}
+
+    decoded = decode_value(encode_value(value, allow_pickle=False), allow_pickle=False)
+
+    assert decoded == {'when': pd.Timestamp('2024-01-02 03:04:05.123456'), 'count': 7, 'price': 1.5}
+    assert type(decoded['count']) is int
+
+def test_pickle_is_refused_when_disallowed():
+    with pytest.raises(EventCodecError):
+        encode_value({'tags': {'a'}}, allow_pickle=False)
+
+    pickled = encode_value({'tags': {'a'}})
+    assert decode_value(pickled) == {'tags': {'a'}}
+    with pytest.raises(EventCodecError):
+        decode_value(pickled, allow_pickle=False)
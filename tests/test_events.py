@@ -0,0 +1,73 @@
+# tests/test_events.py
+import pytest
+
+from trading_bot.utils.event_codec import decode_event, encode_event
+from trading_bot.utils.events import (
+    CandleUpdate, Event, EventBus, EventType, OrderBookUpdate, PriceUpdate, RiskLimitBreach
+)
+from trading_bot.utils.queued_events import event_key
+
+def test_subscribers_run_in_subscription_order():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(EventType.PRICE_UPDATE, lambda event: calls.append(('first', event.data.price)))
+    bus.subscribe(EventType.PRICE_UPDATE, lambda event: calls.append(('second', event.data.price)))
+
+    bus.publish(Event(EventType.PRICE_UPDATE, PriceUpdate('ETH/USDT', 100.0, 1.0)))
+
+    assert calls == [('first', 100.0), ('second', 100.0)]
+
+def test_unsubscribe_during_publish_takes_effect_on_the_next_event():
+    bus = EventBus()
+    calls = []
+
+    def once(event):
+        calls.append('once')
+        bus.unsubscribe(EventType.STARTUP, once)
+
+    bus.subscribe(EventType.STARTUP, once)
+    bus.subscribe(EventType.STARTUP, lambda event: calls.append('always'))
+
+    bus.publish(Event(EventType.STARTUP, {}))
+    bus.publish(Event(EventType.STARTUP, {}))
+
+    assert calls == ['once', 'always', 'always']
+
+def test_failing_subscriber_does_not_stop_the_others():
+    bus = EventBus()
+    calls = []
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(EventType.ERROR, fail)
+    bus.subscribe(EventType.ERROR, lambda event: calls.append(event.data))
+
+    bus.publish(Event(EventType.ERROR, {'message': 'x'}))
+
+    assert calls == [{'message': 'x'}]
+
+def test_events_are_slotted_and_compare_by_value():
+    event = Event(EventType.STARTUP, {'a': 1}, 5.0)
+
+    with pytest.raises(AttributeError):
+        event.extra = True
+    assert event == Event(EventType.STARTUP, {'a': 1}, 5.0)
+    assert event != Event(EventType.SHUTDOWN, {'a': 1}, 5.0)
+    with pytest.raises(TypeError):
+        hash(event)
+
+@pytest.mark.parametrize('event_type, payload', [
+    (EventType.PRICE_UPDATE, PriceUpdate('ETH/USDT', 100.5, 1_700_000_000.0)),
+    (EventType.NEW_CANDLE, CandleUpdate('ETH/USDT', '1m', 1_700_000_000_000, 1.0, 2.0, 0.5, 1.5, 10.0)),
+    (EventType.ORDERBOOK_UPDATE, OrderBookUpdate('ETH/USDT', [[99.0, 1.0]], [[101.0, 2.0]], 1.0)),
+    (EventType.RISK_LIMIT_BREACHED, RiskLimitBreach('ETH/USDT', 'drawdown')),
+])
+def test_typed_payloads_round_trip_and_route_by_symbol(event_type, payload):
+    event = Event(event_type, payload, 5.0)
+
+    decoded = decode_event(encode_event(event))
+
+    assert decoded == event
+    assert type(decoded.data) is type(payload)
+    assert event_key(event) == 'ETH/USDT'
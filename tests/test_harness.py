@@ -0,0 +1,46 @@
+# tests/test_harness.py
+import pytest
+
+from trading_bot.simulation.harness import ThroughputHarness, build_config
+
+def _run(tmp_path, **kwargs):
+    return ThroughputHarness(10, timeframe='1m', workdir=str(tmp_path), **kwargs).run()
+
+def test_build_config_lists_symbols():
+    config = build_config(['A/USDT', 'B/USDT'], '5m', 'spot', 'spot')
+
+    assert [entry['symbol'] for entry in config['trading']['symbols']] == ['A/USDT', 'B/USDT']
+    assert config['trading']['timeframe'] == '5m'
+    assert config['strategy']['type'] == 'moving_average_crossover_spot'
+
+def test_run_steps_through_session_and_places_orders(tmp_path):
+    result = _run(tmp_path)
+
+    assert result['loops'] == 10 * 60
+    assert result['sim_seconds'] == 600
+    assert result['orders'] > 0
+    assert result['close_to_order_sim_s']['p50'] is not None
+    assert result['api_calls']['fetch_ohlcv'] > 0
+
+def test_run_is_deterministic_for_a_seed(tmp_path):
+    (tmp_path / 'first').mkdir()
+    (tmp_path / 'second').mkdir()
+    first = _run(tmp_path / 'first', seed=1)
+    second = _run(tmp_path / 'second', seed=1)
+
+    assert first['orders'] == second['orders']
+    assert first['api_calls'] == second['api_calls']
+
+def test_unknown_strategy_preset_is_rejected():
+    with pytest.raises(ValueError):
+        ThroughputHarness(1, strategy='martingale')
+
+def test_parallel_workers_place_the_same_orders(tmp_path):
+    (tmp_path / 'sequential').mkdir()
+    (tmp_path / 'parallel').mkdir()
+    sequential = _run(tmp_path / 'sequential', seed=2)
+    parallel = _run(tmp_path / 'parallel', seed=2, workers=4)
+
+    assert sequential['orders'] > 0
+    assert parallel['orders'] == sequential['orders']
+    assert parallel['loops'] == sequential['loops']
@@ -0,0 +1,120 @@
+# tests/test_history_store.py
+import time
+from datetime import datetime
+
+import pytest
+
+from trading_bot.data.history_store import TradeHistoryStore
+from trading_bot.models.data_models import Position
+
+@pytest.fixture
+def store(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / 'history' / 'trades.db'), batch_size=100, flush_interval=60)
+    yield store
+    store.close()
+
+def _position(symbol='ETH/USDT', side='long', entry=100.0, current=110.0, amount=2.0, **kwargs):
+    return Position(symbol=symbol, side=side, amount=amount, entry_price=entry, current_price=current,
+                    entry_time=datetime(2024, 1, 1), **kwargs)
+
+def _order(order_id, symbol='ETH/USDT', timestamp=1_700_000_000_000):
+    return {'id': order_id, 'symbol': symbol, 'side': 'buy', 'type': 'market', 'amount': '1.5',
+            'price': None, 'filled': 1.5, 'average': 100.0, 'status': 'closed', 'timestamp': timestamp}
+
+def test_writes_wait_for_a_full_batch(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / 'trades.db'), batch_size=3, flush_interval=60)
+    try:
+        store.record_order(_order('1'))
+        store.record_order(_order('2'))
+        time.sleep(0.05)
+        assert store.metrics()['pending'] == 2
+        assert store.get_orders() == []
+
+        store.record_order(_order('3'))
+        deadline = time.monotonic() + 5.0
+        while store.metrics()['batches'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert store.metrics() == {'batches': 1, 'writes': 3, 'errors': 0, 'pending': 0}
+        assert {order['order_id'] for order in store.get_orders()} == {'1', '2', '3'}
+    finally:
+        store.close()
+
+def test_writes_are_committed_after_flush_interval(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / 'trades.db'), batch_size=100, flush_interval=0.05)
+    try:
+        store.record_order(_order('1'))
+        deadline = time.monotonic() + 5.0
+        while not store.get_orders() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [order['order_id'] for order in store.get_orders()] == ['1']
+    finally:
+        store.close()
+
+def test_flush_commits_queued_writes(store):
+    store.record_order(_order('1', timestamp=1_700_000_000_000), reason='buy', strategy='ma')
+    store.record_order(_order('2', symbol='BTC/USDT', timestamp=1_700_000_060_000))
+    store.record_fill({'id': 't1', 'amount': 1.5, 'price': 100.0, 'cost': 150.0, 'fee': {'cost': 0.15},
+                       'timestamp': 1_700_000_000_500}, order=_order('1'))
+
+    assert store.flush(timeout=5.0)
+    assert store.flush(timeout=5.0)
+
+    orders = store.get_orders()
+    assert [order['order_id'] for order in orders] == ['2', '1']
+    assert (orders[1]['amount'], orders[1]['reason'], orders[1]['strategy']) == (1.5, 'buy', 'ma')
+    assert [order['order_id'] for order in store.get_orders(symbol='ETH/USDT')] == ['1']
+    assert [order['order_id'] for order in store.get_orders(since=1_700_000_030)] == ['2']
+    fill = store.get_fills()[0]
+    assert (fill['trade_id'], fill['order_id'], fill['symbol'], fill['side'], fill['fee'], fill['time']) == (
+        't1', '1', 'ETH/USDT', 'buy', 0.15, 1_700_000_000.5
+    )
+
+def test_closing_moves_a_position_to_the_closed_history(store):
+    store.record_open(_position(current=105.0))
+    store.record_open(_position(current=110.0))
+    store.flush(timeout=5.0)
+    assert [(p.symbol, p.current_price) for p in store.get_open_positions()] == [('ETH/USDT', 110.0)]
+
+    store.record_close(_position(current=110.0, realized_pnl=20.0))
+    store.flush(timeout=5.0)
+
+    assert store.get_open_positions() == []
+    closed = store.get_closed_positions()
+    assert [(row['symbol'], row['exit_price'], row['pnl']) for row in closed] == [('ETH/USDT', 110.0, 20.0)]
+    assert closed[0]['return_pct'] == pytest.approx(0.1)
+
+def test_pnl_and_drawdown_summaries(store):
+    store.record_close(_position('ETH/USDT', current=110.0, amount=2.0, realized_pnl=20.0, max_price=120.0))
+    store.record_close(_position('ETH/USDT', current=90.0, amount=3.0, realized_pnl=-30.0, min_price=80.0))
+    store.record_close(_position('BTC/USDT', side='short', current=95.0, amount=1.0, realized_pnl=5.0))
+    store.flush(timeout=5.0)
+
+    summary = store.pnl_by_symbol()
+    assert summary['ETH/USDT']['trades'] == 2
+    assert summary['ETH/USDT']['wins'] == 1
+    assert summary['ETH/USDT']['pnl'] == pytest.approx(-10.0)
+    assert summary['BTC/USDT']['pnl'] == pytest.approx(5.0)
+
+    stats = store.drawdown_stats()
+    assert stats['positions'] == 3
+    assert stats['max_drawdown'] == pytest.approx(30.0)
+    assert stats['worst_exit_drawdown'] == pytest.approx((120.0 - 110.0) / 120.0)
+    assert stats['worst_adverse_excursion'] == pytest.approx((100.0 - 80.0) / 100.0)
+    assert store.drawdown_stats(symbol='BTC/USDT')['max_drawdown'] == 0.0
+
+def test_close_commits_pending_writes_and_drops_later_ones(tmp_path):
+    path = str(tmp_path / 'trades.db')
+    store = TradeHistoryStore(path, batch_size=100, flush_interval=60)
+    store.record_order(_order('1'))
+
+    store.close()
+    store.record_order(_order('2'))
+    store.close()
+
+    reopened = TradeHistoryStore(path)
+    try:
+        assert [order['order_id'] for order in reopened.get_orders()] == ['1']
+    finally:
+        reopened.close()
@@ -0,0 +1,48 @@
+# tests/test_imports.py
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.importtime import FORBIDDEN_IMPORTS, forbidden_imports, parse_importtime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _loaded_modules(module):
+    """Names of the modules a fresh interpreter has loaded after importing module"""
+    code = f"import sys, {module}; print('\\n'.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    return set(output.stdout.split())
+
+@pytest.mark.parametrize('module', sorted(FORBIDDEN_IMPORTS))
+def test_entry_points_do_not_load_heavy_dependencies(module):
+    loaded = _loaded_modules(module)
+
+    assert [name for name in FORBIDDEN_IMPORTS[module] if name in loaded] == []
+
+def test_strategy_factory_imports_only_the_configured_strategy():
+    code = (
+        "import sys\n"
+        "from trading_bot.strategies.factory import StrategyFactory\n"
+        "assert 'trading_bot.strategies.biased_spot_ma_crossover' not in sys.modules\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
+
+def test_importtime_output_is_parsed_after_the_marker():
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 | site",
+        "-- measured import --",
+        "import time:        50 |         50 |   pandas._libs",
+        "import time:       200 |        250 | pandas",
+        "import time:        10 |        260 | trading_bot.main",
+    ])
+
+    rows = parse_importtime(output)
+
+    assert rows == [('pandas._libs', 50, 50, 1), ('pandas', 200, 250, 0), ('trading_bot.main', 10, 260, 0)]
+    assert forbidden_imports('trading_bot.main', {'modules': [row[0] for row in rows]}) == ['pandas']
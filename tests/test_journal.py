@@ -0,0 +1,143 @@
+# tests/test_journal.py
+import os
+import shutil
+
+import pytest
+
+from trading_bot.utils import journal as journal_module
+from trading_bot.utils.event_codec import EventCodecError, encode_event
+from trading_bot.utils.events import Event, EventBus, EventType
+from trading_bot.utils.journal import EventJournal, list_segments, read_journal
+
+def _event(n, event_type=EventType.ORDER_PLACED):
+    return Event(event_type, {'symbol': 'ETH/USDT', 'n': n}, 1_700_000_000.0 + n)
+
+def _numbers(records):
+    return [event.data['n'] for _, event in records]
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = EventJournal(str(tmp_path / 'journal'), segment_size=4096)
+    yield journal
+    journal.close()
+
+def test_events_replay_in_append_order(journal):
+    offsets = [journal.append(_event(n)) for n in range(5)]
+
+    assert offsets == [0, 1, 2, 3, 4]
+    assert journal.next_offset == 5
+    records = list(journal.replay())
+    assert [offset for offset, _ in records] == offsets
+    assert [event for _, event in records] == [_event(n) for n in range(5)]
+    assert _numbers(journal.replay(start_offset=3)) == [3, 4]
+
+def test_replay_filters_by_event_type(journal):
+    for n in range(6):
+        journal.append(_event(n, EventType.ORDER_PLACED if n % 2 else EventType.PRICE_UPDATE))
+
+    assert _numbers(journal.replay(event_types=[EventType.ORDER_PLACED])) == [1, 3, 5]
+
+def test_bus_transport_journals_published_events(journal):
+    bus = EventBus()
+    bus.add_transport(journal)
+
+    bus.publish(_event(0))
+    bus.publish(_event(1))
+
+    assert _numbers(journal.replay()) == [0, 1]
+
+def test_events_that_need_pickle_are_refused(journal):
+    journal.append(_event(0))
+
+    with pytest.raises(EventCodecError):
+        journal.append(Event(EventType.ORDER_PLACED, {'symbol': 'ETH/USDT', 'tags': {'a'}}))
+
+    assert journal.append(_event(1)) == 1
+    assert _numbers(journal.replay()) == [0, 1]
+
+def test_pickled_records_are_skipped_on_replay(journal, monkeypatch):
+    # A record written by a pickling encoder, e.g. an older version
+    monkeypatch.setattr(journal_module, 'encode_event', lambda event, allow_pickle: encode_event(event))
+    journal.append(_event(0))
+    journal.append(Event(EventType.ORDER_PLACED, {'symbol': 'ETH/USDT', 'n': 1, 'tags': {'a'}}))
+    journal.append(_event(2))
+
+    assert _numbers(journal.replay()) == [0, 2]
+
+def test_segments_rotate_and_replay_seeks_across_them(tmp_path):
+    directory = str(tmp_path / 'journal')
+    journal = EventJournal(directory, segment_size=256)
+    for n in range(20):
+        journal.append(_event(n))
+    journal.close()
+
+    bases = list_segments(directory)
+    assert len(bases) > 2
+    assert bases[0] == 0
+    # Closed segments are trimmed to their used size
+    assert all(os.path.getsize(os.path.join(directory, f"{base:020d}.journal")) <= 256 for base in bases)
+    assert _numbers(read_journal(directory)) == list(range(20))
+    assert _numbers(read_journal(directory, start_offset=bases[2] + 1)) == list(range(bases[2] + 1, 20))
+
+def test_max_segments_deletes_the_oldest(tmp_path):
+    directory = str(tmp_path / 'journal')
+    journal = EventJournal(directory, segment_size=256, max_segments=2)
+    for n in range(20):
+        journal.append(_event(n))
+    journal.close()
+
+    bases = list_segments(directory)
+    assert len(bases) == 2
+    assert _numbers(read_journal(directory)) == list(range(bases[0], 20))
+
+def test_reopening_resumes_after_the_last_record(tmp_path):
+    directory = str(tmp_path / 'journal')
+    journal = EventJournal(directory, segment_size=4096)
+    for n in range(3):
+        journal.append(_event(n))
+    journal.close()
+
+    journal = EventJournal(directory, segment_size=4096)
+    assert journal.append(_event(3)) == 3
+    journal.close()
+
+    assert _numbers(read_journal(directory)) == [0, 1, 2, 3]
+
+def test_torn_record_is_discarded_on_recovery(tmp_path, journal):
+    for n in range(3):
+        journal.append(_event(n))
+    journal.sync()
+    end = journal._position
+
+    # Copy the live, preallocated segment as a crash would leave it, with half a record at the end
+    crashed = tmp_path / 'crashed'
+    shutil.copytree(journal.directory, crashed)
+    segment = crashed / '00000000000000000000.journal'
+    with open(segment, 'r+b') as f:
+        f.seek(end)
+        f.write(b'\x40\x00\x00\x00\xde\xad\xbe\xef\x03\x00\x00\x00\x00\x00\x00\x00partial')
+
+    assert _numbers(read_journal(str(crashed))) == [0, 1, 2]
+    recovered = EventJournal(str(crashed), segment_size=4096)
+    try:
+        assert recovered.next_offset == 3
+        assert recovered.append(_event(3)) == 3
+    finally:
+        recovered.close()
+    assert _numbers(read_journal(str(crashed))) == [0, 1, 2, 3]
+
+def test_corrupted_record_ends_the_replay(journal):
+    for n in range(3):
+        journal.append(_event(n))
+    journal.sync()
+
+    # Flip a payload byte of the last record
+    journal._buf[journal._position - 5] ^= 0xFF
+
+    assert _numbers(journal.replay()) == [0, 1]
+
+def test_closed_journal_rejects_appends(journal):
+    journal.close()
+
+    with pytest.raises(ValueError):
+        journal.append(_event(0))
@@ -0,0 +1,50 @@
+# tests/test_memory.py
+import pytest
+
+from trading_bot.utils.events import EventBus, EventType
+from trading_bot.utils.memory import MemoryMonitor
+
+def test_snapshot_includes_registered_structures():
+    monitor = MemoryMonitor(top_n=3)
+    monitor.register('buffer', lambda: {'rows': 7})
+    try:
+        snapshot = monitor.snapshot()
+    finally:
+        monitor.stop()
+
+    assert snapshot['structures'] == {'buffer': {'rows': 7}}
+    assert len(snapshot['top_allocations']) <= 3
+    assert 'buffer: rows=7' in monitor.format_report(snapshot)
+
+def test_failing_sizer_is_reported_not_raised():
+    monitor = MemoryMonitor()
+    monitor.register('broken', lambda: 1 / 0)
+    monitor.register('removed', lambda: {'rows': 1})
+    monitor.unregister('removed')
+    try:
+        structures = monitor.snapshot()['structures']
+    finally:
+        monitor.stop()
+
+    assert list(structures) == ['broken']
+    assert 'error' in structures['broken']
+
+def test_event_bus_ignores_duplicate_subscriptions():
+    bus = EventBus()
+    calls = []
+    handler = calls.append
+
+    bus.subscribe(EventType.STARTUP, handler)
+    bus.subscribe(EventType.STARTUP, handler)
+
+    assert bus.memory_usage()['subscriptions'] == 1
+
+def test_event_bus_caps_subscribers_per_event_type():
+    bus = EventBus(max_subscribers=2)
+    bus.subscribe(EventType.STARTUP, lambda event: None)
+    bus.subscribe(EventType.STARTUP, lambda event: None)
+
+    with pytest.raises(ValueError):
+        bus.subscribe(EventType.STARTUP, lambda event: None)
+    # Other event types have their own budget
+    bus.subscribe(EventType.SHUTDOWN, lambda event: None)
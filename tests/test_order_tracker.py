@@ -0,0 +1,77 @@
+# tests/test_order_tracker.py
+import pytest
+
+from trading_bot.execution.order_tracker import OrderTracker
+from trading_bot.utils.events import EventBus, EventType
+
+class FakeExchange:
+    """Returns the order responses queued for fetch_order, repeating the last one"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def fetch_order(self, order_id, symbol):
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+def _tracker(exchange):
+    bus = EventBus()
+    fills = []
+    bus.subscribe(EventType.ORDER_FILLED, lambda event: fills.append(event.data['trade']))
+    return OrderTracker(exchange, bus, poll_interval=0), fills
+
+def _order(status='open', filled=0.0, cost=0.0, trades=None):
+    order = {'id': '1', 'symbol': 'ETH/USDT', 'side': 'buy', 'status': status,
+             'filled': filled, 'cost': cost, 'timestamp': 1000}
+    if trades is not None:
+        order['trades'] = trades
+    return order
+
+def test_repeat_polls_without_trades_publish_each_fill_once():
+    partial = _order(filled=1.0, cost=100.0)
+    exchange = FakeExchange(partial, partial, _order(status='closed', filled=3.0, cost=320.0))
+    tracker, fills = _tracker(exchange)
+
+    tracker.track(_order())
+    for now in range(4):
+        tracker.poll(now)
+
+    assert [fill['amount'] for fill in fills] == [1.0, 2.0]
+    assert fills[1]['price'] == pytest.approx(110.0)
+    assert tracker.pending_orders() == 0
+
+def test_repeat_polls_with_trade_ids_publish_each_trade_once():
+    first = {'id': 't1', 'amount': 1.0, 'price': 100.0, 'timestamp': 1000}
+    second = {'id': 't2', 'amount': 2.0, 'price': 110.0, 'timestamp': 2000}
+    exchange = FakeExchange(_order(trades=[first]), _order(trades=[first]),
+                            _order(status='closed', trades=[first, second]))
+    tracker, fills = _tracker(exchange)
+
+    tracker.track(_order(trades=[first]))
+    for now in range(4):
+        tracker.poll(now)
+
+    assert [fill['id'] for fill in fills] == ['t1', 't2']
+
+def test_repeat_polls_with_id_less_trades_publish_each_trade_once():
+    first = {'id': None, 'amount': 1.0, 'price': 100.0, 'timestamp': 1000}
+    second = {'id': None, 'amount': 2.0, 'price': 110.0, 'timestamp': 2000}
+    exchange = FakeExchange(_order(trades=[first]), _order(status='closed', trades=[first, second]))
+    tracker, fills = _tracker(exchange)
+
+    tracker.track(_order(trades=[first]))
+    for now in range(3):
+        tracker.poll(now)
+
+    assert [fill['amount'] for fill in fills] == [1.0, 2.0]
+
+def test_fills_are_published_outside_the_lock():
+    bus = EventBus()
+    tracker = OrderTracker(FakeExchange(_order()), bus, poll_interval=0)
+    locked = []
+    bus.subscribe(EventType.ORDER_FILLED, lambda event: locked.append(tracker._lock.locked()))
+
+    tracker.track(_order(status='closed', filled=1.0, cost=100.0))
+
+    assert locked == [False]
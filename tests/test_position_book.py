@@ -0,0 +1,174 @@
+# tests/test_position_book.py
+from datetime import datetime
+
+import pytest
+
+from trading_bot.models.data_models import Position
+from trading_bot.models.position_book import PositionBook
+
+def _position(symbol='ETH/USDT', side='long', price=100.0, amount=1.0):
+    return Position(symbol=symbol, side=side, amount=amount, entry_price=price, current_price=price,
+                    entry_time=datetime(2024, 1, 1))
+
+def test_add_stores_a_copy_behind_a_view():
+    book = PositionBook()
+    position = _position()
+
+    view = book.add(position)
+    position.amount = 5.0
+
+    assert 'ETH/USDT' in book
+    assert len(book) == 1
+    assert book['ETH/USDT'] is view
+    assert (view.symbol, view.side, view.amount, view.entry_time) == ('ETH/USDT', 'long', 1.0, datetime(2024, 1, 1))
+    assert book.position('ETH/USDT') == _position()
+
+    # Adding the symbol again replaces the row's values
+    assert book.add(_position(amount=2.0)) is view
+    assert view.amount == 2.0
+
+def test_view_writes_go_to_the_book():
+    book = PositionBook()
+    view = book.add(_position(side='short'))
+
+    view.update_price(90.0)
+
+    assert book.position('ETH/USDT').current_price == 90.0
+    assert view.min_price == 90.0
+    assert view.unrealized_pnl == pytest.approx(10.0)
+    assert view.profit_percentage == pytest.approx(0.1)
+
+def test_popped_view_detaches_and_row_is_reused():
+    book = PositionBook(capacity=1)
+    view = book.add(_position())
+
+    popped = book.pop('ETH/USDT')
+    book.add(_position('BTC/USDT', price=200.0))
+    book.add(_position('SOL/USDT', price=20.0))
+
+    assert popped is view
+    assert (view.symbol, view.current_price) == ('ETH/USDT', 100.0)
+    assert book.id_of('BTC/USDT') == 0
+    assert sorted(book.keys()) == ['BTC/USDT', 'SOL/USDT']
+    assert book.pop('ETH/USDT', None) is None
+    with pytest.raises(KeyError):
+        book.pop('ETH/USDT')
+    with pytest.raises(ValueError):
+        book['XRP/USDT'] = _position()
+
+def test_copy_shares_nothing_with_the_original():
+    book = PositionBook()
+    book.add(_position())
+
+    copy = book.copy()
+    book.update_prices({'ETH/USDT': 120.0})
+    copy.add(_position('BTC/USDT'))
+
+    assert copy['ETH/USDT'].current_price == 100.0
+    assert copy['ETH/USDT'] is not book['ETH/USDT']
+    assert 'BTC/USDT' not in book
+
+def test_update_prices_moves_extremes_and_pnl():
+    book = PositionBook()
+    book.add(_position('ETH/USDT', amount=2.0))
+    book.add(_position('BTC/USDT', side='short', amount=1.0))
+
+    updated = book.update_prices({
+        'ETH/USDT': {'last': 110.0},
+        'BTC/USDT': 95.0,
+        'XRP/USDT': 1.0,
+        'SOL/USDT': {'last': None},
+    })
+    book.update_prices({'ETH/USDT': 105.0, 'BTC/USDT': 0})
+
+    assert updated == 2
+    eth, btc = book['ETH/USDT'], book['BTC/USDT']
+    assert (eth.current_price, eth.max_price, eth.min_price) == (105.0, 110.0, 100.0)
+    assert eth.unrealized_pnl == pytest.approx(10.0)
+    assert (btc.current_price, btc.min_price) == (95.0, 95.0)
+    assert btc.unrealized_pnl == pytest.approx(5.0)
+    assert book.drawdowns()[book.id_of('ETH/USDT')] == pytest.approx(eth.current_drawdown_percentage)
+    assert book.profits()[book.id_of('BTC/USDT')] == pytest.approx(btc.profit_percentage)
+
+def test_dust_positions_are_filtered_out():
+    book = PositionBook()
+    book.add(_position('ETH/USDT', amount=1.0))
+    book.add(_position('DUST/USDT', amount=1e-6))
+    book.add(_position('BTC/USDT', amount=1.0))
+    book.pop('BTC/USDT')
+
+    book.update_prices({'ETH/USDT': 80.0, 'DUST/USDT': 50.0})
+
+    assert book.valued_above(1.0) == ['ETH/USDT']
+    assert book.breaching(0.1) == ['ETH/USDT']
+    assert book.breaching(0.1, min_value=100.0) == []
+    assert book.breaching(0.5) == []
+
+def _book(side, price=100.0, amount=1.0):
+    book = PositionBook(max_drawdown=0.1)
+    book.add(Position(symbol='ETH/USDT', side=side, amount=amount, entry_price=price, current_price=price))
+    return book
+
+def test_long_fires_once_per_crossing():
+    book = _book('long')
+    assert book.trigger_price('ETH/USDT') == pytest.approx(90.0)
+
+    book.update_prices({'ETH/USDT': 95.0})
+    assert book.take_breaches() == []
+
+    book.update_prices({'ETH/USDT': 89.0})
+    book.update_prices({'ETH/USDT': 85.0})
+    assert book.take_breaches() == ['ETH/USDT']
+
+    # Still past the trigger: no second breach
+    book.update_prices({'ETH/USDT': 80.0})
+    assert book.take_breaches() == []
+
+    # Recovering re-arms the trigger, a new crossing fires again
+    book.update_prices({'ETH/USDT': 95.0})
+    book.update_prices({'ETH/USDT': 88.0})
+    assert book.take_breaches() == ['ETH/USDT']
+
+def test_short_fires_once_per_crossing():
+    book = _book('short')
+    assert book.trigger_price('ETH/USDT') == pytest.approx(110.0)
+
+    book.update_prices({'ETH/USDT': 105.0})
+    assert book.take_breaches() == []
+
+    book.update_prices({'ETH/USDT': 111.0})
+    book.update_prices({'ETH/USDT': 115.0})
+    assert book.take_breaches() == ['ETH/USDT']
+
+    book.update_prices({'ETH/USDT': 120.0})
+    assert book.take_breaches() == []
+
+def test_trigger_follows_new_high():
+    book = _book('long')
+
+    book.update_prices({'ETH/USDT': 200.0})
+    assert book.trigger_price('ETH/USDT') == pytest.approx(180.0)
+
+    book.update_prices({'ETH/USDT': 179.0})
+    assert book.take_breaches() == ['ETH/USDT']
+
+def test_write_through_view_fires_once():
+    book = _book('long')
+    view = book.get('ETH/USDT')
+
+    view.current_price = 85.0
+    view.current_price = 84.0
+    assert book.take_breaches() == ['ETH/USDT']
+
+def test_dust_positions_do_not_fire():
+    book = _book('long', amount=1e-6)
+
+    book.update_prices({'ETH/USDT': 50.0})
+    assert book.take_breaches() == []
+
+def test_closed_positions_are_not_reported():
+    book = _book('long')
+
+    book.update_prices({'ETH/USDT': 85.0})
+    book.pop('ETH/USDT')
+    assert book.take_breaches() == []
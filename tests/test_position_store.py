@@ -0,0 +1,144 @@
+# tests/test_position_store.py
+import json
+import threading
+import time
+
+import pytest
+
+from trading_bot.utils.position_store import PositionStore
+
+class FakeState:
+    """Position state owned by a tracker, logged to a PositionStore as it changes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.positions = {}
+        self.closed = []
+
+    def snapshot(self):
+        return {'positions': list(self.positions.values()), 'closed_positions': list(self.closed)}
+
+    def open(self, store, symbol, amount):
+        with self.lock:
+            self.positions[symbol] = {'symbol': symbol, 'amount': amount}
+            store.append('open', self.positions[symbol])
+
+    def close(self, store, symbol):
+        with self.lock:
+            position = self.positions.pop(symbol)
+            self.closed.append(position)
+            store.append('close', position)
+
+def _store(path, state, **kwargs):
+    return PositionStore(str(path), state.snapshot, state.lock, **kwargs)
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+def _lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+def test_changes_are_logged_and_survive_a_crash(tmp_path):
+    path = tmp_path / 'positions.json'
+    state = FakeState()
+    store = _store(path, state, flush_interval=60)
+
+    state.open(store, 'ETH/USDT', 1.0)
+    state.open(store, 'BTC/USDT', 2.0)
+    state.close(store, 'ETH/USDT')
+    _wait_for(lambda: store.metrics()['deltas'] == 3)
+
+    assert [(delta['seq'], delta['op']) for delta in _lines(store.log_path)] == [(1, 'open'), (2, 'open'), (3, 'close')]
+    assert not path.exists()
+    # A new process sees the changes without a snapshot ever being written
+    loaded = _store(path, FakeState()).load()
+    assert loaded == {
+        'positions': [{'symbol': 'BTC/USDT', 'amount': 2.0}],
+        'closed_positions': [{'symbol': 'ETH/USDT', 'amount': 1.0}],
+    }
+    store.close()
+
+def test_load_replays_only_deltas_newer_than_the_snapshot(tmp_path):
+    path = tmp_path / 'positions.json'
+    path.write_text(json.dumps({
+        'positions': [{'symbol': 'ETH/USDT', 'amount': 1.0}],
+        'closed_positions': [],
+        'sequence': 2,
+    }))
+    deltas = [
+        {'seq': 1, 'op': 'open', 'position': {'symbol': 'XRP/USDT', 'amount': 5.0}},
+        {'seq': 2, 'op': 'close', 'position': {'symbol': 'XRP/USDT', 'amount': 5.0}},
+        {'seq': 3, 'op': 'open', 'position': {'symbol': 'BTC/USDT', 'amount': 2.0}},
+        {'seq': 4, 'op': 'close', 'position': {'symbol': 'ETH/USDT', 'amount': 1.0}},
+    ]
+    with open(f"{path}.log", 'w') as f:
+        f.write(''.join(json.dumps(delta) + '\n' for delta in deltas))
+        f.write('{"seq": 5, "op": "open", "posi')
+
+    state = FakeState()
+    store = _store(path, state)
+    loaded = store.load()
+
+    assert loaded == {
+        'positions': [{'symbol': 'BTC/USDT', 'amount': 2.0}],
+        'closed_positions': [{'symbol': 'ETH/USDT', 'amount': 1.0}],
+    }
+    # New deltas continue the sequence
+    state.open(store, 'SOL/USDT', 3.0)
+    store.close()
+    assert json.loads(path.read_text())['sequence'] == 5
+
+def test_close_writes_a_snapshot_and_compacts_the_log(tmp_path):
+    path = tmp_path / 'positions.json'
+    state = FakeState()
+    store = _store(path, state, flush_interval=60)
+    state.open(store, 'ETH/USDT', 1.0)
+    state.open(store, 'BTC/USDT', 2.0)
+
+    store.close()
+
+    snapshot = json.loads(path.read_text())
+    assert snapshot['sequence'] == 2
+    assert [position['symbol'] for position in snapshot['positions']] == ['ETH/USDT', 'BTC/USDT']
+    assert _lines(store.log_path) == []
+    assert store.metrics()['logged'] == 0
+    assert _store(path, FakeState()).load()['positions'] == snapshot['positions']
+
+def test_dirty_marks_coalesce_into_one_snapshot(tmp_path):
+    path = tmp_path / 'positions.json'
+    state = FakeState()
+    state.positions['ETH/USDT'] = {'symbol': 'ETH/USDT', 'amount': 1.0}
+    store = _store(path, state, flush_interval=0.1)
+
+    for _ in range(10):
+        store.mark_dirty()
+    _wait_for(lambda: store.metrics()['snapshots'] == 1)
+    time.sleep(0.2)
+
+    assert store.metrics()['snapshots'] == 1
+    assert json.loads(path.read_text())['positions'] == [{'symbol': 'ETH/USDT', 'amount': 1.0}]
+    store.close()
+
+def test_long_log_triggers_compaction(tmp_path):
+    path = tmp_path / 'positions.json'
+    state = FakeState()
+    store = _store(path, state, flush_interval=60, compact_after=3)
+
+    for i in range(3):
+        state.open(store, f"S{i}/USDT", 1.0)
+    _wait_for(lambda: store.metrics()['snapshots'] == 1)
+
+    assert json.loads(path.read_text())['sequence'] == 3
+    assert store.metrics()['logged'] == 0
+    store.close()
+
+def test_unreadable_snapshot_raises(tmp_path):
+    path = tmp_path / 'positions.json'
+    path.write_text('{not json')
+
+    with pytest.raises(ValueError):
+        _store(path, FakeState()).load()
@@ -0,0 +1,63 @@
+# tests/test_position_tracker.py
+import pytest
+
+from trading_bot.models.data_models import PositionTracker
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    # The tracker persists positions under ./logs
+    monkeypatch.chdir(tmp_path)
+    tracker = PositionTracker(exchange=None)
+    yield tracker
+    tracker.close()
+
+def test_apply_fill_opens_position(tracker):
+    position = tracker.apply_fill('ETH/USDT', 'buy', 2.0, 100.0)
+
+    assert position.side == 'long'
+    assert position.amount == 2.0
+    assert position.entry_price == 100.0
+    assert position.realized_pnl == 0.0
+
+def test_apply_fill_adds_at_weighted_entry_price(tracker):
+    tracker.apply_fill('ETH/USDT', 'buy', 1.0, 100.0)
+    position = tracker.apply_fill('ETH/USDT', 'buy', 3.0, 120.0)
+
+    assert position.amount == 4.0
+    assert position.entry_price == pytest.approx(115.0)
+    assert position.realized_pnl == 0.0
+
+def test_apply_fill_reduce_realizes_pnl_of_sold_amount(tracker):
+    tracker.apply_fill('ETH/USDT', 'buy', 4.0, 100.0)
+    position = tracker.apply_fill('ETH/USDT', 'sell', 1.0, 110.0)
+
+    assert position.amount == pytest.approx(3.0)
+    assert position.entry_price == 100.0
+    assert position.realized_pnl == pytest.approx(10.0)
+    assert position.unrealized_pnl == pytest.approx(30.0)
+
+def test_apply_fill_close_realizes_exit_leg(tracker):
+    tracker.apply_fill('ETH/USDT', 'buy', 4.0, 100.0)
+    tracker.apply_fill('ETH/USDT', 'sell', 1.0, 110.0)
+
+    assert tracker.apply_fill('ETH/USDT', 'sell', 3.0, 90.0) is None
+    assert tracker.get_position('ETH/USDT') is None
+    closed = tracker.get_closed_positions()[-1]
+    assert closed.realized_pnl == pytest.approx(10.0 - 30.0)
+
+def test_apply_fill_short_close_realizes_pnl(tracker):
+    tracker.apply_fill('BTC/USDT', 'sell', 2.0, 100.0, market_type='futures')
+    tracker.apply_fill('BTC/USDT', 'buy', 2.0, 80.0, market_type='futures')
+
+    closed = tracker.get_closed_positions()[-1]
+    assert closed.side == 'short'
+    assert closed.realized_pnl == pytest.approx(40.0)
+
+def test_apply_fill_flip_opens_opposite_futures_position(tracker):
+    tracker.apply_fill('BTC/USDT', 'buy', 1.0, 100.0, market_type='futures')
+    position = tracker.apply_fill('BTC/USDT', 'sell', 3.0, 110.0, market_type='futures')
+
+    assert position.side == 'short'
+    assert position.amount == pytest.approx(2.0)
+    assert position.entry_price == 110.0
+    assert tracker.get_closed_positions()[-1].realized_pnl == pytest.approx(10.0)
@@ -0,0 +1,102 @@
+# tests/test_protocol.py
+import socket
+
+import pandas as pd
+import pytest
+
+from trading_bot.distributed.node_coordinator import NodeServer
+from trading_bot.distributed.protocol import (
+    HELLO, PROTOCOL_VERSION, REJECT, WELCOME, FramedConnection, LocalBroker, ProtocolError,
+    decode_candles, encode_candles, parse_address
+)
+from trading_bot.simulation.harness import ThroughputHarness
+from trading_bot.utils.event_codec import encode_value
+
+@pytest.fixture
+def pair():
+    left, right = socket.socketpair()
+    sender, receiver = FramedConnection(left, max_frame_size=1024), FramedConnection(right, max_frame_size=1024)
+    receiver.settimeout(5.0)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+def test_frames_round_trip(pair):
+    sender, receiver = pair
+
+    sender.send(HELLO, {'protocol': PROTOCOL_VERSION, 'name': 'node-a', 'costs': [0.5, 1]})
+    sender.send(WELCOME)
+
+    assert receiver.recv() == (HELLO, {'protocol': PROTOCOL_VERSION, 'name': 'node-a', 'costs': [0.5, 1]})
+    assert receiver.recv() == (WELCOME, {})
+
+def test_payloads_that_need_pickle_are_refused(pair):
+    sender, receiver = pair
+
+    with pytest.raises(ProtocolError):
+        sender.send(HELLO, {'tags': {'a'}})
+
+    # A peer that pickles anyway is rejected on receipt
+    body = encode_value({'tags': {'a'}})
+    sender.sock.sendall(len(body).to_bytes(4, 'little') + bytes([HELLO]) + body)
+    with pytest.raises(ProtocolError):
+        receiver.recv()
+
+def test_oversized_frames_are_refused(pair):
+    sender, receiver = pair
+
+    with pytest.raises(ProtocolError):
+        sender.send(HELLO, {'blob': b'x' * 2048})
+
+    sender.sock.sendall((4096).to_bytes(4, 'little') + bytes([HELLO]))
+    with pytest.raises(ProtocolError):
+        receiver.recv()
+
+def test_candles_round_trip():
+    candles = pd.DataFrame({
+        'timestamp': pd.to_datetime([1_700_000_000_000, 1_700_000_060_000], unit='ms'),
+        'open': [1.0, 2.0],
+        'high': [1.5, 2.5],
+        'low': [0.5, 1.5],
+        'close': [1.2, 2.2],
+        'volume': [10.0, 20.0],
+    })
+
+    decoded = decode_candles(encode_candles(candles), 'ETH/USDT')
+
+    pd.testing.assert_frame_equal(decoded.drop(columns='symbol'), candles)
+    assert list(decoded['symbol']) == ['ETH/USDT', 'ETH/USDT']
+
+def test_parse_address():
+    assert parse_address('127.0.0.1:7878') == ('127.0.0.1', 7878)
+    assert parse_address('[::1]:7878') == ('::1', 7878)
+    with pytest.raises(ValueError):
+        parse_address('localhost')
+
+@pytest.mark.parametrize('token, expected', [('secret', WELCOME), ('wrong', REJECT)])
+def test_server_checks_the_node_token(token, expected):
+    broker = LocalBroker()
+    server = NodeServer(broker, token='secret')
+    server.start()
+    connection = FramedConnection(broker.connect())
+    connection.settimeout(5.0)
+    try:
+        connection.send(HELLO, {'protocol': PROTOCOL_VERSION, 'name': 'node-a', 'token': token})
+        kind, _ = connection.recv()
+
+        assert kind == expected
+        assert len(server.nodes()) == (1 if expected == WELCOME else 0)
+    finally:
+        connection.close()
+        server.close()
+
+def test_nodes_runtime_places_the_same_orders_as_sync(tmp_path):
+    (tmp_path / 'sync').mkdir()
+    (tmp_path / 'nodes').mkdir()
+    harness = dict(timeframe='1m', seed=3)
+    sync = ThroughputHarness(10, workdir=str(tmp_path / 'sync'), **harness).run()
+    nodes = ThroughputHarness(10, runtime='nodes', processes=2,
+                              workdir=str(tmp_path / 'nodes'), **harness).run()
+
+    assert sync['orders'] > 0
+    assert nodes['orders'] == sync['orders']
@@ -0,0 +1,249 @@
+# tests/test_queued_events.py
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from trading_bot.models.data_models import Signal
+from trading_bot.utils.events import Event, EventType
+from trading_bot.utils.queued_events import QueuedEventBus, event_key
+
+def _price(symbol, price=1.0):
+    return Event(EventType.PRICE_UPDATE, {'symbol': symbol, 'price': price})
+
+class GatedSubscriber:
+    """Records events and holds the worker on the first one until released"""
+
+    def __init__(self):
+        self.events = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self, event):
+        if not self.started.is_set():
+            self.started.set()
+            self.gate.wait(5.0)
+        self.events.append(event)
+
+    def symbols(self):
+        return [event.data['symbol'] for event in self.events]
+
+@pytest.fixture
+def make_bus():
+    buses = []
+
+    def make(**kwargs):
+        bus = QueuedEventBus(**kwargs)
+        buses.append(bus)
+        return bus
+
+    yield make
+    for bus in buses:
+        bus.close(timeout=5.0)
+
+def _hold_worker(bus, event_type=EventType.PRICE_UPDATE):
+    """Subscribe a gated subscriber and park the worker inside it"""
+    subscriber = GatedSubscriber()
+    bus.subscribe(event_type, subscriber)
+    bus.publish(_price('first') if event_type == EventType.PRICE_UPDATE
+                else Event(event_type, {'symbol': 'first'}))
+    assert subscriber.started.wait(5.0)
+    return subscriber
+
+def test_publish_returns_before_subscribers_run(make_bus):
+    bus = make_bus(workers=1)
+    subscriber = _hold_worker(bus)
+
+    bus.publish(_price('second'))
+    assert subscriber.symbols() == []
+    assert bus.queue_depths() == {'PRICE_UPDATE': 1}
+
+    subscriber.gate.set()
+    assert bus.drain(timeout=5.0)
+    assert subscriber.symbols() == ['first', 'second']
+
+def test_events_of_a_symbol_keep_publish_order_across_workers(make_bus):
+    bus = make_bus(workers=4)
+    received = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            received.append((event.data['symbol'], event.data['n']))
+
+    bus.subscribe(EventType.ORDER_CANCELLED, record)
+    for n in range(50):
+        for symbol in ('A/USDT', 'B/USDT', 'C/USDT'):
+            bus.publish(Event(EventType.ORDER_CANCELLED, {'symbol': symbol, 'n': n}))
+
+    assert bus.drain(timeout=5.0)
+    for symbol in ('A/USDT', 'B/USDT', 'C/USDT'):
+        assert [n for s, n in received if s == symbol] == list(range(50))
+
+def test_order_events_route_by_nested_symbol():
+    signal = Signal('ETH/USDT', datetime(2024, 1, 1), 'buy', 100.0, 'test')
+
+    assert event_key(Event(EventType.SIGNAL_GENERATED, signal)) == 'ETH/USDT'
+    assert event_key(Event(EventType.ORDER_PLACED, {'order': {'symbol': 'ETH/USDT'}, 'signal': None})) == 'ETH/USDT'
+    assert event_key(Event(EventType.ORDER_PLACED, {'order': None, 'signal': signal})) == 'ETH/USDT'
+    assert event_key(Event(EventType.ORDER_FILLED, {'order': {}, 'trade': {'symbol': 'ETH/USDT'}})) == 'ETH/USDT'
+    assert event_key(Event(EventType.STARTUP, {})) == EventType.STARTUP
+
+def test_order_events_of_a_symbol_keep_publish_order_across_types(make_bus):
+    bus = make_bus(workers=4)
+    received = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            received.append((event.type, event.data['order']['symbol'], event.data['order']['id']))
+
+    bus.subscribe(EventType.ORDER_PLACED, record)
+    bus.subscribe(EventType.ORDER_FILLED, record)
+    for n in range(50):
+        for symbol in ('A/USDT', 'B/USDT', 'C/USDT'):
+            order = {'id': n, 'symbol': symbol}
+            bus.publish(Event(EventType.ORDER_PLACED, {'order': order, 'signal': None}))
+            bus.publish(Event(EventType.ORDER_FILLED, {'order': order, 'trade': {'symbol': symbol}}))
+
+    assert bus.drain(timeout=5.0)
+    for symbol in ('A/USDT', 'B/USDT', 'C/USDT'):
+        expected = [(event_type, n) for n in range(50)
+                    for event_type in (EventType.ORDER_PLACED, EventType.ORDER_FILLED)]
+        assert [(event_type, n) for event_type, s, n in received if s == symbol] == expected
+
+def test_drop_newest_discards_events_that_do_not_fit(make_bus):
+    bus = make_bus(workers=1, queue_sizes={EventType.PRICE_UPDATE: 2}, backpressure='drop_newest')
+    subscriber = _hold_worker(bus)
+
+    for symbol in ('a', 'b', 'c', 'd'):
+        bus.publish(_price(symbol))
+    subscriber.gate.set()
+
+    assert bus.drain(timeout=5.0)
+    assert subscriber.symbols() == ['first', 'a', 'b']
+    stats = bus.metrics()['event_types']['PRICE_UPDATE']
+    assert (stats['published'], stats['handled'], stats['dropped'], stats['max_depth']) == (5, 3, 2, 2)
+
+def test_drop_oldest_keeps_the_latest_events(make_bus):
+    bus = make_bus(workers=1, queue_sizes={EventType.PRICE_UPDATE: 2}, backpressure='drop_oldest')
+    subscriber = _hold_worker(bus)
+
+    for symbol in ('a', 'b', 'c', 'd'):
+        bus.publish(_price(symbol))
+    subscriber.gate.set()
+
+    assert bus.drain(timeout=5.0)
+    assert subscriber.symbols() == ['first', 'c', 'd']
+    assert bus.memory_usage()['dropped_events'] == 2
+
+def test_lossless_types_block_until_there_is_room(make_bus):
+    bus = make_bus(workers=1, queue_sizes={EventType.ORDER_FILLED: 1}, backpressure='drop_newest')
+    subscriber = _hold_worker(bus, EventType.ORDER_FILLED)
+    bus.publish(Event(EventType.ORDER_FILLED, {'symbol': 'a'}))
+
+    publisher = threading.Thread(target=bus.publish, args=(Event(EventType.ORDER_FILLED, {'symbol': 'b'}),))
+    publisher.start()
+    time.sleep(0.05)
+    assert publisher.is_alive()
+
+    subscriber.gate.set()
+    publisher.join(5.0)
+    assert bus.drain(timeout=5.0)
+    assert subscriber.symbols() == ['first', 'a', 'b']
+    stats = bus.metrics()['event_types']['ORDER_FILLED']
+    assert (stats['blocked'], stats['dropped']) == (1, 0)
+
+def test_subscribers_can_publish_without_deadlocking(make_bus):
+    bus = make_bus(workers=1, queue_sizes={EventType.ORDER_PLACED: 1})
+    received = []
+
+    def place(event):
+        for n in range(3):
+            bus.publish(Event(EventType.ORDER_PLACED, {'symbol': 'a', 'n': n}))
+
+    bus.subscribe(EventType.SIGNAL_GENERATED, place)
+    bus.subscribe(EventType.ORDER_PLACED, lambda event: received.append(event.data['n']))
+    bus.publish(Event(EventType.SIGNAL_GENERATED, {'symbol': 'a'}))
+
+    assert bus.drain(timeout=5.0)
+    assert received == [0, 1, 2]
+
+def test_close_handles_queued_events_then_dispatches_inline(make_bus):
+    bus = make_bus(workers=2)
+    received = []
+    bus.subscribe(EventType.PRICE_UPDATE, lambda event: received.append(event.data['symbol']))
+    bus.publish(_price('a'))
+
+    bus.close(timeout=5.0)
+    assert received == ['a']
+    bus.publish(_price('b'))
+    assert received == ['a', 'b']
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        QueuedEventBus(workers=0)
+    with pytest.raises(ValueError):
+        QueuedEventBus(backpressure='drop_random')
+
+def test_higher_priority_lanes_are_handled_first(make_bus):
+    bus = make_bus(workers=1)
+    handled = []
+    for event_type in (EventType.PRICE_UPDATE, EventType.SIGNAL_GENERATED,
+                       EventType.ORDER_FILLED, EventType.RISK_LIMIT_BREACHED):
+        bus.subscribe(event_type, lambda event: handled.append(event.type))
+    subscriber = _hold_worker(bus)
+
+    bus.publish(_price('a'))
+    bus.publish(Event(EventType.SIGNAL_GENERATED, {'symbol': 'a'}))
+    bus.publish(Event(EventType.ORDER_FILLED, {'symbol': 'a'}))
+    bus.publish(Event(EventType.RISK_LIMIT_BREACHED, {'symbol': 'a'}))
+    subscriber.gate.set()
+
+    assert bus.drain(timeout=5.0)
+    assert handled == [
+        EventType.PRICE_UPDATE,
+        EventType.RISK_LIMIT_BREACHED,
+        EventType.ORDER_FILLED,
+        EventType.SIGNAL_GENERATED,
+        EventType.PRICE_UPDATE,
+    ]
+
+def test_queued_prices_coalesce_to_the_latest_per_symbol(make_bus):
+    bus = make_bus(workers=1)
+    subscriber = _hold_worker(bus)
+
+    bus.publish(_price('a', 1.0))
+    bus.publish(_price('b', 1.0))
+    bus.publish(_price('a', 2.0))
+    bus.publish(_price('a', 3.0))
+    subscriber.gate.set()
+
+    assert bus.drain(timeout=5.0)
+    assert [(event.data['symbol'], event.data['price']) for event in subscriber.events[1:]] == [
+        ('a', 3.0), ('b', 1.0)
+    ]
+    assert bus.metrics()['event_types']['PRICE_UPDATE']['coalesced'] == 2
+
+def test_candles_only_coalesce_updates_of_the_same_candle(make_bus):
+    bus = make_bus(workers=1)
+    subscriber = _hold_worker(bus)
+    handled = []
+    bus.subscribe(EventType.NEW_CANDLE, lambda event: handled.append(
+        (event.data['timeframe'], event.data['timestamp'], event.data['close'])
+    ))
+
+    def candle(timeframe, timestamp, close):
+        return Event(EventType.NEW_CANDLE, {
+            'symbol': 'a', 'timeframe': timeframe, 'timestamp': timestamp, 'close': close
+        })
+
+    bus.publish(candle('1m', 0, 1.0))
+    bus.publish(candle('1m', 60, 2.0))
+    bus.publish(candle('5m', 0, 3.0))
+    bus.publish(candle('1m', 60, 4.0))
+    subscriber.gate.set()
+
+    assert bus.drain(timeout=5.0)
+    assert handled == [('1m', 0, 1.0), ('1m', 60, 4.0), ('5m', 0, 3.0)]
@@ -0,0 +1,94 @@
+# tests/test_sharding.py
+import pytest
+import yaml
+
+from trading_bot.distributed import ShardedTradingBot, SymbolCostTracker, assign_shards, shard_loads
+from trading_bot.simulation.exchange import SimulatedExchange
+from trading_bot.simulation.harness import ThroughputHarness, build_config
+
+SYMBOLS = ['A/USDT', 'B/USDT', 'C/USDT', 'D/USDT']
+
+class FakeCommands:
+    """Stand-in for a shard worker's command queue"""
+
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message):
+        self.messages.append(message)
+
+def test_unmeasured_symbols_are_assigned_round_robin():
+    assert assign_shards(SYMBOLS, 2) == [['A/USDT', 'C/USDT'], ['B/USDT', 'D/USDT']]
+    assert assign_shards(SYMBOLS, 1) == [SYMBOLS]
+    with pytest.raises(ValueError):
+        assign_shards(SYMBOLS, 0)
+
+def test_measured_costs_even_out_shard_loads():
+    costs = {'A/USDT': 4.0, 'B/USDT': 3.0, 'C/USDT': 2.0, 'D/USDT': 1.0}
+
+    shards = assign_shards(SYMBOLS, 2, costs)
+
+    assert shards == [['A/USDT', 'D/USDT'], ['B/USDT', 'C/USDT']]
+    assert shard_loads(shards, costs) == [5.0, 5.0]
+    assert shard_loads([['A/USDT', 'E/USDT']], costs) == [4.0]
+
+def test_cost_tracker_keeps_moving_average():
+    tracker = SymbolCostTracker(alpha=0.5)
+
+    tracker.record('A/USDT', 1.0)
+    tracker.record('A/USDT', 3.0)
+
+    assert tracker.costs() == {'A/USDT': 2.0}
+    with pytest.raises(ValueError):
+        SymbolCostTracker(alpha=0)
+
+@pytest.fixture
+def coordinator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = build_config(SYMBOLS, '1m', 'spot', 'spot', shard_processes=2)
+    config['trading']['shard_rebalance_interval'] = 60
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump(config))
+    exchange = SimulatedExchange.from_synthetic(SYMBOLS, n_candles=50, balances={'USDT': 1000.0})
+
+    bot = ShardedTradingBot(str(config_path), log_level='WARNING', exchange=exchange)
+    bot._workers = [(None, FakeCommands()) for _ in range(bot.n_shards)]
+    yield bot
+    bot._workers = [None] * bot.n_shards
+
+def test_coordinator_rebalances_when_shards_drift_apart(coordinator):
+    assert coordinator.shards == [['A/USDT', 'C/USDT'], ['B/USDT', 'D/USDT']]
+    for symbol, seconds in [('A/USDT', 4.0), ('C/USDT', 3.0), ('B/USDT', 2.0), ('D/USDT', 1.0)]:
+        coordinator.cost_tracker.record(symbol, seconds)
+
+    coordinator._maybe_rebalance(1000.0)
+    coordinator._maybe_rebalance(1030.0)
+    assert coordinator.shards == [['A/USDT', 'C/USDT'], ['B/USDT', 'D/USDT']]
+
+    coordinator._maybe_rebalance(1060.0)
+
+    assert coordinator.shards == [['A/USDT', 'D/USDT'], ['B/USDT', 'C/USDT']]
+    assert coordinator._shard_of['D/USDT'] == 0
+    assert coordinator._workers[0][1].messages == [('assign', ['A/USDT', 'D/USDT'])]
+    assert coordinator._workers[1][1].messages == [('assign', ['B/USDT', 'C/USDT'])]
+
+def test_coordinator_keeps_shards_when_gain_is_below_threshold(coordinator):
+    for symbol, seconds in [('A/USDT', 1.0), ('C/USDT', 1.0), ('B/USDT', 1.0), ('D/USDT', 1.05)]:
+        coordinator.cost_tracker.record(symbol, seconds)
+
+    coordinator._maybe_rebalance(1000.0)
+    coordinator._maybe_rebalance(1060.0)
+
+    assert coordinator.shards == [['A/USDT', 'C/USDT'], ['B/USDT', 'D/USDT']]
+    assert all(not commands.messages for _, commands in coordinator._workers)
+
+def test_sharded_runtime_places_the_same_orders_as_sync(tmp_path):
+    (tmp_path / 'sync').mkdir()
+    (tmp_path / 'sharded').mkdir()
+    harness = dict(timeframe='1m', seed=3)
+    sync = ThroughputHarness(10, workdir=str(tmp_path / 'sync'), **harness).run()
+    sharded = ThroughputHarness(10, runtime='sharded', processes=2,
+                                workdir=str(tmp_path / 'sharded'), **harness).run()
+
+    assert sync['orders'] > 0
+    assert sharded['orders'] == sync['orders']
@@ -0,0 +1,87 @@
+# tests/test_shm_ring.py
+import pickle
+import queue
+
+import pytest
+
+from trading_bot.distributed.shm_ring import SharedMemoryEventChannel, SharedMemoryRing
+from trading_bot.utils.events import Event, EventBus, EventType
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryRing(slots=4, slot_size=16)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+def test_messages_come_out_in_order_across_wraparound(ring):
+    received = []
+    for i in range(10):
+        ring.put_nowait(f"m{i}".encode())
+        ring.put_nowait(f"n{i}".encode())
+        received.append(ring.get_nowait())
+        received.append(ring.get_nowait())
+
+    assert received == [f"{prefix}{i}".encode() for i in range(10) for prefix in 'mn']
+    assert len(ring) == 0
+    with pytest.raises(queue.Empty):
+        ring.get_nowait()
+
+def test_large_message_spans_slots_and_wraps(ring):
+    ring.put_nowait(b'a')
+    ring.put_nowait(b'b')
+    ring.get_nowait()
+    ring.get_nowait()
+
+    # 36 bytes need three 12-byte payloads: slots 2, 3 and 0
+    message = bytes(range(36))
+    ring.put_nowait(message)
+
+    assert len(ring) == 3
+    assert ring.get_nowait() == message
+
+def test_full_ring_rejects_until_consumer_frees_slots(ring):
+    for i in range(4):
+        ring.put_nowait(bytes([i]))
+
+    with pytest.raises(queue.Full):
+        ring.put_nowait(b'x')
+    with pytest.raises(queue.Full):
+        ring.put(b'x', timeout=0.01)
+    with pytest.raises(ValueError):
+        ring.put_nowait(bytes(100))
+
+    assert ring.get(timeout=0.01) == bytes([0])
+    ring.put_nowait(b'x')
+    assert [ring.get_nowait() for _ in range(4)] == [bytes([1]), bytes([2]), bytes([3]), b'x']
+
+def test_attached_ring_shares_the_segment(ring):
+    consumer = pickle.loads(pickle.dumps(ring))
+    try:
+        ring.put_nowait(b'hello')
+        assert not consumer.owner
+        assert consumer.get(timeout=1.0) == b'hello'
+        assert len(ring) == 0
+    finally:
+        consumer.close()
+
+def test_channel_forwards_bus_events_without_echo():
+    channel = SharedMemoryEventChannel(slots=64, slot_size=128)
+    try:
+        sender = EventBus()
+        receiver = EventBus()
+        receiver.add_transport(channel)
+        sender.add_transport(channel, event_types=[EventType.ORDER_PLACED])
+        received = []
+        receiver.subscribe(EventType.ORDER_PLACED, received.append)
+
+        sender.publish(Event(EventType.ORDER_PLACED, {'id': '1', 'amount': 1.5}, 100.0))
+        sender.publish(Event(EventType.STARTUP, {}, 101.0))
+        assert channel.pump(receiver) == 1
+
+        assert [(event.type, event.data, event.timestamp) for event in received] == [
+            (EventType.ORDER_PLACED, {'id': '1', 'amount': 1.5}, 100.0)
+        ]
+        assert len(channel.ring) == 0
+    finally:
+        channel.close()
@@ -0,0 +1,99 @@
+# tests/test_simulated_exchange.py
+import ccxt
+import pytest
+
+from trading_bot.simulation.exchange import SimulatedExchange
+
+START = 1_700_000_000_000
+MINUTE = 60_000
+
+def _candles(lows=None, n=10, price=100.0):
+    """Flat 1m candles at price, with the low of candle i set to lows[i]"""
+    lows = lows or {}
+    return [[START + i * MINUTE, price, price, lows.get(i, price), price, 10.0] for i in range(n)]
+
+def _exchange(symbol='ETH/USDT', lows=None, **kwargs):
+    kwargs.setdefault('balances', {'USDT': 1000.0})
+    return SimulatedExchange({symbol: _candles(lows)}, start_time=START, **kwargs)
+
+def test_market_buy_fills_with_slippage_and_fee():
+    exchange = _exchange(fee_rate=0.001, slippage=0.01)
+
+    order = exchange.create_order('ETH/USDT', 'market', 'buy', 2.0)
+
+    assert order['status'] == 'closed'
+    assert order['average'] == pytest.approx(101.0)
+    balance = exchange.fetch_balance()
+    assert balance['ETH']['free'] == pytest.approx(2.0)
+    assert balance['USDT']['free'] == pytest.approx(1000.0 - 202.0 * 1.001)
+    trades = exchange.fetch_my_trades('ETH/USDT')
+    assert [(trade['side'], trade['amount']) for trade in trades] == [('buy', 2.0)]
+
+def test_limit_order_rests_until_price_trades_through():
+    exchange = _exchange(lows={2: 95.0}, fee_rate=0.0)
+
+    order = exchange.create_order('ETH/USDT', 'limit', 'buy', 1.0, price=96.0)
+    assert order['status'] == 'open'
+    assert exchange.fetch_balance()['USDT']['used'] == pytest.approx(96.0)
+
+    exchange.advance(60)
+    assert exchange.fetch_order(order['id'])['status'] == 'open'
+
+    exchange.advance(120)
+    filled = exchange.fetch_order(order['id'])
+    assert filled['status'] == 'closed'
+    assert filled['average'] == 96.0
+    assert filled['trades'][0]['takerOrMaker'] == 'maker'
+    assert exchange.fetch_open_orders() == []
+    assert exchange.fetch_balance()['USDT']['used'] == pytest.approx(0.0)
+
+def test_cancel_releases_reserved_funds():
+    exchange = _exchange(fee_rate=0.0)
+    order = exchange.create_order('ETH/USDT', 'limit', 'buy', 1.0, price=90.0)
+
+    canceled = exchange.cancel_order(order['id'])
+
+    assert canceled['status'] == 'canceled'
+    assert exchange.fetch_balance()['USDT']['free'] == pytest.approx(1000.0)
+    with pytest.raises(ccxt.OrderNotFound):
+        exchange.cancel_order(order['id'])
+
+def test_order_beyond_balance_is_rejected():
+    exchange = _exchange()
+
+    with pytest.raises(ccxt.InsufficientFunds):
+        exchange.create_order('ETH/USDT', 'market', 'buy', 100.0)
+    with pytest.raises(ccxt.InsufficientFunds):
+        exchange.create_order('ETH/USDT', 'market', 'sell', 1.0)
+
+def test_swap_close_realizes_pnl():
+    exchange = SimulatedExchange(
+        {'BTC/USDT:USDT': _candles(price=100.0)[:5] + _candles(price=110.0)[5:]},
+        start_time=START, balances={'USDT': 1000.0}, fee_rate=0.0
+    )
+    exchange.create_order('BTC/USDT:USDT', 'market', 'buy', 2.0)
+    assert exchange.fetch_positions()[0]['contracts'] == 2.0
+
+    exchange.advance(5 * 60)
+    exchange.create_order('BTC/USDT:USDT', 'market', 'sell', 2.0)
+
+    assert exchange.fetch_balance()['USDT']['free'] == pytest.approx(1020.0)
+
+def test_rate_limit_raises_without_enable_rate_limit():
+    exchange = _exchange(rate_limit=1e-6, rate_limit_burst=2, enable_rate_limit=False)
+
+    exchange.fetch_ticker('ETH/USDT')
+    exchange.fetch_ticker('ETH/USDT')
+    with pytest.raises(ccxt.RateLimitExceeded):
+        exchange.fetch_ticker('ETH/USDT')
+
+def test_rate_limit_throttles_with_enable_rate_limit():
+    delays = []
+    exchange = _exchange(rate_limit=10.0, rate_limit_burst=1, sleep=delays.append)
+
+    exchange.fetch_ticker('ETH/USDT')
+    exchange.fetch_ticker('ETH/USDT')
+
+    assert len(delays) == 1
+    assert 0 < delays[0] <= 0.1
+    assert exchange.call_counts['fetch_ticker'] == 2
@@ -0,0 +1,60 @@
+# tests/test_synthetic.py
+import numpy as np
+import pytest
+
+from trading_bot.data.candle_store import CandleStore
+from trading_bot.data.synthetic import SyntheticMarketGenerator
+
+SYMBOLS = ['AAA/USDT', 'BBB/USDT', 'CCC/USDT']
+
+def test_same_seed_gives_same_candles():
+    first = SyntheticMarketGenerator(seed=7).generate_arrays(SYMBOLS, 200)
+    second = SyntheticMarketGenerator(seed=7).generate_arrays(SYMBOLS, 200)
+    other = SyntheticMarketGenerator(seed=8).generate_arrays(SYMBOLS, 200)
+
+    for symbol in SYMBOLS:
+        np.testing.assert_array_equal(first[symbol], second[symbol])
+    assert not np.array_equal(first['AAA/USDT'], other['AAA/USDT'])
+
+def test_candles_are_consistent_ohlcv():
+    generator = SyntheticMarketGenerator(seed=1, timeframe='5m', start_ms=1_000_000)
+    ohlcv = generator.generate_arrays(SYMBOLS, 500)['BBB/USDT']
+
+    assert ohlcv.shape == (500, 6)
+    np.testing.assert_array_equal(np.diff(ohlcv[:, 0]), 300_000)
+    assert ohlcv[0, 0] == 1_000_000
+    opens, highs, lows, closes, volumes = ohlcv[:, 1:].T
+    assert (highs >= np.maximum(opens, closes)).all()
+    assert (lows <= np.minimum(opens, closes)).all()
+    assert (lows > 0).all() and (volumes > 0).all()
+
+def test_stream_batches_continue_one_series():
+    generator = SyntheticMarketGenerator(seed=3)
+    store = CandleStore(max_candles=1000)
+
+    batches = list(generator.stream(SYMBOLS, 250, batch_size=100, candle_store=store))
+
+    assert [len(batch['AAA/USDT']) for batch in batches] == [100, 100, 50]
+    buffered = store.get('AAA/USDT', '1m')
+    assert len(buffered) == 250
+    assert buffered['timestamp'].is_monotonic_increasing
+    assert buffered['timestamp'].is_unique
+
+def test_basket_members_move_together():
+    generator = SyntheticMarketGenerator(seed=5, basket_correlation=0.9, gap_probability=0.0)
+    arrays = generator.generate_arrays(SYMBOLS, 2000, baskets={'majors': ['AAA/USDT', 'BBB/USDT']})
+    returns = {symbol: np.diff(np.log(array[:, 4])) for symbol, array in arrays.items()}
+
+    together = np.corrcoef(returns['AAA/USDT'], returns['BBB/USDT'])[0, 1]
+    apart = np.corrcoef(returns['AAA/USDT'], returns['CCC/USDT'])[0, 1]
+    assert together > 0.5
+    assert abs(apart) < 0.2
+
+def test_dataframe_layout_matches_provider():
+    frames = SyntheticMarketGenerator(seed=0).generate(['AAA/USDT'], 10)
+
+    assert list(frames['AAA/USDT'].columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'symbol']
+
+def test_non_stationary_garch_is_rejected():
+    with pytest.raises(ValueError):
+        SyntheticMarketGenerator(garch_alpha=0.2, garch_beta=0.8)
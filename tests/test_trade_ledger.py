@@ -0,0 +1,107 @@
+# tests/test_trade_ledger.py
+import threading
+
+import pytest
+
+from trading_bot.data.trade_ledger import TradeLedger
+
+class FakeExchange:
+    """Serves trades like fetch_my_trades, failing the calls listed in fail_calls"""
+
+    def __init__(self, trades, fail_calls=()):
+        self.trades = trades
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+        self.on_fetch = None
+
+    def fetch_my_trades(self, symbol, since=None, limit=None, params=None):
+        self.calls += 1
+        if self.on_fetch is not None:
+            self.on_fetch()
+        if self.calls in self.fail_calls:
+            raise ConnectionError('exchange unavailable')
+        until = (params or {}).get('until')
+        trades = [
+            dict(trade) for trade in self.trades
+            if (since is None or trade['timestamp'] >= since) and (until is None or trade['timestamp'] <= until)
+        ]
+        return trades[:limit] if since is not None else trades[-limit:]
+
+def _trade(number, side='buy', amount=1.0, price=100.0):
+    return {'id': str(number), 'symbol': 'ETH/USDT', 'side': side, 'amount': amount,
+            'price': price, 'timestamp': number * 1000, 'fee': None}
+
+def _ledger(tmp_path, exchange, page_limit=500):
+    return TradeLedger(exchange, path=str(tmp_path / 'ledger.json'), sync_interval=300, page_limit=page_limit)
+
+def test_sync_retries_after_failed_fetch(tmp_path):
+    exchange = FakeExchange([_trade(1), _trade(2, price=110.0)], fail_calls={1})
+    ledger = _ledger(tmp_path, exchange)
+
+    assert ledger.sync('ETH/USDT') == 0
+    assert ledger.holding('ETH/USDT')['amount'] == 0.0
+
+    # Not throttled by sync_interval after the failure
+    assert ledger.sync('ETH/USDT') == 2
+    assert ledger.holding('ETH/USDT')['entry_price'] == pytest.approx(105.0)
+    assert ledger.sync('ETH/USDT') == 0
+    assert exchange.calls == 2
+
+def test_sync_keeps_pages_taken_before_a_failed_fetch(tmp_path):
+    exchange = FakeExchange([_trade(1)])
+    ledger = _ledger(tmp_path, exchange, page_limit=2)
+    ledger.sync('ETH/USDT')
+    exchange.trades += [_trade(2), _trade(3), _trade(4)]
+    exchange.fail_calls = {exchange.calls + 2}
+
+    # The page from the cursor holds trades 1 and 2, the next one fails
+    assert ledger.sync('ETH/USDT', force=True) == 0
+    assert ledger.holding('ETH/USDT')['amount'] == 2.0
+
+    assert ledger.sync('ETH/USDT', force=True) == 2
+    assert ledger.holding('ETH/USDT')['amount'] == 4.0
+
+def test_first_sync_pages_back_until_holding_is_covered(tmp_path):
+    trades = [_trade(number, price=100.0 + number) for number in range(1, 11)]
+    exchange = FakeExchange(trades)
+    ledger = _ledger(tmp_path, exchange, page_limit=3)
+
+    ledger.sync('ETH/USDT', held=5.0)
+
+    # Two pages back from the newest trade cover the 5 held
+    assert exchange.calls == 2
+    assert ledger.holding('ETH/USDT')['amount'] == 6.0
+
+def test_first_sync_without_holding_reads_all_history(tmp_path):
+    exchange = FakeExchange([_trade(number) for number in range(1, 11)])
+    ledger = _ledger(tmp_path, exchange, page_limit=3)
+
+    assert ledger.sync('ETH/USDT') == 10
+
+def test_entry_price_prices_newest_lots_covering_amount(tmp_path):
+    exchange = FakeExchange([_trade(1, price=100.0), _trade(2, amount=2.0, price=130.0)])
+    ledger = _ledger(tmp_path, exchange)
+
+    assert ledger.entry_price('ETH/USDT') == pytest.approx(120.0)
+    assert ledger.entry_price('ETH/USDT', 2.0) == pytest.approx(130.0)
+    assert ledger.entry_price('ETH/USDT', 2.5) == pytest.approx((2.0 * 130.0 + 0.5 * 100.0) / 2.5)
+
+def test_fills_are_added_while_a_sync_fetches(tmp_path):
+    exchange = FakeExchange([_trade(1)])
+    ledger = _ledger(tmp_path, exchange)
+    ledger.sync('ETH/USDT')
+    exchange.trades.append(_trade(2))
+    added = []
+
+    def fill_from_another_thread():
+        # The fill also comes back from the fetch in progress
+        thread = threading.Thread(target=lambda: added.append(ledger.add_trade(_trade(2))))
+        thread.start()
+        thread.join(timeout=5.0)
+        assert not thread.is_alive()
+
+    exchange.on_fetch = fill_from_another_thread
+
+    assert ledger.sync('ETH/USDT', force=True) == 0
+    assert added == [True]
+    assert ledger.holding('ETH/USDT')['amount'] == 2.0
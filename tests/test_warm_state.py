@@ -0,0 +1,88 @@
+# tests/test_warm_state.py
+import os
+
+import pandas as pd
+import pytest
+
+from trading_bot.data.candle_store import CandleStore
+from trading_bot.utils.event_codec import EventCodecError, encode_value
+from trading_bot.utils.warm_state import WARM_STATE_VERSION, load_warm_state, save_warm_state
+
+STATE = {
+    'saved_at': 1_700_000_000.0,
+    'exchange_id': 'simulated',
+    'markets': {'ETH/USDT': {'symbol': 'ETH/USDT', 'precision': {'amount': 4}}},
+    'signal_checks': {'ETH/USDT': 1_699_999_940.0},
+    'candles': {'ETH/USDT': {'1m': b'\x00' * 48}},
+}
+
+def test_snapshot_round_trips(tmp_path):
+    path = str(tmp_path / 'state' / 'warm_state.bin')
+
+    size = save_warm_state(path, STATE)
+
+    assert size == os.path.getsize(path)
+    assert not os.path.exists(f"{path}.tmp")
+    assert load_warm_state(path) == STATE
+
+def test_missing_snapshot_loads_as_none(tmp_path):
+    assert load_warm_state(str(tmp_path / 'missing.bin')) is None
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data[:4] + bytes((WARM_STATE_VERSION + 1,)) + data[5:],
+    lambda data: data[:3],
+    lambda data: data[:-10],
+])
+def test_foreign_or_damaged_snapshots_are_ignored(tmp_path, corrupt):
+    path = str(tmp_path / 'warm_state.bin')
+    save_warm_state(path, STATE)
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(corrupt(data))
+
+    assert load_warm_state(path) is None
+
+def test_pickled_or_non_dict_snapshots_are_ignored(tmp_path):
+    path = str(tmp_path / 'warm_state.bin')
+    header = b'TBWS' + bytes((WARM_STATE_VERSION,))
+
+    with open(path, 'wb') as f:
+        f.write(header + encode_value({'tags': {'a'}}))
+    assert load_warm_state(path) is None
+
+    with open(path, 'wb') as f:
+        f.write(header + encode_value([1, 2]))
+    assert load_warm_state(path) is None
+
+def test_values_without_native_encoding_are_refused(tmp_path):
+    path = str(tmp_path / 'warm_state.bin')
+    save_warm_state(path, STATE)
+
+    with pytest.raises(EventCodecError):
+        save_warm_state(path, {'tags': {'a'}})
+
+    # The previous snapshot survives the failed save
+    assert load_warm_state(path) == STATE
+
+def test_candle_buffers_survive_a_snapshot():
+    store = CandleStore()
+    candles = pd.DataFrame({
+        'timestamp': pd.to_datetime([1_700_000_000_000 + i * 60_000 for i in range(3)], unit='ms'),
+        'open': [1.0, 2.0, 3.0],
+        'high': [1.5, 2.5, 3.5],
+        'low': [0.5, 1.5, 2.5],
+        'close': [1.2, 2.2, 3.2],
+        'volume': [10.0, 20.0, 30.0],
+        'symbol': 'ETH/USDT',
+    })
+    store.update('ETH/USDT', '1m', candles)
+
+    restored = CandleStore()
+    assert restored.restore(store.snapshot()) == 1
+
+    pd.testing.assert_frame_equal(
+        restored.get('ETH/USDT', '1m').reset_index(drop=True),
+        store.get('ETH/USDT', '1m').reset_index(drop=True)
+    )
@@ -0,0 +1,21 @@
+"""asyncio runtime: the trading bot on a single event loop"""
+
+from trading_bot.aio.events import AsyncEventBus
+from trading_bot.aio.threads import run_in_thread
+from trading_bot.aio.exchange import AsyncExchange, SyncExchangeBridge, create_async_exchange
+from trading_bot.aio.executor import AsyncCCXTExecutor
+from trading_bot.aio.position_tracker import AsyncPositionTracker
+from trading_bot.aio.provider import AsyncCCXTProvider
+from trading_bot.aio.bot import AsyncTradingBot
+
+__all__ = [
+    'AsyncEventBus',
+    'AsyncExchange',
+    'SyncExchangeBridge',
+    'create_async_exchange',
+    'AsyncCCXTExecutor',
+    'AsyncPositionTracker',
+    'AsyncCCXTProvider',
+    'AsyncTradingBot',
+    'run_in_thread',
+]
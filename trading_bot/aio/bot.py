@@ -0,0 +1,319 @@
+# trading_bot/aio/bot.py
+import asyncio
+import os
+from typing import List
+
+from dotenv import load_dotenv
+
+from trading_bot.aio.events import AsyncEventBus
+from trading_bot.aio.exchange import AsyncExchange, SyncExchangeBridge, create_async_exchange
+from trading_bot.aio.executor import AsyncCCXTExecutor
+from trading_bot.aio.position_tracker import AsyncPositionTracker
+from trading_bot.aio.provider import AsyncCCXTProvider
+from trading_bot.aio.threads import run_in_thread
+from trading_bot.main import TradingBot
+from trading_bot.models.data_models import Signal
+from trading_bot.utils.clock import get_clock
+from trading_bot.utils.events import Event, EventType
+
+class AsyncTradingBot(TradingBot):
+    """
+    Trading bot running on a single asyncio event loop.
+
+    Candle fetches for all due symbols, position refreshes and order
+    placement are awaited concurrently through one AsyncExchange, bounded
+    by exchange.max_concurrency, instead of blocking a thread each. The
+    strategies, risk manager and drawdown handling are the same objects as
+    in TradingBot; where they still make blocking exchange calls they run
+    on a worker thread and reach the exchange through a SyncExchangeBridge,
+    so the I/O itself stays on the loop.
+
+    ``await bot.run_async()`` runs the bot inside an existing loop and
+    ``bot.run()`` is the blocking wrapper with the TradingBot API.
+    """
+
+    def __init__(self,
+                 config_path: str,
+                 dry_run: bool = False,
+                 log_level: str = "INFO",
+                 exchange=None):
+        """
+        Initialize the trading bot
+
+        Args:
+            config_path: Path to the configuration file
+            dry_run: Whether to run in dry run mode (default: False)
+            log_level: Logging level (e.g., DEBUG, INFO, WARNING, ERROR)
+            exchange: Optional pre-built exchange, either a ccxt.async_support
+                instance or a synchronous one (e.g. a SimulatedExchange); by
+                default a ccxt.async_support instance for exchange.id is created
+        """
+        self._exchange_source = exchange
+        super().__init__(config_path, dry_run=dry_run, log_level=log_level, exchange=None)
+
+    def _setup_components(self):
+        """Set up the async exchange layer, then the shared components on top of it"""
+        exchange = self._exchange_source
+        if exchange is None:
+            load_dotenv()
+            exchange_id = self.config.get_strict('exchange.id')
+            api_key = os.environ.get('EXCHANGE_API_KEY')
+            secret = os.environ.get('EXCHANGE_SECRET')
+            if not api_key:
+                raise ValueError("API key not found. Please set EXCHANGE_API_KEY environment variable.")
+            if not secret:
+                raise ValueError("API secret not found. Please set EXCHANGE_SECRET environment variable.")
+            exchange = create_async_exchange(
+                exchange_id, api_key, secret, self.config.get('exchange.params', {})
+            )
+
+        self.async_exchange = AsyncExchange(
+            exchange,
+            max_concurrency=self.config.get('exchange.max_concurrency', 100)
+        )
+        self.exchange_bridge = SyncExchangeBridge(self.async_exchange)
+        self._exchange = self.exchange_bridge
+
+        super()._setup_components()
+
+        self.async_provider = AsyncCCXTProvider(self.async_exchange, self.data_provider.exchange_id)
+        self.async_executor = AsyncCCXTExecutor(self.async_exchange, dry_run=self.executor.dry_run)
+
+    def _create_event_bus(self) -> AsyncEventBus:
+        """Create the event bus shared by all components"""
+        return AsyncEventBus(
+            max_subscribers=self.config.get('system.memory.max_subscribers', 100)
+        )
+
+    def _create_position_tracker(self) -> AsyncPositionTracker:
+        """Create the PositionTracker shared by strategies and the risk manager"""
+        return AsyncPositionTracker(
+            exchange=self.data_provider.exchange,
+            async_exchange=self.async_exchange,
+            max_closed_positions=self.config.get('system.memory.max_closed_positions', 100),
+            flush_interval=self.config.get('system.persistence.flush_interval', 5.0),
+            compact_after=self.config.get('system.persistence.compact_after', 1000),
+            history=self.history,
+            reconcile_interval=self.config.get('system.positions.reconcile_interval', 300),
+            ledger=self.trade_ledger
+        )
+
+    def _register_events(self):
+        """Register event handlers, handling signals on the event loop"""
+        super()._register_events()
+        self.event_bus.unsubscribe(EventType.SIGNAL_GENERATED, self._handle_signal)
+        self.event_bus.subscribe(EventType.SIGNAL_GENERATED, self._handle_signal_async)
+        self.event_bus.unsubscribe(EventType.ORDER_FILLED, self._handle_order_filled)
+        self.event_bus.subscribe(EventType.ORDER_FILLED, self._handle_order_filled_async)
+        self.event_bus.unsubscribe(EventType.PRICE_UPDATE, self._handle_price_update)
+        self.event_bus.subscribe(EventType.PRICE_UPDATE, self._handle_price_update_async)
+
+    async def _handle_order_filled_async(self, event: Event) -> None:
+        """Apply a fill on a worker thread, since the tracker's lock may be held by a thread waiting on this loop"""
+        await run_in_thread(self._handle_order_filled, event)
+
+    async def _handle_price_update_async(self, event: Event) -> None:
+        """Apply a price update on a worker thread, for the same reason as fills"""
+        await run_in_thread(self._handle_price_update, event)
+
+    async def _handle_signal_async(self, event: Event) -> None:
+        """
+        Handle incoming trading signals
+
+        Args:
+            event: SIGNAL_GENERATED event carrying the Signal as its data
+        """
+        try:
+            signal: Signal = event.data
+            self.logger.info(f"Received signal: {signal}")
+
+            # Risk checks use the synchronous risk manager
+            prepared = await run_in_thread(self._order_for_signal, signal)
+            if prepared is None:
+                return
+            order, success_message = prepared
+
+            result = await self.async_executor.place_order(order)
+            self._report_signal_order(signal, result, success_message)
+
+        except Exception as e:
+            self.logger.error(f"Error handling signal: {e}")
+
+    async def _poll_prices_async(self, current_time: float) -> None:
+        """
+        Fetch the tickers of the open positions concurrently and publish them as PRICE_UPDATEs
+
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        positions = await run_in_thread(self.position_tracker.snapshot)
+        symbols = [position.symbol for position in positions.all_positions()]
+        tickers = await asyncio.gather(
+            *(self.async_exchange.call('fetch_ticker', symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        for symbol, ticker in zip(symbols, tickers):
+            if isinstance(ticker, Exception):
+                self.logger.debug(f"Error polling the price of {symbol}: {ticker}")
+                continue
+            event = self._price_update_event(symbol, ticker, current_time)
+            if event is not None:
+                await self.event_bus.publish_async(event)
+        self._last_price_poll = current_time
+
+    async def _evaluate_symbol_async(self, symbol: str, timeframe: str) -> List[Signal]:
+        """
+        Fetch the latest candles for a symbol and run its strategy
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            Signals generated by the symbol's strategy
+        """
+        try:
+            required_candles = getattr(self.strategies[symbol], 'get_required_data_points', lambda: 100)()
+            since, limit = self._candle_request(symbol, timeframe, required_candles)
+            candles = await self.async_provider.get_historical_data(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=limit
+            )
+            # Strategies may call the exchange through the bridge, which blocks: keep them off the loop
+            return await run_in_thread(self._signals_from_candles, symbol, timeframe, candles, required_candles)
+
+        except Exception as e:
+            self.logger.error(f"Error processing {symbol}: {e}")
+            return []
+
+    async def run_once_async(self, current_time: float) -> None:
+        """
+        Run a single iteration of the main loop
+
+        Fetches candles for every due symbol concurrently, then handles the
+        resulting signals in configuration order, checks drawdown limits and
+        retries failed drawdown closes.
+
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        if not self._loop_prepared:
+            self._prepare_loop()
+        if self._last_memory_report is None:
+            self._last_memory_report = current_time
+
+        due_symbols = self._due_symbols(current_time)
+        results = await asyncio.gather(
+            *(self._evaluate_symbol_async(symbol, timeframe) for symbol, timeframe in due_symbols)
+        )
+
+        prices = self._latest_closes(due_symbols)
+        if prices:
+            await run_in_thread(self.position_tracker.update_prices, prices)
+        if self._price_poll_interval and current_time - self._last_price_poll >= self._price_poll_interval:
+            await self._poll_prices_async(current_time)
+
+        drawdown_due = current_time - self._last_drawdown_check > self._drawdown_check_interval
+        retry_due = bool(self._drawdown_close_retries) and current_time - self._last_retry_check > self._retry_interval
+        if drawdown_due or retry_due or any(results):
+            # One concurrent refresh per pass; the risk checks below read snapshots of it
+            await self.position_tracker.update_positions_async()
+        for signals in results:
+            for signal in signals:
+                await self.event_bus.publish_async(Event(
+                    EventType.SIGNAL_GENERATED,
+                    signal
+                ))
+
+        if await run_in_thread(self.position_tracker.take_breaches) or drawdown_due:
+            await run_in_thread(self._check_drawdowns, current_time)
+        if drawdown_due:
+            self._last_drawdown_check = current_time
+
+        if retry_due:
+            await run_in_thread(self._retry_drawdown_closes, current_time)
+
+        if self.order_tracker.pending_orders():
+            await run_in_thread(self.order_tracker.poll, current_time)
+        if self.trade_ledger is not None:
+            self.trade_ledger.save()
+
+        if self._memory_report_interval and current_time - self._last_memory_report > self._memory_report_interval:
+            self.memory_report()
+            self._last_memory_report = current_time
+
+        # Let events published by synchronous components finish before the next pass
+        await self.event_bus.drain()
+
+        if self.journal is not None:
+            self.journal.sync_if_due()
+
+        if self.warm_state_path is not None:
+            if self._last_warm_state_save is None:
+                self._last_warm_state_save = current_time
+            elif current_time - self._last_warm_state_save > self._warm_state_interval:
+                self._save_warm_state(current_time)
+
+    async def start_async(self) -> None:
+        """Attach the bot to the running event loop and load markets"""
+        loop = asyncio.get_running_loop()
+        self.event_bus.bind(loop)
+        self.exchange_bridge.bind(loop)
+        await self.async_exchange.load_markets()
+
+    async def shutdown_async(self) -> None:
+        """Finish pending events, close the exchange and detach from the event loop"""
+        await self.event_bus.drain()
+        await self.async_exchange.close()
+        self.exchange_bridge.bind(None)
+        self.event_bus.bind(None)
+        self._shutdown_symbol_pool()
+        if self.warm_state_path is not None and self._loop_prepared:
+            self._save_warm_state(get_clock().time())
+        self.position_tracker.close()
+        if self.trade_ledger is not None:
+            self.trade_ledger.save()
+        self._close_history()
+        self._close_journal()
+
+    async def run_async(self) -> None:
+        """Run the trading bot on the current event loop"""
+        self.running = True
+        self.logger.info("Starting trading bot (asyncio runtime)...")
+
+        try:
+            await self.start_async()
+
+            await self.event_bus.publish_async(Event(
+                EventType.STARTUP,
+                {'timestamp': get_clock().time()}
+            ))
+
+            self._prepare_loop()
+            clock = get_clock()
+
+            while self.running:
+                await self.run_once_async(clock.time())
+
+                # Throttle the loop to avoid excessive CPU usage
+                await clock.sleep_async(1)
+
+        except Exception as e:
+            self.logger.error(f"Error in main loop: {e}")
+            await self.event_bus.publish_async(Event(
+                EventType.ERROR,
+                {
+                    'source': 'main_loop',
+                    'message': str(e)
+                }
+            ))
+
+        finally:
+            await self.shutdown_async()
+            self.logger.info("Trading bot stopped")
+
+    def run(self):
+        """Run the trading bot, blocking until it is stopped"""
+        asyncio.run(self.run_async())
@@ -0,0 +1,94 @@
+# trading_bot/aio/events.py
+import asyncio
+import inspect
+import logging
+import threading
+from typing import Optional, Set
+
+from trading_bot.utils.events import Event, EventBus
+
+logger = logging.getLogger(__name__)
+
+class AsyncEventBus(EventBus):
+    """
+    Event bus whose subscribers may be coroutine functions.
+
+    ``await bus.publish_async(event)`` runs the subscribers in subscription
+    order, awaiting coroutine subscribers before moving on to the next one.
+    The synchronous ``publish`` stays available for components written
+    against EventBus: on the loop thread it schedules the dispatch as a
+    task, and from other threads it hands the event to the loop.
+    """
+
+    def __init__(self, max_subscribers: int = 100):
+        """
+        Initialize the event bus
+
+        Args:
+            max_subscribers: Maximum number of callbacks per event type
+        """
+        super().__init__(max_subscribers=max_subscribers)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._pending: Set[asyncio.Future] = set()
+
+    def bind(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Attach the bus to the event loop that runs the subscribers (None to detach)"""
+        self._loop = loop
+        self._loop_thread = threading.get_ident() if loop is not None else None
+
+    async def publish_async(self, event: Event) -> None:
+        """
+        Publish an event and wait until every subscriber has handled it
+
+        Args:
+            event: Event object to publish
+        """
+        if self._transports:
+            self._forward(event)
+        callbacks = self._dispatch.get(event.type, ())
+        for callback in callbacks:
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in event handler for {event.type.name}: {e}")
+        if callbacks and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Published {event.type.name} event to {len(callbacks)} subscribers")
+
+    def publish(self, event: Event) -> None:
+        """
+        Publish an event from synchronous code without waiting for it
+
+        Args:
+            event: Event object to publish
+        """
+        if self._loop is None:
+            # No loop yet: only synchronous subscribers can run
+            if self._transports:
+                self._forward(event)
+            for callback in self._dispatch.get(event.type, ()):
+                try:
+                    result = callback(event)
+                    if inspect.iscoroutine(result):
+                        result.close()
+                        logger.error(f"Async handler for {event.type.name} skipped: event loop not running")
+                except Exception as e:
+                    logger.error(f"Error in event handler for {event.type.name}: {e}")
+            return
+
+        if threading.get_ident() == self._loop_thread:
+            future = self._loop.create_task(self.publish_async(event))
+        else:
+            future = asyncio.run_coroutine_threadsafe(self.publish_async(event), self._loop)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for events published through publish() to be handled"""
+        while self._pending:
+            pending = list(self._pending)
+            await asyncio.gather(*(asyncio.wrap_future(f) if not isinstance(f, asyncio.Future) else f
+                                   for f in pending), return_exceptions=True)
+            self._pending.difference_update(pending)
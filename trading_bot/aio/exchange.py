@@ -0,0 +1,167 @@
+# trading_bot/aio/exchange.py
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+# ccxt methods that perform I/O and are awaited through AsyncExchange
+EXCHANGE_METHODS = frozenset((
+    'load_markets',
+    'fetch_ohlcv',
+    'fetch_ticker',
+    'fetch_tickers',
+    'fetch_order_book',
+    'fetch_balance',
+    'fetch_positions',
+    'fetch_my_trades',
+    'fetch_open_orders',
+    'fetch_order',
+    'create_order',
+    'cancel_order',
+    'close',
+))
+
+def create_async_exchange(exchange_id: str,
+                          api_key: Optional[str] = None,
+                          secret: Optional[str] = None,
+                          params: Optional[Dict[str, Any]] = None):
+    """
+    Create a ccxt.async_support exchange instance
+
+    Args:
+        exchange_id: CCXT exchange ID (e.g. 'bybit', 'binance')
+        api_key: API key for authenticated requests
+        secret: API secret for authenticated requests
+        params: Additional parameters for the exchange
+
+    Returns:
+        Async CCXT exchange instance
+    """
+    import ccxt.async_support as ccxt_async
+
+    exchange_params = {'enableRateLimit': True}
+    if api_key and secret:
+        exchange_params.update({'apiKey': api_key, 'secret': secret})
+    if params:
+        exchange_params.update(params)
+    return getattr(ccxt_async, exchange_id)(exchange_params)
+
+class AsyncExchange:
+    """
+    Awaitable view of an exchange with a bound on in-flight requests.
+
+    Wraps either a ccxt.async_support exchange, whose coroutines are awaited
+    directly on the event loop, or a synchronous exchange (ccxt or
+    SimulatedExchange), whose calls run on a small thread pool. Either way
+    callers simply ``await exchange.fetch_ohlcv(...)`` and thousands of
+    concurrent operations share one event loop.
+    """
+
+    def __init__(self, exchange, max_concurrency: int = 100, sync_workers: int = 16):
+        """
+        Initialize the wrapper
+
+        Args:
+            exchange: Async or sync exchange instance with the ccxt API
+            max_concurrency: Maximum number of requests in flight at once
+            sync_workers: Threads used to run calls of a synchronous exchange
+        """
+        self.exchange = exchange
+        self.max_concurrency = max_concurrency
+        self.is_native = inspect.iscoroutinefunction(getattr(exchange, 'fetch_ohlcv', None))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pool = None if self.is_native else ThreadPoolExecutor(
+            max_workers=sync_workers, thread_name_prefix='exchange-io'
+        )
+        self.logger = logging.getLogger(__name__)
+
+    async def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call an exchange method without blocking the event loop
+
+        Args:
+            method: ccxt method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's result
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        func = getattr(self.exchange, method)
+        async with self._semaphore:
+            if self.is_native:
+                return await func(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, lambda: func(*args, **kwargs))
+
+    def __getattr__(self, name: str):
+        if name in EXCHANGE_METHODS:
+            async def method(*args, **kwargs):
+                return await self.call(name, *args, **kwargs)
+            return method
+        return getattr(self.exchange, name)
+
+    async def close(self) -> None:
+        """Release the exchange's connections and worker threads"""
+        if self.is_native:
+            await self.exchange.close()
+        elif self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+class SyncExchangeBridge:
+    """
+    Blocking ccxt-style facade over an AsyncExchange for synchronous
+    components (strategies, risk manager, executor, position tracker).
+
+    Calls from worker threads are submitted to the event loop and wait for
+    the result, so all network I/O still happens on the loop. Calls made
+    directly on the loop thread would deadlock and raise instead. A
+    synchronous underlying exchange is called directly.
+    """
+
+    def __init__(self, async_exchange: AsyncExchange):
+        """
+        Initialize the bridge
+
+        Args:
+            async_exchange: AsyncExchange the calls are forwarded to
+        """
+        self._async_exchange = async_exchange
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+
+    def bind(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Attach the bridge to the event loop running the bot (None to detach)"""
+        self._loop = loop
+        self._loop_thread = threading.get_ident() if loop is not None else None
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        exchange = self._async_exchange.exchange
+        if not self._async_exchange.is_native:
+            return getattr(exchange, method)(*args, **kwargs)
+
+        if method == 'load_markets' and getattr(exchange, 'markets', None):
+            # Markets are loaded once by the async runtime; serve them from memory
+            return exchange.markets
+        if self._loop is None:
+            if method == 'load_markets':
+                return getattr(exchange, 'markets', None) or {}
+            raise RuntimeError(f"Exchange call {method} made before the event loop was started")
+        if threading.get_ident() == self._loop_thread:
+            raise RuntimeError(f"Blocking exchange call {method} made on the event loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_exchange.call(method, *args, **kwargs), self._loop
+        )
+        return future.result()
+
+    def __getattr__(self, name: str):
+        if name in EXCHANGE_METHODS:
+            def method(*args, **kwargs):
+                return self._call(name, *args, **kwargs)
+            return method
+        return getattr(self._async_exchange.exchange, name)
@@ -0,0 +1,104 @@
+# trading_bot/aio/executor.py
+import logging
+from typing import Any, Dict, List, Optional
+
+from trading_bot.aio.exchange import AsyncExchange
+from trading_bot.execution.ccxt_executor import CCXTExecutor
+from trading_bot.models.data_models import Order
+
+class AsyncCCXTExecutor(CCXTExecutor):
+    """
+    Awaitable counterpart of CCXTExecutor.
+
+    Order validation, precision handling and logging are shared with
+    CCXTExecutor; only the exchange requests are awaited.
+    """
+
+    def __init__(self, async_exchange: AsyncExchange, dry_run: bool = False):
+        """
+        Initialize the executor
+
+        Args:
+            async_exchange: AsyncExchange used for all requests
+            dry_run: Whether to run in dry run mode
+        """
+        super().__init__(exchange=async_exchange, dry_run=dry_run)
+
+    async def place_order(self, order: Order) -> Dict[str, Any]:
+        """
+        Place an order on the exchange
+
+        Args:
+            order: Order to place
+
+        Returns:
+            Order response from the exchange
+        """
+        return await self.execute_order(order)
+
+    async def execute_order(self, order: Order) -> Dict:
+        """
+        Execute an order on the exchange
+
+        Args:
+            order: Order object with details
+
+        Returns:
+            Dictionary with order information
+        """
+        try:
+            markets = await self.exchange.load_markets()
+            request = self._prepare_order(order, markets)
+            order_result = await self.exchange.create_order(**request)
+
+            self.logger.info(f"Order placed successfully: {order_result.get('id')}")
+            self.orders_logger.debug(f"Order response: {order_result}")
+            return order_result
+
+        except Exception as e:
+            self._log_order_error(order, e)
+            raise
+
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        """
+        Cancel an existing order
+
+        Args:
+            order_id: ID of the order to cancel
+            symbol: Symbol of the order
+
+        Returns:
+            True if cancelled successfully
+        """
+        if self.dry_run:
+            self.logger.info(f"DRY RUN: Cancelling order {order_id} (not actually cancelled)")
+            return True
+
+        try:
+            await self.exchange.cancel_order(order_id, symbol)
+            self.logger.info(f"Order {order_id} cancelled successfully")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error cancelling order {order_id}: {e}")
+            return False
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all open orders
+
+        Args:
+            symbol: Symbol to filter orders (optional)
+
+        Returns:
+            List of open orders
+        """
+        try:
+            if symbol:
+                orders = await self.exchange.fetch_open_orders(symbol)
+            else:
+                orders = await self.exchange.fetch_open_orders()
+            self.logger.debug(f"Retrieved {len(orders)} open orders")
+            return orders
+        except Exception as e:
+            self.logger.error(f"Error retrieving open orders: {e}")
+            raise
@@ -0,0 +1,157 @@
+# trading_bot/aio/position_tracker.py
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from trading_bot.aio.exchange import AsyncExchange
+from trading_bot.aio.threads import run_in_thread
+from trading_bot.models.data_models import PositionTracker
+from trading_bot.utils.symbol_utils import normalize_symbol
+
+if TYPE_CHECKING:
+    from trading_bot.data.history_store import TradeHistoryStore
+    from trading_bot.data.trade_ledger import TradeLedger
+
+QUOTE_CURRENCIES = ('USDT', 'USD', 'BUSD', 'USDC')
+
+class _PrefetchedExchange:
+    """
+    Serves the responses gathered by AsyncPositionTracker to the
+    synchronous PositionTracker.update_positions without further I/O
+    """
+
+    def __init__(self, exchange_id: str, positions: Optional[List[Dict[str, Any]]],
+                 balance: Dict[str, Any], tickers: Dict[str, Any], trades: Dict[str, List[Dict[str, Any]]]):
+        self.id = exchange_id
+        self._positions = positions
+        self._balance = balance
+        self._tickers = tickers
+        self._trades = trades
+
+    def fetch_positions(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        return self._positions or []
+
+    def fetch_balance(self, *args, **kwargs) -> Dict[str, Any]:
+        return self._balance
+
+    def fetch_ticker(self, symbol: str, *args, **kwargs) -> Dict[str, Any]:
+        if symbol not in self._tickers:
+            import ccxt
+            raise ccxt.BadSymbol(f"No ticker fetched for {symbol}")
+        return self._tickers[symbol]
+
+    def fetch_my_trades(self, symbol: str, *args, **kwargs) -> List[Dict[str, Any]]:
+        return list(self._trades.get(symbol, []))
+
+class AsyncPositionTracker(PositionTracker):
+    """
+    PositionTracker whose refresh gathers all exchange data concurrently.
+
+    update_positions_async fetches positions and balances together, then
+    the tickers (and, for newly seen holdings, the recent trades) of every
+    held currency at once, and finally runs the regular
+    PositionTracker.update_positions against those responses. Synchronous
+    callers keep using the inherited API through ``exchange``.
+    """
+
+    def __init__(self, exchange, async_exchange: AsyncExchange, max_closed_positions: int = 100,
+                 flush_interval: float = 5.0, compact_after: int = 1000,
+                 history: Optional['TradeHistoryStore'] = None, reconcile_interval: float = 0,
+                 ledger: Optional['TradeLedger'] = None):
+        """
+        Initialize the position tracker
+
+        Args:
+            exchange: Blocking exchange facade for synchronous callers
+            async_exchange: AsyncExchange used for concurrent refreshes
+            max_closed_positions: Number of closed positions kept in memory and on disk
+            flush_interval: Seconds a position update may wait before positions.json is rewritten
+            compact_after: Opened and closed positions logged before positions.json is rewritten
+            history: Store receiving every opened, updated and closed position
+            reconcile_interval: Seconds between reconciliations with the exchange's balances
+            ledger: Trade ledger giving the cost basis of holdings found on the exchange
+        """
+        super().__init__(exchange, max_closed_positions=max_closed_positions,
+                         flush_interval=flush_interval, compact_after=compact_after,
+                         history=history, reconcile_interval=reconcile_interval, ledger=ledger)
+        self.async_exchange = async_exchange
+
+    async def _gather_optional(self, method: str, *args, **kwargs) -> Any:
+        try:
+            return await self.async_exchange.call(method, *args, **kwargs)
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"{method}{args} failed during position refresh: {e}")
+            return e
+
+    async def update_positions_async(self) -> None:
+        """Refresh positions from the exchange, issuing requests concurrently"""
+        if not self._should_update():
+            return
+        if not self._reconcile_due():
+            # Positions follow fills in between: refresh prices only
+            symbols = list(self._positions)
+            responses = await asyncio.gather(*(self._gather_optional('fetch_ticker', symbol) for symbol in symbols))
+            tickers = {
+                symbol: response for symbol, response in zip(symbols, responses)
+                if not isinstance(response, Exception)
+            }
+            await run_in_thread(self._refresh_prices, tickers)
+            return
+
+        has_positions = bool(getattr(self.async_exchange, 'has', {}).get('fetchPositions'))
+        positions_task = self._gather_optional('fetch_positions') if has_positions else None
+        balance_task = self._gather_optional('fetch_balance')
+        if positions_task is not None:
+            positions, balance = await asyncio.gather(positions_task, balance_task)
+        else:
+            positions, balance = None, await balance_task
+
+        if isinstance(positions, Exception):
+            positions = None
+        if isinstance(balance, Exception):
+            balance = {}
+
+        # Tickers for every held non-quote currency, trades only for holdings not yet tracked
+        symbols = []
+        for currency, data in balance.items():
+            if currency in QUOTE_CURRENCIES or not isinstance(data, dict):
+                continue
+            try:
+                if float(data.get('free') or 0) > 0:
+                    symbols.append(f"{currency}/USDT")
+            except (TypeError, ValueError):
+                continue
+        known = set(self._positions)
+        # The trade ledger fetches its own trades, incrementally
+        new_symbols = [] if self.ledger is not None else [
+            symbol for symbol in symbols if normalize_symbol(symbol) not in known
+        ]
+
+        responses = await asyncio.gather(
+            *(self._gather_optional('fetch_ticker', symbol) for symbol in symbols),
+            *(self._gather_optional('fetch_my_trades', symbol, limit=20) for symbol in new_symbols),
+        )
+        tickers = {
+            symbol: response for symbol, response in zip(symbols, responses[:len(symbols)])
+            if not isinstance(response, Exception)
+        }
+        trades = {
+            symbol: response for symbol, response in zip(new_symbols, responses[len(symbols):])
+            if not isinstance(response, Exception)
+        }
+
+        prefetched = _PrefetchedExchange(
+            getattr(self.async_exchange, 'id', 'unknown'), positions, balance, tickers, trades
+        )
+        # Applied on a worker thread: the tracker's lock may be held by a thread
+        # that is itself waiting on this event loop
+        await run_in_thread(self._apply_prefetched, prefetched)
+
+    def _apply_prefetched(self, prefetched: _PrefetchedExchange) -> None:
+        with self._lock:
+            live_exchange = self.exchange
+            self.exchange = prefetched
+            try:
+                self.update_positions()
+            finally:
+                self.exchange = live_exchange
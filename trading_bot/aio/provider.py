@@ -0,0 +1,112 @@
+# trading_bot/aio/provider.py
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+from trading_bot.aio.exchange import AsyncExchange
+from trading_bot.data.providers.ccxt_provider import CCXTProvider
+
+class AsyncCCXTProvider(CCXTProvider):
+    """
+    Awaitable counterpart of CCXTProvider.
+
+    Exposes the same data methods as coroutines backed by an AsyncExchange.
+    Response parsing and logging are shared with CCXTProvider.
+    """
+
+    def __init__(self, async_exchange: AsyncExchange, exchange_id: Optional[str] = None):
+        """
+        Initialize the provider
+
+        Args:
+            async_exchange: AsyncExchange used for all requests
+            exchange_id: Exchange ID used in log messages
+        """
+        self.async_exchange = async_exchange
+        self.exchange = async_exchange
+        self.exchange_id = exchange_id or getattr(async_exchange, 'id', 'unknown')
+        self.logger = logging.getLogger(__name__)
+
+    async def get_historical_data(self,
+                                  symbol: str,
+                                  timeframe: str = '1m',
+                                  since: Optional[Union[datetime, int]] = None,
+                                  limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Retrieve historical OHLCV data from the exchange
+
+        Args:
+            symbol: Trading pair symbol (e.g. 'ETH/USDT')
+            timeframe: Data timeframe (e.g. '1m', '5m', '1h')
+            since: Starting time for data retrieval
+            limit: Maximum number of candles to retrieve
+
+        Returns:
+            DataFrame with columns: timestamp, open, high, low, close, volume
+        """
+        if since is not None and isinstance(since, datetime):
+            since = int(since.timestamp() * 1000)
+        if limit is None:
+            limit = 500
+
+        try:
+            ohlcv = await self.async_exchange.fetch_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=limit
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving historical data for {symbol}: {e}")
+            raise
+        return self._to_dataframe(ohlcv, symbol, timeframe, limit)
+
+    async def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get current ticker data for a symbol
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Dictionary with ticker data
+        """
+        try:
+            return await self.async_exchange.fetch_ticker(symbol)
+        except Exception as e:
+            self.logger.error(f"Error retrieving ticker for {symbol}: {e}")
+            raise
+
+    async def get_balance(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get account balances
+
+        Returns:
+            Dictionary of currencies and their balances
+        """
+        try:
+            balance = await self.async_exchange.fetch_balance()
+        except Exception as e:
+            self.logger.error(f"Error retrieving balances: {e}")
+            raise
+        return {k: v for k, v in balance.items() if isinstance(v, dict) and 'free' in v}
+
+    async def get_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, List]:
+        """
+        Get the order book for a symbol
+
+        Args:
+            symbol: Trading pair symbol
+            limit: Depth of the order book
+
+        Returns:
+            Dictionary with 'bids' and 'asks'
+        """
+        params = {'limit': limit} if limit else {}
+        try:
+            return await self.async_exchange.fetch_order_book(symbol, params=params)
+        except Exception as e:
+            self.logger.error(f"Error retrieving order book for {symbol}: {e}")
+            raise
@@ -0,0 +1,21 @@
+# trading_bot/aio/threads.py
+import asyncio
+import functools
+from typing import Any, Callable
+
+async def run_in_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable on the event loop's default executor
+
+    Equivalent to asyncio.to_thread, which needs Python 3.9.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
@@ -4,6 +4,8 @@ import numpy as np
 import logging
 from typing import Optional, Dict, Any, List
 
+logger = logging.getLogger("indicators")
+
 def sma(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
     """
     Calculate Simple Moving Average
@@ -16,15 +18,14 @@ def sma(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
     Returns:
         Series with SMA values
     """
-    logger = logging.getLogger("indicators")
-    logger.debug(f"Calculating SMA with period={period} on column='{column}', data shape: {data.shape}")
-    
     result = data[column].rolling(window=period).mean()
     
-    # Log diagnostic info
-    null_count = result.isnull().sum()
-    logger.debug(f"SMA period={period} results: {null_count} NaN values ({null_count/len(result)*100:.2f}%), " 
-                f"range: {result.min():.6f} - {result.max():.6f}")
+    # Log diagnostic info; the statistics scan the whole series, so only when enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        null_count = result.isnull().sum()
+        logger.debug(f"SMA period={period} on column='{column}', data shape: {data.shape}: "
+                     f"{null_count} NaN values ({null_count/len(result)*100:.2f}%), "
+                     f"range: {result.min():.6f} - {result.max():.6f}")
     
     return result
 
@@ -40,15 +41,14 @@ def ema(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
     Returns:
         Series with EMA values
     """
-    logger = logging.getLogger("indicators")
-    logger.debug(f"Calculating EMA with period={period} on column='{column}', data shape: {data.shape}")
-    
     result = data[column].ewm(span=period, adjust=False).mean()
     
-    # Log diagnostic info
-    null_count = result.isnull().sum()
-    logger.debug(f"EMA period={period} results: {null_count} NaN values ({null_count/len(result)*100:.2f}%), " 
-                f"range: {result.min():.6f} - {result.max():.6f}")
+    # Log diagnostic info; the statistics scan the whole series, so only when enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        null_count = result.isnull().sum()
+        logger.debug(f"EMA period={period} on column='{column}', data shape: {data.shape}: "
+                     f"{null_count} NaN values ({null_count/len(result)*100:.2f}%), "
+                     f"range: {result.min():.6f} - {result.max():.6f}")
     
     return result
 
@@ -64,11 +64,12 @@ def calculate_indicators(data: pd.DataFrame, indicators_config: List[Dict[str, A
         DataFrame with added indicators
     """
     df = data.copy()
-    logger = logging.getLogger("indicators")
+    debug = logger.isEnabledFor(logging.DEBUG)
     
-    logger.debug(f"Calculating indicators with input data shape: {data.shape}")
-    logger.debug(f"Input columns: {data.columns.tolist()}")
-    logger.debug(f"Indicator configurations: {indicators_config}")
+    if debug:
+        logger.debug(f"Calculating indicators with input data shape: {data.shape}")
+        logger.debug(f"Input columns: {data.columns.tolist()}")
+        logger.debug(f"Indicator configurations: {indicators_config}")
     
     # Map of indicator names to functions
     indicator_functions = {
@@ -82,7 +83,8 @@ def calculate_indicators(data: pd.DataFrame, indicators_config: List[Dict[str, A
         params = config.get('params', {})
         output_column = config.get('output_column')
         
-        logger.debug(f"Calculating {name} with params: {params}")
+        if debug:
+            logger.debug(f"Calculating {name} with params: {params}")
         
         if name in indicator_functions:
             if output_column is None:
@@ -93,8 +95,8 @@ def calculate_indicators(data: pd.DataFrame, indicators_config: List[Dict[str, A
             df[output_column] = indicator_functions[name](df, **params)
             
             # Log sample results
-            logger.debug(f"{name} calculation for {output_column} completed.")
-            if len(df) > 3:
+            if debug and len(df) > 3:
+                logger.debug(f"{name} calculation for {output_column} completed.")
                 sample = df[[output_column]].tail(3)
                 logger.debug(f"Sample values (last 3 rows):\n{sample.to_dict('records')}")
         else:
@@ -102,5 +104,6 @@ def calculate_indicators(data: pd.DataFrame, indicators_config: List[Dict[str, A
             logger.error(error_msg)
             raise ValueError(error_msg)
     
-    logger.debug(f"Indicators calculation complete. Output columns: {df.columns.tolist()}")
+    if debug:
+        logger.debug(f"Indicators calculation complete. Output columns: {df.columns.tolist()}")
     return df
\ No newline at end of file
@@ -0,0 +1,192 @@
+# trading_bot/data/candle_store.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+_CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+def encode_candles(candles: pd.DataFrame) -> bytes:
+    """
+    Pack a get_historical_data DataFrame into float64 rows of
+    [timestamp ms, open, high, low, close, volume]
+
+    Args:
+        candles: DataFrame with timestamp, open, high, low, close and volume columns
+
+    Returns:
+        Packed rows
+    """
+    rows = np.empty((len(candles), len(_CANDLE_COLUMNS)), dtype='<f8')
+    rows[:, 0] = candles['timestamp'].to_numpy(dtype='datetime64[ms]').astype('int64')
+    rows[:, 1:] = candles[_CANDLE_COLUMNS[1:]].to_numpy(dtype='float64')
+    return rows.tobytes()
+
+def decode_candles(data: bytes, symbol: str) -> pd.DataFrame:
+    """
+    Unpack rows produced by encode_candles
+
+    Args:
+        data: Packed rows
+        symbol: Trading pair symbol
+
+    Returns:
+        DataFrame in the get_historical_data layout
+    """
+    rows = np.frombuffer(data, dtype='<f8').reshape(-1, len(_CANDLE_COLUMNS))
+    candles = pd.DataFrame(rows[:, 1:].copy(), columns=_CANDLE_COLUMNS[1:])
+    candles.insert(0, 'timestamp', pd.to_datetime(rows[:, 0].astype('int64'), unit='ms'))
+    candles['symbol'] = symbol
+    return candles
+
+class CandleStore:
+    """
+    Bounded in-memory buffer of recent candles per (symbol, timeframe).
+
+    Each buffer keeps at most ``max_candles`` rows and the store keeps at most
+    ``max_series`` buffers, evicting the least recently updated one first, so
+    a long-running process holds a flat memory footprint.
+    """
+
+    def __init__(self, max_candles: int = 1000, max_series: Optional[int] = None):
+        """
+        Initialize the candle store
+
+        Args:
+            max_candles: Maximum number of candles kept per (symbol, timeframe)
+            max_series: Maximum number of (symbol, timeframe) buffers (None = unbounded)
+        """
+        if max_candles <= 0:
+            raise ValueError(f"max_candles must be positive, got {max_candles}")
+        self.max_candles = max_candles
+        self.max_series = max_series
+        self.logger = logging.getLogger(__name__)
+        self._buffers: "OrderedDict[Tuple[str, str], pd.DataFrame]" = OrderedDict()
+        # Symbols may be fetched and merged from several worker threads
+        self._lock = threading.Lock()
+
+    def update(self, symbol: str, timeframe: str, candles: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge new candles into the buffer for a symbol and timeframe
+
+        Candles with a timestamp already in the buffer replace the stored row,
+        so a still-forming candle is refreshed on every fetch.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe (e.g. '1m', '1h')
+            candles: DataFrame in the layout returned by get_historical_data
+
+        Returns:
+            The merged, trimmed buffer
+        """
+        key = (symbol, timeframe)
+        with self._lock:
+            existing = self._buffers.get(key)
+
+        # Merge outside the lock so different symbols can merge concurrently
+        if existing is None or existing.empty:
+            merged = candles
+        elif candles.empty:
+            merged = existing
+        else:
+            merged = pd.concat([existing, candles], ignore_index=True)
+            merged = merged.drop_duplicates(subset='timestamp', keep='last')
+            merged = merged.sort_values('timestamp', kind='stable')
+
+        if len(merged) > self.max_candles:
+            merged = merged.iloc[-self.max_candles:]
+        merged = merged.reset_index(drop=True)
+
+        with self._lock:
+            self._buffers.pop(key, None)
+            self._buffers[key] = merged
+
+            # Evict least recently updated buffers beyond the configured bound
+            while self.max_series is not None and len(self._buffers) > self.max_series:
+                evicted_key, _ = self._buffers.popitem(last=False)
+                self.logger.debug(f"Evicted candle buffer for {evicted_key[0]} ({evicted_key[1]})")
+
+        return merged
+
+    def get(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Get the buffered candles for a symbol and timeframe
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            DataFrame of buffered candles or None if nothing is buffered
+        """
+        with self._lock:
+            return self._buffers.get((symbol, timeframe))
+
+    def remove(self, symbol: str, timeframe: str) -> None:
+        """Drop the buffer for a symbol and timeframe"""
+        with self._lock:
+            self._buffers.pop((symbol, timeframe), None)
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """Get all buffered (symbol, timeframe) keys"""
+        with self._lock:
+            return list(self._buffers.keys())
+
+    def snapshot(self) -> Dict[str, Dict[str, bytes]]:
+        """
+        Pack every buffer, e.g. for a warm-state snapshot
+
+        Returns:
+            Candles packed by encode_candles per symbol and timeframe
+        """
+        with self._lock:
+            buffers = list(self._buffers.items())
+        packed: Dict[str, Dict[str, bytes]] = {}
+        for (symbol, timeframe), candles in buffers:
+            packed.setdefault(symbol, {})[timeframe] = encode_candles(candles)
+        return packed
+
+    def restore(self, packed: Dict[str, Dict[str, bytes]]) -> int:
+        """
+        Merge buffers packed by snapshot() into the store
+
+        Args:
+            packed: Packed candles per symbol and timeframe
+
+        Returns:
+            Number of buffers restored
+        """
+        count = 0
+        for symbol, series in packed.items():
+            for timeframe, data in series.items():
+                self.update(symbol, timeframe, decode_candles(data, symbol))
+                count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report the size of the buffered candles
+
+        Returns:
+            Dictionary with the number of series, total rows and bytes held
+        """
+        with self._lock:
+            buffers = list(self._buffers.values())
+        rows = 0
+        nbytes = 0
+        for df in buffers:
+            rows += len(df)
+            nbytes += int(df.memory_usage(deep=True).sum())
+        return {
+            'series': len(buffers),
+            'rows': rows,
+            'bytes': nbytes,
+            'max_candles': self.max_candles,
+        }
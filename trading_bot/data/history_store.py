@@ -0,0 +1,452 @@
+# trading_bot/data/history_store.py
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from trading_bot.models.data_models import Position
+from trading_bot.utils.clock import get_clock
+
+logger = logging.getLogger(__name__)
+
+# Times are stored as seconds since the epoch
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS open_positions (
+    symbol TEXT PRIMARY KEY,
+    side TEXT NOT NULL,
+    amount REAL NOT NULL,
+    entry_price REAL NOT NULL,
+    current_price REAL NOT NULL,
+    max_price REAL NOT NULL,
+    min_price REAL NOT NULL,
+    entry_time REAL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS closed_positions (
+    id INTEGER PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    amount REAL NOT NULL,
+    entry_price REAL NOT NULL,
+    exit_price REAL NOT NULL,
+    max_price REAL NOT NULL,
+    min_price REAL NOT NULL,
+    entry_time REAL,
+    exit_time REAL NOT NULL,
+    pnl REAL NOT NULL,
+    return_pct REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS closed_positions_symbol_time ON closed_positions (symbol, exit_time);
+CREATE INDEX IF NOT EXISTS closed_positions_time ON closed_positions (exit_time);
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    order_id TEXT,
+    symbol TEXT NOT NULL,
+    side TEXT,
+    type TEXT,
+    amount REAL,
+    price REAL,
+    filled REAL,
+    average REAL,
+    status TEXT,
+    reason TEXT,
+    strategy TEXT,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_symbol_time ON orders (symbol, time);
+CREATE INDEX IF NOT EXISTS orders_time ON orders (time);
+CREATE INDEX IF NOT EXISTS orders_order_id ON orders (order_id);
+CREATE TABLE IF NOT EXISTS fills (
+    id INTEGER PRIMARY KEY,
+    trade_id TEXT,
+    order_id TEXT,
+    symbol TEXT NOT NULL,
+    side TEXT,
+    amount REAL NOT NULL,
+    price REAL NOT NULL,
+    cost REAL,
+    fee REAL,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fills_symbol_time ON fills (symbol, time);
+CREATE INDEX IF NOT EXISTS fills_time ON fills (time);
+CREATE INDEX IF NOT EXISTS fills_order_id ON fills (order_id);
+"""
+
+_UPSERT_OPEN = (
+    "INSERT OR REPLACE INTO open_positions "
+    "(symbol, side, amount, entry_price, current_price, max_price, min_price, entry_time, updated) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_DELETE_OPEN = "DELETE FROM open_positions WHERE symbol = ?"
+_INSERT_CLOSED = (
+    "INSERT INTO closed_positions "
+    "(symbol, side, amount, entry_price, exit_price, max_price, min_price, entry_time, exit_time, pnl, return_pct) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_ORDER = (
+    "INSERT INTO orders (order_id, symbol, side, type, amount, price, filled, average, status, reason, strategy, time) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_FILL = (
+    "INSERT INTO fills (trade_id, order_id, symbol, side, amount, price, cost, fee, time) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def _where(symbol: Optional[str], since: Optional[float], time_column: str) -> Tuple[str, List[Any]]:
+    clauses, params = [], []
+    if symbol is not None:
+        clauses.append("symbol = ?")
+        params.append(symbol)
+    if since is not None:
+        clauses.append(f"{time_column} >= ?")
+        params.append(since)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+class TradeHistoryStore:
+    """
+    Durable history of positions, orders and fills in an SQLite database.
+
+    The database runs in WAL mode, so queries read a consistent state while
+    the writer appends. Writes are queued by the trading thread and
+    committed by a background thread in one transaction per batch: once
+    batch_size writes are queued or flush_interval seconds after the first
+    one. Unlike the bounded closed position list of PositionTracker, the
+    history grows without limit and is read through the query methods.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 1.0):
+        """
+        Open or create the database
+
+        Args:
+            path: SQLite database file
+            batch_size: Queued writes that trigger a commit
+            flush_interval: Seconds a queued write may wait for its commit
+        """
+        self.path = os.path.abspath(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            connection.commit()
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[str, tuple]] = []
+        self._pending_since: Optional[float] = None
+        self._queued = 0  # Writes queued since opening
+        self._written = 0  # Writes committed or dropped since opening
+        self._closing = False
+        self._stats = {'batches': 0, 'writes': 0, 'errors': 0}
+        self._thread = threading.Thread(target=self._run, name="history-store", daemon=True)
+        self._thread.start()
+
+    def _queue(self, statement: str, params: tuple) -> None:
+        with self._cond:
+            if self._closing:
+                logger.warning("Trade history store is closed, dropping write")
+                return
+            self._pending.append((statement, params))
+            self._queued += 1
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+                self._cond.notify_all()
+            elif len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def record_open(self, position: Position) -> None:
+        """
+        Insert or refresh an open position
+
+        Args:
+            position: Open position
+        """
+        self._queue(_UPSERT_OPEN, (
+            position.symbol, position.side, position.amount, position.entry_price, position.current_price,
+            position.max_price, position.min_price, _epoch(position.entry_time), get_clock().time()
+        ))
+
+    def record_close(self, position: Position) -> None:
+        """
+        Move a position to the closed positions, exiting at its current price
+
+        Args:
+            position: Closed position, whose realized PnL includes its exit
+        """
+        self._queue(_DELETE_OPEN, (position.symbol,))
+        self._queue(_INSERT_CLOSED, (
+            position.symbol, position.side, position.amount, position.entry_price, position.current_price,
+            position.max_price, position.min_price, _epoch(position.entry_time), get_clock().time(),
+            position.realized_pnl, position.profit_percentage
+        ))
+
+    def record_order(self, order: Dict[str, Any], reason: Optional[str] = None,
+                     strategy: Optional[str] = None) -> None:
+        """
+        Record an order placed on the exchange
+
+        Args:
+            order: Order response from the exchange
+            reason: Why the order was placed (e.g. a signal type or max_drawdown)
+            strategy: Strategy whose signal placed the order
+        """
+        timestamp = order.get('timestamp')
+        self._queue(_INSERT_ORDER, (
+            str(order['id']) if order.get('id') is not None else None,
+            order.get('symbol', 'unknown'), order.get('side'), order.get('type'),
+            _float(order.get('amount')), _float(order.get('price')),
+            _float(order.get('filled')), _float(order.get('average')), order.get('status'),
+            reason, strategy,
+            timestamp / 1000 if timestamp else get_clock().time()
+        ))
+
+    def record_fill(self, trade: Dict[str, Any], order: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a fill (trade) of an order
+
+        Args:
+            trade: Trade with amount and price, in the exchange's trade format
+            order: Order the trade filled, used for missing trade fields
+        """
+        order = order or {}
+        fee = trade.get('fee')
+        timestamp = trade.get('timestamp')
+        order_id = trade.get('order', order.get('id'))
+        self._queue(_INSERT_FILL, (
+            str(trade['id']) if trade.get('id') is not None else None,
+            str(order_id) if order_id is not None else None,
+            trade.get('symbol', order.get('symbol', 'unknown')), trade.get('side', order.get('side')),
+            float(trade['amount']), float(trade['price']), _float(trade.get('cost')),
+            _float(fee.get('cost')) if isinstance(fee, dict) else _float(fee),
+            timestamp / 1000 if timestamp else get_clock().time()
+        ))
+
+    def _run(self) -> None:
+        connection = sqlite3.connect(self.path)
+        # Durable across process crashes; a power loss can drop the last commits
+        connection.execute("PRAGMA synchronous=NORMAL")
+        try:
+            while True:
+                with self._cond:
+                    while not self._closing:
+                        if self._pending_since is not None:
+                            remaining = self._pending_since + self.flush_interval - time.monotonic()
+                            if remaining <= 0 or len(self._pending) >= self.batch_size:
+                                break
+                            self._cond.wait(remaining)
+                        else:
+                            self._cond.wait()
+                    closing = self._closing
+                    batch, self._pending = self._pending, []
+                    self._pending_since = None
+                if batch:
+                    self._commit(connection, batch)
+                with self._cond:
+                    self._written += len(batch)
+                    self._cond.notify_all()
+                if closing and not self._pending:
+                    return
+        finally:
+            connection.close()
+
+    def _commit(self, connection: sqlite3.Connection, batch: List[Tuple[str, tuple]]) -> None:
+        try:
+            with connection:
+                for statement, params in batch:
+                    connection.execute(statement, params)
+            self._stats['batches'] += 1
+            self._stats['writes'] += len(batch)
+        except sqlite3.Error as e:
+            self._stats['errors'] += 1
+            logger.error(f"Error writing {len(batch)} records to trade history {self.path}: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commit the queued writes and wait for them
+
+        Args:
+            timeout: Seconds to wait (default: no limit)
+
+        Returns:
+            True if everything queued before the call was committed
+        """
+        with self._cond:
+            target = self._queued
+            if self._written >= target:
+                return True
+            # Due now
+            self._pending_since = time.monotonic() - self.flush_interval
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout)
+
+    def _query(self, sql: str, params: List[Any]) -> List[sqlite3.Row]:
+        with closing(sqlite3.connect(self.path)) as connection:
+            connection.row_factory = sqlite3.Row
+            return connection.execute(sql, params).fetchall()
+
+    def get_open_positions(self) -> List[Position]:
+        """
+        Get the open positions as last recorded
+
+        Returns:
+            List of Position objects ordered by symbol
+        """
+        rows = self._query("SELECT * FROM open_positions ORDER BY symbol", [])
+        return [Position(
+            symbol=row['symbol'], side=row['side'], amount=row['amount'], entry_price=row['entry_price'],
+            current_price=row['current_price'], max_price=row['max_price'], min_price=row['min_price'],
+            entry_time=datetime.fromtimestamp(row['entry_time']) if row['entry_time'] is not None else None
+        ) for row in rows]
+
+    def get_closed_positions(self, symbol: Optional[str] = None, since: Optional[float] = None,
+                             limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get closed positions, most recent first
+
+        Args:
+            symbol: Only positions of this symbol
+            since: Only positions closed at or after this time (seconds since the epoch)
+            limit: Maximum number of positions returned
+
+        Returns:
+            List of dictionaries with the closed_positions columns
+        """
+        where, params = _where(symbol, since, 'exit_time')
+        rows = self._query(f"SELECT * FROM closed_positions{where} ORDER BY exit_time DESC LIMIT ?", params + [limit])
+        return [dict(row) for row in rows]
+
+    def get_orders(self, symbol: Optional[str] = None, since: Optional[float] = None,
+                   limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get recorded orders, most recent first
+
+        Args:
+            symbol: Only orders of this symbol
+            since: Only orders placed at or after this time (seconds since the epoch)
+            limit: Maximum number of orders returned
+
+        Returns:
+            List of dictionaries with the orders columns
+        """
+        where, params = _where(symbol, since, 'time')
+        rows = self._query(f"SELECT * FROM orders{where} ORDER BY time DESC LIMIT ?", params + [limit])
+        return [dict(row) for row in rows]
+
+    def get_fills(self, symbol: Optional[str] = None, since: Optional[float] = None,
+                  limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get recorded fills, most recent first
+
+        Args:
+            symbol: Only fills of this symbol
+            since: Only fills at or after this time (seconds since the epoch)
+            limit: Maximum number of fills returned
+
+        Returns:
+            List of dictionaries with the fills columns
+        """
+        where, params = _where(symbol, since, 'time')
+        rows = self._query(f"SELECT * FROM fills{where} ORDER BY time DESC LIMIT ?", params + [limit])
+        return [dict(row) for row in rows]
+
+    def pnl_by_symbol(self, since: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize realized PnL of closed positions per symbol
+
+        Args:
+            since: Only positions closed at or after this time (seconds since the epoch)
+
+        Returns:
+            Dictionary of symbol -> {'trades', 'wins', 'pnl', 'avg_return',
+            'best_return', 'worst_return'}, returns as decimals
+        """
+        where, params = _where(None, since, 'exit_time')
+        rows = self._query(
+            "SELECT symbol, COUNT(*) AS trades, SUM(pnl > 0) AS wins, SUM(pnl) AS pnl, "
+            "AVG(return_pct) AS avg_return, MAX(return_pct) AS best_return, MIN(return_pct) AS worst_return "
+            f"FROM closed_positions{where} GROUP BY symbol ORDER BY symbol",
+            params
+        )
+        return {row['symbol']: {key: row[key] for key in row.keys() if key != 'symbol'} for row in rows}
+
+    def drawdown_stats(self, symbol: Optional[str] = None, since: Optional[float] = None) -> Dict[str, float]:
+        """
+        Drawdown statistics of closed positions
+
+        Args:
+            symbol: Only positions of this symbol
+            since: Only positions closed at or after this time (seconds since the epoch)
+
+        Returns:
+            Dictionary with:
+            - positions: Number of closed positions
+            - max_drawdown: Largest peak-to-trough fall of the cumulative
+              realized PnL, in quote currency
+            - avg_exit_drawdown, worst_exit_drawdown: Fall from the best
+              price of a position to its exit price, as decimals
+            - avg_adverse_excursion, worst_adverse_excursion: Worst price of
+              a position against its entry price, as decimals
+        """
+        where, params = _where(symbol, since, 'exit_time')
+        rows = self._query(
+            "SELECT pnl, "
+            "CASE WHEN side = 'long' THEN (max_price - exit_price) / max_price "
+            "ELSE (exit_price - min_price) / min_price END AS exit_drawdown, "
+            "CASE WHEN side = 'long' THEN (entry_price - min_price) / entry_price "
+            "ELSE (max_price - entry_price) / entry_price END AS adverse_excursion "
+            f"FROM closed_positions{where} ORDER BY exit_time",
+            params
+        )
+        cumulative = peak = max_drawdown = 0.0
+        exit_drawdowns, excursions = [], []
+        for row in rows:
+            cumulative += row['pnl']
+            peak = max(peak, cumulative)
+            max_drawdown = max(max_drawdown, peak - cumulative)
+            if row['exit_drawdown'] is not None:
+                exit_drawdowns.append(row['exit_drawdown'])
+            if row['adverse_excursion'] is not None:
+                excursions.append(row['adverse_excursion'])
+        return {
+            'positions': len(rows),
+            'max_drawdown': max_drawdown,
+            'avg_exit_drawdown': sum(exit_drawdowns) / len(exit_drawdowns) if exit_drawdowns else 0.0,
+            'worst_exit_drawdown': max(exit_drawdowns, default=0.0),
+            'avg_adverse_excursion': sum(excursions) / len(excursions) if excursions else 0.0,
+            'worst_adverse_excursion': max(excursions, default=0.0),
+        }
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get writer counters
+
+        Returns:
+            Dictionary with batches and writes committed, failed batches and
+            writes still queued
+        """
+        with self._cond:
+            return dict(self._stats, pending=len(self._pending))
+
+    def close(self) -> None:
+        """Commit the queued writes and stop the writer"""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
@@ -1,5 +1,4 @@
 # trading_bot/data/providers/ccxt_provider.py
-import ccxt
 import pandas as pd
 import logging
 from typing import Dict, List, Any, Optional, Union
@@ -17,7 +16,10 @@ class CCXTProvider(DataProvider):
                 exchange_id: str, 
                 api_key: Optional[str] = None, 
                 secret: Optional[str] = None, 
-                params: Optional[Dict[str, Any]] = None):
+                params: Optional[Dict[str, Any]] = None,
+                exchange=None,
+                markets: Optional[Dict[str, Any]] = None,
+                currencies: Optional[Dict[str, Any]] = None):
         """
         Initialize the CCXT exchange connection
         
@@ -26,10 +28,58 @@ class CCXTProvider(DataProvider):
             api_key: API key for authenticated requests
             secret: API secret for authenticated requests
             params: Additional parameters for the exchange
+            exchange: Optional pre-built exchange object with the ccxt API
+                (e.g. a SimulatedExchange); used instead of creating one
+            markets: Optional markets saved from an earlier load_markets()
+                (e.g. a warm-state snapshot); skips loading them again
+            currencies: Currencies saved along with markets
         """
         self.exchange_id = exchange_id
         self.logger = logging.getLogger(__name__)
         
+        if exchange is not None:
+            self.exchange = exchange
+            self._load_markets(markets, currencies)
+            self.logger.info(f"Using provided exchange instance {getattr(exchange, 'id', exchange_id)}")
+            return
+        
+        try:
+            self.exchange = self.create_exchange(exchange_id, api_key, secret, params)
+            self.logger.info(f"Initialized connection to {exchange_id}")
+            
+            # Load markets to get trading pairs info
+            self._load_markets(markets, currencies)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize {exchange_id}: {e}")
+            raise
+    
+    def _load_markets(self, markets: Optional[Dict[str, Any]], currencies: Optional[Dict[str, Any]]) -> None:
+        """Install saved markets when given and supported, otherwise load them from the exchange"""
+        if markets and hasattr(self.exchange, 'set_markets'):
+            self.exchange.set_markets(markets, currencies)
+            self.logger.info(f"Restored {len(markets)} saved markets for {self.exchange_id}")
+            return
+        self.exchange.load_markets()
+        self.logger.info(f"Loaded markets for {self.exchange_id}")
+    
+    @staticmethod
+    def create_exchange(exchange_id: str,
+                        api_key: Optional[str] = None,
+                        secret: Optional[str] = None,
+                        params: Optional[Dict[str, Any]] = None):
+        """
+        Create a ccxt exchange instance without loading markets
+        
+        Args:
+            exchange_id: CCXT exchange ID (e.g. 'bybit', 'binance')
+            api_key: API key for authenticated requests
+            secret: API secret for authenticated requests
+            params: Additional parameters for the exchange
+            
+        Returns:
+            CCXT exchange instance
+        """
         # Initialize exchange parameters
         exchange_params = {
             'enableRateLimit': True,  # Respect exchange rate limits
@@ -46,19 +96,12 @@ class CCXTProvider(DataProvider):
         if params:
             exchange_params.update(params)
         
-        # Create the exchange instance
-        try:
-            exchange_class = getattr(ccxt, exchange_id)
-            self.exchange = exchange_class(exchange_params)
-            self.logger.info(f"Initialized connection to {exchange_id}")
-            
-            # Load markets to get trading pairs info
-            self.exchange.load_markets()
-            self.logger.info(f"Loaded markets for {exchange_id}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize {exchange_id}: {e}")
-            raise
+        # ccxt takes longer to import than the rest of the bot together, so
+        # runs on an injected exchange (simulation, worker nodes) never load it
+        import ccxt
+        
+        exchange_class = getattr(ccxt, exchange_id)
+        return exchange_class(exchange_params)
     
     def get_historical_data(self, 
                            symbol: str, 
@@ -97,43 +140,7 @@ class CCXTProvider(DataProvider):
                 limit=limit
             )
             
-            data_logger.debug(f"Retrieved {len(ohlcv)} raw data points for {symbol}")
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(
-                ohlcv, 
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Add symbol column
-            df['symbol'] = symbol
-            
-            # Log detailed information
-            self.logger.debug(f"Retrieved {len(df)} candles for {symbol} ({timeframe})")
-            
-            if not df.empty:
-                data_logger.debug(
-                    f"Data for {symbol} ({timeframe}):\n"
-                    f"  Time range: {df['timestamp'].min()} to {df['timestamp'].max()}\n"
-                    f"  Price range: {df['low'].min():.6f} - {df['high'].max():.6f}\n" 
-                    f"  Last 3 candles: {df[['timestamp', 'open', 'high', 'low', 'close']].tail(3).to_dict('records')}\n"
-                    f"  Missing data check: {df['timestamp'].diff().describe()}"
-                )
-                
-                # Check for potential data issues
-                if df['close'].isnull().any():
-                    data_logger.warning(f"NULL values detected in close prices for {symbol}")
-                
-                if len(df) < limit:
-                    data_logger.warning(f"Received fewer candles than requested for {symbol}: {len(df)}/{limit}")
-            
-            else:
-                data_logger.warning(f"Empty dataframe returned for {symbol}")
-                
-            return df
+            return self._to_dataframe(ohlcv, symbol, timeframe, limit)
             
         except Exception as e:
             self.logger.error(f"Error retrieving historical data for {symbol}: {e}")
@@ -144,6 +151,58 @@ class CCXTProvider(DataProvider):
                              f"  Params: timeframe={timeframe}, since={since}, limit={limit}")
             raise
     
+    def _to_dataframe(self, ohlcv: List[List[float]], symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """
+        Convert a ccxt OHLCV response to the get_historical_data layout
+        
+        Args:
+            ohlcv: Rows of [timestamp, open, high, low, close, volume]
+            symbol: Trading pair symbol
+            timeframe: Data timeframe
+            limit: Number of candles requested
+            
+        Returns:
+            DataFrame with columns: timestamp, open, high, low, close, volume, symbol
+        """
+        data_logger = logging.getLogger("data")
+        data_logger.debug(f"Retrieved {len(ohlcv)} raw data points for {symbol}")
+        
+        # Convert to DataFrame
+        df = pd.DataFrame(
+            ohlcv, 
+            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        )
+        
+        # Convert timestamp to datetime
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        # Add symbol column
+        df['symbol'] = symbol
+        
+        # Log detailed information
+        self.logger.debug(f"Retrieved {len(df)} candles for {symbol} ({timeframe})")
+        
+        if not df.empty:
+            data_logger.debug(
+                f"Data for {symbol} ({timeframe}):\n"
+                f"  Time range: {df['timestamp'].min()} to {df['timestamp'].max()}\n"
+                f"  Price range: {df['low'].min():.6f} - {df['high'].max():.6f}\n" 
+                f"  Last 3 candles: {df[['timestamp', 'open', 'high', 'low', 'close']].tail(3).to_dict('records')}\n"
+                f"  Missing data check: {df['timestamp'].diff().describe()}"
+            )
+            
+            # Check for potential data issues
+            if df['close'].isnull().any():
+                data_logger.warning(f"NULL values detected in close prices for {symbol}")
+            
+            if len(df) < limit:
+                data_logger.warning(f"Received fewer candles than requested for {symbol}: {len(df)}/{limit}")
+        
+        else:
+            data_logger.warning(f"Empty dataframe returned for {symbol}")
+            
+        return df
+    
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Get current ticker data for a symbol
@@ -0,0 +1,293 @@
+# trading_bot/data/synthetic.py
+import logging
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+TIMEFRAME_MS = {
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '1d': 86_400_000,
+}
+
+# Default market regimes as (drift per candle, volatility multiplier)
+DEFAULT_REGIMES: List[Tuple[float, float]] = [
+    (0.0, 1.0),       # Range-bound
+    (0.0004, 0.8),    # Trending up, calm
+    (-0.0006, 1.8),   # Trending down, volatile
+]
+
+# Probability of moving from regime i (row) to regime j (column) each candle
+DEFAULT_TRANSITIONS: List[List[float]] = [
+    [0.990, 0.006, 0.004],
+    [0.010, 0.988, 0.002],
+    [0.015, 0.005, 0.980],
+]
+
+class _GeneratorState:
+    """Per-symbol state carried between streamed batches"""
+
+    def __init__(self, n_symbols: int, n_baskets: int, start_prices: np.ndarray,
+                 variance: float, start_ms: int):
+        self.close = start_prices.astype(np.float64)
+        self.variance = np.full(n_symbols, variance)
+        self.last_shock = np.zeros(n_symbols)
+        self.regime = np.zeros(n_baskets, dtype=np.int64)
+        self.next_ms = start_ms
+
+class SyntheticMarketGenerator:
+    """
+    Deterministic generator of realistic OHLCV candles for many symbols.
+
+    Log returns follow a geometric Brownian motion whose drift and
+    volatility switch between Markov regimes, with GARCH(1,1) volatility
+    clustering, occasional price gaps between candles and correlated
+    shocks within baskets of symbols. All symbols are simulated together,
+    vectorized over the symbol axis, so thousands of symbols are cheap.
+
+    Output matches CCXTProvider.get_historical_data (DataFrames with
+    timestamp, open, high, low, close, volume, symbol) or the raw ccxt
+    OHLCV layout for the SimulatedExchange. The same seed always produces
+    the same candles.
+    """
+
+    def __init__(self,
+                 seed: int = 0,
+                 timeframe: str = '1m',
+                 start_ms: int = 1_700_000_000_000,
+                 volatility: float = 0.002,
+                 regimes: Optional[Sequence[Tuple[float, float]]] = None,
+                 transitions: Optional[Sequence[Sequence[float]]] = None,
+                 garch_alpha: float = 0.08,
+                 garch_beta: float = 0.90,
+                 gap_probability: float = 0.002,
+                 gap_volatility: float = 0.01,
+                 basket_correlation: float = 0.6,
+                 price_range: Tuple[float, float] = (0.1, 1000.0)):
+        """
+        Initialize the generator
+
+        Args:
+            seed: Random seed
+            timeframe: Candle timeframe
+            start_ms: Open time of the first candle in milliseconds
+            volatility: Long-run standard deviation of per-candle log returns
+            regimes: (drift, volatility multiplier) per regime
+            transitions: Regime transition matrix (rows sum to 1)
+            garch_alpha: GARCH reaction to the previous shock
+            garch_beta: GARCH persistence of the previous variance
+            gap_probability: Probability of a gap before each candle
+            gap_volatility: Standard deviation of gap log returns
+            basket_correlation: Correlation of shocks within a basket
+            price_range: Range start prices are drawn from (log-uniform)
+        """
+        if timeframe not in TIMEFRAME_MS:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+        if garch_alpha + garch_beta >= 1.0:
+            raise ValueError("garch_alpha + garch_beta must be below 1 for a stationary variance")
+        if not 0.0 <= basket_correlation < 1.0:
+            raise ValueError(f"basket_correlation must be in [0, 1), got {basket_correlation}")
+
+        self.seed = seed
+        self.timeframe = timeframe
+        self.timeframe_ms = TIMEFRAME_MS[timeframe]
+        self.start_ms = start_ms
+        self.volatility = volatility
+        self.regimes = np.asarray(regimes or DEFAULT_REGIMES, dtype=np.float64)
+        self.transitions = np.asarray(transitions or DEFAULT_TRANSITIONS, dtype=np.float64)
+        if self.transitions.shape != (len(self.regimes), len(self.regimes)):
+            raise ValueError("transitions must be a square matrix with one row per regime")
+        if not np.allclose(self.transitions.sum(axis=1), 1.0):
+            raise ValueError("Each row of transitions must sum to 1")
+        self.garch_alpha = garch_alpha
+        self.garch_beta = garch_beta
+        self.garch_omega = volatility ** 2 * (1.0 - garch_alpha - garch_beta)
+        self.gap_probability = gap_probability
+        self.gap_volatility = gap_volatility
+        self.basket_correlation = basket_correlation
+        self.price_range = price_range
+        self.logger = logging.getLogger(__name__)
+
+    def _basket_index(self, symbols: List[str],
+                      baskets: Optional[Dict[str, List[str]]]) -> Tuple[np.ndarray, int]:
+        """Map each symbol to a basket number (unlisted symbols get their own basket)"""
+        if not baskets:
+            return np.arange(len(symbols)), len(symbols)
+        lookup = {}
+        for number, members in enumerate(baskets.values()):
+            for symbol in members:
+                lookup[symbol] = number
+        index = np.empty(len(symbols), dtype=np.int64)
+        next_basket = len(baskets)
+        for i, symbol in enumerate(symbols):
+            if symbol in lookup:
+                index[i] = lookup[symbol]
+            else:
+                index[i] = next_basket
+                next_basket += 1
+        return index, next_basket
+
+    def _initial_state(self, rng: np.random.Generator, n_symbols: int, n_baskets: int) -> _GeneratorState:
+        low, high = np.log(self.price_range[0]), np.log(self.price_range[1])
+        start_prices = np.exp(rng.uniform(low, high, n_symbols))
+        return _GeneratorState(n_symbols, n_baskets, start_prices, self.volatility ** 2, self.start_ms)
+
+    def _simulate(self, rng: np.random.Generator, state: _GeneratorState,
+                  basket_of: np.ndarray, n_candles: int) -> np.ndarray:
+        """
+        Simulate n_candles for all symbols, advancing the state
+
+        Returns:
+            Array of shape (n_symbols, n_candles, 6) in ccxt OHLCV layout
+        """
+        n_symbols = len(basket_of)
+        n_baskets = len(state.regime)
+
+        # Regime paths: sequential in time, vectorized over baskets
+        cumulative = np.cumsum(self.transitions, axis=1)
+        draws = rng.random((n_candles, n_baskets))
+        regime_path = np.empty((n_candles, n_baskets), dtype=np.int64)
+        regime = state.regime
+        for t in range(n_candles):
+            regime = (draws[t][:, None] > cumulative[regime]).sum(axis=1)
+            regime_path[t] = regime
+        state.regime = regime
+        drift = self.regimes[regime_path[:, basket_of], 0]
+        vol_scale = self.regimes[regime_path[:, basket_of], 1]
+
+        # Correlated standard normal shocks: shared basket factor plus idiosyncratic part
+        rho = self.basket_correlation
+        factor = rng.standard_normal((n_candles, n_baskets))[:, basket_of]
+        idiosyncratic = rng.standard_normal((n_candles, n_symbols))
+        shocks = np.sqrt(rho) * factor + np.sqrt(1.0 - rho) * idiosyncratic
+
+        # GARCH(1,1) volatility clustering: sequential in time, vectorized over symbols
+        returns = np.empty((n_candles, n_symbols))
+        sigmas = np.empty((n_candles, n_symbols))
+        variance, last_shock = state.variance, state.last_shock
+        for t in range(n_candles):
+            variance = self.garch_omega + self.garch_alpha * last_shock ** 2 + self.garch_beta * variance
+            sigma = np.sqrt(variance)
+            last_shock = sigma * shocks[t]
+            sigmas[t] = sigma
+            returns[t] = last_shock
+        state.variance, state.last_shock = variance, last_shock
+        returns = drift - 0.5 * (vol_scale * sigmas) ** 2 + vol_scale * returns
+
+        # Gaps between the previous close and the next open
+        gaps = np.where(
+            rng.random((n_candles, n_symbols)) < self.gap_probability,
+            rng.normal(0.0, self.gap_volatility, (n_candles, n_symbols)),
+            0.0,
+        )
+
+        # Chain opens and closes through cumulative log returns
+        log_close = np.log(state.close) + np.cumsum(gaps + returns, axis=0)
+        close = np.exp(log_close)
+        open_ = close * np.exp(-returns)
+        state.close = close[-1]
+
+        # Wicks scale with the candle's volatility
+        wick_sigma = vol_scale * sigmas * 0.5
+        high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0.0, 1.0, (n_candles, n_symbols))) * wick_sigma)
+        low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0.0, 1.0, (n_candles, n_symbols))) * wick_sigma)
+
+        # Volume rises with the size of the move relative to normal volatility
+        move = np.abs(returns) / self.volatility
+        volume = rng.lognormal(3.0, 0.5, (n_candles, n_symbols)) * (1.0 + move)
+
+        timestamps = state.next_ms + np.arange(n_candles, dtype=np.int64) * self.timeframe_ms
+        state.next_ms = int(timestamps[-1]) + self.timeframe_ms if n_candles else state.next_ms
+
+        ohlcv = np.empty((n_symbols, n_candles, 6))
+        ohlcv[:, :, 0] = timestamps
+        ohlcv[:, :, 1] = open_.T
+        ohlcv[:, :, 2] = high.T
+        ohlcv[:, :, 3] = low.T
+        ohlcv[:, :, 4] = close.T
+        ohlcv[:, :, 5] = volume.T
+        return ohlcv
+
+    def generate_arrays(self, symbols: List[str], n_candles: int,
+                        baskets: Optional[Dict[str, List[str]]] = None) -> Dict[str, np.ndarray]:
+        """
+        Generate candles in the ccxt OHLCV layout
+
+        Args:
+            symbols: Symbols to generate
+            n_candles: Candles per symbol
+            baskets: Optional basket name -> member symbols; members of a
+                basket share regimes and correlated shocks
+
+        Returns:
+            Symbol -> array of shape (n_candles, 6)
+        """
+        rng = np.random.default_rng(self.seed)
+        basket_of, n_baskets = self._basket_index(symbols, baskets)
+        state = self._initial_state(rng, len(symbols), n_baskets)
+        ohlcv = self._simulate(rng, state, basket_of, n_candles)
+        return {symbol: ohlcv[i] for i, symbol in enumerate(symbols)}
+
+    def generate(self, symbols: List[str], n_candles: int,
+                 baskets: Optional[Dict[str, List[str]]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Generate candles as DataFrames in the layout returned by
+        CCXTProvider.get_historical_data
+
+        Args:
+            symbols: Symbols to generate
+            n_candles: Candles per symbol
+            baskets: Optional basket name -> member symbols
+
+        Returns:
+            Symbol -> DataFrame with columns timestamp, open, high, low, close, volume, symbol
+        """
+        arrays = self.generate_arrays(symbols, n_candles, baskets)
+        return {symbol: self.to_dataframe(symbol, array) for symbol, array in arrays.items()}
+
+    def stream(self, symbols: List[str], n_candles: int, batch_size: int = 100,
+               baskets: Optional[Dict[str, List[str]]] = None,
+               candle_store=None) -> Iterator[Dict[str, pd.DataFrame]]:
+        """
+        Generate candles in consecutive batches, carrying prices, volatility
+        and regimes over from one batch to the next
+
+        Args:
+            symbols: Symbols to generate
+            n_candles: Total candles per symbol
+            batch_size: Candles per symbol in each batch
+            baskets: Optional basket name -> member symbols
+            candle_store: Optional CandleStore each batch is merged into
+
+        Yields:
+            Symbol -> DataFrame for each batch
+        """
+        rng = np.random.default_rng(self.seed)
+        basket_of, n_baskets = self._basket_index(symbols, baskets)
+        state = self._initial_state(rng, len(symbols), n_baskets)
+
+        remaining = n_candles
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            ohlcv = self._simulate(rng, state, basket_of, size)
+            batch = {symbol: self.to_dataframe(symbol, ohlcv[i]) for i, symbol in enumerate(symbols)}
+            if candle_store is not None:
+                for symbol, df in batch.items():
+                    candle_store.update(symbol, self.timeframe, df)
+            remaining -= size
+            yield batch
+
+    @staticmethod
+    def to_dataframe(symbol: str, ohlcv: np.ndarray) -> pd.DataFrame:
+        """Convert a ccxt-layout array to the get_historical_data DataFrame layout"""
+        df = pd.DataFrame(ohlcv[:, 1:], columns=['open', 'high', 'low', 'close', 'volume'])
+        df.insert(0, 'timestamp', pd.to_datetime(ohlcv[:, 0].astype(np.int64), unit='ms'))
+        df['symbol'] = symbol
+        return df
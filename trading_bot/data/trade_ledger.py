@@ -0,0 +1,385 @@
+# trading_bot/data/trade_ledger.py
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from trading_bot.utils.clock import get_clock
+from trading_bot.utils.symbol_utils import get_base_currency, normalize_symbol
+
+logger = logging.getLogger(__name__)
+
+LEDGER_VERSION = 1
+COST_METHODS = ('fifo', 'average')
+
+class _SymbolLedger:
+    """Open lots and sync cursor of one symbol"""
+    __slots__ = ('lots', 'amount', 'cost', 'realized_pnl', 'cursor', 'cursor_ids', 'applied_ids', 'synced_at')
+
+    def __init__(self):
+        self.lots = deque()  # [amount, price], oldest first
+        self.amount = 0.0  # Sum of the lot amounts
+        self.cost = 0.0  # Sum of amount * price over the lots
+        self.realized_pnl = 0.0
+        self.cursor: Optional[int] = None  # Timestamp (ms) of the newest synced trade
+        self.cursor_ids = set()  # Ids of the synced trades at the cursor timestamp
+        self.applied_ids = {}  # Id -> timestamp of trades applied from fills after the cursor
+        self.synced_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'lots': [list(lot) for lot in self.lots],
+            'realized_pnl': self.realized_pnl,
+            'cursor': self.cursor,
+            'cursor_ids': sorted(self.cursor_ids),
+            'applied_ids': self.applied_ids,
+            'synced_at': self.synced_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_SymbolLedger':
+        ledger = cls()
+        ledger.lots = deque([float(amount), float(price)] for amount, price in data.get('lots', []))
+        ledger.amount = sum(lot[0] for lot in ledger.lots)
+        ledger.cost = sum(lot[0] * lot[1] for lot in ledger.lots)
+        ledger.realized_pnl = data.get('realized_pnl', 0.0)
+        ledger.cursor = data.get('cursor')
+        ledger.cursor_ids = set(data.get('cursor_ids', []))
+        ledger.applied_ids = dict(data.get('applied_ids', {}))
+        ledger.synced_at = data.get('synced_at')
+        return ledger
+
+class TradeLedger:
+    """
+    Local ledger of our spot trades with the cost basis of the holdings.
+
+    Buys add a lot; sells consume lots first-in first-out ('fifo') or
+    reduce the single average-cost position ('average'), realizing PnL.
+    Running totals make the entry price of a holding an O(1) lookup.
+
+    Trades arrive from the fills of our orders (add_trade) and from
+    fetch_my_trades, which is called per symbol only for the trades after
+    the newest one synced and at most every sync_interval seconds. The
+    cursor only moves on sync, so fills applied but not saved before a
+    crash are fetched again, while trade ids keep both sources from
+    counting a trade twice. The ledger is saved as JSON next to the
+    positions.
+    """
+
+    def __init__(self, exchange, path: str = os.path.join('logs', 'trade_ledger.json'),
+                 method: str = 'fifo', sync_interval: float = 300, page_limit: int = 500):
+        """
+        Initialize the ledger and load the saved one
+
+        Args:
+            exchange: CCXT exchange instance used to fetch our trades
+            path: JSON file the ledger is saved to
+            method: Cost basis method, 'fifo' or 'average'
+            sync_interval: Minimum seconds between trade fetches of a symbol
+            page_limit: Trades requested per fetch_my_trades call
+        """
+        if method not in COST_METHODS:
+            raise ValueError(f"Unknown cost basis method {method!r}, expected one of {COST_METHODS}")
+        self.exchange = exchange
+        self.path = os.path.abspath(path)
+        self.method = method
+        self.sync_interval = sync_interval
+        self.page_limit = page_limit
+        self._symbols: Dict[str, _SymbolLedger] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._stats = {'trades': 0, 'fetches': 0}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable trade ledger {self.path}: {e}")
+            return
+        if data.get('version') != LEDGER_VERSION or data.get('method') != self.method:
+            logger.warning(f"Ignoring trade ledger {self.path}: saved for another version or cost method")
+            return
+        self._symbols = {symbol: _SymbolLedger.from_dict(state) for symbol, state in data.get('symbols', {}).items()}
+        logger.info(f"Loaded trade ledger for {len(self._symbols)} symbols")
+
+    def save(self) -> None:
+        """Write the ledger to disk if it changed, replacing the previous file atomically"""
+        with self._lock:
+            if not self._dirty:
+                return
+            body = json.dumps({
+                'version': LEDGER_VERSION,
+                'method': self.method,
+                'symbols': {symbol: ledger.to_dict() for symbol, ledger in self._symbols.items()},
+            }, separators=(',', ':'))
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, 'w') as f:
+                f.write(body)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.path)
+        except OSError as e:
+            logger.error(f"Error saving trade ledger to {self.path}: {e}")
+            with self._lock:
+                self._dirty = True
+
+    def _apply(self, ledger: _SymbolLedger, symbol: str, trade: Dict[str, Any]) -> None:
+        """Add a trade to the lots of its symbol"""
+        amount = float(trade['amount'])
+        price = float(trade['price'])
+        fee = trade.get('fee')
+        if isinstance(fee, dict) and fee.get('currency') == get_base_currency(symbol):
+            # A fee charged in the traded currency changes the amount held
+            fee_amount = float(fee.get('cost') or 0)
+        else:
+            fee_amount = 0.0
+
+        if str(trade.get('side', '')).lower() == 'buy':
+            held = amount - fee_amount
+            if held <= 0:
+                return
+            if self.method == 'average' and ledger.lots:
+                lot = ledger.lots[0]
+                lot[1] = (ledger.cost + amount * price) / (ledger.amount + held)
+                lot[0] += held
+            else:
+                # The lot's cost is what was paid, spread over the amount received
+                ledger.lots.append([held, amount * price / held])
+        else:
+            remaining = amount + fee_amount
+            while remaining > 0 and ledger.lots:
+                lot = ledger.lots[0]
+                used = min(lot[0], remaining)
+                ledger.realized_pnl += (price - lot[1]) * used
+                lot[0] -= used
+                remaining -= used
+                if lot[0] <= 1e-12:
+                    ledger.lots.popleft()
+            if remaining > 1e-12:
+                logger.debug(f"Sell of {remaining} {symbol} exceeds the ledger's lots, older trades are missing")
+        ledger.amount = sum(lot[0] for lot in ledger.lots)
+        ledger.cost = sum(lot[0] * lot[1] for lot in ledger.lots)
+        self._stats['trades'] += 1
+        self._dirty = True
+
+    def add_trade(self, trade: Dict[str, Any]) -> bool:
+        """
+        Add one of our trades, e.g. the fill of an order
+
+        Trades without an id are left to the next sync, since they could
+        not be told apart from the fetched ones.
+
+        Args:
+            trade: Trade with id, symbol, side, amount, price and timestamp (ms)
+
+        Returns:
+            True if the trade was added, False if it was already known or has no id
+        """
+        if trade.get('id') is None or not trade.get('symbol'):
+            return False
+        symbol = normalize_symbol(trade['symbol'])
+        trade_id = str(trade['id'])
+        timestamp = trade.get('timestamp') or 0
+        with self._lock:
+            ledger = self._symbols.setdefault(symbol, _SymbolLedger())
+            if trade_id in ledger.applied_ids or trade_id in ledger.cursor_ids:
+                return False
+            if ledger.cursor is not None and timestamp < ledger.cursor:
+                # Already covered by a sync
+                return False
+            ledger.applied_ids[trade_id] = timestamp
+            self._apply(ledger, symbol, trade)
+            return True
+
+    def sync(self, symbol: str, force: bool = False, held: Optional[float] = None) -> int:
+        """
+        Fetch the trades of a symbol made since the last sync
+
+        The first sync of a symbol pages back from its newest trades until
+        they account for the held amount (or to its oldest trade when held
+        is not given). The sync time only moves when every fetch succeeded,
+        so a failed fetch is retried on the next call.
+
+        Args:
+            symbol: Trading pair symbol
+            force: Fetch even if the last sync is less than sync_interval ago
+            held: Amount of the symbol held, which the first sync's trades should cover
+
+        Returns:
+            Number of new trades added
+        """
+        normalized_symbol = normalize_symbol(symbol)
+        now = get_clock().time()
+        with self._lock:
+            ledger = self._symbols.setdefault(normalized_symbol, _SymbolLedger())
+            if not force and ledger.synced_at is not None and now - ledger.synced_at < self.sync_interval:
+                return 0
+            cursor = ledger.cursor
+
+        # Pages are fetched without the lock and taken under it; trades a
+        # concurrent sync or fill already added are skipped by their ids
+        try:
+            if cursor is None:
+                trades = self._fetch_history(normalized_symbol, held)
+                with self._lock:
+                    added = self._take(ledger, normalized_symbol, trades)
+            else:
+                added = self._sync_since(ledger, normalized_symbol, cursor)
+        except Exception as e:
+            logger.debug(f"Error fetching trades for {normalized_symbol}: {e}")
+            with self._lock:
+                if ledger.cursor != cursor:
+                    # Pages fetched before the failure were taken
+                    self._dirty = True
+            return 0
+
+        with self._lock:
+            # Fills older than the cursor that no fetch returned are dropped from the dedup set
+            if ledger.cursor is not None:
+                ledger.applied_ids = {
+                    trade_id: timestamp for trade_id, timestamp in ledger.applied_ids.items()
+                    if timestamp >= ledger.cursor
+                }
+            ledger.synced_at = now
+            self._dirty = True
+        return added
+
+    def _fetch(self, symbol: str, since: Optional[int] = None, until: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch one page of trades, oldest first"""
+        with self._lock:
+            self._stats['fetches'] += 1
+        params = {'until': until} if until is not None else {}
+        trades = self.exchange.fetch_my_trades(symbol, since=since, limit=self.page_limit, params=params)
+        return sorted(trades or [], key=lambda trade: trade.get('timestamp') or 0)
+
+    def _fetch_history(self, symbol: str, held: Optional[float]) -> List[Dict[str, Any]]:
+        """Fetch pages of trades back from the newest until they cover the held amount, oldest first"""
+        trades = []
+        seen = set()
+        net = 0.0  # Bought minus sold over the fetched trades
+        until = None
+        while True:
+            page = [trade for trade in self._fetch(symbol, until=until) if str(trade.get('id')) not in seen]
+            if not page:
+                break
+            for trade in page:
+                seen.add(str(trade.get('id')))
+                amount = float(trade.get('amount') or 0)
+                net += amount if str(trade.get('side', '')).lower() == 'buy' else -amount
+            trades[:0] = page
+            oldest = page[0].get('timestamp')
+            if len(page) < self.page_limit or not oldest or (until is not None and oldest > until):
+                break
+            if held is not None and net >= held * (1 - 1e-9):
+                break
+            until = oldest - 1
+        return trades
+
+    def _sync_since(self, ledger: _SymbolLedger, symbol: str, cursor: int) -> int:
+        """Fetch the pages of trades from the cursor on, taking each under the lock"""
+        added = 0
+        while True:
+            trades = self._fetch(symbol, since=cursor)
+            with self._lock:
+                added += self._take(ledger, symbol, trades)
+                previous, cursor = cursor, ledger.cursor
+            if len(trades) < self.page_limit or cursor == previous:
+                # Last page, or a page of trades at one timestamp that since= cannot skip
+                return added
+
+    def _take(self, ledger: _SymbolLedger, symbol: str, trades: List[Dict[str, Any]]) -> int:
+        """Apply fetched trades, oldest first, that are past the cursor and move it"""
+        added = 0
+        for trade in trades:
+            trade_id = str(trade.get('id'))
+            timestamp = trade.get('timestamp') or 0
+            if ledger.cursor is not None and timestamp < ledger.cursor:
+                continue
+            if trade_id in ledger.cursor_ids:
+                continue
+            # Move the cursor past the trade
+            if ledger.cursor is None or timestamp > ledger.cursor:
+                ledger.cursor = timestamp
+                ledger.cursor_ids = set()
+            ledger.cursor_ids.add(trade_id)
+            if ledger.applied_ids.pop(trade_id, None) is not None:
+                # Added from a fill already
+                continue
+            self._apply(ledger, symbol, trade)
+            added += 1
+        return added
+
+    def entry_price(self, symbol: str, amount: Optional[float] = None, sync: bool = True) -> float:
+        """
+        Get the cost basis per unit of the holding of a symbol
+
+        Args:
+            symbol: Trading pair symbol
+            amount: Amount held; the newest lots covering it are priced
+                (default: all open lots)
+            sync: Fetch new trades first when sync_interval has passed
+
+        Returns:
+            Average price of the lots, or 0 if the ledger holds none
+        """
+        normalized_symbol = normalize_symbol(symbol)
+        if sync:
+            self.sync(normalized_symbol, held=amount)
+        with self._lock:
+            ledger = self._symbols.get(normalized_symbol)
+            if ledger is None or ledger.amount <= 0:
+                return 0.0
+            if amount is None or amount >= ledger.amount:
+                return ledger.cost / ledger.amount
+            if amount <= 0:
+                return 0.0
+            # Lots sold outside the ledger's view are assumed to be the oldest
+            remaining = amount
+            cost = 0.0
+            for lot_amount, price in reversed(ledger.lots):
+                used = min(lot_amount, remaining)
+                cost += used * price
+                remaining -= used
+                if remaining <= 0:
+                    break
+            return cost / amount
+
+    def holding(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get the ledger's view of a symbol
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Dictionary with amount, entry_price, realized_pnl and lots
+            (list of [amount, price], oldest first)
+        """
+        with self._lock:
+            ledger = self._symbols.get(normalize_symbol(symbol)) or _SymbolLedger()
+            return {
+                'amount': ledger.amount,
+                'entry_price': ledger.cost / ledger.amount if ledger.amount > 0 else 0.0,
+                'realized_pnl': ledger.realized_pnl,
+                'lots': [list(lot) for lot in ledger.lots],
+            }
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get ledger counters
+
+        Returns:
+            Dictionary with trades applied and fetch_my_trades calls since
+            startup, and symbols in the ledger
+        """
+        with self._lock:
+            return dict(self._stats, symbols=len(self._symbols))
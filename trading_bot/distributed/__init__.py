@@ -0,0 +1,27 @@
+"""Components for running the trading bot across several processes and hosts"""
+
+from trading_bot.distributed.sharding import SymbolCostTracker, assign_shards, shard_loads
+from trading_bot.distributed.shm_ring import SharedMemoryEventChannel, SharedMemoryRing
+from trading_bot.distributed.worker import PositionView, ShardWorker
+from trading_bot.distributed.coordinator import ShardedTradingBot
+from trading_bot.distributed.protocol import FramedConnection, LocalBroker, ProtocolError, TcpListener
+from trading_bot.distributed.node import NodeWorker
+from trading_bot.distributed.node_coordinator import MultiNodeTradingBot, NodeServer
+
+__all__ = [
+    'SymbolCostTracker',
+    'assign_shards',
+    'shard_loads',
+    'SharedMemoryRing',
+    'SharedMemoryEventChannel',
+    'PositionView',
+    'ShardWorker',
+    'ShardedTradingBot',
+    'FramedConnection',
+    'LocalBroker',
+    'ProtocolError',
+    'TcpListener',
+    'NodeWorker',
+    'NodeServer',
+    'MultiNodeTradingBot',
+]
@@ -0,0 +1,274 @@
+# trading_bot/distributed/coordinator.py
+import multiprocessing
+import os
+import queue
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from trading_bot.distributed.shm_ring import SharedMemoryEventChannel
+from trading_bot.distributed.sharding import SymbolCostTracker, assign_shards, shard_loads
+from trading_bot.distributed.worker import run_shard_worker
+from trading_bot.main import TradingBot
+from trading_bot.models.data_models import Signal
+from trading_bot.utils.clock import SimulatedClock, get_clock
+
+class ShardedTradingBot(TradingBot):
+    """
+    Trading bot that shards trading.symbols across worker processes.
+
+    Each worker process fetches candles and runs the strategies of its
+    shard. This process is the coordinator: it decides which symbols are
+    due, collects the workers' signals and handles them with the single
+    BasicRiskManager, PositionTracker and CCXTExecutor, so portfolio limits
+    such as max_open_trades stay globally consistent.
+
+    Workers report the time each symbol takes; every
+    trading.shard_rebalance_interval seconds the coordinator reassigns
+    symbols when that evens out the shard loads noticeably. A worker that
+    dies is restarted with its shard.
+
+    With trading.shard_transport set to 'shm', workers return their signals
+    through a shared-memory ring per shard (SharedMemoryEventChannel)
+    instead of pickling them onto the result queue.
+    """
+
+    def __init__(self,
+                 config_path: str,
+                 dry_run: bool = False,
+                 log_level: str = "INFO",
+                 exchange=None,
+                 exchange_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the coordinator
+
+        Args:
+            config_path: Path to the configuration file
+            dry_run: Whether to run in dry run mode (default: False)
+            log_level: Logging level (e.g., DEBUG, INFO, WARNING, ERROR)
+            exchange: Optional pre-built exchange object for the coordinator
+            exchange_factory: Optional picklable callable that builds the
+                exchange of each worker process (e.g. a replica of a
+                SimulatedExchange); by default workers connect to exchange.id
+        """
+        self.log_level = log_level
+        self.exchange_factory = exchange_factory
+        super().__init__(config_path, dry_run=dry_run, log_level=log_level, exchange=exchange)
+
+        symbols = list(self.strategies.keys())
+        processes = self.config.get('trading.shard_processes', 0) or os.cpu_count() or 1
+        self.n_shards = max(1, min(processes, len(symbols)))
+        self.shard_timeout = self.config.get('trading.shard_timeout', 60)
+        self.rebalance_interval = self.config.get('trading.shard_rebalance_interval', 300)
+        self.rebalance_threshold = self.config.get('trading.shard_rebalance_threshold', 0.1)
+        self.shard_transport = self.config.get('trading.shard_transport', 'queue')
+        if self.shard_transport not in ('queue', 'shm'):
+            raise ValueError(f"Unknown trading.shard_transport: {self.shard_transport}")
+
+        self.cost_tracker = SymbolCostTracker()
+        self.shards: List[List[str]] = assign_shards(symbols, self.n_shards)
+        self._shard_of: Dict[str, int] = {}
+        self._index_shards()
+
+        self._context = multiprocessing.get_context('spawn')
+        self._results = None
+        self._workers: List[Optional[Tuple[Any, Any]]] = [None] * self.n_shards
+        self._channels: List[Optional[SharedMemoryEventChannel]] = [None] * self.n_shards
+        self._tick = 0
+        self._last_rebalance: Optional[float] = None
+
+    def _index_shards(self) -> None:
+        self._shard_of = {symbol: shard for shard, symbols in enumerate(self.shards) for symbol in symbols}
+
+    def _start_worker(self, shard: int) -> None:
+        """Spawn the process of one shard"""
+        clock = get_clock()
+        commands = self._context.Queue()
+        process = self._context.Process(
+            target=run_shard_worker,
+            name=f"shard-{shard}",
+            args=(shard, os.path.abspath(self.config_path), self.shards[shard], commands, self._results),
+            kwargs={
+                'exchange_factory': self.exchange_factory,
+                'simulated_time': clock.time() if isinstance(clock, SimulatedClock) else None,
+                'log_level': self.log_level,
+                'signal_channel': self._channels[shard],
+            },
+            daemon=True
+        )
+        process.start()
+        self._workers[shard] = (process, commands)
+
+    def _wait_ready(self, shards: List[int]) -> None:
+        """Wait until the given shards report that they are set up"""
+        waiting = set(shards)
+        deadline = time.monotonic() + self.shard_timeout
+        while waiting:
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                exited = sorted(shard for shard in waiting if not self._workers[shard][0].is_alive())
+                if exited:
+                    raise RuntimeError(f"Shard workers {exited} exited during startup")
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Shard workers {sorted(waiting)} did not start within {self.shard_timeout}s")
+                continue
+            if message[0] == 'ready':
+                waiting.discard(message[1])
+            elif message[0] == 'error' and message[2] is None:
+                raise RuntimeError(f"Shard worker {message[1]} failed to start: {message[3]}")
+
+    def start_workers(self) -> None:
+        """Start one process per shard and wait until they are ready"""
+        if self._results is not None:
+            return
+        self._results = self._context.Queue()
+        if self.shard_transport == 'shm':
+            # Room for several signals per symbol, whichever shard it ends up in
+            slots = max(1024, 8 * len(self._shard_of))
+            self._channels = [SharedMemoryEventChannel(slots=slots) for _ in range(self.n_shards)]
+        for shard in range(self.n_shards):
+            self._start_worker(shard)
+        self._wait_ready(list(range(self.n_shards)))
+        self.logger.info(
+            f"Started {self.n_shards} shard workers: "
+            + ", ".join(f"{len(symbols)} symbols" for symbols in self.shards)
+        )
+
+    def _restart_dead_workers(self) -> None:
+        """Restart shard workers whose process has exited"""
+        dead = [shard for shard, worker in enumerate(self._workers)
+                if worker is not None and not worker[0].is_alive()]
+        for shard in dead:
+            self.logger.error(
+                f"Shard worker {shard} exited with code {self._workers[shard][0].exitcode}, restarting"
+            )
+            self._start_worker(shard)
+        if dead:
+            self._wait_ready(dead)
+
+    def close(self) -> None:
+        """Stop all shard workers"""
+        if self._results is None:
+            return
+        for worker in self._workers:
+            if worker is not None:
+                worker[1].put(('stop',))
+        for shard, worker in enumerate(self._workers):
+            if worker is None:
+                continue
+            process = worker[0]
+            process.join(timeout=5)
+            if process.is_alive():
+                self.logger.warning(f"Shard worker {shard} did not stop, terminating")
+                process.terminate()
+            self._workers[shard] = None
+        for shard, channel in enumerate(self._channels):
+            if channel is not None:
+                channel.close()
+                self._channels[shard] = None
+        self._results = None
+        self.logger.info("Shard workers stopped")
+
+    def _evaluate_due(self, due_symbols: List[Tuple[str, str]]) -> List[List[Signal]]:
+        """
+        Evaluate the due symbols on the shard workers
+
+        Args:
+            due_symbols: (symbol, timeframe) pairs returned by _due_symbols
+
+        Returns:
+            Signals per due symbol, in the order of due_symbols
+        """
+        if not due_symbols:
+            return []
+        self.start_workers()
+        self._restart_dead_workers()
+
+        by_shard: Dict[int, List[Tuple[str, str]]] = {}
+        for symbol, timeframe in due_symbols:
+            by_shard.setdefault(self._shard_of[symbol], []).append((symbol, timeframe))
+
+        self._tick += 1
+        current_time = get_clock().time()
+        positions = self.position_tracker.snapshot().all_positions()
+        for shard, due in by_shard.items():
+            self._workers[shard][1].put(('evaluate', self._tick, current_time, due, positions))
+
+        signals: Dict[str, List[Signal]] = {}
+        waiting = set(by_shard)
+        deadline = time.monotonic() + self.shard_timeout
+        while waiting:
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                exited = sorted(shard for shard in waiting if not self._workers[shard][0].is_alive())
+                if exited:
+                    # Restarted on the next pass; their symbols are skipped this time
+                    self.logger.error(f"Shard workers {exited} exited while evaluating")
+                    waiting.difference_update(exited)
+                elif time.monotonic() > deadline:
+                    self.logger.error(f"Shard workers {sorted(waiting)} did not reply within {self.shard_timeout}s")
+                    break
+                continue
+            kind, shard = message[0], message[1]
+            if kind == 'ready' or message[2] != self._tick:
+                # Late reply to an earlier tick
+                continue
+            if kind == 'result':
+                if message[3] is None:
+                    signals.update(self._receive_signals(shard))
+                else:
+                    signals.update(message[3])
+                for symbol, seconds in message[4].items():
+                    self.cost_tracker.record(symbol, seconds)
+            elif kind == 'error':
+                self.logger.error(f"Shard worker {shard} failed: {message[3]}")
+            waiting.discard(shard)
+
+        self._maybe_rebalance(current_time)
+        return [signals.get(symbol, []) for symbol, _ in due_symbols]
+
+    def _receive_signals(self, shard: int) -> Dict[str, List[Signal]]:
+        """Read the signals of the current pass from a shard's channel"""
+        signals: Dict[str, List[Signal]] = {}
+        for event in self._channels[shard].poll():
+            # Signals of a pass that timed out arrive late and are dropped
+            if event.data['tick'] == self._tick:
+                signal = event.data['signal']
+                signals.setdefault(signal.symbol, []).append(signal)
+        return signals
+
+    def _maybe_rebalance(self, current_time: float) -> None:
+        """Reassign symbols when the measured costs have drifted apart"""
+        if self._last_rebalance is None:
+            self._last_rebalance = current_time
+            return
+        if current_time - self._last_rebalance < self.rebalance_interval:
+            return
+        self._last_rebalance = current_time
+
+        costs = self.cost_tracker.costs()
+        if len(costs) < len(self._shard_of):
+            return
+
+        proposed = assign_shards(list(self.strategies.keys()), self.n_shards, costs)
+        current_max = max(shard_loads(self.shards, costs))
+        proposed_max = max(shard_loads(proposed, costs))
+        if proposed_max >= current_max * (1 - self.rebalance_threshold):
+            return
+
+        for shard, symbols in enumerate(proposed):
+            if symbols != self.shards[shard]:
+                self._workers[shard][1].put(('assign', symbols))
+        self.logger.info(
+            f"Rebalanced shards: slowest shard {current_max * 1000:.1f}ms -> {proposed_max * 1000:.1f}ms per pass"
+        )
+        self.shards = proposed
+        self._index_shards()
+
+    def run(self):
+        """Run the trading bot, stopping the shard workers on exit"""
+        try:
+            super().run()
+        finally:
+            self.close()
@@ -0,0 +1,268 @@
+# trading_bot/distributed/node.py
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from trading_bot.distributed.protocol import (
+    ASSIGN, BYE, ERROR, EVALUATE, HEARTBEAT, HELLO, PROTOCOL_VERSION, REJECT, SIGNALS, WELCOME,
+    FramedConnection, ProtocolError, decode_candles, parse_address
+)
+from trading_bot.distributed.worker import PositionView
+from trading_bot.models.data_models import Position, Signal
+from trading_bot.strategies.factory import StrategyFactory
+
+class NodeWorker:
+    """
+    Strategy worker node of a multi-node deployment.
+
+    Connects to a MultiNodeTradingBot coordinator, receives its strategy
+    configuration and symbols, and turns the candle batches the coordinator
+    sends into signals. A node holds no exchange connection, credentials or
+    configuration file: the coordinator fetches all market data and places
+    all orders.
+
+    The node heartbeats while connected and reconnects with backoff when
+    the coordinator goes away, until the coordinator says goodbye or stop()
+    is called.
+    """
+
+    def __init__(self,
+                 connect: Callable[[], socket.socket],
+                 token: str = '',
+                 name: Optional[str] = None,
+                 reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 30.0):
+        """
+        Initialize the node
+
+        Args:
+            connect: Callable opening a connection to the coordinator, e.g.
+                TcpListener.connect or LocalBroker.connect
+            token: Shared secret the coordinator expects
+            name: Name reported to the coordinator (default: host and pid)
+            reconnect_delay: First delay before reconnecting, in seconds
+            max_reconnect_delay: Upper bound of the doubling reconnect delay
+        """
+        self.connect = connect
+        self.token = token
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.logger = logging.getLogger(__name__)
+
+        self.positions = PositionView()
+        self.strategies: Dict[str, Any] = {}
+        self._strategy_config: Optional[Dict[str, Any]] = None
+        self._stopping = threading.Event()
+        self._connection: Optional[FramedConnection] = None
+        self._joined = False
+
+    def assign(self, strategy_config: Dict[str, Any], symbols: List[str]) -> None:
+        """
+        Set the symbols this node evaluates, creating strategies for new ones
+
+        Args:
+            strategy_config: Strategy configuration including its timeframe
+            symbols: Symbols assigned to this node
+        """
+        if strategy_config != self._strategy_config:
+            self.strategies = {}
+            self._strategy_config = strategy_config
+
+        wanted = set(symbols)
+        for symbol in list(self.strategies):
+            if symbol not in wanted:
+                del self.strategies[symbol]
+
+        for symbol in symbols:
+            if symbol not in self.strategies:
+                self.strategies[symbol] = StrategyFactory.create_strategy(
+                    dict(strategy_config),
+                    trading_pairs=[symbol],
+                    position_tracker=self.positions
+                )
+        self.logger.info(f"Node {self.name} evaluating {len(self.strategies)} symbols")
+
+    def evaluate(self, candles: Dict[str, bytes],
+                 positions: List[Dict[str, Any]]) -> Tuple[Dict[str, List[Signal]], Dict[str, float]]:
+        """
+        Run the strategies on a batch of candles
+
+        Args:
+            candles: Candles per symbol, packed by encode_candles
+            positions: Open positions from the coordinator, as Position.to_dict()
+
+        Returns:
+            Tuple of (signals per symbol, seconds spent per symbol)
+        """
+        self.positions.update([Position.from_dict(position) for position in positions])
+        signals: Dict[str, List[Signal]] = {}
+        costs: Dict[str, float] = {}
+
+        for symbol, data in candles.items():
+            strategy = self.strategies.get(symbol)
+            if strategy is None:
+                self.logger.warning(f"Node {self.name} received {symbol}, which it does not own")
+                continue
+
+            start = time.perf_counter()
+            try:
+                signals[symbol] = strategy.generate_signals(decode_candles(data, symbol))
+            except Exception as e:
+                self.logger.error(f"Error processing {symbol}: {e}")
+                signals[symbol] = []
+            costs[symbol] = time.perf_counter() - start
+
+        return signals, costs
+
+    def _heartbeat(self, connection: FramedConnection, interval: float, done: threading.Event) -> None:
+        while not done.wait(interval):
+            try:
+                connection.send(HEARTBEAT)
+            except OSError:
+                return
+
+    def _handle(self, connection: FramedConnection, kind: int, payload: Dict[str, Any]) -> None:
+        if kind == ASSIGN:
+            self.assign(payload['strategy'], payload['symbols'])
+        elif kind == EVALUATE:
+            tick = payload['tick']
+            try:
+                signals, costs = self.evaluate(payload['candles'], payload['positions'])
+                connection.send(SIGNALS, {'tick': tick, 'signals': signals, 'costs': costs})
+            except ProtocolError as e:
+                self.logger.error(f"Node {self.name} failed to evaluate tick {tick}: {e}")
+                connection.send(ERROR, {'tick': tick, 'message': str(e)})
+        elif kind != HEARTBEAT:
+            self.logger.warning(f"Node {self.name} ignoring unexpected message {kind}")
+
+    def serve(self, connection: FramedConnection) -> None:
+        """
+        Handle one connection to the coordinator until the coordinator ends
+        the session (goodbye or rejection)
+
+        Args:
+            connection: Connection to the coordinator
+
+        Raises:
+            OSError: If the connection is lost or the coordinator stops heartbeating
+            ProtocolError: If the coordinator sends a malformed frame
+        """
+        connection.send(HELLO, {'protocol': PROTOCOL_VERSION, 'name': self.name, 'token': self.token})
+        kind, welcome = connection.recv()
+        if kind == REJECT:
+            self.logger.error(f"Coordinator rejected node {self.name}: {welcome.get('reason')}")
+            return
+        if kind != WELCOME:
+            raise ProtocolError(f"Expected WELCOME, got message {kind}")
+        self.logger.info(f"Node {self.name} joined as node {welcome['node_id']}")
+        self._joined = True
+
+        # A coordinator that stops heartbeating is treated as gone
+        connection.settimeout(welcome['heartbeat_timeout'])
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(connection, welcome['heartbeat_interval'], done),
+            name=f"node-heartbeat-{self.name}",
+            daemon=True
+        )
+        heartbeat.start()
+        try:
+            while True:
+                kind, payload = connection.recv()
+                if kind == BYE:
+                    self.logger.info(f"Coordinator closed the session of node {self.name}")
+                    return
+                self._handle(connection, kind, payload)
+        finally:
+            done.set()
+
+    def run(self) -> None:
+        """Connect and serve the coordinator, reconnecting until the session ends"""
+        delay = self.reconnect_delay
+        while not self._stopping.is_set():
+            self._joined = False
+            try:
+                self._connection = FramedConnection(self.connect())
+                self.serve(self._connection)
+                break
+            except (OSError, ProtocolError) as e:
+                if self._stopping.is_set():
+                    break
+                if self._joined:
+                    delay = self.reconnect_delay
+                self.logger.warning(f"Node {self.name} lost the coordinator: {e}; retrying in {delay:.0f}s")
+            finally:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+            if self._stopping.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def stop(self) -> None:
+        """Leave the coordinator and stop run()"""
+        self._stopping.set()
+        connection = self._connection
+        if connection is not None:
+            try:
+                connection.send(BYE)
+            except OSError:
+                pass
+            connection.close()
+
+def run_node(address: str, token: str = '', name: Optional[str] = None, log_level: str = 'INFO') -> None:
+    """
+    Entry point of a worker node process
+
+    Args:
+        address: Coordinator address as host:port
+        token: Shared secret the coordinator expects
+        name: Name reported to the coordinator
+        log_level: Logging level
+    """
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper(), logging.INFO),
+        format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    host, port = parse_address(address)
+
+    def connect() -> socket.socket:
+        sock = socket.create_connection((host, port), timeout=10)
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    NodeWorker(connect, token=token, name=name).run()
+
+def main() -> int:
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Trading bot strategy worker node')
+    parser.add_argument('--connect', type=str, required=True,
+                        help='Coordinator address as host:port (trading.nodes.listen)')
+    parser.add_argument('--name', type=str, default=None, help='Node name reported to the coordinator')
+    parser.add_argument(
+        '--log-level',
+        type=str,
+        default='INFO',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        help='Set the logging level (default: INFO)'
+    )
+    args = parser.parse_args()
+
+    # The shared secret comes from the environment, like the exchange credentials
+    load_dotenv()
+    run_node(args.connect, token=os.environ.get('TRADING_NODE_TOKEN', ''), name=args.name,
+             log_level=args.log_level)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+# trading_bot/distributed/node_coordinator.py
+import hmac
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from trading_bot.distributed.protocol import (
+    ASSIGN, BYE, ERROR, EVALUATE, HEARTBEAT, HELLO, PROTOCOL_VERSION, REJECT, SIGNALS, WELCOME,
+    FramedConnection, ProtocolError, TcpListener, encode_candles, parse_address
+)
+from trading_bot.distributed.sharding import SymbolCostTracker, assign_shards
+from trading_bot.main import TradingBot
+from trading_bot.models.data_models import Signal
+
+# Reply kind queued when a node goes away, so waiting collectors wake up
+DISCONNECTED = 0
+
+_LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+class RemoteNode:
+    """Coordinator-side state of one connected worker node"""
+
+    def __init__(self, node_id: int, name: str, connection: FramedConnection):
+        self.node_id = node_id
+        self.name = name
+        self.connection = connection
+        self.last_seen = time.monotonic()
+        self.alive = True
+
+class NodeServer:
+    """
+    Accepts worker nodes and keeps track of which ones are alive.
+
+    Each node gets a reader thread; SIGNALS and ERROR replies land on the
+    ``replies`` queue as (node_id, kind, payload). A heartbeat thread pings
+    every node each heartbeat_interval and drops nodes that have been
+    silent for heartbeat_timeout; a dropped node queues a DISCONNECTED
+    reply.
+    """
+
+    def __init__(self, listener, token: str = '', heartbeat_interval: float = 2.0,
+                 heartbeat_timeout: float = 10.0):
+        """
+        Initialize the server
+
+        Args:
+            listener: TcpListener or LocalBroker to accept nodes from
+            token: Shared secret nodes must present (empty accepts any node)
+            heartbeat_interval: Seconds between heartbeats in both directions
+            heartbeat_timeout: Seconds of silence after which a peer counts as dead
+        """
+        self.listener = listener
+        self.token = token
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.logger = logging.getLogger(__name__)
+
+        self.replies: queue.Queue = queue.Queue()
+        self._nodes: Dict[int, RemoteNode] = {}
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start accepting nodes"""
+        if self._threads:
+            return
+        for target, name in ((self._accept_loop, 'node-accept'), (self._heartbeat_loop, 'node-heartbeat')):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(f"Waiting for worker nodes on {self.listener.address}")
+
+    def _accept_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                sock = self.listener.accept(timeout=0.5)
+            except OSError:
+                if not self._stopping.is_set():
+                    self.logger.exception("Listener failed")
+                return
+            if sock is not None:
+                threading.Thread(target=self._serve, args=(sock,), name='node-reader', daemon=True).start()
+
+    def _handshake(self, connection: FramedConnection) -> Optional[RemoteNode]:
+        """Check a new connection's HELLO and register the node"""
+        connection.settimeout(self.heartbeat_timeout)
+        kind, hello = connection.recv()
+        reason = None
+        if kind != HELLO or not isinstance(hello, dict):
+            reason = "expected HELLO"
+        elif hello.get('protocol') != PROTOCOL_VERSION:
+            reason = f"unsupported protocol version {hello.get('protocol')}"
+        elif self.token and not hmac.compare_digest(str(hello.get('token', '')).encode(), self.token.encode()):
+            reason = "invalid token"
+        if reason is not None:
+            self.logger.warning(f"Rejected node connection: {reason}")
+            connection.send(REJECT, {'reason': reason})
+            return None
+
+        connection.settimeout(None)
+        with self._lock:
+            node = RemoteNode(self._next_id, str(hello.get('name', '')), connection)
+            self._next_id += 1
+            self._nodes[node.node_id] = node
+        connection.send(WELCOME, {
+            'node_id': node.node_id,
+            'heartbeat_interval': self.heartbeat_interval,
+            'heartbeat_timeout': self.heartbeat_timeout,
+        })
+        return node
+
+    def _serve(self, sock) -> None:
+        """Reader thread of one node connection"""
+        connection = FramedConnection(sock)
+        try:
+            node = self._handshake(connection)
+        except (OSError, ProtocolError) as e:
+            self.logger.warning(f"Node handshake failed: {e}")
+            node = None
+        if node is None:
+            connection.close()
+            return
+        self.logger.info(f"Node {node.node_id} ({node.name}) connected")
+
+        reason = "closed the connection"
+        level = logging.WARNING
+        try:
+            while True:
+                kind, payload = connection.recv()
+                node.last_seen = time.monotonic()
+                if kind == BYE:
+                    reason = "left"
+                    level = logging.INFO
+                    break
+                if kind == SIGNALS or kind == ERROR:
+                    self.replies.put((node.node_id, kind, payload))
+                elif kind != HEARTBEAT:
+                    self.logger.warning(f"Node {node.node_id} sent unexpected message {kind}")
+        except (OSError, ProtocolError) as e:
+            reason = f"connection lost: {e}"
+        self.drop(node.node_id, reason, level)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self.heartbeat_interval):
+            now = time.monotonic()
+            for node in self.nodes():
+                if now - node.last_seen > self.heartbeat_timeout:
+                    self.drop(node.node_id, f"no heartbeat for {now - node.last_seen:.1f}s")
+                else:
+                    self.send(node.node_id, HEARTBEAT)
+
+    def nodes(self) -> List[RemoteNode]:
+        """Live nodes in the order they joined"""
+        with self._lock:
+            return [self._nodes[node_id] for node_id in sorted(self._nodes)]
+
+    def wait_for_nodes(self, count: int, timeout: float) -> bool:
+        """
+        Wait until at least count nodes are connected
+
+        Args:
+            count: Number of nodes to wait for
+            timeout: Seconds to wait
+
+        Returns:
+            True if enough nodes connected in time
+        """
+        deadline = time.monotonic() + timeout
+        while len(self.nodes()) < count:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def send(self, node_id: int, kind: int, payload: Any = None) -> bool:
+        """
+        Send a message to a node, dropping the node if the send fails
+
+        Args:
+            node_id: Node to send to
+            kind: Message type
+            payload: Message payload
+
+        Returns:
+            True if the message was sent
+        """
+        with self._lock:
+            node = self._nodes.get(node_id)
+        if node is None:
+            return False
+        try:
+            node.connection.send(kind, payload)
+            return True
+        except (OSError, ProtocolError) as e:
+            self.drop(node_id, f"send failed: {e}")
+            return False
+
+    def drop(self, node_id: int, reason: str, level: int = logging.WARNING) -> None:
+        """
+        Disconnect a node and tell collectors waiting for it
+
+        Args:
+            node_id: Node to drop
+            reason: Reason for the log
+            level: Logging level of the message
+        """
+        with self._lock:
+            node = self._nodes.pop(node_id, None)
+        if node is None or not node.alive:
+            return
+        node.alive = False
+        node.connection.close()
+        self.logger.log(level, f"Node {node_id} ({node.name}) {reason}")
+        self.replies.put((node_id, DISCONNECTED, None))
+
+    def close(self) -> None:
+        """Say goodbye to all nodes and stop listening"""
+        self._stopping.set()
+        for node in self.nodes():
+            try:
+                node.connection.send(BYE)
+            except (OSError, ProtocolError):
+                pass
+            self.drop(node.node_id, "closed by coordinator", logging.INFO)
+        self.listener.close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+class MultiNodeTradingBot(TradingBot):
+    """
+    Trading bot that evaluates strategies on worker nodes over the network.
+
+    This process is the coordinator: it holds the exchange credentials,
+    fetches the candles of every due symbol, and keeps the only
+    BasicRiskManager, PositionTracker and CCXTExecutor. Worker nodes
+    (trading_bot.distributed.node) connect to trading.nodes.listen, receive
+    the strategy configuration and a share of the symbols, and return the
+    signals for each candle batch.
+
+    Symbols are split across the live nodes with assign_shards, weighted by
+    the evaluation times nodes report. When a node joins, leaves, or misses
+    heartbeats for trading.nodes.heartbeat_timeout seconds, its symbols are
+    reassigned on the next pass. Symbols whose node fails or does not reply
+    within trading.nodes.reply_timeout are evaluated locally, as are all
+    symbols while no node is connected.
+    """
+
+    def __init__(self,
+                 config_path: str,
+                 dry_run: bool = False,
+                 log_level: str = "INFO",
+                 exchange=None,
+                 listener=None,
+                 token: Optional[str] = None):
+        """
+        Initialize the coordinator
+
+        Args:
+            config_path: Path to the configuration file
+            dry_run: Whether to run in dry run mode (default: False)
+            log_level: Logging level (e.g., DEBUG, INFO, WARNING, ERROR)
+            exchange: Optional pre-built exchange object
+            listener: Optional TcpListener or LocalBroker; by default a
+                TcpListener on trading.nodes.listen
+            token: Shared secret nodes must present (default: the
+                TRADING_NODE_TOKEN environment variable)
+        """
+        super().__init__(config_path, dry_run=dry_run, log_level=log_level, exchange=exchange)
+
+        self.reply_timeout = self.config.get('trading.nodes.reply_timeout', 30)
+        if token is None:
+            token = os.environ.get('TRADING_NODE_TOKEN', '')
+        if listener is None:
+            host, port = parse_address(self.config.get('trading.nodes.listen', '127.0.0.1:7878'))
+            if not token and host not in _LOOPBACK_HOSTS:
+                raise ValueError(f"Set TRADING_NODE_TOKEN before listening for nodes on {host}")
+            listener = TcpListener(host, port)
+
+        self.server = NodeServer(
+            listener,
+            token=token,
+            heartbeat_interval=self.config.get('trading.nodes.heartbeat_interval', 2),
+            heartbeat_timeout=self.config.get('trading.nodes.heartbeat_timeout', 10)
+        )
+        self.cost_tracker = SymbolCostTracker()
+        self._assignment: Dict[int, List[str]] = {}
+        self._node_of: Dict[str, int] = {}
+        self._tick = 0
+        self.server.start()
+
+    def _sync_assignment(self) -> None:
+        """Reassign symbols when the set of live nodes has changed"""
+        live = [node.node_id for node in self.server.nodes()]
+        if set(live) == set(self._assignment):
+            return
+
+        symbols = list(self.strategies.keys())
+        shards = assign_shards(symbols, len(live), self.cost_tracker.costs()) if live else []
+        self._assignment = dict(zip(live, shards))
+        self._node_of = {symbol: node_id for node_id, shard in self._assignment.items() for symbol in shard}
+
+        strategy_config = self.config.config['strategy'].copy()
+        strategy_config['timeframe'] = self.config.get_strict('trading.timeframe')
+        for node_id, shard in self._assignment.items():
+            # A failed send drops the node and triggers another reassignment next pass
+            self.server.send(node_id, ASSIGN, {'strategy': strategy_config, 'symbols': shard})
+        self.logger.info(
+            f"Assigned symbols to {len(live)} nodes: "
+            + (", ".join(f"node {node_id}: {len(shard)}" for node_id, shard in self._assignment.items())
+               or "none connected, evaluating locally")
+        )
+
+    def _fetch_candles(self, symbol: str, timeframe: str) -> Optional[Tuple[Any, int]]:
+        """
+        Fetch and buffer the latest candles for a symbol
+
+        Returns:
+            Tuple of (candles, required candles), or None if fetching failed
+        """
+        try:
+            required_candles = getattr(self.strategies[symbol], 'get_required_data_points', lambda: 100)()
+            since, limit = self._candle_request(symbol, timeframe, required_candles)
+            candles = self.data_provider.get_historical_data(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=limit
+            )
+            merged = self.candle_store.update(symbol, timeframe, candles)
+            return merged.iloc[-required_candles:].reset_index(drop=True), required_candles
+        except Exception as e:
+            self.logger.error(f"Error processing {symbol}: {e}")
+            return None
+
+    def _evaluate_locally(self, symbol: str, candles) -> List[Signal]:
+        try:
+            return self.strategies[symbol].generate_signals(candles)
+        except Exception as e:
+            self.logger.error(f"Error processing {symbol}: {e}")
+            return []
+
+    def _evaluate_due(self, due_symbols: List[Tuple[str, str]]) -> List[List[Signal]]:
+        """
+        Fetch candles for the due symbols and evaluate them on the worker nodes
+
+        Args:
+            due_symbols: (symbol, timeframe) pairs returned by _due_symbols
+
+        Returns:
+            Signals per due symbol, in the order of due_symbols
+        """
+        if not due_symbols:
+            return []
+        self._sync_assignment()
+
+        if self._symbol_pool is not None and len(due_symbols) > 1:
+            futures = [self._symbol_pool.submit(self._fetch_candles, symbol, timeframe)
+                       for symbol, timeframe in due_symbols]
+            fetched = [future.result() for future in futures]
+        else:
+            fetched = [self._fetch_candles(symbol, timeframe) for symbol, timeframe in due_symbols]
+
+        candles: Dict[str, Any] = {}
+        batches: Dict[int, Dict[str, bytes]] = {}
+        local: List[str] = []
+        for (symbol, _), result in zip(due_symbols, fetched):
+            if result is None:
+                continue
+            symbol_candles, required_candles = result
+            if len(symbol_candles) < required_candles:
+                self.logger.warning(f"Not enough candles for {symbol}: {len(symbol_candles)}/{required_candles}")
+                continue
+            candles[symbol] = symbol_candles
+            node_id = self._node_of.get(symbol)
+            if node_id is None:
+                local.append(symbol)
+            else:
+                batches.setdefault(node_id, {})[symbol] = encode_candles(symbol_candles)
+
+        self._tick += 1
+        positions = [position.to_dict() for position in self.position_tracker.snapshot().all_positions()]
+        pending: Dict[int, List[str]] = {}
+        for node_id, batch in batches.items():
+            if self.server.send(node_id, EVALUATE, {'tick': self._tick, 'candles': batch, 'positions': positions}):
+                pending[node_id] = list(batch)
+            else:
+                local.extend(batch)
+
+        signals, unanswered = self._collect(pending)
+        for symbol in local + unanswered:
+            signals[symbol] = self._evaluate_locally(symbol, candles[symbol])
+        return [signals.get(symbol, []) for symbol, _ in due_symbols]
+
+    def _collect(self, pending: Dict[int, List[str]]) -> Tuple[Dict[str, List[Signal]], List[str]]:
+        """
+        Wait for the nodes' replies to the current pass
+
+        Args:
+            pending: Symbols sent to each node
+
+        Returns:
+            Tuple of (signals per symbol, symbols without a usable reply)
+        """
+        signals: Dict[str, List[Signal]] = {}
+        unanswered: List[str] = []
+        deadline = time.monotonic() + self.reply_timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.error(f"Nodes {sorted(pending)} did not reply within {self.reply_timeout}s")
+                break
+            try:
+                node_id, kind, payload = self.server.replies.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                continue
+            if node_id not in pending:
+                continue
+            if kind == DISCONNECTED:
+                unanswered.extend(pending.pop(node_id))
+                continue
+            if payload.get('tick') != self._tick:
+                # Late reply to an earlier pass
+                continue
+
+            symbols = pending.pop(node_id)
+            if kind == SIGNALS:
+                signals.update(payload['signals'])
+                for symbol, seconds in payload['costs'].items():
+                    self.cost_tracker.record(symbol, seconds)
+            else:
+                self.logger.error(f"Node {node_id} failed: {payload.get('message')}")
+                unanswered.extend(symbols)
+
+        for symbols in pending.values():
+            unanswered.extend(symbols)
+        if unanswered:
+            self.logger.warning(f"Evaluating {len(unanswered)} symbols locally")
+        return signals, unanswered
+
+    def close(self) -> None:
+        """Disconnect the worker nodes and stop listening"""
+        self.server.close()
+
+    def run(self):
+        """Run the trading bot, disconnecting the worker nodes on exit"""
+        try:
+            super().run()
+        finally:
+            self.close()
@@ -0,0 +1,228 @@
+# trading_bot/distributed/protocol.py
+import queue
+import socket
+import struct
+import threading
+from typing import Any, Optional, Tuple
+
+from trading_bot.data.candle_store import decode_candles, encode_candles
+from trading_bot.utils.event_codec import EventCodecError, decode_value, encode_value
+
+PROTOCOL_VERSION = 1
+
+# Frame header: payload length, message type
+_FRAME = struct.Struct('<IB')
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Message types and their payloads
+HELLO = 1  # worker: {'protocol', 'name', 'token'}
+WELCOME = 2  # coordinator: {'node_id', 'heartbeat_interval', 'heartbeat_timeout'}
+REJECT = 3  # coordinator: {'reason'}
+ASSIGN = 4  # coordinator: {'strategy': strategy config, 'symbols': [...]}
+EVALUATE = 5  # coordinator: {'tick', 'candles': {symbol: encoded candles}, 'positions': [...]}
+SIGNALS = 6  # worker: {'tick', 'signals': {symbol: [Signal]}, 'costs': {symbol: seconds}}
+ERROR = 7  # worker: {'tick', 'message'}
+HEARTBEAT = 8  # both: {}
+BYE = 9  # both: {}
+
+class ProtocolError(ConnectionError):
+    """Raised when a peer sends a frame that does not follow the protocol"""
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Split a 'host:port' address
+
+    Args:
+        address: Address such as '127.0.0.1:7878' or '[::1]:7878'
+
+    Returns:
+        Tuple of (host, port)
+    """
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"Invalid address {address!r}, expected host:port")
+    return host.strip('[]'), int(port)
+
+class FramedConnection:
+    """
+    Length-prefixed messages over a stream socket.
+
+    Every frame is a 5-byte header (payload length, message type) followed
+    by a payload in the event codec's value encoding. Payloads are encoded
+    and decoded without pickle, so a peer can never make this side run
+    code. send() may be called from several threads; recv() from one.
+    """
+
+    def __init__(self, sock: socket.socket, max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        Initialize the connection
+
+        Args:
+            sock: Connected stream socket
+            max_frame_size: Largest payload accepted in either direction
+        """
+        self.sock = sock
+        self.max_frame_size = max_frame_size
+        self._send_lock = threading.Lock()
+
+    def send(self, kind: int, payload: Any = None) -> None:
+        """
+        Send one message
+
+        Args:
+            kind: Message type
+            payload: Message payload (an empty dict when omitted)
+
+        Raises:
+            ProtocolError: If the payload cannot be encoded or is too large
+            OSError: If the socket fails
+        """
+        try:
+            body = encode_value({} if payload is None else payload, allow_pickle=False)
+        except EventCodecError as e:
+            raise ProtocolError(f"Cannot encode message {kind}: {e}") from e
+        if len(body) > self.max_frame_size:
+            raise ProtocolError(f"Message {kind} of {len(body)} bytes exceeds {self.max_frame_size}")
+        with self._send_lock:
+            self.sock.sendall(_FRAME.pack(len(body), kind) + body)
+
+    def _recv_exactly(self, size: int) -> bytearray:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self.sock.recv_into(view[received:])
+            if count == 0:
+                raise ConnectionError("Connection closed by peer")
+            received += count
+        return buffer
+
+    def recv(self) -> Tuple[int, Any]:
+        """
+        Receive one message, blocking up to the socket timeout
+
+        Returns:
+            Tuple of (message type, payload)
+
+        Raises:
+            ProtocolError: If the frame is too large or malformed
+            OSError: If the socket fails, times out or is closed
+        """
+        length, kind = _FRAME.unpack(self._recv_exactly(_FRAME.size))
+        if length > self.max_frame_size:
+            raise ProtocolError(f"Frame of {length} bytes exceeds {self.max_frame_size}")
+        try:
+            return kind, decode_value(self._recv_exactly(length), allow_pickle=False)
+        except EventCodecError as e:
+            raise ProtocolError(f"Malformed message {kind}: {e}") from e
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        """Set the socket timeout in seconds (None blocks)"""
+        self.sock.settimeout(timeout)
+
+    def close(self) -> None:
+        """Shut the socket down, waking up a blocked recv()"""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+class TcpListener:
+    """Accepts worker node connections on a TCP port"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        """
+        Bind and listen
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self._sock = socket.create_server((host, port))
+        self.address = '{}:{}'.format(*self._sock.getsockname()[:2])
+
+    def accept(self, timeout: Optional[float] = None) -> Optional[socket.socket]:
+        """
+        Wait for a connection
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Connected socket, or None on timeout
+        """
+        self._sock.settimeout(timeout)
+        try:
+            sock, _ = self._sock.accept()
+        except socket.timeout:
+            return None
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def connect(self) -> socket.socket:
+        """Open a client connection to this listener"""
+        host, port = parse_address(self.address)
+        sock = socket.create_connection((host, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def close(self) -> None:
+        """Stop listening"""
+        self._sock.close()
+
+class LocalBroker:
+    """
+    In-process stand-in for TcpListener.
+
+    connect() hands out one end of a socket pair and queues the other for
+    accept(), so a coordinator and worker nodes in one process (e.g. in
+    tests) use the same framing, heartbeat and reassignment code as over
+    TCP.
+    """
+
+    def __init__(self):
+        self._pending: queue.Queue = queue.Queue()
+        self._closed = False
+        self.address = 'local'
+
+    def connect(self) -> socket.socket:
+        """
+        Open a connection to the broker
+
+        Returns:
+            Worker side of a new socket pair
+
+        Raises:
+            ConnectionRefusedError: If the broker is closed
+        """
+        if self._closed:
+            raise ConnectionRefusedError("Local broker is closed")
+        worker_side, coordinator_side = socket.socketpair()
+        self._pending.put(coordinator_side)
+        return worker_side
+
+    def accept(self, timeout: Optional[float] = None) -> Optional[socket.socket]:
+        """
+        Wait for a connection
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Coordinator side of a socket pair, or None on timeout
+        """
+        try:
+            return self._pending.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Refuse new connections and drop the ones not yet accepted"""
+        self._closed = True
+        while True:
+            try:
+                self._pending.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,98 @@
+# trading_bot/distributed/sharding.py
+import heapq
+import threading
+from typing import Dict, List, Optional
+
+def assign_shards(symbols: List[str], n_shards: int,
+                  costs: Optional[Dict[str, float]] = None) -> List[List[str]]:
+    """
+    Split symbols into shards of roughly equal total cost
+
+    Uses the greedy longest-processing-time rule: symbols are placed from
+    most to least expensive onto the currently cheapest shard. Symbols
+    without a measured cost count as the average measured cost (or 1.0 when
+    nothing has been measured yet), so the first assignment is round-robin.
+
+    Args:
+        symbols: Symbols in configuration order
+        n_shards: Number of shards
+        costs: Measured cost per symbol (e.g. seconds per evaluation)
+
+    Returns:
+        List of n_shards symbol lists, each in configuration order
+    """
+    if n_shards < 1:
+        raise ValueError(f"n_shards must be at least 1, got {n_shards}")
+    costs = costs or {}
+    measured = [costs[symbol] for symbol in symbols if symbol in costs]
+    default_cost = sum(measured) / len(measured) if measured else 1.0
+
+    rank = {symbol: i for i, symbol in enumerate(symbols)}
+    # Stable sort: equal costs keep configuration order
+    ordered = sorted(symbols, key=lambda symbol: -costs.get(symbol, default_cost))
+
+    loads = [(0.0, shard) for shard in range(n_shards)]
+    shards: List[List[str]] = [[] for _ in range(n_shards)]
+    for symbol in ordered:
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(symbol)
+        heapq.heappush(loads, (load + costs.get(symbol, default_cost), shard))
+
+    return [sorted(shard, key=rank.__getitem__) for shard in shards]
+
+def shard_loads(shards: List[List[str]], costs: Dict[str, float]) -> List[float]:
+    """
+    Total measured cost of each shard
+
+    Args:
+        shards: Symbol lists per shard
+        costs: Measured cost per symbol; unmeasured symbols count as 0
+
+    Returns:
+        Cost per shard
+    """
+    return [sum(costs.get(symbol, 0.0) for symbol in shard) for shard in shards]
+
+class SymbolCostTracker:
+    """
+    Exponentially weighted moving average of the time each symbol takes to
+    fetch and evaluate, as reported by the shard workers
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        """
+        Initialize the tracker
+
+        Args:
+            alpha: Weight of the newest measurement (0 < alpha <= 1)
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self._costs: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, symbol: str, seconds: float) -> None:
+        """
+        Add a measurement for a symbol
+
+        Args:
+            symbol: Trading pair symbol
+            seconds: Time spent on one evaluation of the symbol
+        """
+        with self._lock:
+            previous = self._costs.get(symbol)
+            if previous is None:
+                self._costs[symbol] = seconds
+            else:
+                self._costs[symbol] = previous + self.alpha * (seconds - previous)
+
+    def costs(self) -> Dict[str, float]:
+        """
+        Get the current cost estimates
+
+        Returns:
+            Dictionary of symbol to average seconds per evaluation
+        """
+        with self._lock:
+            return dict(self._costs)
@@ -0,0 +1,252 @@
+# trading_bot/distributed/worker.py
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from trading_bot.data.providers.ccxt_provider import CCXTProvider
+from trading_bot.models.data_models import Position, Signal
+from trading_bot.strategies.factory import StrategyFactory
+from trading_bot.utils.clock import SimulatedClock, get_clock, set_clock
+from trading_bot.utils.config import Config
+from trading_bot.utils.events import Event, EventType
+from trading_bot.utils.symbol_utils import normalize_symbol
+
+class PositionView:
+    """
+    Read-only stand-in for PositionTracker inside a shard worker.
+
+    Strategies only read positions; the coordinator owns the real
+    PositionTracker and sends its open positions with every evaluate
+    command.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, Position] = {}
+
+    def update(self, positions: List[Position]) -> None:
+        """
+        Replace the known positions
+
+        Args:
+            positions: Open positions from the coordinator's PositionTracker
+        """
+        self._positions = {normalize_symbol(position.symbol): position for position in positions}
+
+    def get_position(self, symbol: str) -> Optional[Position]:
+        """
+        Get position information for a specific symbol
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Position object or None if no position exists
+        """
+        return self._positions.get(normalize_symbol(symbol))
+
+    def get_all_positions(self) -> List[Position]:
+        """
+        Get all known positions
+
+        Returns:
+            List of Position objects
+        """
+        return list(self._positions.values())
+
+class ShardWorker:
+    """
+    Fetches candles and runs strategies for one shard of the configured
+    symbols. Produces signals only; orders, risk checks and positions stay
+    with the coordinator.
+    """
+
+    def __init__(self,
+                 shard_id: int,
+                 config_path: str,
+                 exchange_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the worker
+
+        Args:
+            shard_id: Index of this shard
+            config_path: Path to the bot configuration file
+            exchange_factory: Optional picklable callable returning an exchange
+                object with the ccxt API; by default the worker connects to
+                exchange.id with the credentials from the environment
+        """
+        self.shard_id = shard_id
+        self.logger = logging.getLogger(__name__)
+        self.config = Config(config_path)
+        self.timeframe = self.config.get_strict('trading.timeframe')
+
+        exchange = exchange_factory() if exchange_factory is not None else None
+        if exchange is None:
+            load_dotenv()
+        self.data_provider = CCXTProvider(
+            exchange_id=self.config.get_strict('exchange.id'),
+            api_key=os.environ.get('EXCHANGE_API_KEY'),
+            secret=os.environ.get('EXCHANGE_SECRET'),
+            params=self.config.get('exchange.params', {}),
+            exchange=exchange
+        )
+        self.positions = PositionView()
+        self.strategies: Dict[str, Any] = {}
+
+    def assign(self, symbols: List[str]) -> None:
+        """
+        Set the symbols this worker evaluates, creating strategies for new ones
+
+        Args:
+            symbols: Symbols of this shard
+        """
+        wanted = set(symbols)
+        for symbol in list(self.strategies):
+            if symbol not in wanted:
+                del self.strategies[symbol]
+
+        for symbol in symbols:
+            if symbol in self.strategies:
+                continue
+            strategy_config = self.config.config['strategy'].copy()
+            strategy_config['timeframe'] = self.timeframe
+            self.strategies[symbol] = StrategyFactory.create_strategy(
+                strategy_config,
+                exchange=self.data_provider.exchange,
+                data_provider=self.data_provider,
+                trading_pairs=[symbol],
+                position_tracker=self.positions
+            )
+        self.logger.info(f"Shard {self.shard_id} evaluating {len(self.strategies)} symbols")
+
+    def evaluate(self, due: List[Tuple[str, str]],
+                 positions: List[Position]) -> Tuple[Dict[str, List[Signal]], Dict[str, float]]:
+        """
+        Fetch candles for the due symbols and run their strategies
+
+        Args:
+            due: (symbol, timeframe) pairs to evaluate
+            positions: Open positions from the coordinator
+
+        Returns:
+            Tuple of (signals per symbol, seconds spent per symbol)
+        """
+        self.positions.update(positions)
+        signals: Dict[str, List[Signal]] = {}
+        costs: Dict[str, float] = {}
+
+        for symbol, timeframe in due:
+            strategy = self.strategies.get(symbol)
+            if strategy is None:
+                self.logger.warning(f"Shard {self.shard_id} received {symbol}, which it does not own")
+                continue
+
+            start = time.perf_counter()
+            try:
+                required_candles = getattr(strategy, 'get_required_data_points', lambda: 100)()
+                candles = self.data_provider.get_historical_data(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    limit=required_candles
+                )
+                if len(candles) < required_candles:
+                    self.logger.warning(f"Not enough candles for {symbol}: {len(candles)}/{required_candles}")
+                    signals[symbol] = []
+                else:
+                    signals[symbol] = strategy.generate_signals(candles)
+            except Exception as e:
+                self.logger.error(f"Error processing {symbol}: {e}")
+                signals[symbol] = []
+            costs[symbol] = time.perf_counter() - start
+
+        return signals, costs
+
+def run_shard_worker(shard_id: int,
+                     config_path: str,
+                     symbols: List[str],
+                     commands,
+                     results,
+                     exchange_factory: Optional[Callable[[], Any]] = None,
+                     simulated_time: Optional[float] = None,
+                     log_level: str = "INFO",
+                     signal_channel=None) -> None:
+    """
+    Entry point of a shard worker process
+
+    Handles commands from the coordinator until it receives ('stop',):
+
+    - ('assign', symbols): change the symbols of this shard
+    - ('evaluate', tick, current_time, due, positions): evaluate due symbols
+      and reply ('result', shard_id, tick, signals, costs); with a
+      signal_channel the signals are sent over it as SIGNAL_GENERATED
+      events carrying {'tick': tick, 'signal': signal} and the reply
+      carries None in their place
+
+    Replies ('ready', shard_id) once set up and ('error', shard_id, tick,
+    message) when a command fails.
+
+    Args:
+        shard_id: Index of this shard
+        config_path: Path to the bot configuration file
+        symbols: Initial symbols of this shard
+        commands: Queue the coordinator sends commands on
+        results: Queue shared by all workers for replies
+        exchange_factory: Optional picklable callable returning an exchange
+        simulated_time: When set, the worker follows the coordinator's
+            simulated time through a SimulatedClock starting here
+        log_level: Logging level for the worker process
+        signal_channel: Optional SharedMemoryEventChannel for the signals
+    """
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper(), logging.INFO),
+        format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger = logging.getLogger(__name__)
+
+    if simulated_time is not None:
+        set_clock(SimulatedClock(simulated_time))
+
+    try:
+        worker = ShardWorker(shard_id, config_path, exchange_factory=exchange_factory)
+        worker.assign(symbols)
+    except Exception as e:
+        logger.error(f"Shard {shard_id} failed to start: {e}")
+        results.put(('error', shard_id, None, str(e)))
+        return
+    results.put(('ready', shard_id))
+
+    while True:
+        command = commands.get()
+        kind = command[0]
+        if kind == 'stop':
+            break
+
+        tick = None
+        try:
+            if kind == 'assign':
+                worker.assign(command[1])
+            elif kind == 'evaluate':
+                _, tick, current_time, due, positions = command
+                if simulated_time is not None:
+                    get_clock().set_time(current_time)
+                signals, costs = worker.evaluate(due, positions)
+                if signal_channel is not None:
+                    for symbol_signals in signals.values():
+                        for signal in symbol_signals:
+                            signal_channel.send(
+                                Event(EventType.SIGNAL_GENERATED, {'tick': tick, 'signal': signal}),
+                                timeout=60
+                            )
+                    signals = None
+                results.put(('result', shard_id, tick, signals, costs))
+            else:
+                raise ValueError(f"Unknown shard command: {kind}")
+        except Exception as e:
+            logger.error(f"Shard {shard_id} failed to handle {kind}: {e}")
+            results.put(('error', shard_id, tick, str(e)))
+
+    if signal_channel is not None:
+        signal_channel.close()
+    logger.info(f"Shard {shard_id} stopped")
@@ -1,5 +1,4 @@
 # trading_bot/execution/ccxt_executor.py
-import ccxt
 from typing import Dict, List, Any, Optional
 from trading_bot.interfaces.order_executor import OrderExecutor
 from trading_bot.models.data_models import Order, Trade, Position
@@ -50,101 +49,11 @@ class CCXTExecutor(OrderExecutor):
         order_logger = logging.getLogger("orders")
         
         try:
-            # Get trading pair
-            symbol = order.symbol
-            
-            # Get order details
-            order_type = order.order_type
-            side = order.side
-            amount = order.amount
-            price = order.price
-            
-            # Log detailed order information
-            self.logger.info(f"Order: {side} {amount} {symbol} at {order_type} price")
-            order_logger.debug(
-                f"Order details:\n"
-                f"  Symbol: {symbol}\n"
-                f"  Order Type: {order_type}\n"
-                f"  Side: {side}\n"
-                f"  Amount: {amount:.8f}\n"
-                f"  Price: {price if price else 'Market'}"
-            )
-            
-            # Conditionally log optional attributes if they exist
-            order_id = getattr(order, 'id', None)
-            if order_id is not None:
-                order_logger.debug(f"  Order ID: {order_id}")
-                
-            strategy = getattr(order, 'strategy', None)
-            if strategy is not None:
-                order_logger.debug(f"  Strategy: {strategy}")
-                
-            signal_price = getattr(order, 'signal_price', None)
-            if signal_price is not None:
-                order_logger.debug(f"  Signal Price: {signal_price}")
-            
             # Get market info to check limits
             markets = self.exchange.load_markets()
-            if symbol in markets:
-                market_info = markets[symbol]
-                
-                # Log market limits for debugging
-                order_logger.debug(
-                    f"Market info for {symbol}:\n"
-                    f"  Limits - Amount: {market_info.get('limits', {}).get('amount', {})}\n"
-                    f"  Limits - Price: {market_info.get('limits', {}).get('price', {})}\n"
-                    f"  Limits - Cost: {market_info.get('limits', {}).get('cost', {})}\n"
-                    f"  Precision - Amount: {market_info.get('precision', {}).get('amount')}\n"
-                    f"  Precision - Price: {market_info.get('precision', {}).get('price')}"
-                )
-                
-                # Check for minimum amount
-                min_amount = market_info.get('limits', {}).get('amount', {}).get('min')
-                if min_amount and amount < min_amount:
-                    error_msg = f"{self.exchange.id} amount of {symbol} must be greater than minimum amount precision of {min_amount}"
-                    self.logger.error(f"Error placing order: {error_msg}")
-                    order_logger.error(f"Order validation failed: {error_msg}")
-                    raise ValueError(error_msg)
-                
-                # Round amount to exchange precision if needed
-                precision = market_info.get('precision', {}).get('amount')
-                if precision is not None and isinstance(precision, int):
-                    rounded_amount = round(amount, precision)
-                    if rounded_amount != amount:
-                        order_logger.debug(f"Amount adjusted for precision: {amount:.8f} -> {rounded_amount:.8f}")
-                        amount = rounded_amount
-            else:
-                order_logger.warning(f"Could not find market info for {symbol}")
-            
-            # Set up parameters for the order
-            params = {}
+            request = self._prepare_order(order, markets)
             
-            # Need special handling for order types in some exchanges
-            if order_type == 'market':
-                # For market orders, don't include price
-                order_result = self.exchange.create_order(
-                    symbol=symbol,
-                    type=order_type,
-                    side=side,
-                    amount=amount,
-                    params=params
-                )
-            else:
-                # For limit orders, include price
-                if price is None:
-                    error_msg = f"Price is required for limit orders"
-                    self.logger.error(error_msg)
-                    order_logger.error(error_msg)
-                    raise ValueError(error_msg)
-                
-                order_result = self.exchange.create_order(
-                    symbol=symbol,
-                    type=order_type,
-                    side=side,
-                    amount=amount,
-                    price=price,
-                    params=params
-                )
+            order_result = self.exchange.create_order(**request)
                 
             # Log successful order
             self.logger.info(f"Order placed successfully: {order_result.get('id')}")
@@ -153,22 +62,132 @@ class CCXTExecutor(OrderExecutor):
             return order_result
             
         except Exception as e:
-            error_message = f"Error placing order: {str(e)}"
-            self.logger.error(error_message)
+            self._log_order_error(order, e)
+            raise
+    
+    def _prepare_order(self, order: Order, markets: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate an order against market limits and build the create_order arguments
+        
+        Args:
+            order: Order object with details
+            markets: Markets returned by load_markets
             
-            # Log detailed error information
-            order_logger.error(
-                f"Order execution error:\n"
-                f"  Error: {str(e)}\n"
-                f"  Error type: {type(e).__name__}\n"
-                f"  Symbol: {order.symbol}\n"
-                f"  Side: {order.side}\n"
-                f"  Amount: {order.amount}\n"
-                f"  Order type: {order.order_type}\n"
-                f"  Exchange: {self.exchange.id}"
+        Returns:
+            Keyword arguments for exchange.create_order
+        """
+        order_logger = logging.getLogger("orders")
+        
+        # Get trading pair
+        symbol = order.symbol
+        
+        # Get order details
+        order_type = order.order_type
+        side = order.side
+        amount = order.amount
+        price = order.price
+        
+        # Log detailed order information
+        self.logger.info(f"Order: {side} {amount} {symbol} at {order_type} price")
+        order_logger.debug(
+            f"Order details:\n"
+            f"  Symbol: {symbol}\n"
+            f"  Order Type: {order_type}\n"
+            f"  Side: {side}\n"
+            f"  Amount: {amount:.8f}\n"
+            f"  Price: {price if price else 'Market'}"
+        )
+        
+        # Conditionally log optional attributes if they exist
+        order_id = getattr(order, 'id', None)
+        if order_id is not None:
+            order_logger.debug(f"  Order ID: {order_id}")
+            
+        strategy = getattr(order, 'strategy', None)
+        if strategy is not None:
+            order_logger.debug(f"  Strategy: {strategy}")
+            
+        signal_price = getattr(order, 'signal_price', None)
+        if signal_price is not None:
+            order_logger.debug(f"  Signal Price: {signal_price}")
+        
+        if symbol in markets:
+            market_info = markets[symbol]
+            
+            # Log market limits for debugging
+            order_logger.debug(
+                f"Market info for {symbol}:\n"
+                f"  Limits - Amount: {market_info.get('limits', {}).get('amount', {})}\n"
+                f"  Limits - Price: {market_info.get('limits', {}).get('price', {})}\n"
+                f"  Limits - Cost: {market_info.get('limits', {}).get('cost', {})}\n"
+                f"  Precision - Amount: {market_info.get('precision', {}).get('amount')}\n"
+                f"  Precision - Price: {market_info.get('precision', {}).get('price')}"
             )
             
-            raise
+            # Check for minimum amount
+            min_amount = market_info.get('limits', {}).get('amount', {}).get('min')
+            if min_amount and amount < min_amount:
+                error_msg = f"{self.exchange.id} amount of {symbol} must be greater than minimum amount precision of {min_amount}"
+                self.logger.error(f"Error placing order: {error_msg}")
+                order_logger.error(f"Order validation failed: {error_msg}")
+                raise ValueError(error_msg)
+            
+            # Round amount to exchange precision if needed
+            precision = market_info.get('precision', {}).get('amount')
+            if precision is not None and isinstance(precision, int):
+                rounded_amount = round(amount, precision)
+                if rounded_amount != amount:
+                    order_logger.debug(f"Amount adjusted for precision: {amount:.8f} -> {rounded_amount:.8f}")
+                    amount = rounded_amount
+        else:
+            order_logger.warning(f"Could not find market info for {symbol}")
+        
+        # Set up parameters for the order
+        params = {}
+        
+        # Need special handling for order types in some exchanges
+        if order_type == 'market':
+            # For market orders, don't include price
+            return {
+                'symbol': symbol,
+                'type': order_type,
+                'side': side,
+                'amount': amount,
+                'params': params,
+            }
+        
+        # For limit orders, include price
+        if price is None:
+            error_msg = f"Price is required for limit orders"
+            self.logger.error(error_msg)
+            order_logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        return {
+            'symbol': symbol,
+            'type': order_type,
+            'side': side,
+            'amount': amount,
+            'price': price,
+            'params': params,
+        }
+    
+    def _log_order_error(self, order: Order, e: Exception) -> None:
+        """Log a failed order with its details"""
+        error_message = f"Error placing order: {str(e)}"
+        self.logger.error(error_message)
+        
+        # Log detailed error information
+        logging.getLogger("orders").error(
+            f"Order execution error:\n"
+            f"  Error: {str(e)}\n"
+            f"  Error type: {type(e).__name__}\n"
+            f"  Symbol: {order.symbol}\n"
+            f"  Side: {order.side}\n"
+            f"  Amount: {order.amount}\n"
+            f"  Order type: {order.order_type}\n"
+            f"  Exchange: {self.exchange.id}"
+        )
     
     def cancel_order(self, order_id: str, symbol: str) -> bool:
         """
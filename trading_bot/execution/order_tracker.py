@@ -0,0 +1,212 @@
+# trading_bot/execution/order_tracker.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from trading_bot.utils.events import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Order states after which no further fills arrive
+TERMINAL_STATUSES = frozenset({'closed', 'canceled', 'cancelled', 'expired', 'rejected'})
+
+def _float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+class _OrderState:
+    """Fills of an order published so far"""
+    __slots__ = ('symbol', 'market_type', 'filled', 'cost', 'trade_keys', 'failures')
+
+    def __init__(self, symbol: str, market_type: str):
+        self.symbol = symbol
+        self.market_type = market_type
+        self.filled = 0.0
+        self.cost = 0.0
+        # Ids of the published trades, or (timestamp, price, amount) for trades without one
+        self.trade_keys = set()
+        self.failures = 0
+
+class OrderTracker:
+    """
+    Follows placed orders until they are done and publishes their fills.
+
+    Every ORDER_PLACED order is inspected for fills: the trades listed in
+    the order response or, without them, the growth of its filled amount
+    and cost. Each new fill is published as an ORDER_FILLED event with
+    {'order', 'trade', 'market_type'}, where trade holds the fill's amount
+    and price. Orders that are not done yet are polled with fetch_order
+    every poll_interval seconds until they are.
+    """
+
+    def __init__(self, exchange, event_bus, poll_interval: float = 10.0,
+                 max_open_orders: int = 1000, max_poll_failures: int = 5):
+        """
+        Initialize the order tracker and subscribe it to ORDER_PLACED
+
+        Args:
+            exchange: CCXT exchange instance used to poll open orders
+            event_bus: Event bus receiving ORDER_FILLED events
+            poll_interval: Seconds between polls of the open orders
+            max_open_orders: Open orders followed; the oldest are dropped beyond it
+            max_poll_failures: Consecutive failed polls after which an order is dropped
+        """
+        self.exchange = exchange
+        self.event_bus = event_bus
+        self.poll_interval = poll_interval
+        self.max_open_orders = max_open_orders
+        self.max_poll_failures = max_poll_failures
+        # Order id -> state, oldest first
+        self._open: 'OrderedDict[str, _OrderState]' = OrderedDict()
+        self._last_poll: Optional[float] = None
+        # ORDER_PLACED may be handled on event worker threads while the main loop polls
+        self._lock = threading.Lock()
+        self._stats = {'orders': 0, 'fills': 0, 'polls': 0}
+
+        self.event_bus.subscribe(EventType.ORDER_PLACED, self._handle_order_placed)
+
+    def _handle_order_placed(self, event: Event) -> None:
+        """Publish the fills of a placed order and follow it if it is not done"""
+        order = event.data.get('order')
+        if not isinstance(order, dict) or order.get('id') is None:
+            return
+        signal = event.data.get('signal')
+        market_type = signal.params.get('market_type', 'spot') if signal is not None else 'spot'
+        self._stats['orders'] += 1
+        self.track(order, market_type)
+
+    def track(self, order: Dict[str, Any], market_type: str = 'spot') -> None:
+        """
+        Publish the fills of an order response and follow the order until it is done
+
+        Args:
+            order: Order response from the exchange
+            market_type: 'spot' or 'futures', passed on with the fills
+        """
+        order_id = str(order['id'])
+        with self._lock:
+            state = self._open.pop(order_id, None) or _OrderState(order.get('symbol'), market_type)
+            events = self._fill_events(order, state)
+            if order.get('status') not in TERMINAL_STATUSES:
+                self._open[order_id] = state
+                while len(self._open) > self.max_open_orders:
+                    dropped, _ = self._open.popitem(last=False)
+                    logger.warning(f"Following too many open orders, dropping order {dropped}")
+        self._publish(events)
+
+    def _new_fills(self, order: Dict[str, Any], state: _OrderState) -> List[Dict[str, Any]]:
+        """Fills of an order response not published yet"""
+        symbol = order.get('symbol') or state.symbol
+        fills = []
+        trades = order.get('trades') or []
+        if trades:
+            for trade in trades:
+                amount = _float(trade.get('amount'))
+                price = _float(trade.get('price'))
+                if amount <= 0 or price <= 0:
+                    continue
+                key = trade.get('id')
+                if key is None:
+                    key = (trade.get('timestamp'), price, amount)
+                if key in state.trade_keys:
+                    continue
+                state.trade_keys.add(key)
+                fills.append(dict(trade, symbol=trade.get('symbol') or symbol,
+                                  side=trade.get('side') or order.get('side'), order=order['id']))
+            # Keep the amount-based accounting in step for responses without trades
+            state.filled = max(state.filled, _float(order.get('filled')))
+            state.cost = max(state.cost, _float(order.get('cost')))
+            return fills
+
+        filled = _float(order.get('filled'))
+        amount = filled - state.filled
+        if amount <= filled * 1e-12:
+            return fills
+        cost = _float(order.get('cost'))
+        if cost > state.cost:
+            price = (cost - state.cost) / amount
+        else:
+            price = _float(order.get('average')) or _float(order.get('price'))
+        if price <= 0:
+            logger.warning(f"Order {order['id']} filled {amount} {symbol} without a price, fill not published")
+            return fills
+        state.filled = filled
+        state.cost = cost if cost > 0 else state.cost + amount * price
+        fills.append({
+            'id': None,
+            'order': order['id'],
+            'symbol': symbol,
+            'side': order.get('side'),
+            'amount': amount,
+            'price': price,
+            'cost': amount * price,
+            'fee': None,
+            'timestamp': order.get('lastTradeTimestamp') or order.get('timestamp'),
+        })
+        return fills
+
+    def _fill_events(self, order: Dict[str, Any], state: _OrderState) -> List[Event]:
+        """ORDER_FILLED events of the new fills of an order response, called under the lock"""
+        events = [
+            Event(EventType.ORDER_FILLED, {'order': order, 'trade': trade, 'market_type': state.market_type})
+            for trade in self._new_fills(order, state)
+        ]
+        self._stats['fills'] += len(events)
+        return events
+
+    def _publish(self, events: List[Event]) -> None:
+        # Published without the lock: handlers may place orders that are tracked in turn
+        for event in events:
+            self.event_bus.publish(event)
+
+    def pending_orders(self) -> int:
+        """Number of orders followed until they are done"""
+        return len(self._open)
+
+    def poll(self, current_time: float) -> None:
+        """
+        Fetch the open orders once poll_interval has passed and publish their fills
+
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        if not self._open:
+            return
+        if self._last_poll is not None and current_time - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = current_time
+
+        with self._lock:
+            orders = list(self._open.items())
+        for order_id, state in orders:
+            self._stats['polls'] += 1
+            try:
+                order = self.exchange.fetch_order(order_id, state.symbol)
+            except Exception as e:
+                state.failures += 1
+                if state.failures >= self.max_poll_failures:
+                    logger.warning(f"Dropping order {order_id} after {state.failures} failed polls: {e}")
+                    with self._lock:
+                        self._open.pop(order_id, None)
+                else:
+                    logger.debug(f"Error polling order {order_id}: {e}")
+                continue
+            state.failures = 0
+            with self._lock:
+                events = self._fill_events(order, state)
+                if order.get('status') in TERMINAL_STATUSES:
+                    self._open.pop(order_id, None)
+            self._publish(events)
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get order tracking counters
+
+        Returns:
+            Dictionary with orders seen, fills published, polls made and
+            orders still open
+        """
+        return dict(self._stats, open_orders=len(self._open))
@@ -1,9 +1,11 @@
 # trading_bot/interfaces/data_provider.py
 from abc import ABC, abstractmethod
-import pandas as pd
-from typing import Dict, List, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class DataProvider(ABC):
     """
     Abstract interface for market data providers.
@@ -17,7 +19,7 @@ class DataProvider(ABC):
                            symbol: str, 
                            timeframe: str, 
                            since: Optional[Union[datetime, int]] = None,
-                           limit: Optional[int] = None) -> pd.DataFrame:
+                           limit: Optional[int] = None) -> 'pd.DataFrame':
         """
         Retrieve historical OHLCV data
         
@@ -1,7 +1,7 @@
 # trading_bot/interfaces/risk_manager.py
 from abc import ABC, abstractmethod
 from typing import Dict, Tuple, Any, Optional
-from trading_bot.models.data_models import Signal, Order
+from trading_bot.models.data_models import Signal, Order, PositionSnapshot
 
 class RiskManager(ABC):
     """
@@ -12,12 +12,13 @@ class RiskManager(ABC):
     """
     
     @abstractmethod
-    def validate_signal(self, signal: Signal) -> Tuple[bool, str]:
+    def validate_signal(self, signal: Signal, positions: Optional[PositionSnapshot] = None) -> Tuple[bool, str]:
         """
         Validate if a signal should be executed based on risk rules
         
         Args:
             signal: Signal to validate
+            positions: Position snapshot of the current processing pass
             
         Returns:
             Tuple of (is_valid, reason) where:
@@ -27,12 +28,13 @@ class RiskManager(ABC):
         pass
     
     @abstractmethod
-    def calculate_position_size(self, signal: Signal) -> float:
+    def calculate_position_size(self, signal: Signal, positions: Optional[PositionSnapshot] = None) -> float:
         """
         Calculate appropriate position size for a signal
         
         Args:
             signal: Trading signal
+            positions: Position snapshot of the current processing pass
             
         Returns:
             Position size in base currency
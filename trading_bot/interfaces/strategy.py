@@ -1,9 +1,11 @@
 # trading_bot/interfaces/strategy.py
 from abc import ABC, abstractmethod
-import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from trading_bot.models.data_models import Signal
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class Strategy(ABC):
     """
     Abstract interface for trading strategies.
@@ -12,7 +14,7 @@ class Strategy(ABC):
     """
     
     @abstractmethod
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+    def generate_signals(self, data: 'pd.DataFrame') -> List[Signal]:
         """
         Analyze data and generate trading signals
         
@@ -1,22 +1,42 @@
 # trading_bot/main.py
-import time
 import argparse
 import os
 import signal
 import sys
+import time
 import logging
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from trading_bot.utils.config import Config
 from trading_bot.utils.logging import setup_logging
-from trading_bot.utils.events import EventBus, EventType, Event
+from trading_bot.utils.events import EventBus, EventType, Event, PriceUpdate, RiskLimitBreach
+from trading_bot.utils.queued_events import COALESCED_EVENT_TYPES, QueuedEventBus
+from trading_bot.utils.journal import EventJournal
+from trading_bot.utils.warm_state import load_warm_state, save_warm_state
+from trading_bot.utils.event_codec import EventCodecError
+from trading_bot.utils.memory import MemoryMonitor
+from trading_bot.utils.clock import get_clock
+from trading_bot.utils.symbol_utils import normalize_symbol
 
-from trading_bot.data.providers.ccxt_provider import CCXTProvider
 from trading_bot.strategies.factory import StrategyFactory
 from trading_bot.execution.ccxt_executor import CCXTExecutor
+from trading_bot.execution.order_tracker import OrderTracker
 from trading_bot.risk.basic_risk_manager import BasicRiskManager
 from trading_bot.models.data_models import Order, Signal, PositionTracker
+from trading_bot.data.trade_ledger import TradeLedger
+
+# Map timeframes to seconds for throttling signal checks
+TIMEFRAME_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+    '4h': 14400,
+    '1d': 86400
+}
 
 class TradingBot:
     """
@@ -26,7 +46,8 @@ class TradingBot:
     def __init__(self, 
                  config_path: str, 
                  dry_run: bool = False,
-                 log_level: str = "INFO"):
+                 log_level: str = "INFO",
+                 exchange=None):
         """
         Initialize the trading bot
         
@@ -34,9 +55,12 @@ class TradingBot:
             config_path: Path to the configuration file
             dry_run: Whether to run in dry run mode (default: False)
             log_level: Logging level (e.g., DEBUG, INFO, WARNING, ERROR)
+            exchange: Optional pre-built exchange object with the ccxt API
+                (e.g. a SimulatedExchange) used instead of connecting to exchange.id
         """
         self.config_path = config_path
         self.dry_run = dry_run
+        self._exchange = exchange
         self.config = self._load_config()
         
         # Setup logging first, using the provided log_level
@@ -46,16 +70,30 @@ class TradingBot:
         self.logger = logging.getLogger(__name__)
         
         # Create event bus
-        self.event_bus = EventBus()
+        self.event_bus = self._create_event_bus()
+        
+        # Warm state of the previous run, used by the components below
+        self._warm_state = self._load_warm_state()
+        
+        # Optional trade history database, written by the position tracker and order events
+        self._setup_history()
         
         # Set up components
         self._setup_components()
+        self._restore_candles()
+        
+        # Optional worker pool for fetching and evaluating symbols concurrently
+        self._setup_symbol_pool()
+        
+        # Register bounded structures for on-demand memory accounting
+        self._setup_memory_monitor()
         
         # Register event handlers
         self._register_events()
         
         # Flag to control the main loop
         self.running = False
+        self._loop_prepared = False
         
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
@@ -64,6 +102,9 @@ class TradingBot:
         # Track drawdown positions that failed to close
         self._drawdown_close_retries = {}
         
+        # Optional event journal; recovers pending drawdown closes of the previous run
+        self._setup_journal()
+        
         self.logger.info("Trading bot initialized")
     
     def _load_config(self) -> Config:
@@ -80,6 +121,11 @@ class TradingBot:
     
     def _setup_components(self):
         """Set up all bot components based on configuration"""
+        # pandas comes in with these; importing them here keeps importing
+        # this module (e.g. for --help) fast
+        from trading_bot.data.providers.ccxt_provider import CCXTProvider
+        from trading_bot.data.candle_store import CandleStore
+        
         load_dotenv()
 
         # Set up data provider with required parameters
@@ -91,21 +137,27 @@ class TradingBot:
         api_key = os.environ.get('EXCHANGE_API_KEY')
         secret = os.environ.get('EXCHANGE_SECRET')
         
-        # Validate that keys were found
-        if not api_key:
-            raise ValueError("API key not found. Please set EXCHANGE_API_KEY environment variable.")
-        if not secret:
-            raise ValueError("API secret not found. Please set EXCHANGE_SECRET environment variable.")
+        # Validate that keys were found (not needed for an injected exchange)
+        if self._exchange is None:
+            if not api_key:
+                raise ValueError("API key not found. Please set EXCHANGE_API_KEY environment variable.")
+            if not secret:
+                raise ValueError("API secret not found. Please set EXCHANGE_SECRET environment variable.")
         
         # Optional exchange parameters (may have defaults)
         params = self.config.get('exchange.params', {})
         
+        markets, currencies = self._restored_markets()
         self.data_provider = CCXTProvider(
             exchange_id=exchange_id,
             api_key=api_key,
             secret=secret,
-            params=params
+            params=params,
+            exchange=self._exchange,
+            markets=markets,
+            currencies=currencies
         )
+        self._markets_loaded_at = self._warm_state['markets_loaded_at'] if markets else get_clock().time()
         
         # Create strategies for different market types
         self.strategies = {}
@@ -133,10 +185,19 @@ class TradingBot:
         total_trading_pairs = len(trading_symbols)
         self.logger.info(f"Total trading pairs: {total_trading_pairs}")
         
+        # Cost basis of our holdings, synced incrementally from our trades
+        self.trade_ledger = self._create_trade_ledger()
+        
         # Create PositionTracker instance (shared)
-        self.position_tracker = PositionTracker(exchange=self.data_provider.exchange)
+        self.position_tracker = self._create_position_tracker()
         self.logger.info("Initialized shared PositionTracker")
         
+        # Bounded buffer of the most recently fetched candles per symbol
+        self.candle_store = CandleStore(
+            max_candles=self.config.get('system.memory.max_candles', 1000),
+            max_series=total_trading_pairs
+        )
+        
         for symbol_config in trading_symbols:
             if isinstance(symbol_config, dict):
                 if 'symbol' not in symbol_config:
@@ -200,6 +261,13 @@ class TradingBot:
             dry_run=dry_run
         )
         
+        # Turns placed orders into ORDER_FILLED events, polling the ones not filled yet
+        self.order_tracker = OrderTracker(
+            exchange=self.data_provider.exchange,
+            event_bus=self.event_bus,
+            poll_interval=self.config.get('system.orders.poll_interval', 10)
+        )
+        
         # Required risk configuration
         if not self.config.has_key('risk'):
             raise ValueError("Configuration missing required section: 'risk'")
@@ -219,110 +287,369 @@ class TradingBot:
         # Log risk manager configuration
         self.logger.info(f"Risk manager configured with max drawdown: {max_drawdown*100}%")
     
+    def _create_event_bus(self) -> EventBus:
+        """Create the event bus shared by all components"""
+        max_subscribers = self.config.get('system.memory.max_subscribers', 100)
+        
+        # Queued dispatch keeps slow handlers (e.g. order placement) off the data loop
+        workers = self.config.get('system.events.workers', 0)
+        if workers > 0:
+            queue_sizes = self.config.get('system.events.queue_sizes', {})
+            self.logger.info(f"Dispatching events on {workers} worker threads")
+            return QueuedEventBus(
+                max_subscribers=max_subscribers,
+                workers=workers,
+                queue_size=self.config.get('system.events.queue_size', 10000),
+                queue_sizes={EventType[name]: size for name, size in queue_sizes.items()},
+                backpressure=self.config.get('system.events.backpressure', 'block'),
+                coalesce_types=COALESCED_EVENT_TYPES if self.config.get('system.events.coalesce', True) else ()
+            )
+        return EventBus(max_subscribers=max_subscribers)
+    
+    def _setup_journal(self):
+        """Open the event journal when system.journal.enabled is set and journal every published event"""
+        self.journal = None
+        if not self.config.get('system.journal.enabled', False):
+            return
+        
+        self.journal = EventJournal(
+            directory=self.config.get('system.journal.directory', os.path.join('logs', 'journal')),
+            segment_size=int(self.config.get('system.journal.segment_size_mb', 16) * 1024 * 1024),
+            sync_interval=self.config.get('system.journal.sync_interval', 1.0),
+            max_segments=self.config.get('system.journal.max_segments', 4)
+        )
+        self._recover_from_journal()
+        self.event_bus.add_transport(self.journal)
+        
+    def _recover_from_journal(self):
+        """
+        Rebuild in-flight state from the journal of the previous run
+        
+        A drawdown breach without a later close order means the bot stopped
+        (or failed) between the two; the symbol goes back on the retry list,
+        which checks that the position still exists before closing it.
+        """
+        start = time.perf_counter()
+        pending = {}
+        count = 0
+        for _, event in self.journal.replay(event_types=(EventType.RISK_LIMIT_BREACHED, EventType.ORDER_PLACED)):
+            count += 1
+            if event.type == EventType.RISK_LIMIT_BREACHED:
+                pending[event.data.symbol] = event.timestamp
+            elif event.type == EventType.ORDER_PLACED and str(event.data.get('reason', '')).startswith('max_drawdown'):
+                order = event.data.get('order') or {}
+                pending.pop(order.get('symbol'), None)
+                
+        self._drawdown_close_retries.update(pending)
+        self.logger.info(
+            f"Replayed {count} journaled risk and order events in {(time.perf_counter() - start) * 1000:.1f} ms"
+            + (f", retrying drawdown closes for {sorted(pending)}" if pending else "")
+        )
+        
+    def _setup_history(self):
+        """Open the trade history database when system.history.enabled is set"""
+        self.history = None
+        if not self.config.get('system.history.enabled', False):
+            return
+        
+        from trading_bot.data.history_store import TradeHistoryStore
+        self.history = TradeHistoryStore(
+            path=self.config.get('system.history.path', os.path.join('logs', 'history.db')),
+            batch_size=self.config.get('system.history.batch_size', 500),
+            flush_interval=self.config.get('system.history.flush_interval', 1.0)
+        )
+        self.logger.info(f"Recording trade history in {self.history.path}")
+        
+    def _close_history(self):
+        """Commit the queued trade history and close the database"""
+        if self.history is not None:
+            self.history.close()
+            
+    def _close_journal(self):
+        """Detach the event journal from the bus and close it"""
+        if self.journal is not None:
+            self.event_bus.remove_transport(self.journal)
+            self.journal.close()
+            self.journal = None
+    
+    def _load_warm_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the warm-state snapshot when system.warm_state.enabled is set
+        
+        Returns:
+            State saved by _save_warm_state, or None
+        """
+        self.warm_state_path = None
+        if not self.config.get('system.warm_state.enabled', False):
+            return None
+        self.warm_state_path = self.config.get('system.warm_state.path', os.path.join('logs', 'warm_state.bin'))
+        
+        state = load_warm_state(self.warm_state_path)
+        if state is None:
+            return None
+        if state.get('exchange_id') != self.config.get_strict('exchange.id'):
+            self.logger.info(f"Ignoring warm state saved for exchange {state.get('exchange_id')}")
+            return None
+        self.logger.info(f"Restoring warm state saved {get_clock().time() - state['saved_at']:.0f}s ago")
+        return state
+        
+    def _restored_markets(self) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Markets and currencies of the warm state, unless older than system.warm_state.markets_ttl"""
+        state = self._warm_state
+        if not state or not state.get('markets'):
+            return None, None
+        age = get_clock().time() - state['markets_loaded_at']
+        if age > self.config.get('system.warm_state.markets_ttl', 86400):
+            self.logger.info(f"Saved markets are {age:.0f}s old, reloading them")
+            return None, None
+        return state['markets'], state.get('currencies')
+        
+    def _restore_candles(self) -> None:
+        """Refill the candle buffers of the configured symbols from the warm state"""
+        if not self._warm_state:
+            return
+        saved = self._warm_state.get('candles', {})
+        restored = self.candle_store.restore({
+            symbol: saved[symbol] for symbol in self.strategies if symbol in saved
+        })
+        self.logger.info(f"Restored {restored} candle buffers")
+        
+    def _save_warm_state(self, current_time: float) -> None:
+        """
+        Snapshot the state a restart would otherwise rebuild from the exchange
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        self._last_warm_state_save = current_time
+        exchange = self.data_provider.exchange
+        state = {
+            'saved_at': current_time,
+            'exchange_id': self.config.get_strict('exchange.id'),
+            'markets': getattr(exchange, 'markets', None) or None,
+            'currencies': getattr(exchange, 'currencies', None) or None,
+            'markets_loaded_at': self._markets_loaded_at,
+            'candles': self.candle_store.snapshot(),
+            'signal_checks': dict(self._last_signal_check),
+            'last_drawdown_check': self._last_drawdown_check,
+        }
+        try:
+            try:
+                size = save_warm_state(self.warm_state_path, state)
+            except EventCodecError as e:
+                # Markets of some exchanges hold values without a native encoding
+                self.logger.debug(f"Saving warm state without markets: {e}")
+                state['markets'] = state['currencies'] = None
+                size = save_warm_state(self.warm_state_path, state)
+        except (OSError, EventCodecError) as e:
+            self.logger.error(f"Error saving warm state: {e}")
+            return
+        self.logger.debug(f"Saved {size} bytes of warm state to {self.warm_state_path}")
+    
+    def _create_position_tracker(self) -> PositionTracker:
+        """Create the PositionTracker shared by strategies and the risk manager"""
+        return PositionTracker(
+            exchange=self.data_provider.exchange,
+            max_closed_positions=self.config.get('system.memory.max_closed_positions', 100),
+            flush_interval=self.config.get('system.persistence.flush_interval', 5.0),
+            compact_after=self.config.get('system.persistence.compact_after', 1000),
+            history=self.history,
+            reconcile_interval=self.config.get('system.positions.reconcile_interval', 300),
+            ledger=self.trade_ledger
+        )
+    
+    def _create_trade_ledger(self) -> Optional[TradeLedger]:
+        """Create the trade ledger when system.ledger.enabled is set"""
+        if not self.config.get('system.ledger.enabled', False):
+            return None
+        return TradeLedger(
+            exchange=self.data_provider.exchange,
+            path=self.config.get('system.ledger.path', os.path.join('logs', 'trade_ledger.json')),
+            method=self.config.get('system.ledger.method', 'fifo'),
+            sync_interval=self.config.get('system.ledger.sync_interval', 300)
+        )
+    
+    def _setup_symbol_pool(self):
+        """Create the symbol worker pool when trading.parallel_workers is above 1"""
+        self.parallel_workers = self.config.get('trading.parallel_workers', 0)
+        self._symbol_pool = None
+        if self.parallel_workers > 1:
+            self._symbol_pool = ThreadPoolExecutor(
+                max_workers=self.parallel_workers,
+                thread_name_prefix='symbol-worker'
+            )
+            self.logger.info(f"Evaluating symbols on {self.parallel_workers} worker threads")
+    
+    def _shutdown_symbol_pool(self):
+        """Stop the symbol worker pool"""
+        if self._symbol_pool is not None:
+            self._symbol_pool.shutdown(wait=True)
+            self._symbol_pool = None
+    
+    def _shutdown_event_bus(self):
+        """Handle the queued events and stop the event worker threads"""
+        if isinstance(self.event_bus, QueuedEventBus):
+            self.event_bus.close(timeout=30)
+    
+    def _setup_memory_monitor(self):
+        """Set up memory accounting for the bot's long-lived structures"""
+        self.memory_monitor = MemoryMonitor(
+            top_n=self.config.get('system.memory.top_allocations', 10)
+        )
+        self.memory_monitor.register('candle_store', self.candle_store.memory_usage)
+        self.memory_monitor.register('position_tracker', self.position_tracker.memory_usage)
+        self.memory_monitor.register('event_bus', self.event_bus.memory_usage)
+        
+        # Trace allocations from startup if requested, otherwise on first report
+        if self.config.get('system.memory.tracemalloc', False):
+            self.memory_monitor.start()
+    
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Take a memory snapshot of the running bot and log it
+        
+        Returns:
+            Snapshot dictionary from MemoryMonitor.snapshot()
+        """
+        return self.memory_monitor.log_report()
+    
     def _register_events(self):
         """Register event handlers"""
         self.event_bus.subscribe(EventType.SIGNAL_GENERATED, self._handle_signal)
         self.event_bus.subscribe(EventType.ORDER_PLACED, self._handle_order_placed)
         self.event_bus.subscribe(EventType.ORDER_FILLED, self._handle_order_filled)
+        self.event_bus.subscribe(EventType.PRICE_UPDATE, self._handle_price_update)
         self.event_bus.subscribe(EventType.ERROR, self._handle_error)
+        if self.history is not None:
+            self.event_bus.subscribe(EventType.ORDER_PLACED, self._record_order)
+            self.event_bus.subscribe(EventType.ORDER_FILLED, self._record_fill)
     
-    def _handle_signal(self, signal: Signal) -> None:
+    def _handle_signal(self, event: Event) -> None:
         """
         Handle incoming trading signals
         
         Args:
-            signal: Trading signal to process
+            event: SIGNAL_GENERATED event carrying the Signal as its data
         """
         try:
+            signal: Signal = event.data
             self.logger.info(f"Received signal: {signal}")
             
-            # Handle close signals from spot strategies
-            if signal.type == 'close' and signal.strategy_type == 'spot':
-                # Get current position
-                position = self.risk_manager.get_position(signal.symbol)
-                
-                if position:
-                    # Calculate position value in USD
-                    position_value = position.amount * position.current_price
-                    
-                    # Skip if position value is too small
-                    if position_value <= 1.0:
-                        self.logger.warning(
-                            f"Skipping close signal for {signal.symbol} - "
-                            f"position value (${position_value:.2f}) is too small"
-                        )
-                        return
-                    
-                    # Determine side based on position
-                    side = 'sell' if position.side == 'long' else 'buy'
-                    
-                    # Create market order to close position
-                    order = Order(
-                        symbol=signal.symbol,
-                        side=side,
-                        type='market',
-                        amount=position.amount,
-                        price=None,
-                        params={'reduceOnly': True}
-                    )
-                    
-                    # Execute order
-                    result = self.executor.place_order(order)
-                    
-                    if result:
-                        self.logger.info(
-                            f"Position closed for {signal.symbol}: "
-                            f"{position.amount:.8f} units at {position.current_price:.6f}, "
-                            f"value=${position_value:.2f}"
-                        )
-                        self.event_bus.publish(EventType.ORDER_PLACED, result)
-                    else:
-                        self.logger.error(f"Failed to close position for {signal.symbol}")
-                        
-            # Handle buy/sell signals
-            elif signal.type in ['buy', 'sell']:
-                # Validate signal with risk manager
-                # Unpack the tuple returned by validate_signal
-                is_valid, reason = self.risk_manager.validate_signal(signal)
-                self.logger.debug(f"Risk validation result for {signal.symbol}: is_valid={is_valid}, reason='{reason}'") # Add DEBUG log
-                
-                # Check the unpacked boolean value
-                if not is_valid:
-                    # Use the reason from the unpacked tuple
-                    self.logger.info(f"Signal rejected: {reason}")
-                    return
-                
-                # Calculate position size
-                position_size = self.risk_manager.calculate_position_size(signal)
-                
-                if position_size <= 0:
-                    self.logger.warning(f"Invalid position size calculated for {signal.symbol}: {position_size}")
-                    return
-                
-                # Create market order
-                order = Order(
-                    symbol=signal.symbol,
-                    side=signal.type,
-                    type='market',
-                    amount=position_size,
-                    price=None
-                )
-                
-                # Execute order
-                result = self.executor.place_order(order)
-                
-                if result:
-                    self.logger.info(
-                        f"Order executed for {signal.symbol}: "
-                        f"{signal.type.upper()} {position_size:.8f} units"
-                    )
-                    self.event_bus.publish(EventType.ORDER_PLACED, result)
-                else:
-                    self.logger.error(f"Failed to execute {signal.type} order for {signal.symbol}")
+            prepared = self._order_for_signal(signal)
+            if prepared is None:
+                return
+            order, success_message = prepared
+            
+            # Execute order
+            result = self.executor.place_order(order)
+            self._report_signal_order(signal, result, success_message)
                     
         except Exception as e:
             self.logger.error(f"Error handling signal: {e}")
     
+    def _order_for_signal(self, signal: Signal) -> Optional[Tuple[Order, str]]:
+        """
+        Apply risk checks to a signal and build the order that executes it
+        
+        Args:
+            signal: Trading signal
+            
+        Returns:
+            (order, message logged once the order is placed), or None if the
+            signal should not be traded
+        """
+        # Every check of the signal reads the same positions, as refreshed for this pass
+        positions = self.position_tracker.snapshot()
+        
+        # Handle close signals from spot strategies
+        if signal.signal_type == 'close' and signal.params.get('market_type', 'spot') == 'spot':
+            # Get current position
+            position = self.risk_manager.get_position(signal.symbol, positions)
+            
+            if not position:
+                return None
+            
+            # Calculate position value in USD
+            position_value = position.amount * position.current_price
+            
+            # Skip if position value is too small
+            if position_value <= 1.0:
+                self.logger.warning(
+                    f"Skipping close signal for {signal.symbol} - "
+                    f"position value (${position_value:.2f}) is too small"
+                )
+                return None
+            
+            # Determine side based on position
+            side = 'sell' if position.side == 'long' else 'buy'
+            
+            # Create market order to close position
+            order = Order(
+                symbol=signal.symbol,
+                side=side,
+                order_type='market',
+                amount=position.amount,
+                price=None,
+                params={'reduceOnly': True},
+                strategy=signal.strategy_name,
+                signal_price=signal.price
+            )
+            return order, (
+                f"Position closed for {signal.symbol}: "
+                f"{position.amount:.8f} units at {position.current_price:.6f}, "
+                f"value=${position_value:.2f}"
+            )
+        
+        # Handle buy/sell signals
+        if signal.signal_type in ['buy', 'sell']:
+            # Validate signal with risk manager
+            # Unpack the tuple returned by validate_signal
+            is_valid, reason = self.risk_manager.validate_signal(signal, positions)
+            self.logger.debug(f"Risk validation result for {signal.symbol}: is_valid={is_valid}, reason='{reason}'") # Add DEBUG log
+            
+            # Check the unpacked boolean value
+            if not is_valid:
+                # Use the reason from the unpacked tuple
+                self.logger.info(f"Signal rejected: {reason}")
+                return None
+            
+            # Calculate position size
+            position_size = self.risk_manager.calculate_position_size(signal, positions)
+            
+            if position_size <= 0:
+                self.logger.warning(f"Invalid position size calculated for {signal.symbol}: {position_size}")
+                return None
+            
+            # Create market order
+            order = Order(
+                symbol=signal.symbol,
+                side=signal.signal_type,
+                order_type='market',
+                amount=position_size,
+                price=None,
+                strategy=signal.strategy_name,
+                signal_price=signal.price
+            )
+            return order, (
+                f"Order executed for {signal.symbol}: "
+                f"{signal.signal_type.upper()} {position_size:.8f} units"
+            )
+        
+        return None
+    
+    def _report_signal_order(self, signal: Signal, result: Optional[Dict[str, Any]], success_message: str) -> None:
+        """Log the outcome of a signal's order and publish ORDER_PLACED on success"""
+        if result:
+            self.logger.info(success_message)
+            self.event_bus.publish(Event(
+                EventType.ORDER_PLACED,
+                {'order': result, 'signal': signal}
+            ))
+        elif signal.signal_type == 'close':
+            self.logger.error(f"Failed to close position for {signal.symbol}")
+        else:
+            self.logger.error(f"Failed to execute {signal.signal_type} order for {signal.symbol}")
+    
     def _handle_order_placed(self, event: Event):
         """Handle order placed event"""
         order = event.data.get('order')
@@ -330,9 +657,40 @@ class TradingBot:
         self.logger.info(f"Order placed successfully: {order.get('id')}")
     
     def _handle_order_filled(self, event: Event):
-        """Handle order filled event"""
+        """Handle order filled event: apply the fill to the tracked position"""
         order = event.data.get('order')
-        self.logger.info(f"Order filled: {order.get('id')}")
+        trade = event.data.get('trade') or {}
+        self.logger.info(
+            f"Order filled: {order.get('id')} {trade.get('side')} {trade.get('amount')} "
+            f"{trade.get('symbol')} @ {trade.get('price')}"
+        )
+        if trade.get('symbol') and trade.get('side'):
+            if self.trade_ledger is not None:
+                self.trade_ledger.add_trade(trade)
+            self.position_tracker.apply_fill(
+                trade['symbol'], trade['side'], float(trade['amount']), float(trade['price']),
+                market_type=event.data.get('market_type', 'spot')
+            )
+    
+    def _handle_price_update(self, event: Event):
+        """Handle price update event: move the symbol's position to the price, checking its drawdown trigger"""
+        update: PriceUpdate = event.data
+        self.position_tracker.update_prices({normalize_symbol(update.symbol): float(update.price)})
+    
+    def _record_order(self, event: Event):
+        """Add a placed order to the trade history"""
+        signal = event.data.get('signal')
+        self.history.record_order(
+            event.data.get('order') or {},
+            reason=signal.signal_type if signal is not None else event.data.get('reason'),
+            strategy=signal.strategy_name if signal is not None else None
+        )
+    
+    def _record_fill(self, event: Event):
+        """Add the trade of a filled order to the trade history"""
+        trade = event.data.get('trade')
+        if trade:
+            self.history.record_fill(trade, event.data.get('order'))
     
     def _handle_error(self, event: Event):
         """Handle error event"""
@@ -345,6 +703,40 @@ class TradingBot:
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.stop()
     
+    def _prepare_loop(self) -> None:
+        """Read loop intervals from config and reset the loop timers"""
+        # Get drawdown check interval - required in config
+        self._drawdown_check_interval = self.config.get_strict('risk.drawdown_check_interval')
+        self._last_drawdown_check = 0
+        
+        # Internal retry interval - OK to have a default
+        self._retry_interval = 60  # This is an internal parameter, not in config
+        self._last_retry_check = 0
+        
+        # Ticker polls of the open positions between candles, disabled when the interval is 0
+        self._price_poll_interval = self.config.get('risk.price_poll_interval', 0)
+        self._last_price_poll = 0
+        
+        # Periodic memory report, disabled when the interval is 0
+        self._memory_report_interval = self.config.get('system.memory.report_interval', 0)
+        self._last_memory_report = None
+        
+        # Track last signal check time for each symbol and timeframe
+        self._last_signal_check = {}
+        
+        # Periodic warm-state snapshots
+        self._warm_state_interval = self.config.get('system.warm_state.interval', 60)
+        self._last_warm_state_save = None
+        
+        # Resume the schedule of the previous run, so a restart neither
+        # re-evaluates candles it already acted on nor waits a full period
+        if self._warm_state:
+            self._last_signal_check.update(self._warm_state.get('signal_checks', {}))
+            self._last_drawdown_check = self._warm_state.get('last_drawdown_check', 0)
+            self._warm_state = None
+        
+        self._loop_prepared = True
+    
     def run(self):
         """Run the trading bot"""
         self.running = True
@@ -353,251 +745,18 @@ class TradingBot:
         # Publish startup event
         self.event_bus.publish(Event(
             EventType.STARTUP,
-            {'timestamp': time.time()}
+            {'timestamp': get_clock().time()}
         ))
         
-        # Get drawdown check interval - required in config
-        drawdown_check_interval = self.config.get_strict('risk.drawdown_check_interval')
-        last_drawdown_check = 0
-        
-        # Internal retry interval - OK to have a default
-        retry_interval = 60  # This is an internal parameter, not in config
-        last_retry_check = 0
-        
-        # Track last signal check time for each timeframe
-        last_signal_check = {}
-        # Map timeframes to seconds for throttling
-        timeframe_seconds = {
-            '1m': 60,
-            '5m': 300,
-            '15m': 900,
-            '30m': 1800,
-            '1h': 3600,
-            '4h': 14400,
-            '1d': 86400
-        }
+        self._prepare_loop()
+        clock = get_clock()
         
         try:
             while self.running:
-                # Process each trading symbol
-                current_time = time.time()
-                
-                for symbol in self.strategies.keys():
-                    # Skip if key isn't in strategies (shouldn't happen, but better be safe)
-                    if symbol not in self.strategies:
-                        continue
-                    
-                    # Determine timeframe from strategy
-                    timeframe = getattr(self.strategies[symbol], 'timeframe', '1h')
-                    
-                    # Only check for signals at appropriate intervals based on timeframe
-                    # Convert timeframe to seconds and add a small buffer (5 seconds)
-                    check_interval = timeframe_seconds.get(timeframe, 3600) + 5  # Default to 1h if unknown
-                    
-                    # Create a key that combines symbol and timeframe for tracking last check time
-                    symbol_timeframe_key = f"{symbol}_{timeframe}"
-                    
-                    # Initialize last check time if not set
-                    if symbol_timeframe_key not in last_signal_check:
-                        last_signal_check[symbol_timeframe_key] = 0
-                    
-                    # Skip if we checked too recently
-                    if current_time - last_signal_check[symbol_timeframe_key] < check_interval:
-                        self.logger.debug(
-                            f"Skipping signal check for {symbol} - next check in "
-                            f"{check_interval - (current_time - last_signal_check[symbol_timeframe_key]):.0f} seconds"
-                        )
-                        continue
-                    
-                    # Update the last check time
-                    last_signal_check[symbol_timeframe_key] = current_time
-                    
-                    # Fetch latest market data
-                    try:
-                        # Get required data points from strategy
-                        required_candles = getattr(self.strategies[symbol], 'get_required_data_points', lambda: 100)()
-                        
-                        # Fetch candles
-                        candles = self.data_provider.get_historical_data(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            limit=required_candles
-                        )
-                        
-                        # Skip if not enough candles
-                        if len(candles) < required_candles:
-                            self.logger.warning(f"Not enough candles for {symbol}: {len(candles)}/{required_candles}")
-                            continue
-                        
-                        # Generate signals from strategy
-                        signals = self.strategies[symbol].generate_signals(candles)
-                        
-                        # Process signals
-                        for signal in signals:
-                            # Publish signal event
-                            self.event_bus.publish(Event(
-                                EventType.SIGNAL_GENERATED,
-                                signal
-                            ))
-                            
-                    except Exception as e:
-                        self.logger.error(f"Error processing {symbol}: {e}")
-                
-                # Check for drawdown limit breaches at regular intervals
-                if current_time - last_drawdown_check > drawdown_check_interval:
-                    self.logger.debug("Checking positions against drawdown limits")
-                    symbols_to_close = self.risk_manager.check_drawdown_limits()
-                    
-                    # Generate close signals for positions that breached drawdown limits
-                    for symbol in symbols_to_close:
-                        self.logger.warning(f"Maximum drawdown exceeded for {symbol}, generating close signal")
-                        
-                        # Get position details 
-                        position = self.risk_manager.get_position(symbol)
-                        
-                        # If position doesn't exist, try to check spot balance directly
-                        if position is None:
-                            # Extract base currency from symbol
-                            base_currency = symbol.split('/')[0]
-                            
-                            try:
-                                # Directly check balance from exchange
-                                balance = self.data_provider.exchange.fetch_balance()
-                                free_amount = float(balance.get(base_currency, {}).get('free', 0) or 0)
-                                
-                                if free_amount > 0:
-                                    # We have a balance, we can directly close this position
-                                    self.logger.info(f"Found {base_currency} balance directly: {free_amount}")
-                                    
-                                    try:
-                                        # Create an order to close the position
-                                        order = Order(
-                                            symbol=symbol,
-                                            order_type='market',
-                                            side='sell',  # Spot positions are always closed with sell
-                                            amount=free_amount,
-                                            strategy="risk_management",  # Add source of order
-                                            signal_price=0  # No signal price for risk management orders
-                                        )
-                                        
-                                        # Execute order
-                                        order_result = self.executor.place_order(order)
-                                        
-                                        # Publish order placed event
-                                        self.event_bus.publish(Event(
-                                            EventType.ORDER_PLACED,
-                                            {
-                                                'signal': None,  # No signal for this order
-                                                'order': order_result,
-                                                'reason': 'max_drawdown'
-                                            }
-                                        ))
-                                        
-                                        # If this symbol was in retry list, remove it
-                                        if hasattr(self, '_drawdown_close_retries') and symbol in self._drawdown_close_retries:
-                                            del self._drawdown_close_retries[symbol]
-                                            
-                                        continue  # Skip to next symbol
-                                    except Exception as e:
-                                        self.logger.error(f"Error closing position due to max drawdown: {e}")
-                                        # Add to retry list with timestamp
-                                        if hasattr(self, '_drawdown_close_retries'):
-                                            self._drawdown_close_retries[symbol] = current_time
-                            except Exception as e:
-                                self.logger.error(f"Error checking balance for {base_currency}: {e}")
-                        
-                        # If we have a position object, proceed with normal close
-                        if position and position.amount > 0:
-                            try:
-                                # Determine the proper side for closing the position
-                                close_side = 'sell' if position.side.lower() == 'long' else 'buy'
-                                
-                                # Create an order to close the position
-                                order = Order(
-                                    symbol=symbol,
-                                    order_type='market',
-                                    side=close_side,  # Use appropriate side based on position type
-                                    amount=position.amount
-                                )
-                                
-                                # Execute order
-                                order_result = self.executor.place_order(order)
-                                
-                                # Publish order placed event
-                                self.event_bus.publish(Event(
-                                    EventType.ORDER_PLACED,
-                                    {
-                                        'signal': None,  # No signal for this order
-                                        'order': order_result,
-                                        'reason': 'max_drawdown'
-                                    }
-                                ))
-                                
-                                # Remove from retry list if it was there
-                                if symbol in self._drawdown_close_retries:
-                                    del self._drawdown_close_retries[symbol]
-                                    
-                            except Exception as e:
-                                self.logger.error(f"Error closing position due to max drawdown: {e}")
-                                
-                                # Add to retry list with timestamp
-                                self._drawdown_close_retries[symbol] = current_time
-                    
-                    # Update last check time
-                    last_drawdown_check = current_time
-                
-                # Check if we need to retry any failed drawdown close orders
-                if self._drawdown_close_retries and current_time - last_retry_check > retry_interval:
-                    self.logger.debug(f"Retrying {len(self._drawdown_close_retries)} failed drawdown close orders")
-                    
-                    # Create a copy of keys to allow modification during iteration
-                    symbols_to_retry = list(self._drawdown_close_retries.keys())
-                    
-                    for symbol in symbols_to_retry:
-                        # Get position details 
-                        position = self.risk_manager.get_position(symbol)
-                        if position and position.amount > 0:
-                            try:
-                                # Determine the proper side for closing
-                                close_side = 'sell' if position.side.lower() == 'long' else 'buy'
-                                
-                                # Create an order to close the position
-                                order = Order(
-                                    symbol=symbol,
-                                    order_type='market',
-                                    side=close_side,
-                                    amount=position.amount
-                                )
-                                
-                                # Execute order
-                                order_result = self.executor.place_order(order)
-                                
-                                # Publish order placed event
-                                self.event_bus.publish(Event(
-                                    EventType.ORDER_PLACED,
-                                    {
-                                        'signal': None,
-                                        'order': order_result,
-                                        'reason': 'max_drawdown_retry'
-                                    }
-                                ))
-                                
-                                # Remove from retry list
-                                del self._drawdown_close_retries[symbol]
-                                
-                            except Exception as e:
-                                self.logger.error(f"Retry failed for drawdown close of {symbol}: {e}")
-                                # Keep in retry list for next attempt
-                        else:
-                            # Position no longer exists or is empty, remove from retry list
-                            self.logger.info(f"Position {symbol} no longer exists, removing from retry list")
-                            del self._drawdown_close_retries[symbol]
-                    
-                    # Update last retry check time
-                    last_retry_check = current_time
+                self.run_once(clock.time())
                 
                 # Throttle the loop to avoid excessive CPU usage
-                time.sleep(1)
+                clock.sleep(1)
                 
         except Exception as e:
             self.logger.error(f"Error in main loop: {e}")
@@ -612,8 +771,393 @@ class TradingBot:
             
         finally:
             # Clean shutdown
+            self._shutdown_symbol_pool()
+            self._shutdown_event_bus()
+            if self.warm_state_path is not None:
+                self._save_warm_state(clock.time())
+            self.position_tracker.close()
+            if self.trade_ledger is not None:
+                self.trade_ledger.save()
+            self._close_history()
+            self._close_journal()
             self.logger.info("Trading bot stopped")
     
+    def _due_symbols(self, current_time: float) -> List[Tuple[str, str]]:
+        """
+        Find the symbols whose timeframe is due for a signal check
+        
+        Marks each returned symbol as checked at current_time.
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+            
+        Returns:
+            List of (symbol, timeframe) in configuration order
+        """
+        due = []
+        for symbol in self.strategies.keys():
+            # Determine timeframe from strategy
+            timeframe = getattr(self.strategies[symbol], 'timeframe', '1h')
+            
+            # Only check for signals at appropriate intervals based on timeframe
+            # Convert timeframe to seconds and add a small buffer (5 seconds)
+            check_interval = TIMEFRAME_SECONDS.get(timeframe, 3600) + 5  # Default to 1h if unknown
+            
+            # Create a key that combines symbol and timeframe for tracking last check time
+            symbol_timeframe_key = f"{symbol}_{timeframe}"
+            
+            # Initialize last check time if not set
+            if symbol_timeframe_key not in self._last_signal_check:
+                self._last_signal_check[symbol_timeframe_key] = 0
+            
+            # Skip if we checked too recently
+            if current_time - self._last_signal_check[symbol_timeframe_key] < check_interval:
+                self.logger.debug(
+                    f"Skipping signal check for {symbol} - next check in "
+                    f"{check_interval - (current_time - self._last_signal_check[symbol_timeframe_key]):.0f} seconds"
+                )
+                continue
+            
+            # Update the last check time
+            self._last_signal_check[symbol_timeframe_key] = current_time
+            due.append((symbol, timeframe))
+        return due
+    
+    def _evaluate_symbol(self, symbol: str, timeframe: str) -> List[Signal]:
+        """
+        Fetch the latest candles for a symbol and run its strategy
+        
+        Safe to call from worker threads: it does not publish events.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            
+        Returns:
+            Signals generated by the symbol's strategy
+        """
+        try:
+            # Get required data points from strategy
+            required_candles = getattr(self.strategies[symbol], 'get_required_data_points', lambda: 100)()
+            
+            # Fetch the candles the buffer is missing
+            since, limit = self._candle_request(symbol, timeframe, required_candles)
+            candles = self.data_provider.get_historical_data(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=limit
+            )
+            
+            return self._signals_from_candles(symbol, timeframe, candles, required_candles)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing {symbol}: {e}")
+            return []
+    
+    def _candle_request(self, symbol: str, timeframe: str, required_candles: int) -> Tuple[Optional[int], int]:
+        """
+        Work out which candles to fetch for a symbol
+        
+        Once the buffer holds the strategy's window (e.g. restored from the
+        warm state), only the candles from the last buffered one, which may
+        still have been forming, onwards are fetched.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            required_candles: Candles the strategy needs
+            
+        Returns:
+            (since in milliseconds or None, limit) for get_historical_data
+        """
+        buffered = self.candle_store.get(symbol, timeframe)
+        if buffered is None or len(buffered) < required_candles:
+            return None, required_candles
+        
+        last = buffered['timestamp'].iloc[-1].value // 1_000_000
+        missing = int((get_clock().milliseconds() - last) // (TIMEFRAME_SECONDS.get(timeframe, 3600) * 1000)) + 1
+        if missing >= required_candles:
+            return None, required_candles
+        return last, missing
+    
+    def _signals_from_candles(self, symbol: str, timeframe: str, candles, required_candles: int) -> List[Signal]:
+        """
+        Buffer freshly fetched candles and run the symbol's strategy on them
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            candles: DataFrame returned by get_historical_data
+            required_candles: Candles the strategy needs
+            
+        Returns:
+            Signals generated by the symbol's strategy
+        """
+        # Keep the latest candles in the bounded buffer; the strategy sees
+        # its window of the buffer, which incremental fetches keep current
+        merged = self.candle_store.update(symbol, timeframe, candles)
+        candles = merged.iloc[-required_candles:].reset_index(drop=True)
+        
+        # Skip if not enough candles
+        if len(candles) < required_candles:
+            self.logger.warning(f"Not enough candles for {symbol}: {len(candles)}/{required_candles}")
+            return []
+        
+        # Generate signals from strategy
+        return self.strategies[symbol].generate_signals(candles)
+    
+    def run_once(self, current_time: float) -> None:
+        """
+        Run a single iteration of the main loop
+        
+        Evaluates every symbol whose timeframe is due, checks drawdown limits
+        and retries failed drawdown closes. run() calls this once per second;
+        a simulation harness can call it directly with a simulated time.
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        if not self._loop_prepared:
+            self._prepare_loop()
+        if self._last_memory_report is None:
+            self._last_memory_report = current_time
+        
+        # Evaluate every symbol that is due
+        due_symbols = self._due_symbols(current_time)
+        results = self._evaluate_due(due_symbols)
+        
+        # The fetched candles carry the latest prices; positions check them against their drawdown triggers
+        prices = self._latest_closes(due_symbols)
+        if prices:
+            self.position_tracker.update_prices(prices)
+        
+        # Between candles, tickers of the open positions are published as price updates
+        if self._price_poll_interval and current_time - self._last_price_poll >= self._price_poll_interval:
+            self._poll_prices(current_time)
+        
+        drawdown_due = current_time - self._last_drawdown_check > self._drawdown_check_interval
+        retry_due = bool(self._drawdown_close_retries) and current_time - self._last_retry_check > self._retry_interval
+        if drawdown_due or retry_due or any(results):
+            # One refresh per pass; the risk checks below read snapshots of it
+            self.risk_manager.refresh_positions()
+        
+        # Publish signals from this thread only
+        for signals in results:
+            for signal in signals:
+                self.event_bus.publish(Event(
+                    EventType.SIGNAL_GENERATED,
+                    signal
+                ))
+        
+        # Close positions on the pass a price crosses their drawdown trigger, and
+        # check all positions at regular intervals
+        if self.position_tracker.take_breaches() or drawdown_due:
+            self._check_drawdowns(current_time)
+        if drawdown_due:
+            self._last_drawdown_check = current_time
+        
+        # Check if we need to retry any failed drawdown close orders
+        if retry_due:
+            self._retry_drawdown_closes(current_time)
+        
+        # Publish fills of orders that were not filled when placed
+        self.order_tracker.poll(current_time)
+        if self.trade_ledger is not None:
+            self.trade_ledger.save()
+        
+        # Log memory accounting at the configured interval
+        if self._memory_report_interval and current_time - self._last_memory_report > self._memory_report_interval:
+            self.memory_report()
+            self._last_memory_report = current_time
+            
+        # Flush journaled events to disk once they are due
+        if self.journal is not None:
+            self.journal.sync_if_due()
+            
+        # Snapshot warm state for fast restarts
+        if self.warm_state_path is not None:
+            if self._last_warm_state_save is None:
+                self._last_warm_state_save = current_time
+            elif current_time - self._last_warm_state_save > self._warm_state_interval:
+                self._save_warm_state(current_time)
+    
+    def _latest_closes(self, due_symbols: List[Tuple[str, str]]) -> Dict[str, float]:
+        """
+        Get the close of the newest buffered candle of each due symbol
+        
+        Args:
+            due_symbols: (symbol, timeframe) pairs evaluated in this pass
+            
+        Returns:
+            Symbol -> price, for the symbols with buffered candles
+        """
+        prices = {}
+        for symbol, timeframe in due_symbols:
+            candles = self.candle_store.get(symbol, timeframe)
+            if candles is not None and not candles.empty:
+                prices[normalize_symbol(symbol)] = float(candles['close'].iat[-1])
+        return prices
+    
+    def _poll_prices(self, current_time: float) -> None:
+        """
+        Publish the ticker price of every open position as a PRICE_UPDATE
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        for position in self.position_tracker.snapshot().all_positions():
+            try:
+                ticker = self.data_provider.exchange.fetch_ticker(position.symbol)
+            except Exception as e:
+                self.logger.debug(f"Error polling the price of {position.symbol}: {e}")
+                continue
+            event = self._price_update_event(position.symbol, ticker, current_time)
+            if event is not None:
+                self.event_bus.publish(event)
+        self._last_price_poll = current_time
+    
+    def _price_update_event(self, symbol: str, ticker: Any, current_time: float) -> Optional[Event]:
+        """Build the PRICE_UPDATE event of a ticker, or None if it has no last price"""
+        price = ticker.get('last') if isinstance(ticker, dict) else None
+        if not price:
+            return None
+        return Event(EventType.PRICE_UPDATE, PriceUpdate(symbol=symbol, price=float(price), timestamp=current_time))
+    
+    def _evaluate_due(self, due_symbols: List[Tuple[str, str]]) -> List[List[Signal]]:
+        """
+        Evaluate the due symbols, in parallel when a worker pool is configured
+        
+        Args:
+            due_symbols: (symbol, timeframe) pairs returned by _due_symbols
+            
+        Returns:
+            Signals per due symbol, in the order of due_symbols
+        """
+        if self._symbol_pool is not None and len(due_symbols) > 1:
+            futures = [
+                self._symbol_pool.submit(self._evaluate_symbol, symbol, timeframe)
+                for symbol, timeframe in due_symbols
+            ]
+            # Collect in configuration order so signals are published deterministically
+            return [future.result() for future in futures]
+        return [self._evaluate_symbol(symbol, timeframe) for symbol, timeframe in due_symbols]
+    
+    def _check_drawdowns(self, current_time: float) -> None:
+        """
+        Close positions that breached the drawdown limit
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        self.logger.debug("Checking positions against drawdown limits")
+        positions = self.position_tracker.snapshot()
+        symbols_to_close = self.risk_manager.check_drawdown_limits(positions)
+        
+        # Generate close signals for positions that breached drawdown limits
+        for symbol in symbols_to_close:
+            self.logger.warning(f"Maximum drawdown exceeded for {symbol}, generating close signal")
+            self.event_bus.publish(Event(
+                EventType.RISK_LIMIT_BREACHED,
+                RiskLimitBreach(symbol=symbol, reason='max_drawdown')
+            ))
+            
+            # Get position details 
+            position = self.risk_manager.get_position(symbol, positions)
+            
+            # If we have a position object, proceed with normal close
+            if position and position.amount > 0:
+                try:
+                    # Determine the proper side for closing the position
+                    close_side = 'sell' if position.side.lower() == 'long' else 'buy'
+                    
+                    # Create an order to close the position
+                    order = Order(
+                        symbol=symbol,
+                        order_type='market',
+                        side=close_side,  # Use appropriate side based on position type
+                        amount=position.amount
+                    )
+                    
+                    # Execute order
+                    order_result = self.executor.place_order(order)
+                    
+                    # Publish order placed event
+                    self.event_bus.publish(Event(
+                        EventType.ORDER_PLACED,
+                        {
+                            'signal': None,  # No signal for this order
+                            'order': order_result,
+                            'reason': 'max_drawdown'
+                        }
+                    ))
+                    
+                    # Remove from retry list if it was there
+                    if symbol in self._drawdown_close_retries:
+                        del self._drawdown_close_retries[symbol]
+                        
+                except Exception as e:
+                    self.logger.error(f"Error closing position due to max drawdown: {e}")
+                    
+                    # Add to retry list with timestamp
+                    self._drawdown_close_retries[symbol] = current_time
+    
+    def _retry_drawdown_closes(self, current_time: float) -> None:
+        """
+        Retry drawdown closes that failed earlier
+        
+        Args:
+            current_time: Current time in seconds since the epoch
+        """
+        self.logger.debug(f"Retrying {len(self._drawdown_close_retries)} failed drawdown close orders")
+        
+        # Create a copy of keys to allow modification during iteration
+        symbols_to_retry = list(self._drawdown_close_retries.keys())
+        positions = self.position_tracker.snapshot()
+        
+        for symbol in symbols_to_retry:
+            # Get position details 
+            position = self.risk_manager.get_position(symbol, positions)
+            if position and position.amount > 0:
+                try:
+                    # Determine the proper side for closing
+                    close_side = 'sell' if position.side.lower() == 'long' else 'buy'
+                    
+                    # Create an order to close the position
+                    order = Order(
+                        symbol=symbol,
+                        order_type='market',
+                        side=close_side,
+                        amount=position.amount
+                    )
+                    
+                    # Execute order
+                    order_result = self.executor.place_order(order)
+                    
+                    # Publish order placed event
+                    self.event_bus.publish(Event(
+                        EventType.ORDER_PLACED,
+                        {
+                            'signal': None,
+                            'order': order_result,
+                            'reason': 'max_drawdown_retry'
+                        }
+                    ))
+                    
+                    # Remove from retry list
+                    del self._drawdown_close_retries[symbol]
+                    
+                except Exception as e:
+                    self.logger.error(f"Retry failed for drawdown close of {symbol}: {e}")
+                    # Keep in retry list for next attempt
+            else:
+                # Position no longer exists or is empty, remove from retry list
+                self.logger.info(f"Position {symbol} no longer exists, removing from retry list")
+                del self._drawdown_close_retries[symbol]
+        
+        # Update last retry check time
+        self._last_retry_check = current_time
+    
     def stop(self):
         """Stop the trading bot"""
         if not self.running:
@@ -625,7 +1169,7 @@ class TradingBot:
         # Publish shutdown event
         self.event_bus.publish(Event(
             EventType.SHUTDOWN,
-            {'timestamp': time.time()}
+            {'timestamp': get_clock().time()}
         ))
         
         # You could add cleanup code here
@@ -641,7 +1185,33 @@ if __name__ == "__main__":
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], 
         help='Set the logging level (default: INFO)'
     )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Run on the asyncio runtime (trading_bot.aio.AsyncTradingBot)'
+    )
+    parser.add_argument(
+        '--sharded',
+        action='store_true',
+        help='Shard symbols across worker processes (trading_bot.distributed.ShardedTradingBot)'
+    )
+    parser.add_argument(
+        '--nodes',
+        action='store_true',
+        help='Evaluate strategies on worker nodes over the network (trading_bot.distributed.MultiNodeTradingBot)'
+    )
     args = parser.parse_args()
     
-    bot = TradingBot(config_path=args.config, log_level=args.log_level)
+    if args.nodes:
+        from trading_bot.distributed import MultiNodeTradingBot
+        bot = MultiNodeTradingBot(config_path=args.config, log_level=args.log_level)
+    elif args.sharded:
+        from trading_bot.distributed import ShardedTradingBot
+        bot = ShardedTradingBot(config_path=args.config, log_level=args.log_level)
+    elif args.use_async:
+        from trading_bot.aio import AsyncTradingBot
+        bot = AsyncTradingBot(config_path=args.config, log_level=args.log_level)
+    else:
+        bot = TradingBot(config_path=args.config, log_level=args.log_level)
     bot.run()
\ No newline at end of file
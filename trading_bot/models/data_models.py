@@ -1,15 +1,23 @@
 # trading_bot/models/data_models.py
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, TYPE_CHECKING
 from datetime import datetime, timedelta
-import pandas as pd
 from trading_bot.utils.symbol_utils import normalize_symbol, get_base_currency, get_quote_currency
-import json
+from trading_bot.utils.clock import get_clock
+from trading_bot.utils.position_store import PositionStore
 import os
 import uuid
 import logging
+import threading
+from collections import deque
+from functools import wraps
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from trading_bot.data.history_store import TradeHistoryStore
+    from trading_bot.data.trade_ledger import TradeLedger
+    from trading_bot.models.position_book import PositionBook
+
 @dataclass
 class Candle:
     """
@@ -26,6 +34,8 @@ class Candle:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Candle':
         """Create a Candle instance from a dictionary"""
+        import pandas as pd
+        
         return cls(
             timestamp=data['timestamp'] if isinstance(data['timestamp'], datetime) 
                      else pd.to_datetime(data['timestamp']),
@@ -84,7 +94,7 @@ class Position:
         if self.min_price == 0.0:
             self.min_price = self.current_price
         if self.entry_time is None:
-            self.entry_time = datetime.now()
+            self.entry_time = get_clock().now()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Position to a dictionary for serialization"""
@@ -102,7 +112,7 @@ class Position:
             try:
                 data['entry_time'] = datetime.fromisoformat(data['entry_time'])
             except ValueError:
-                data['entry_time'] = datetime.now()
+                data['entry_time'] = get_clock().now()
         
         return cls(**data)
     
@@ -172,7 +182,7 @@ class Position:
         """
         if self.entry_time is None:
             return timedelta(0)
-        return datetime.now() - self.entry_time
+        return get_clock().now() - self.entry_time
 
 @dataclass
 class Signal:
@@ -217,29 +227,145 @@ class Order:
         elif self.price is None and self.order_type.lower() == 'limit':
             raise ValueError("Price is required for limit orders")
 
+class PositionSnapshot:
+    """
+    Immutable view of the tracked positions at one version of the tracker.
+    
+    Holds a copy of the tracker's PositionBook, so later updates of the
+    tracker never change what a snapshot shows and it can be read from any
+    thread without locking. Taken with PositionTracker.snapshot(); every
+    consumer of one processing pass reads the same snapshot.
+    """
+    __slots__ = ('_version', '_positions')
+    
+    def __init__(self, version: int, positions: 'PositionBook'):
+        """
+        Initialize the snapshot
+        
+        Args:
+            version: Tracker version the positions belong to
+            positions: Copy of the tracker's positions, owned by the snapshot
+        """
+        object.__setattr__(self, '_version', version)
+        object.__setattr__(self, '_positions', positions)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("PositionSnapshot is immutable")
+    
+    @property
+    def version(self) -> int:
+        """Tracker version the snapshot was taken at; grows with every position change"""
+        return self._version
+    
+    def get(self, symbol: str) -> Optional[Position]:
+        """
+        Get the position of a symbol
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Copy of the position, or None if there was none
+        """
+        return self._positions.position(normalize_symbol(symbol))
+    
+    def all_positions(self) -> List[Position]:
+        """
+        Get all positions with a value greater than $1, like PositionTracker.get_all_positions
+        
+        Returns:
+            Copies of the positions with value > $1
+        """
+        return [self._positions.position(symbol) for symbol in self._positions.valued_above(1.0)]
+    
+    def breaching(self, max_drawdown: float) -> List[str]:
+        """
+        Get the positions with a value greater than $1 past a drawdown limit
+        
+        Args:
+            max_drawdown: Drawdown limit as a decimal
+        
+        Returns:
+            Symbols whose current_drawdown_percentage exceeds max_drawdown
+        """
+        return self._positions.breaching(max_drawdown, min_value=1.0)
+    
+    def __contains__(self, symbol: str) -> bool:
+        return normalize_symbol(symbol) in self._positions
+    
+    def __len__(self) -> int:
+        return len(self._positions)
+
+def _synchronized(method):
+    """Run a PositionTracker method while holding the tracker's lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _realize(position, price: float, amount: float) -> None:
+    """Add the PnL of exiting amount of a position at price to its realized PnL"""
+    direction = 1.0 if position.side.lower() == 'long' else -1.0
+    position.realized_pnl += (price - position.entry_price) * amount * direction
+
 class PositionTracker:
     """
     Tracks the state of open positions including entry price, current price,
     and drawdown metrics to enable risk management based on position performance.
     """
     
-    def __init__(self, exchange):
+    def __init__(self, exchange, max_closed_positions: int = 100,
+                 flush_interval: float = 5.0, compact_after: int = 1000,
+                 history: Optional['TradeHistoryStore'] = None, reconcile_interval: float = 0,
+                 ledger: Optional['TradeLedger'] = None):
         """
         Initialize the position tracker
         
         Args:
             exchange: CCXT exchange instance used to fetch current positions
+            max_closed_positions: Number of closed positions kept in memory and on disk
+            flush_interval: Seconds a position update may wait before positions.json is rewritten
+            compact_after: Opened and closed positions logged before positions.json is rewritten
+            history: Store receiving every opened, updated and closed position, which
+                keeps the full history while memory holds max_closed_positions
+            reconcile_interval: Seconds between reconciliations of the positions with the
+                exchange's balances; updates in between only refresh prices, relying on
+                apply_fill for position changes (0 reconciles on every update)
+            ledger: Trade ledger giving the cost basis of holdings found on the exchange
+                (default: estimated from the last 20 trades)
         """
         self.exchange = exchange
-        self._positions: Dict[str, Position] = {}  # Symbol -> Position
-        self._closed_positions: List[Position] = []  # History of closed positions
+        self.history = history
+        self.ledger = ledger
+        self.max_closed_positions = max_closed_positions
+        # History of closed positions, oldest entries are dropped beyond the bound
+        self._closed_positions = deque(maxlen=max_closed_positions)
         self._last_update: Optional[datetime] = None  # Track last position update
         self._update_interval = timedelta(seconds=5)  # Minimum time between updates
+        self._last_reconcile: Optional[datetime] = None  # Track last full refresh from balances
+        self._reconcile_interval = timedelta(seconds=reconcile_interval)
+        # Open positions as arrays, for bulk price updates and vectorized risk metrics
+        from trading_bot.models.position_book import PositionBook
+        self._positions = PositionBook()
+        # Guards position state when symbols are evaluated on worker threads
+        self._lock = threading.RLock()
+        # Bumped on every position change; snapshots are rebuilt only when it moved
+        self._version = 0
+        self._snapshot: Optional[PositionSnapshot] = None
         
         # Set default data directory
         self.data_dir = Path("logs")
         self.data_dir.mkdir(exist_ok=True)
         self.position_file = self.data_dir / "positions.json"
+        # Written behind by a background thread
+        self._store = PositionStore(
+            str(self.position_file),
+            snapshot=self._persisted_state,
+            lock=self._lock,
+            flush_interval=flush_interval,
+            compact_after=compact_after
+        )
         
         # Load persisted positions on startup
         self._load_positions()
@@ -253,24 +379,22 @@ class PositionTracker:
         """
         if self._last_update is None:
             return True
-        return datetime.now() - self._last_update > self._update_interval
+        return get_clock().now() - self._last_update > self._update_interval
     
     def _load_positions(self) -> None:
         """Load position data from disk"""
-        if not self.position_file.exists():
+        if not self.position_file.exists() and not os.path.exists(self._store.log_path):
             logging.getLogger(__name__).info("No saved position data found")
             return
             
         try:
-            with open(self.position_file, 'r') as f:
-                data = json.load(f)
+            data = self._store.load()
                 
             # Load open positions
             if 'positions' in data:
                 for pos_data in data['positions']:
                     try:
-                        position = Position.from_dict(pos_data)
-                        self._positions[position.symbol] = position
+                        position = self._positions.add(Position.from_dict(pos_data))
                         logging.getLogger(__name__).info(
                             f"Loaded position: {position.symbol}, entry_price: {position.entry_price}, "
                             f"max_price: {position.max_price}, min_price: {position.min_price}"
@@ -278,9 +402,9 @@ class PositionTracker:
                     except Exception as e:
                         logging.getLogger(__name__).error(f"Error loading position: {e}")
             
-            # Load closed positions history (limited to last 100)
+            # Load closed positions history (limited to max_closed_positions)
             if 'closed_positions' in data:
-                for pos_data in data['closed_positions'][-100:]:
+                for pos_data in data['closed_positions'][-self.max_closed_positions:]:
                     try:
                         position = Position.from_dict(pos_data)
                         self._closed_positions.append(position)
@@ -294,21 +418,47 @@ class PositionTracker:
         except Exception as e:
             logging.getLogger(__name__).error(f"Error loading positions from file: {e}")
     
+    def _persisted_state(self) -> Dict[str, Any]:
+        """Position data written to disk, called by the store's writer thread"""
+        return {
+            'positions': [p.to_dict() for p in self._positions.values()],
+            'closed_positions': [p.to_dict() for p in self._closed_positions]  # Bounded by max_closed_positions
+        }
+    
     def _save_positions(self) -> None:
-        """Save position data to disk"""
-        try:
-            data = {
-                'positions': [p.to_dict() for p in self._positions.values()],
-                'closed_positions': [p.to_dict() for p in self._closed_positions[-100:]]  # Save last 100 only
-            }
-            
-            with open(self.position_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-            logging.getLogger(__name__).debug("Saved positions to disk")
-                
-        except Exception as e:
-            logging.getLogger(__name__).error(f"Error saving positions to file: {e}")
+        """Schedule the position data to be saved to disk"""
+        self._changed()
+        self._store.mark_dirty()
+    
+    def _changed(self) -> None:
+        """Record a change of the positions, called holding the lock"""
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Number of position changes so far"""
+        return self._version
+    
+    @_synchronized
+    def snapshot(self) -> PositionSnapshot:
+        """
+        Get an immutable snapshot of the current positions
+        
+        Does not refresh from the exchange: call update_positions once per
+        processing pass, then hand the snapshot to every consumer. Snapshots
+        are cached per version, so taking one without a change in between
+        is free.
+        
+        Returns:
+            PositionSnapshot of the current version
+        """
+        if self._snapshot is None or self._snapshot.version != self._version:
+            self._snapshot = PositionSnapshot(self._version, self._positions.copy())
+        return self._snapshot
+    
+    def close(self) -> None:
+        """Write pending position changes to disk and stop the background writer"""
+        self._store.close()
     
     def _get_entry_price_from_trades(self, symbol: str, amount: float) -> float:
         """
@@ -321,6 +471,10 @@ class PositionTracker:
         Returns:
             Average entry price or 0 if trades can't be retrieved
         """
+        if self.ledger is not None:
+            # Cost basis of the newest lots covering the holding, fetching only trades since the ledger's last sync
+            return self.ledger.entry_price(symbol, amount)
+        
         try:
             # Try to fetch recent trades for this symbol
             trades = self.exchange.fetch_my_trades(symbol, limit=20)
@@ -360,6 +514,7 @@ class PositionTracker:
             logging.getLogger(__name__).debug(f"Error getting trade history for {symbol}: {e}")
             return 0
     
+    @_synchronized
     def update_positions(self) -> None:
         """
         Update position information from the exchange
@@ -369,13 +524,14 @@ class PositionTracker:
         """
         if not self._should_update():
             return
+        if not self._reconcile_due():
+            self._refresh_prices()
+            return
             
         try:
-            # Store existing position data to preserve tracking info
-            existing_positions = {symbol: pos for symbol, pos in self._positions.items()}
-            
-            # Clear current positions but keep closed positions history
-            self._positions = {}
+            # Positions found on the exchange; existing ones keep their tracking info
+            existing_positions = self._positions
+            found = set()
             
             # Get exchange positions (for futures)
             exchange_positions = []
@@ -409,24 +565,24 @@ class PositionTracker:
                                 
                                 # Update existing position or create new one
                                 normalized_symbol = normalize_symbol(symbol)
+                                found.add(normalized_symbol)
                                 if normalized_symbol in existing_positions:
                                     # Update existing position with new price but keep tracking info
                                     position = existing_positions[normalized_symbol]
                                     position.update_price(mark_price)
                                     position.amount = contracts  # Update amount in case it changed
                                     position.unrealized_pnl = unrealized_pnl
-                                    self._positions[normalized_symbol] = position
                                 else:
                                     # Create new position
-                                    self._positions[normalized_symbol] = Position(
+                                    self._positions.add(Position(
                                         symbol=normalized_symbol,
                                         side=side,
                                         amount=contracts,
                                         entry_price=entry_price,
                                         current_price=mark_price,
                                         unrealized_pnl=unrealized_pnl,
-                                        entry_time=datetime.now()
-                                    )
+                                        entry_time=get_clock().now()
+                                    ))
                             except (ValueError, TypeError) as e:
                                 logging.getLogger(__name__).debug(f"Error processing position data for {symbol}: {e}")
                                 continue
@@ -441,6 +597,9 @@ class PositionTracker:
                 logging.getLogger(__name__).error(f"Error fetching balance: {e}")
                 balance = {}
             
+            # Prices of tracked spot positions, applied to all of them at once below
+            spot_prices = {}
+            
             # Process non-quote currency balances (spot positions)
             for currency, data in balance.items():
                 # Skip checking quote currencies like USDT
@@ -480,12 +639,11 @@ class PositionTracker:
                         if current_price > 0:
                             # Update existing position or create new one
                             normalized_symbol = normalize_symbol(symbol)
+                            found.add(normalized_symbol)
                             if normalized_symbol in existing_positions:
                                 # Update existing position with new price but keep tracking info
-                                position = existing_positions[normalized_symbol]
-                                position.update_price(current_price)
-                                position.amount = free_amount  # Update amount in case it changed
-                                self._positions[normalized_symbol] = position
+                                existing_positions[normalized_symbol].amount = free_amount  # Update amount in case it changed
+                                spot_prices[normalized_symbol] = current_price
                             else:
                                 # Try to get a better entry price from trade history
                                 entry_price = self._get_entry_price_from_trades(symbol, free_amount)
@@ -495,35 +653,209 @@ class PositionTracker:
                                     entry_price = current_price
                                 
                                 # Create new position with the best entry price we could find
-                                self._positions[normalized_symbol] = Position(
+                                self._positions.add(Position(
                                     symbol=normalized_symbol,
                                     side='long',  # Spot positions are always long
                                     amount=free_amount,
                                     entry_price=entry_price,
                                     current_price=current_price,
-                                    entry_time=datetime.now()
-                                )
+                                    entry_time=get_clock().now()
+                                ))
                     except Exception as e:
                         logging.getLogger(__name__).debug(f"Error getting price for {symbol}: {e}")
                         # Skip if we can't get price info
                         pass
             
+            self._positions.update_prices(spot_prices)
+            
             # Check for positions that no longer exist on the exchange
-            for symbol, position in list(existing_positions.items()):
-                if symbol not in self._positions:
+            for symbol in list(existing_positions):
+                if symbol not in found:
                     # Position no longer exists - add to closed positions
+                    position = self._positions.pop(symbol)
+                    _realize(position, position.current_price, position.amount)
                     self._closed_positions.append(position)
+                    if self.history is not None:
+                        self.history.record_close(position)
                     logging.getLogger(__name__).info(f"Position {symbol} closed (no longer on exchange)")
+            
+            if self.history is not None:
+                for position in self._positions.values():
+                    self.history.record_open(position)
                 
             # Save updated positions to disk
             self._save_positions()
             
             # Update last update timestamp
-            self._last_update = datetime.now()
+            self._last_update = self._last_reconcile = get_clock().now()
                 
         except Exception as e:
+            # Positions may be partly rebuilt
+            self._changed()
             logging.getLogger(__name__).error(f"Error updating positions: {e}")
     
+    def _reconcile_due(self) -> bool:
+        """
+        Check if positions should be rebuilt from the exchange's balances
+        
+        Returns:
+            bool: True if reconcile_interval has passed since the last reconciliation
+        """
+        if self._last_reconcile is None:
+            return True
+        return get_clock().now() - self._last_reconcile >= self._reconcile_interval
+    
+    def _fetch_tickers(self, symbols: List[str]) -> Dict[str, Any]:
+        """Fetch tickers of the given symbols, in one request if the exchange supports it"""
+        if getattr(self.exchange, 'has', {}).get('fetchTickers'):
+            try:
+                return self.exchange.fetch_tickers(symbols)
+            except Exception as e:
+                logging.getLogger(__name__).debug(f"Error fetching tickers: {e}")
+        tickers = {}
+        for symbol in symbols:
+            try:
+                tickers[symbol] = self.exchange.fetch_ticker(symbol)
+            except Exception as e:
+                logging.getLogger(__name__).debug(f"Error getting price for {symbol}: {e}")
+        return tickers
+    
+    @_synchronized
+    def _refresh_prices(self, tickers: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Update the prices of the tracked positions without reconciling them
+        
+        Args:
+            tickers: Tickers by symbol (default: fetched from the exchange)
+        """
+        if tickers is None:
+            tickers = self._fetch_tickers(list(self._positions)) if self._positions else {}
+        self._positions.update_prices({
+            symbol: ticker for symbol, ticker in tickers.items() if isinstance(ticker, dict)
+        })
+        self._save_positions()
+        self._last_update = get_clock().now()
+    
+    @_synchronized
+    def update_prices(self, prices: Dict[str, float]) -> None:
+        """
+        Move the positions to prices observed elsewhere, e.g. the latest candle closes
+        
+        Args:
+            prices: Symbol -> price; symbols without a position are ignored
+        """
+        if self._positions.update_prices(prices):
+            self._save_positions()
+    
+    @_synchronized
+    def set_drawdown_limit(self, max_drawdown: Optional[float]) -> None:
+        """
+        Set the drawdown limit at which positions trigger
+        
+        Args:
+            max_drawdown: Maximum drawdown as a decimal (None disables the triggers)
+        """
+        self._positions.set_drawdown_limit(max_drawdown)
+    
+    @_synchronized
+    def take_breaches(self) -> List[str]:
+        """
+        Get the positions whose price crossed the drawdown limit since the last call
+        
+        Every price change (refreshes, fills, update_prices) is checked
+        against the position's trigger price when it happens.
+        
+        Returns:
+            Symbols of the open positions that breached
+        """
+        return self._positions.take_breaches()
+    
+    @_synchronized
+    def apply_fill(self, symbol: str, side: str, amount: float, price: float,
+                   market_type: str = 'spot') -> Optional[Position]:
+        """
+        Update a position from a fill of one of our orders
+        
+        A fill in the direction of the position (or without a position) adds
+        to it at the volume-weighted entry price; an opposite fill reduces
+        it, realizing PnL, and closes it once nothing is left. On futures
+        markets a larger opposite fill opens a position on the other side;
+        a spot sell without a tracked position is ignored.
+        
+        Args:
+            symbol: Trading pair symbol
+            side: 'buy' or 'sell'
+            amount: Filled amount
+            price: Fill price
+            market_type: 'spot' or 'futures'
+            
+        Returns:
+            The position after the fill, or None if it is closed or untracked
+        """
+        normalized_symbol = normalize_symbol(symbol)
+        side = side.lower()
+        position = self._positions.get(normalized_symbol)
+        fill_side = 'long' if side == 'buy' else 'short'
+        
+        if position is None:
+            if fill_side == 'short' and market_type == 'spot':
+                logging.getLogger(__name__).debug(f"Ignoring sell fill of untracked spot position {normalized_symbol}")
+                return None
+            return self._open_from_fill(normalized_symbol, fill_side, amount, price)
+        
+        if position.side.lower() == fill_side:
+            # Adding to the position
+            total = position.amount + amount
+            position.entry_price = (position.entry_price * position.amount + price * amount) / total
+            position.amount = total
+            position.update_price(price)
+            self._log_open(position)
+            return position
+        
+        # Reducing, closing or flipping the position
+        remaining = position.amount - amount
+        position.update_price(price)
+        if remaining > position.amount * 1e-9:
+            _realize(position, price, amount)
+            position.amount = remaining
+            position.update_price(price)  # Recompute unrealized PnL for the remaining amount
+            self._log_open(position)
+            return position
+        
+        position = self._positions.pop(normalized_symbol)
+        _realize(position, price, position.amount)
+        self._closed_positions.append(position)
+        self._changed()
+        self._store.append('close', position.to_dict())
+        if self.history is not None:
+            self.history.record_close(position)
+        logging.getLogger(__name__).info(f"Position {normalized_symbol} closed by fill at {price}")
+        if -remaining > position.amount * 1e-9 and market_type != 'spot':
+            return self._open_from_fill(normalized_symbol, fill_side, -remaining, price)
+        return None
+    
+    def _open_from_fill(self, symbol: str, side: str, amount: float, price: float) -> Position:
+        """Open a position from a fill at its price"""
+        position = Position(
+            symbol=symbol,
+            side=side,
+            amount=amount,
+            entry_price=price,
+            current_price=price,
+            entry_time=get_clock().now()
+        )
+        position = self._positions.add(position)
+        self._log_open(position)
+        return position
+    
+    def _log_open(self, position: Position) -> None:
+        """Persist an opened or resized position right away"""
+        self._changed()
+        self._store.append('open', position.to_dict())
+        if self.history is not None:
+            self.history.record_open(position)
+    
+    @_synchronized
     def get_position(self, symbol: str) -> Optional[Position]:
         """
         Get position information for a specific symbol
@@ -564,11 +896,12 @@ class PositionTracker:
                                     amount=free_amount,
                                     entry_price=current_price,  # Approximation
                                     current_price=current_price,
-                                    entry_time=datetime.now()
+                                    entry_time=get_clock().now()
                                 )
                                 
                                 # Save this in our tracker
-                                self._positions[normalized_symbol] = position
+                                position = self._positions.add(position)
+                                self._changed()
                                 return position
                 except Exception as e:
                     logging.getLogger(__name__).error(f"Error directly checking position for {normalized_symbol}: {e}")
@@ -577,6 +910,7 @@ class PositionTracker:
         
         return position
     
+    @_synchronized
     def get_all_positions(self) -> List[Position]:
         """
         Get all current positions with a value greater than $1
@@ -585,20 +919,19 @@ class PositionTracker:
         Returns:
             List of Position objects with value > $1
         """
-        # Filter out positions with value less than $1
-        valid_positions = []
-        for position in self._positions.values():
-            position_value = position.amount * position.current_price
-            if position_value > 1.0:
-                valid_positions.append(position)
-            else:
-                logging.getLogger(__name__).debug(
-                    f"Ignoring dust position for {position.symbol}: "
+        # Filter out positions with value less than $1, valuing all positions at once
+        values = self._positions.values_array()
+        logger = logging.getLogger(__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            for symbol in self._positions.symbols_where(values <= 1.0):
+                position = self._positions[symbol]
+                logger.debug(
+                    f"Ignoring dust position for {symbol}: "
                     f"{position.amount} units at {position.current_price}, "
-                    f"value=${position_value:.2f}"
+                    f"value=${position.amount * position.current_price:.2f}"
                 )
         
-        return valid_positions
+        return [self._positions[symbol] for symbol in self._positions.symbols_where(values > 1.0)]
     
     def get_closed_positions(self) -> List[Position]:
         """
@@ -607,8 +940,9 @@ class PositionTracker:
         Returns:
             List of closed Position objects
         """
-        return self._closed_positions
+        return list(self._closed_positions)
     
+    @_synchronized
     def record_position(self, symbol: str, side: str, amount: float, 
                        entry_price: float, current_price: float) -> None:
         """
@@ -623,18 +957,19 @@ class PositionTracker:
         """
         # Normalize the symbol before storing
         normalized_symbol = normalize_symbol(symbol)
-        self._positions[normalized_symbol] = Position(
+        position = self._positions.add(Position(
             symbol=normalized_symbol,
             side=side,
             amount=amount,
             entry_price=entry_price,
             current_price=current_price,
-            entry_time=datetime.now()
-        )
+            entry_time=get_clock().now()
+        ))
         
-        # Save after recording a new position
-        self._save_positions()
+        # Log the new position right away
+        self._log_open(position)
     
+    @_synchronized
     def close_position(self, symbol: str) -> None:
         """
         Mark a position as closed and move it to closed_positions
@@ -645,10 +980,26 @@ class PositionTracker:
         # Normalize the symbol before lookup
         normalized_symbol = normalize_symbol(symbol)
         if normalized_symbol in self._positions:
+            position = self._positions.pop(normalized_symbol)
+            _realize(position, position.current_price, position.amount)
             # Add to closed positions history
-            self._closed_positions.append(self._positions[normalized_symbol])
-            # Remove from active positions
-            del self._positions[normalized_symbol]
+            self._closed_positions.append(position)
+            self._changed()
             
-            # Save after closing a position
-            self._save_positions()
\ No newline at end of file
+            # Log the closed position right away
+            self._store.append('close', position.to_dict())
+            if self.history is not None:
+                self.history.record_close(position)
+    
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report the size of the tracked position state
+        
+        Returns:
+            Dictionary with open and closed position counts
+        """
+        return {
+            'open_positions': len(self._positions),
+            'closed_positions': len(self._closed_positions),
+            'max_closed_positions': self.max_closed_positions,
+        }
\ No newline at end of file
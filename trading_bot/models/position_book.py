@@ -0,0 +1,470 @@
+# trading_bot/models/position_book.py
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from trading_bot.models.data_models import Position
+
+# Float columns of the book, named after the Position attributes they hold
+_COLUMNS = ('amount', 'entry_price', 'current_price', 'unrealized_pnl', 'realized_pnl', 'max_price', 'min_price')
+
+# Columns a drawdown trigger depends on
+_TRIGGER_INPUTS = frozenset({'current_price', 'max_price', 'min_price'})
+
+# Positions worth this much or less are dust and never trigger
+_DUST_VALUE = 1.0
+
+def _column(name: str) -> property:
+    """Property reading a float column of the view's row, or the detached position"""
+    def fget(self):
+        if self._detached is not None:
+            return getattr(self._detached, name)
+        return float(self._book._columns[name][self._row])
+
+    def fset(self, value):
+        if self._detached is not None:
+            setattr(self._detached, name, value)
+        else:
+            self._book._columns[name][self._row] = value
+            if name in _TRIGGER_INPUTS:
+                self._book._row_changed(self._row, retrigger=name != 'current_price')
+    return property(fget, fset)
+
+class PositionView:
+    """
+    Position API over one row of a PositionBook.
+
+    Reads and writes go to the book's arrays, so code written against
+    Position keeps working on the tracked positions. When its row is removed
+    from the book the view detaches: it keeps the values it had as a plain
+    Position and no longer follows the book.
+    """
+    __slots__ = ('_book', '_row', '_detached', 'symbol')
+
+    amount = _column('amount')
+    entry_price = _column('entry_price')
+    current_price = _column('current_price')
+    unrealized_pnl = _column('unrealized_pnl')
+    realized_pnl = _column('realized_pnl')
+    max_price = _column('max_price')
+    min_price = _column('min_price')
+
+    # The math is shared with Position, which only uses attribute access
+    update_price = Position.update_price
+    current_drawdown_percentage = Position.current_drawdown_percentage
+    profit_percentage = Position.profit_percentage
+    duration = Position.duration
+
+    def __init__(self, book: 'PositionBook', row: int, symbol: str):
+        self._book = book
+        self._row = row
+        self._detached: Optional[Position] = None
+        self.symbol = symbol
+
+    @property
+    def side(self) -> str:
+        if self._detached is not None:
+            return self._detached.side
+        return 'long' if self._book._side[self._row] > 0 else 'short'
+
+    @side.setter
+    def side(self, value: str) -> None:
+        if self._detached is not None:
+            self._detached.side = value
+        else:
+            self._book._side[self._row] = 1 if value.lower() == 'long' else -1
+            self._book._row_changed(self._row, retrigger=True)
+
+    @property
+    def entry_time(self) -> Optional[datetime]:
+        if self._detached is not None:
+            return self._detached.entry_time
+        return self._book._entry_time[self._row]
+
+    @entry_time.setter
+    def entry_time(self, value: Optional[datetime]) -> None:
+        if self._detached is not None:
+            self._detached.entry_time = value
+        else:
+            self._book._entry_time[self._row] = value
+
+    def to_position(self) -> Position:
+        """Copy the view into a standalone Position"""
+        return Position(
+            symbol=self.symbol,
+            side=self.side,
+            amount=self.amount,
+            entry_price=self.entry_price,
+            current_price=self.current_price,
+            unrealized_pnl=self.unrealized_pnl,
+            realized_pnl=self.realized_pnl,
+            entry_time=self.entry_time,
+            max_price=self.max_price,
+            min_price=self.min_price
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the position to a dictionary for serialization"""
+        return self.to_position().to_dict()
+
+    def _detach(self) -> None:
+        self._detached = self.to_position()
+        self._book = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_position())
+
+class PositionBook:
+    """
+    Open positions stored as a struct of arrays.
+
+    Each symbol gets a row id; amount, entry, current, max and min prices,
+    PnL and side are NumPy arrays indexed by it, so prices of all positions
+    are updated from one ticker snapshot and drawdown, profit and value are
+    computed for every position in one vectorized call. Rows of removed
+    positions are reused.
+
+    With a drawdown limit set, every position also holds its trigger: the
+    price at which its drawdown would exceed the limit, max * (1 - limit)
+    for longs and min * (1 + limit) for shorts. It is recomputed only when
+    a position sets a new high (low for shorts), and every price update is
+    compared against it, so a breach is noticed on the update that causes
+    it. Each position fires once per breach and re-arms when its price
+    recovers past the trigger; take_breaches() collects the symbols.
+
+    The book behaves like a dictionary of symbol -> PositionView for the
+    code written against Position objects. Assigning a Position copies it
+    into the book. Not thread-safe; PositionTracker guards it with its lock.
+    """
+
+    def __init__(self, capacity: int = 64, max_drawdown: Optional[float] = None):
+        """
+        Initialize an empty book
+
+        Args:
+            capacity: Initial number of rows; the arrays double when full
+            max_drawdown: Drawdown limit the triggers are set at (None: no triggers)
+        """
+        capacity = max(1, capacity)
+        self.max_drawdown = max_drawdown
+        self._trigger = np.full(capacity, np.nan)
+        self._tripped = np.zeros(capacity, dtype=bool)
+        self._breaches: List[str] = []
+        self._columns: Dict[str, np.ndarray] = {name: np.zeros(capacity) for name in _COLUMNS}
+        self._side = np.ones(capacity, dtype=np.int8)  # 1 long, -1 short
+        self._used = np.zeros(capacity, dtype=bool)
+        self._entry_time: List[Optional[datetime]] = [None] * capacity
+        self._symbols: List[Optional[str]] = [None] * capacity
+        self._views: List[Optional[PositionView]] = [None] * capacity
+        self._ids: Dict[str, int] = {}  # Symbol -> row
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def _grow(self) -> None:
+        capacity = len(self._used)
+        for name, column in self._columns.items():
+            self._columns[name] = np.concatenate([column, np.zeros(capacity)])
+        self._side = np.concatenate([self._side, np.ones(capacity, dtype=np.int8)])
+        self._used = np.concatenate([self._used, np.zeros(capacity, dtype=bool)])
+        self._trigger = np.concatenate([self._trigger, np.full(capacity, np.nan)])
+        self._tripped = np.concatenate([self._tripped, np.zeros(capacity, dtype=bool)])
+        self._entry_time.extend([None] * capacity)
+        self._symbols.extend([None] * capacity)
+        self._views.extend([None] * capacity)
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def add(self, position: Position) -> PositionView:
+        """
+        Store a position, replacing the symbol's current one
+
+        Args:
+            position: Position (or view) to copy into the book
+
+        Returns:
+            View of the stored position
+        """
+        row = self._ids.get(position.symbol)
+        if row is None:
+            if not self._free:
+                self._grow()
+            row = self._free.pop()
+            self._ids[position.symbol] = row
+            self._symbols[row] = position.symbol
+            self._views[row] = PositionView(self, row, position.symbol)
+            self._used[row] = True
+        for name, column in self._columns.items():
+            column[row] = getattr(position, name)
+        self._side[row] = 1 if position.side.lower() == 'long' else -1
+        self._entry_time[row] = position.entry_time
+        self._tripped[row] = False
+        self._row_changed(row, retrigger=True)
+        return self._views[row]
+
+    def pop(self, symbol: str, *default) -> Any:
+        """
+        Remove a position
+
+        Args:
+            symbol: Trading pair symbol
+            default: Returned when the symbol has no position
+
+        Returns:
+            The position's view, detached from the book
+
+        Raises:
+            KeyError: If the symbol has no position and no default is given
+        """
+        row = self._ids.pop(symbol, None)
+        if row is None:
+            if default:
+                return default[0]
+            raise KeyError(symbol)
+        view = self._views[row]
+        view._detach()
+        self._views[row] = None
+        self._symbols[row] = None
+        self._entry_time[row] = None
+        self._used[row] = False
+        for column in self._columns.values():
+            column[row] = 0.0
+        self._trigger[row] = np.nan
+        self._tripped[row] = False
+        self._free.append(row)
+        return view
+
+    def get(self, symbol: str, default: Any = None) -> Any:
+        """Get the view of a symbol's position, or default"""
+        row = self._ids.get(symbol)
+        return self._views[row] if row is not None else default
+
+    def position(self, symbol: str) -> Optional[Position]:
+        """Get a standalone copy of a symbol's position, or None"""
+        row = self._ids.get(symbol)
+        return self._views[row].to_position() if row is not None else None
+
+    def __getitem__(self, symbol: str) -> PositionView:
+        return self._views[self._ids[symbol]]
+
+    def __setitem__(self, symbol: str, position: Position) -> None:
+        if position.symbol != symbol:
+            raise ValueError(f"Position of {position.symbol} stored under {symbol}")
+        self.add(position)
+
+    def __delitem__(self, symbol: str) -> None:
+        self.pop(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ids))
+
+    def keys(self) -> List[str]:
+        return list(self._ids)
+
+    def values(self) -> List[PositionView]:
+        return [self._views[row] for row in self._ids.values()]
+
+    def items(self) -> List[Any]:
+        return [(symbol, self._views[row]) for symbol, row in self._ids.items()]
+
+    def copy(self) -> 'PositionBook':
+        """Copy of the book sharing nothing with it; views of the copy are its own"""
+        book = PositionBook.__new__(PositionBook)
+        book._columns = {name: column.copy() for name, column in self._columns.items()}
+        book._side = self._side.copy()
+        book._used = self._used.copy()
+        book.max_drawdown = self.max_drawdown
+        book._trigger = self._trigger.copy()
+        book._tripped = self._tripped.copy()
+        book._breaches = []
+        book._entry_time = list(self._entry_time)
+        book._symbols = list(self._symbols)
+        book._views = [PositionView(book, row, symbol) if symbol is not None else None
+                       for row, symbol in enumerate(self._symbols)]
+        book._ids = dict(self._ids)
+        book._free = list(self._free)
+        return book
+
+    def update_prices(self, tickers: Dict[str, Any]) -> int:
+        """
+        Update the prices of all positions from a ticker snapshot at once
+
+        Like Position.update_price, this moves the max and min prices and
+        recomputes unrealized PnL.
+
+        Args:
+            tickers: Symbol -> ticker dictionary ('last' is used) or price;
+                symbols without a position or a positive price are skipped
+
+        Returns:
+            Number of positions updated
+        """
+        rows = []
+        prices = []
+        for symbol, ticker in tickers.items():
+            row = self._ids.get(symbol)
+            if row is None:
+                continue
+            try:
+                price = float((ticker.get('last') if isinstance(ticker, dict) else ticker) or 0)
+            except (ValueError, TypeError):
+                continue
+            if price > 0:
+                rows.append(row)
+                prices.append(price)
+        if not rows:
+            return 0
+
+        rows = np.array(rows, dtype=np.intp)
+        prices = np.array(prices)
+        columns = self._columns
+        columns['current_price'][rows] = prices
+        high = columns['max_price'][rows]
+        low = columns['min_price'][rows]
+        new_high = prices > high
+        new_low = (prices < low) | (low == 0)
+        columns['max_price'][rows] = np.where(new_high, prices, high)
+        columns['min_price'][rows] = np.where(new_low, prices, low)
+        columns['unrealized_pnl'][rows] = (
+            (prices - columns['entry_price'][rows]) * columns['amount'][rows] * self._side[rows]
+        )
+        if self.max_drawdown is not None:
+            # Only a new high (long) or low (short) moves a trigger
+            self._retrigger(rows[np.where(self._side[rows] > 0, new_high, new_low)])
+            self._check_triggers(rows)
+        return len(rows)
+
+    def set_drawdown_limit(self, max_drawdown: Optional[float]) -> None:
+        """
+        Set the drawdown limit and recompute every trigger
+
+        Positions already past the new limit fire on their next price update.
+
+        Args:
+            max_drawdown: Drawdown limit as a decimal (None: no triggers)
+        """
+        self.max_drawdown = max_drawdown
+        self._tripped[:] = False
+        self._trigger[:] = np.nan
+        if max_drawdown is not None:
+            self._retrigger(np.flatnonzero(self._used))
+
+    def _retrigger(self, rows: np.ndarray) -> None:
+        """Recompute the triggers of rows from their max (long) or min (short) price"""
+        if len(rows) == 0:
+            return
+        long = self._side[rows] > 0
+        self._trigger[rows] = np.where(
+            long,
+            self._columns['max_price'][rows] * (1 - self.max_drawdown),
+            self._columns['min_price'][rows] * (1 + self.max_drawdown)
+        )
+
+    def _check_triggers(self, rows: np.ndarray) -> None:
+        """Record the rows whose price crossed their trigger and re-arm the recovered ones"""
+        price = self._columns['current_price'][rows]
+        trigger = self._trigger[rows]
+        # Comparisons with a missing (nan) trigger are false
+        past = np.where(self._side[rows] > 0, price < trigger, price > trigger)
+        tripped = self._tripped[rows]
+        fired = past & ~tripped & (self._columns['amount'][rows] * price > _DUST_VALUE)
+        self._tripped[rows] = past & (tripped | fired)
+        for row in rows[fired]:
+            self._breaches.append(self._symbols[row])
+
+    def _row_changed(self, row: int, retrigger: bool) -> None:
+        """Keep the trigger of a row written through its view in step"""
+        if self.max_drawdown is None:
+            return
+        # Scalar version of _retrigger and _check_triggers
+        columns = self._columns
+        long = self._side[row] > 0
+        if retrigger:
+            if long:
+                self._trigger[row] = columns['max_price'][row] * (1 - self.max_drawdown)
+            else:
+                self._trigger[row] = columns['min_price'][row] * (1 + self.max_drawdown)
+        price = columns['current_price'][row]
+        trigger = self._trigger[row]
+        past = bool(price < trigger if long else price > trigger)
+        if not past:
+            self._tripped[row] = False
+        elif not self._tripped[row] and columns['amount'][row] * price > _DUST_VALUE:
+            self._tripped[row] = True
+            self._breaches.append(self._symbols[row])
+
+    def trigger_price(self, symbol: str) -> Optional[float]:
+        """Price at which a symbol's position would exceed the drawdown limit, or None"""
+        row = self._ids.get(symbol)
+        if row is None or np.isnan(self._trigger[row]):
+            return None
+        return float(self._trigger[row])
+
+    def take_breaches(self) -> List[str]:
+        """
+        Collect the positions that crossed their trigger since the last call
+
+        Returns:
+            Symbols still in the book, in the order they fired
+        """
+        breaches, self._breaches = self._breaches, []
+        return [symbol for symbol in dict.fromkeys(breaches) if symbol in self._ids]
+
+    def values_array(self) -> np.ndarray:
+        """Value (amount * current price) per row id; 0 for unused rows"""
+        return self._columns['amount'] * self._columns['current_price']
+
+    def drawdowns(self) -> np.ndarray:
+        """
+        Drawdown per row id, as Position.current_drawdown_percentage
+
+        Returns:
+            Drawdown from the max price (long) or min price (short) as a
+            decimal; 0 for unused rows and rows without a reference price
+        """
+        current = self._columns['current_price']
+        long = self._side > 0
+        reference = np.where(long, self._columns['max_price'], self._columns['min_price'])
+        moved = np.where(long, reference - current, current - reference)
+        return np.divide(moved, reference, out=np.zeros_like(current), where=self._used & (reference > 0))
+
+    def profits(self) -> np.ndarray:
+        """
+        Profit per row id, as Position.profit_percentage
+
+        Returns:
+            Profit relative to the entry price as a decimal; 0 for unused
+            rows and rows without an entry price
+        """
+        entry = self._columns['entry_price']
+        moved = (self._columns['current_price'] - entry) * self._side
+        return np.divide(moved, entry, out=np.zeros_like(entry), where=self._used & (entry > 0))
+
+    def symbols_where(self, mask: np.ndarray) -> List[str]:
+        """Symbols of the used rows selected by a boolean mask over row ids"""
+        return [self._symbols[row] for row in np.flatnonzero(mask & self._used)]
+
+    def valued_above(self, min_value: float) -> List[str]:
+        """Symbols of the positions worth more than min_value"""
+        return self.symbols_where(self.values_array() > min_value)
+
+    def breaching(self, max_drawdown: float, min_value: float = 1.0) -> List[str]:
+        """
+        Symbols of the positions past a drawdown limit
+
+        Args:
+            max_drawdown: Drawdown limit as a decimal
+            min_value: Positions worth this much or less are ignored as dust
+
+        Returns:
+            Symbols whose drawdown exceeds max_drawdown
+        """
+        return self.symbols_where((self.drawdowns() > max_drawdown) & (self.values_array() > min_value))
+
+    def id_of(self, symbol: str) -> Optional[int]:
+        """Row id of a symbol's position, indexing the metric arrays"""
+        return self._ids.get(symbol)
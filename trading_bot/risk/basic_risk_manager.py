@@ -1,7 +1,7 @@
 # trading_bot/risk/basic_risk_manager.py
 from typing import Dict, Tuple, Any, Optional, List
 from trading_bot.interfaces.risk_manager import RiskManager
-from trading_bot.models.data_models import Signal, Order, Position, PositionTracker
+from trading_bot.models.data_models import Signal, Order, Position, PositionSnapshot, PositionTracker
 import logging
 from trading_bot.utils.symbol_utils import normalize_symbol, get_base_currency, get_quote_currency
 
@@ -33,6 +33,8 @@ class BasicRiskManager(RiskManager):
         if position_tracker is None:
             raise ValueError("PositionTracker instance must be provided to BasicRiskManager")
         self.position_tracker = position_tracker # Assign injected tracker
+        # Positions flag a breach of the limit on the price update that causes it
+        self.position_tracker.set_drawdown_limit(max_drawdown)
         self.logger = logging.getLogger(__name__)
         self.max_open_trades = max_open_trades
         self.max_drawdown = max_drawdown
@@ -44,12 +46,27 @@ class BasicRiskManager(RiskManager):
             f"max_drawdown={max_drawdown*100}%"
         )
     
-    def validate_signal(self, signal: Signal) -> Tuple[bool, str]:
+    def refresh_positions(self) -> PositionSnapshot:
+        """
+        Update positions from the exchange and take a snapshot of them
+        
+        Call once per processing pass and pass the snapshot to the checks
+        below, so they all see the same positions and the exchange is
+        queried once.
+        
+        Returns:
+            PositionSnapshot of the refreshed positions
+        """
+        self.position_tracker.update_positions()
+        return self.position_tracker.snapshot()
+    
+    def validate_signal(self, signal: Signal, positions: Optional[PositionSnapshot] = None) -> Tuple[bool, str]:
         """
         Validate if a signal should be executed based on risk rules
         
         Args:
             signal: Signal to validate
+            positions: Position snapshot to check against (default: refreshed now)
             
         Returns:
             (valid, reason) tuple where valid is a boolean and reason is a string
@@ -61,12 +78,12 @@ class BasicRiskManager(RiskManager):
         if signal.signal_type == 'close':
             return True, "Close signals are always valid"
 
-        # Update our position tracker to get latest data
-        self.position_tracker.update_positions()
+        if positions is None:
+            positions = self.refresh_positions()
         
         # If this is a buy signal, check if we already have a position for this symbol
         if signal.signal_type == 'buy':
-            position = self.get_position(signal.symbol)
+            position = self.get_position(signal.symbol, positions)
             if position and position.amount > 0:
                 # Calculate position value
                 position_value = position.amount * position.current_price
@@ -75,8 +92,8 @@ class BasicRiskManager(RiskManager):
                     self.logger.warning(f"Signal rejected: {reason}")
                     return False, reason
         
-        # Only count positions with value > $1 (PositionTracker.get_all_positions() now filters dust positions)
-        current_positions = self.position_tracker.get_all_positions()
+        # Only count positions with value > $1 (dust positions are filtered out)
+        current_positions = positions.all_positions()
         self.logger.info(f"Current valid positions: {len(current_positions)}, max allowed: {self.max_open_trades}")
 
         # Check if we already have too many open trades
@@ -91,13 +108,14 @@ class BasicRiskManager(RiskManager):
         
         return True, "Signal validated"
     
-    def calculate_position_size(self, signal: Signal) -> float:
+    def calculate_position_size(self, signal: Signal, positions: Optional[PositionSnapshot] = None) -> float:
         """
         Calculate position size using available USDT balance divided by
         remaining positions (max_open_trades - current positions).
         
         Args:
             signal: Trading signal
+            positions: Position snapshot counting the open positions (default: refreshed now)
             
         Returns:
             Position size in base currency
@@ -106,8 +124,8 @@ class BasicRiskManager(RiskManager):
             # Normalize the symbol in the signal
             signal.symbol = normalize_symbol(signal.symbol)
             
-            # Update our position tracker to get latest data
-            self.position_tracker.update_positions()
+            if positions is None:
+                positions = self.refresh_positions()
             
             # Get account balance
             balance = self.exchange.fetch_balance()
@@ -121,8 +139,8 @@ class BasicRiskManager(RiskManager):
                 return 0
             
             # Count active positions to determine how many positions we already have
-            # Only count positions with value > $1 (PositionTracker.get_all_positions() now filters dust positions)
-            active_positions = len(self.position_tracker.get_all_positions())
+            # Only count positions with value > $1 (dust positions are filtered out)
+            active_positions = len(positions.all_positions())
             
             # Calculate remaining available positions
             remaining_positions = max(1, self.max_open_trades - active_positions)
@@ -152,26 +170,27 @@ class BasicRiskManager(RiskManager):
             self.logger.error(f"Error calculating position size: {e}")
             return 0  # Return 0 on error to prevent trading
     
-    def check_drawdown_limits(self) -> List[str]:
+    def check_drawdown_limits(self, positions: Optional[PositionSnapshot] = None) -> List[str]:
         """
         Check all open positions against drawdown limits
         
+        Args:
+            positions: Position snapshot to check (default: refreshed now)
+        
         Returns:
             List of symbols that have exceeded the maximum drawdown limit
         """
-        self.position_tracker.update_positions()
-        # Only check positions with value > $1 (PositionTracker.get_all_positions() now filters dust positions)
-        positions = self.position_tracker.get_all_positions()
-        
-        symbols_to_close = []
-        for position in positions:
-            drawdown = position.current_drawdown_percentage
-            if drawdown > self.max_drawdown:
-                self.logger.warning(
-                    f"Position {position.symbol} has exceeded maximum drawdown: "
-                    f"{drawdown*100:.2f}% > {self.max_drawdown*100:.2f}%"
-                )
-                symbols_to_close.append(position.symbol)
+        if positions is None:
+            positions = self.refresh_positions()
+        
+        # Drawdowns of all positions are computed at once; dust positions (value <= $1) are ignored
+        symbols_to_close = positions.breaching(self.max_drawdown)
+        for symbol in symbols_to_close:
+            drawdown = positions.get(symbol).current_drawdown_percentage
+            self.logger.warning(
+                f"Position {symbol} has exceeded maximum drawdown: "
+                f"{drawdown*100:.2f}% > {self.max_drawdown*100:.2f}%"
+            )
                 
         return symbols_to_close
     
@@ -188,18 +207,26 @@ class BasicRiskManager(RiskManager):
         """
         return None
         
-    def get_position(self, symbol: str) -> Optional[Position]:
+    def get_position(self, symbol: str, positions: Optional[PositionSnapshot] = None) -> Optional[Position]:
         """
         Get current position for a symbol
         
         Args:
             symbol: Trading symbol
+            positions: Position snapshot to read the position from (default: the
+                tracker's live position, after an update); a symbol missing from
+                it is looked up with the tracker, which checks the exchange balance
             
         Returns:
             Position object or None if no position exists
         """
         # Normalize the symbol before querying position
         normalized_symbol = normalize_symbol(symbol)
+        if positions is not None:
+            position = positions.get(normalized_symbol)
+            if position is None:
+                position = self.position_tracker.get_position(normalized_symbol)
+            return position
         
         # Update positions before returning
         self.position_tracker.update_positions()
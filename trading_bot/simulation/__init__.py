@@ -0,0 +1,6 @@
+"""Simulation components for running the trading bot without a live exchange"""
+
+from trading_bot.simulation.exchange import SimulatedExchange
+from trading_bot.simulation.cassette import RecordingExchange, ReplayExchange
+
+__all__ = ['SimulatedExchange', 'RecordingExchange', 'ReplayExchange']
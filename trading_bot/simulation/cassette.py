@@ -0,0 +1,228 @@
+# trading_bot/simulation/cassette.py
+import gzip
+import json
+import logging
+import threading
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import ccxt
+
+from trading_bot.utils.clock import Clock, SimulatedClock, get_clock
+
+CASSETTE_VERSION = 1
+
+# Exchange methods whose requests and responses are captured
+RECORDED_METHODS = (
+    'load_markets',
+    'fetch_ohlcv',
+    'fetch_ticker',
+    'fetch_tickers',
+    'fetch_order_book',
+    'fetch_balance',
+    'fetch_positions',
+    'fetch_my_trades',
+    'fetch_open_orders',
+    'fetch_order',
+    'create_order',
+    'cancel_order',
+)
+
+# Plain attributes read by the bot, stored in the cassette header
+RECORDED_ATTRIBUTES = ('id', 'name', 'has', 'timeframes', 'rateLimit', 'enableRateLimit')
+
+def _request_key(method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Canonical string identifying a request, used to match it on replay"""
+    return json.dumps([method, list(args), kwargs], sort_keys=True, default=str)
+
+class CassetteMiss(ccxt.ExchangeError):
+    """Raised when a replayed request has no recorded response"""
+    pass
+
+class RecordingExchange:
+    """
+    Proxy around a ccxt exchange that records every request and response.
+
+    The cassette is a gzip-compressed file of JSON lines: a header with the
+    exchange's static attributes, one entry per call (method, arguments,
+    clock time, result or error) and a footer with the end time. All other
+    attribute access passes straight through to the wrapped exchange.
+    """
+
+    def __init__(self, exchange, path: str, clock: Optional[Clock] = None):
+        """
+        Initialize the recorder
+
+        Args:
+            exchange: ccxt exchange instance to wrap
+            path: Cassette file to write
+            clock: Clock used to timestamp calls (default: the active clock)
+        """
+        self._exchange = exchange
+        self.path = path
+        self._clock = clock or get_clock()
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self.calls = 0
+        self.logger = logging.getLogger(__name__)
+
+        header = {'version': CASSETTE_VERSION, 'start': self._clock.time()}
+        header['attributes'] = {
+            name: getattr(exchange, name) for name in RECORDED_ATTRIBUTES if hasattr(exchange, name)
+        }
+        self._write(header)
+        self.logger.info(f"Recording exchange calls to {path}")
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._exchange, name)
+        if name in RECORDED_METHODS and callable(attribute):
+            def recorded(*args, **kwargs):
+                return self._call(name, attribute, args, kwargs)
+            return recorded
+        return attribute
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(record, default=str, separators=(',', ':')))
+            self._file.write('\n')
+
+    def _call(self, method: str, func, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        entry = {'t': self._clock.time(), 'method': method, 'args': list(args), 'kwargs': kwargs}
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            entry['error'] = {'type': type(e).__name__, 'message': str(e)}
+            self._write(entry)
+            self.calls += 1
+            raise
+        entry['result'] = result
+        self._write(entry)
+        self.calls += 1
+        return result
+
+    def close(self) -> None:
+        """Write the footer and close the cassette"""
+        self._write({'end': self._clock.time(), 'calls': self.calls})
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self.logger.info(f"Recorded {self.calls} exchange calls to {self.path}")
+
+class ReplayExchange:
+    """
+    Serves a recorded cassette back with the ccxt API.
+
+    Requests are matched on method and arguments, and matching responses
+    are returned in recorded order. Once the recorded responses for a
+    request are used up, the last one is repeated (or CassetteMiss is
+    raised in strict mode). Recorded errors are raised again as the
+    corresponding ccxt exception.
+
+    When given a SimulatedClock, each response moves the clock forward to
+    the time the call was originally made, so time-dependent logic sees
+    the recorded timing while the session runs at full speed.
+    """
+
+    def __init__(self, path: str, clock: Optional[SimulatedClock] = None, strict: bool = False):
+        """
+        Initialize the replay exchange
+
+        Args:
+            path: Cassette file written by RecordingExchange
+            clock: Optional simulated clock kept in step with the recording
+            strict: Raise CassetteMiss instead of repeating exhausted responses
+        """
+        self.path = path
+        self.clock = clock
+        self.strict = strict
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self.total_entries = 0
+        self.remaining = 0
+        self.misses: Counter = Counter()
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+
+        self.id = 'replay'
+        self.has: Dict[str, Any] = {}
+        self.markets: Dict[str, Any] = {}
+        self.symbols: List[str] = []
+        self._load()
+
+    def _load(self) -> None:
+        last_time = None
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if 'version' in record:
+                    if record['version'] != CASSETTE_VERSION:
+                        raise ValueError(f"Unsupported cassette version: {record['version']}")
+                    self.start_time = record['start']
+                    for name, value in record.get('attributes', {}).items():
+                        setattr(self, name, value)
+                elif 'method' in record:
+                    key = _request_key(record['method'], tuple(record['args']), record['kwargs'])
+                    self._entries.setdefault(key, deque()).append(record)
+                    self.total_entries += 1
+                    last_time = record['t']
+                elif 'end' in record:
+                    self.end_time = record['end']
+
+        # A recording cut short has no footer
+        if self.end_time is None:
+            self.end_time = last_time if last_time is not None else self.start_time
+        self.remaining = self.total_entries
+        self.logger.info(f"Loaded {self.total_entries} recorded exchange calls from {self.path}")
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every recorded response has been served"""
+        return self.remaining == 0
+
+    def _serve(self, method: str, *args, **kwargs) -> Any:
+        key = _request_key(method, args, kwargs)
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                entry = queue.popleft()
+                self._last[key] = entry
+                self.remaining -= 1
+            elif key in self._last and not self.strict:
+                entry = self._last[key]
+                self.misses[method] += 1
+            else:
+                self.misses[method] += 1
+                raise CassetteMiss(f"No recorded response for {method}{list(args)} {kwargs}")
+
+        if self.clock is not None and entry['t'] > self.clock.time():
+            self.clock.set_time(entry['t'])
+
+        if 'error' in entry:
+            error_class = getattr(ccxt, entry['error']['type'], ccxt.ExchangeError)
+            if not (isinstance(error_class, type) and issubclass(error_class, Exception)):
+                error_class = ccxt.ExchangeError
+            raise error_class(entry['error']['message'])
+        return entry['result']
+
+    def load_markets(self, *args, **kwargs) -> Dict[str, Any]:
+        markets = self._serve('load_markets', *args, **kwargs)
+        self.markets = markets
+        self.symbols = sorted(markets)
+        return markets
+
+    def milliseconds(self) -> int:
+        return (self.clock or get_clock()).milliseconds()
+
+    def __getattr__(self, name: str):
+        if name in RECORDED_METHODS:
+            def replayed(*args, **kwargs):
+                return self._serve(name, *args, **kwargs)
+            return replayed
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
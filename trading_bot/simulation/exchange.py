@@ -0,0 +1,709 @@
+# trading_bot/simulation/exchange.py
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import ccxt
+import numpy as np
+import pandas as pd
+
+from trading_bot.data.synthetic import TIMEFRAME_MS, SyntheticMarketGenerator
+from trading_bot.utils.clock import Clock
+from trading_bot.utils.symbol_utils import get_base_currency, get_quote_currency
+
+def _iso8601(timestamp_ms: int) -> str:
+    """Format a millisecond timestamp the way ccxt does"""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+class SimulatedExchange:
+    """
+    In-process stand-in for a ccxt exchange.
+
+    Implements the ccxt methods used by the bot (load_markets, fetch_ohlcv,
+    fetch_ticker(s), fetch_balance, fetch_positions, fetch_my_trades,
+    create_order, cancel_order, fetch_open_orders, fetch_order) on top of
+    candle data held in memory. Market orders fill immediately at the current
+    price plus slippage, limit orders rest until the price trades through
+    them. Time only moves when advance() or set_time() is called, so a test
+    or load harness controls the market clock.
+
+    Symbols containing a settle currency (e.g. 'BTC/USDT:USDT') are treated
+    as linear perpetual swaps and reported by fetch_positions; all other
+    symbols are spot markets settled through balances. Margin is not
+    modelled: futures fills only move the quote balance by fees and
+    realized PnL.
+    """
+
+    def __init__(self,
+                 candles: Dict[str, Union[np.ndarray, List[List[float]]]],
+                 timeframe: str = '1m',
+                 start_time: Optional[int] = None,
+                 balances: Optional[Dict[str, float]] = None,
+                 fee_rate: float = 0.001,
+                 slippage: float = 0.0,
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 rate_limit: Optional[float] = None,
+                 rate_limit_burst: int = 10,
+                 enable_rate_limit: bool = True,
+                 min_amount: float = 0.0,
+                 amount_precision: int = 8,
+                 sleep: Optional[Callable[[float], None]] = None,
+                 clock: Optional[Clock] = None,
+                 seed: int = 0):
+        """
+        Initialize the simulated exchange
+
+        Args:
+            candles: Symbol -> candles in ccxt OHLCV layout at the native timeframe
+            timeframe: Native timeframe of the candle data
+            start_time: Initial market time in ms (default: open of the 300th candle)
+            balances: Initial free balances per currency (default: 10,000 USDT)
+            fee_rate: Taker/maker fee as a fraction of cost, charged in the quote currency
+            slippage: Market order slippage as a fraction of price
+            latency: Fixed delay added to every API call in seconds
+            latency_jitter: Random extra delay of up to this many seconds per call
+            rate_limit: Sustained API calls per second (None = unlimited)
+            rate_limit_burst: Calls allowed in a burst before rate limiting applies
+            enable_rate_limit: Throttle calls like ccxt's enableRateLimit instead of
+                raising RateLimitExceeded
+            min_amount: Minimum order amount reported in market limits
+            amount_precision: Decimal places of order amounts
+            sleep: Function used to apply latency and throttling delays
+                (default: time.sleep, so latency costs wall-clock time)
+            clock: Optional clock the market time follows; when set, every API
+                call first moves the market to the clock's current time
+            seed: Seed for latency jitter
+        """
+        if timeframe not in TIMEFRAME_MS:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+        if not candles:
+            raise ValueError("At least one symbol with candle data is required")
+
+        self.id = 'simulated'
+        self.name = 'Simulated Exchange'
+        self.logger = logging.getLogger(__name__)
+        self.timeframe = timeframe
+        self.timeframe_ms = TIMEFRAME_MS[timeframe]
+        self.timeframes = {tf: tf for tf, ms in TIMEFRAME_MS.items() if ms % self.timeframe_ms == 0}
+        self.has = {
+            'fetchOHLCV': True,
+            'fetchTicker': True,
+            'fetchTickers': True,
+            'fetchBalance': True,
+            'fetchPositions': True,
+            'fetchMyTrades': True,
+            'fetchOpenOrders': True,
+            'fetchOrder': True,
+            'createOrder': True,
+            'cancelOrder': True,
+        }
+        self.fee_rate = fee_rate
+        self.slippage = slippage
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.enableRateLimit = enable_rate_limit
+        self.rateLimit = int(1000 / rate_limit) if rate_limit else 0
+        self.min_amount = min_amount
+        self.amount_precision = amount_precision
+        self.clock = clock
+        self._sleep = sleep or time.sleep
+        self._random = random.Random(seed)
+
+        self._ohlcv: Dict[str, np.ndarray] = {}
+        for symbol, rows in candles.items():
+            array = np.asarray(rows, dtype=np.float64)
+            if array.ndim != 2 or array.shape[1] != 6:
+                raise ValueError(f"Candles for {symbol} must have 6 columns, got shape {array.shape}")
+            self._ohlcv[symbol] = array
+
+        first_series = next(iter(self._ohlcv.values()))
+        if start_time is None:
+            start_time = int(first_series[min(300, len(first_series) - 1), 0])
+        self.now_ms = int(start_time)
+
+        self.markets: Dict[str, Dict[str, Any]] = {}
+        self.symbols: List[str] = []
+
+        self._lock = threading.RLock()
+        self._balances: Dict[str, Dict[str, float]] = {}
+        for currency, amount in (balances or {'USDT': 10_000.0}).items():
+            self._balances[currency] = {'free': float(amount), 'used': 0.0}
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._open_order_ids: List[str] = []
+        self._trades: List[Dict[str, Any]] = []
+        self._positions: Dict[str, Dict[str, float]] = {}
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+
+        self.call_counts: Counter = Counter()
+        # Callbacks invoked with every created order (used by load harnesses)
+        self.order_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._tokens = float(rate_limit_burst)
+        self._last_refill = self._rate_limit_time()
+
+    @classmethod
+    def from_synthetic(cls, symbols: List[str], n_candles: int = 2000, timeframe: str = '1m',
+                       start_ms: int = 1_700_000_000_000, seed: int = 0,
+                       baskets: Optional[Dict[str, List[str]]] = None,
+                       generator_options: Optional[Dict[str, Any]] = None,
+                       **kwargs) -> 'SimulatedExchange':
+        """
+        Create an exchange driven by SyntheticMarketGenerator candles
+
+        Args:
+            symbols: Symbols to list
+            n_candles: Candles generated per symbol
+            timeframe: Native timeframe of the generated candles
+            start_ms: Open time of the first candle
+            seed: Random seed for the generated data
+            baskets: Optional basket name -> member symbols with correlated prices
+            generator_options: Extra SyntheticMarketGenerator arguments
+            **kwargs: Passed to the constructor
+
+        Returns:
+            SimulatedExchange instance
+        """
+        generator = SyntheticMarketGenerator(seed=seed, timeframe=timeframe, start_ms=start_ms,
+                                             **(generator_options or {}))
+        candles = generator.generate_arrays(symbols, n_candles, baskets=baskets)
+        return cls(candles, timeframe=timeframe, seed=seed, **kwargs)
+
+    @classmethod
+    def from_dataframes(cls, frames: Dict[str, pd.DataFrame], timeframe: str = '1m',
+                        **kwargs) -> 'SimulatedExchange':
+        """
+        Create an exchange driven by historical candles
+
+        Args:
+            frames: Symbol -> DataFrame in the layout returned by
+                CCXTProvider.get_historical_data
+            timeframe: Timeframe of the candles
+            **kwargs: Passed to the constructor
+
+        Returns:
+            SimulatedExchange instance
+        """
+        candles = {}
+        for symbol, df in frames.items():
+            timestamps = df['timestamp']
+            if pd.api.types.is_datetime64_any_dtype(timestamps):
+                timestamps = timestamps.astype('datetime64[ms]').astype('int64')
+            array = np.column_stack([
+                np.asarray(timestamps, dtype=np.float64),
+                df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64),
+            ])
+            candles[symbol] = array
+        return cls(candles, timeframe=timeframe, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Market clock
+    # ------------------------------------------------------------------
+
+    def set_time(self, timestamp_ms: int) -> None:
+        """
+        Move the market clock to a timestamp and match resting orders
+        against the candles traded in between
+
+        Args:
+            timestamp_ms: New market time in milliseconds
+        """
+        with self._lock:
+            previous = self.now_ms
+            self.now_ms = int(timestamp_ms)
+            if self.now_ms > previous and self._open_order_ids:
+                self._match_resting_orders(previous, self.now_ms)
+
+    def advance(self, seconds: float) -> None:
+        """Advance the market clock by a number of seconds"""
+        self.set_time(self.now_ms + int(seconds * 1000))
+
+    def milliseconds(self) -> int:
+        """Current market time in milliseconds (ccxt compatible)"""
+        self._sync_clock()
+        return self.now_ms
+
+    def _sync_clock(self) -> None:
+        """Move the market forward to the attached clock's time"""
+        if self.clock is not None:
+            target = self.clock.milliseconds()
+            if target > self.now_ms:
+                self.set_time(target)
+
+    def _rate_limit_time(self) -> float:
+        """Time base of the rate limiter in seconds"""
+        return self.clock.time() if self.clock is not None else time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Call accounting, latency and rate limits
+    # ------------------------------------------------------------------
+
+    def _api_call(self, method: str) -> None:
+        """Account for an API call and apply rate limiting and latency"""
+        self._sync_clock()
+        with self._lock:
+            self.call_counts[method] += 1
+            delay = 0.0
+            if self.rate_limit:
+                now = self._rate_limit_time()
+                self._tokens = min(float(self.rate_limit_burst),
+                                   self._tokens + (now - self._last_refill) * self.rate_limit)
+                self._last_refill = now
+                if self._tokens < 1.0:
+                    if not self.enableRateLimit:
+                        raise ccxt.RateLimitExceeded(f"{self.id} {method}: rate limit exceeded")
+                    delay = (1.0 - self._tokens) / self.rate_limit
+                self._tokens -= 1.0
+
+        delay += self.latency
+        if self.latency_jitter:
+            delay += self._random.uniform(0.0, self.latency_jitter)
+        if delay > 0:
+            self._sleep(delay)
+
+    def reset_call_counts(self) -> None:
+        """Reset the per-method API call counters"""
+        with self._lock:
+            self.call_counts.clear()
+
+    # ------------------------------------------------------------------
+    # Market data
+    # ------------------------------------------------------------------
+
+    def _series(self, symbol: str) -> np.ndarray:
+        series = self._ohlcv.get(symbol)
+        if series is None:
+            raise ccxt.BadSymbol(f"{self.id} does not have market symbol {symbol}")
+        return series
+
+    def _current_index(self, series: np.ndarray) -> int:
+        """Index of the candle that contains the current market time"""
+        return int(np.searchsorted(series[:, 0], self.now_ms, side='right')) - 1
+
+    def _partial_candle(self, row: np.ndarray) -> np.ndarray:
+        """Return the still-forming part of a candle at the current market time"""
+        fraction = min(1.0, max(0.0, (self.now_ms - row[0]) / self.timeframe_ms))
+        price = row[1] + (row[4] - row[1]) * fraction
+        partial = row.copy()
+        partial[2] = min(row[2], max(row[1], price))
+        partial[3] = max(row[3], min(row[1], price))
+        partial[4] = price
+        partial[5] = row[5] * fraction
+        return partial
+
+    def _price(self, symbol: str) -> float:
+        """Current traded price of a symbol"""
+        series = self._series(symbol)
+        index = self._current_index(series)
+        if index < 0:
+            raise ccxt.ExchangeError(f"{self.id} has no data for {symbol} at {self.now_ms}")
+        return float(self._partial_candle(series[index])[4])
+
+    def load_markets(self, reload: bool = False, params: Optional[Dict] = None) -> Dict[str, Dict[str, Any]]:
+        """Load market definitions for all simulated symbols"""
+        self._api_call('load_markets')
+        with self._lock:
+            if not self.markets or reload:
+                self._build_markets()
+        return self.markets
+
+    def _build_markets(self) -> None:
+        markets = {}
+        for symbol in self._ohlcv:
+            base = get_base_currency(symbol)
+            quote_part = symbol.split('/')[1] if '/' in symbol else get_quote_currency(symbol)
+            quote, _, settle = quote_part.partition(':')
+            is_swap = bool(settle)
+            markets[symbol] = {
+                'id': symbol.replace('/', '').replace(':', ''),
+                'symbol': symbol,
+                'base': base,
+                'quote': quote,
+                'settle': settle or None,
+                'type': 'swap' if is_swap else 'spot',
+                'spot': not is_swap,
+                'swap': is_swap,
+                'linear': True if is_swap else None,
+                'contractSize': 1.0 if is_swap else None,
+                'active': True,
+                'precision': {'amount': self.amount_precision, 'price': 8},
+                'limits': {
+                    'amount': {'min': self.min_amount or None, 'max': None},
+                    'price': {'min': None, 'max': None},
+                    'cost': {'min': None, 'max': None},
+                },
+                'info': {},
+            }
+        self.markets = markets
+        self.symbols = sorted(markets)
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', since: Optional[int] = None,
+                    limit: Optional[int] = None, params: Optional[Dict] = None) -> List[List[float]]:
+        """
+        Fetch candles up to the current market time
+
+        The last candle is the one still forming, with its close at the
+        current price. Timeframes that are multiples of the native timeframe
+        are aggregated on the fly.
+        """
+        self._api_call('fetch_ohlcv')
+        if timeframe not in self.timeframes:
+            raise ccxt.BadRequest(f"{self.id} does not support timeframe {timeframe}")
+
+        tf_ms = TIMEFRAME_MS[timeframe]
+        factor = tf_ms // self.timeframe_ms
+        limit = limit or 500
+
+        series = self._series(symbol)
+        index = self._current_index(series)
+        if index < 0:
+            return []
+
+        if since is not None:
+            start = int(np.searchsorted(series[:, 0], (since // tf_ms) * tf_ms, side='left'))
+        else:
+            start = max(0, index + 1 - (limit + 1) * factor)
+        rows = series[start:index + 1].copy()
+        if len(rows) == 0:
+            return []
+        rows[-1] = self._partial_candle(rows[-1])
+
+        if factor > 1:
+            keys = (rows[:, 0] // tf_ms).astype(np.int64)
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+            ends = np.concatenate((starts[1:], [len(rows)])) - 1
+            aggregated = np.empty((len(starts), 6))
+            aggregated[:, 0] = keys[starts] * tf_ms
+            aggregated[:, 1] = rows[starts, 1]
+            aggregated[:, 2] = np.maximum.reduceat(rows[:, 2], starts)
+            aggregated[:, 3] = np.minimum.reduceat(rows[:, 3], starts)
+            aggregated[:, 4] = rows[ends, 4]
+            aggregated[:, 5] = np.add.reduceat(rows[:, 5], starts)
+            rows = aggregated
+
+        if since is not None:
+            rows = rows[rows[:, 0] >= since][:limit]
+        else:
+            rows = rows[-limit:]
+
+        return [[int(row[0]), row[1], row[2], row[3], row[4], row[5]] for row in rows.tolist()]
+
+    def _ticker(self, symbol: str) -> Dict[str, Any]:
+        price = self._price(symbol)
+        half_spread = price * self.slippage
+        return {
+            'symbol': symbol,
+            'timestamp': self.now_ms,
+            'datetime': _iso8601(self.now_ms),
+            'last': price,
+            'close': price,
+            'bid': price - half_spread,
+            'ask': price + half_spread,
+            'info': {},
+        }
+
+    def fetch_ticker(self, symbol: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Fetch the current ticker for a symbol"""
+        self._api_call('fetch_ticker')
+        return self._ticker(symbol)
+
+    def fetch_tickers(self, symbols: Optional[List[str]] = None,
+                      params: Optional[Dict] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch current tickers for several symbols (all symbols by default)"""
+        self._api_call('fetch_tickers')
+        return {symbol: self._ticker(symbol) for symbol in (symbols or list(self._ohlcv))}
+
+    # ------------------------------------------------------------------
+    # Account
+    # ------------------------------------------------------------------
+
+    def fetch_balance(self, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Fetch balances in the unified ccxt layout"""
+        self._api_call('fetch_balance')
+        with self._lock:
+            result: Dict[str, Any] = {'info': {}, 'free': {}, 'used': {}, 'total': {}}
+            for currency, entry in self._balances.items():
+                total = entry['free'] + entry['used']
+                result[currency] = {'free': entry['free'], 'used': entry['used'], 'total': total}
+                result['free'][currency] = entry['free']
+                result['used'][currency] = entry['used']
+                result['total'][currency] = total
+            return result
+
+    def fetch_positions(self, symbols: Optional[List[str]] = None,
+                        params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Fetch open swap positions"""
+        self._api_call('fetch_positions')
+        with self._lock:
+            positions = []
+            for symbol, state in self._positions.items():
+                if symbols and symbol not in symbols:
+                    continue
+                contracts = state['contracts']
+                if contracts == 0:
+                    continue
+                mark_price = self._price(symbol)
+                side = 'long' if contracts > 0 else 'short'
+                pnl = (mark_price - state['entryPrice']) * contracts
+                positions.append({
+                    'symbol': symbol,
+                    'side': side,
+                    'contracts': abs(contracts),
+                    'contractSize': 1.0,
+                    'entryPrice': state['entryPrice'],
+                    'markPrice': mark_price,
+                    'notional': abs(contracts) * mark_price,
+                    'unrealizedPnl': pnl,
+                    'timestamp': self.now_ms,
+                    'info': {},
+                })
+            return positions
+
+    def fetch_my_trades(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                        limit: Optional[int] = None, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Fetch the account's trades, oldest first (params may hold 'until', in ms)"""
+        self._api_call('fetch_my_trades')
+        until = (params or {}).get('until')
+        with self._lock:
+            trades = [
+                dict(trade) for trade in self._trades
+                if (symbol is None or trade['symbol'] == symbol)
+                and (since is None or trade['timestamp'] >= since)
+                and (until is None or trade['timestamp'] <= until)
+            ]
+        if limit is not None:
+            trades = trades[-limit:] if since is None else trades[:limit]
+        return trades
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def _balance_entry(self, currency: str) -> Dict[str, float]:
+        return self._balances.setdefault(currency, {'free': 0.0, 'used': 0.0})
+
+    def _reserve(self, symbol: str, side: str, amount: float, price: float) -> Dict[str, float]:
+        """Check and reserve the funds an order needs, raising InsufficientFunds"""
+        market = self.markets[symbol]
+        if market['swap']:
+            # Margin is not modelled, only the fee is reserved
+            required = {market['quote']: amount * price * self.fee_rate}
+        elif side == 'buy':
+            required = {market['quote']: amount * price * (1 + self.fee_rate)}
+        else:
+            required = {market['base']: amount}
+
+        for currency, needed in required.items():
+            entry = self._balance_entry(currency)
+            if entry['free'] + 1e-12 < needed:
+                raise ccxt.InsufficientFunds(
+                    f"{self.id} {side} {amount} {symbol}: {currency} balance {entry['free']} < {needed}"
+                )
+        for currency, needed in required.items():
+            entry = self._balance_entry(currency)
+            entry['free'] -= needed
+            entry['used'] += needed
+        return required
+
+    def _release(self, reserved: Dict[str, float]) -> None:
+        for currency, amount in reserved.items():
+            entry = self._balance_entry(currency)
+            entry['used'] -= amount
+            entry['free'] += amount
+
+    def _fill(self, order: Dict[str, Any], price: float, taker: bool) -> None:
+        """Fill an order completely at a price and settle balances"""
+        symbol = order['symbol']
+        market = self.markets[symbol]
+        amount = order['amount']
+        cost = amount * price
+        fee = cost * self.fee_rate
+
+        self._release(order['_reserved'])
+        quote = self._balance_entry(market['quote'])
+
+        if market['swap']:
+            state = self._positions.setdefault(symbol, {'contracts': 0.0, 'entryPrice': 0.0})
+            signed = amount if order['side'] == 'buy' else -amount
+            contracts = state['contracts']
+            if contracts == 0 or (contracts > 0) == (signed > 0):
+                # Opening or adding: average the entry price
+                total = contracts + signed
+                state['entryPrice'] = (state['entryPrice'] * abs(contracts) + price * amount) / abs(total)
+                state['contracts'] = total
+            else:
+                # Reducing or flipping: realize PnL on the closed part
+                closed = min(abs(contracts), amount)
+                direction = 1.0 if contracts > 0 else -1.0
+                quote['free'] += (price - state['entryPrice']) * closed * direction
+                state['contracts'] = contracts + signed
+                if abs(signed) > abs(contracts):
+                    state['entryPrice'] = price
+                elif state['contracts'] == 0:
+                    state['entryPrice'] = 0.0
+            quote['free'] -= fee
+        elif order['side'] == 'buy':
+            quote['free'] -= cost + fee
+            self._balance_entry(market['base'])['free'] += amount
+        else:
+            self._balance_entry(market['base'])['free'] -= amount
+            quote['free'] += cost - fee
+
+        trade = {
+            'id': str(next(self._trade_ids)),
+            'order': order['id'],
+            'timestamp': self.now_ms,
+            'datetime': _iso8601(self.now_ms),
+            'symbol': symbol,
+            'type': order['type'],
+            'side': order['side'],
+            'takerOrMaker': 'taker' if taker else 'maker',
+            'price': price,
+            'amount': amount,
+            'cost': cost,
+            'fee': {'cost': fee, 'currency': market['quote']},
+            'info': {},
+        }
+        self._trades.append(trade)
+
+        order.update({
+            'status': 'closed',
+            'filled': amount,
+            'remaining': 0.0,
+            'average': price,
+            'cost': cost,
+            'fee': {'cost': fee, 'currency': market['quote']},
+            'lastTradeTimestamp': self.now_ms,
+            '_reserved': {},
+        })
+        order['trades'].append(trade)
+        if order['id'] in self._open_order_ids:
+            self._open_order_ids.remove(order['id'])
+
+    def _public_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        public = {key: value for key, value in order.items() if not key.startswith('_')}
+        public['trades'] = list(order['trades'])
+        return public
+
+    def create_order(self, symbol: str, type: str, side: str, amount: float,
+                     price: Optional[float] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Create an order; market orders and marketable limit orders fill
+        immediately, other limit orders rest until the price reaches them
+        """
+        self._api_call('create_order')
+        with self._lock:
+            if not self.markets:
+                self._build_markets()
+            if symbol not in self.markets:
+                raise ccxt.BadSymbol(f"{self.id} does not have market symbol {symbol}")
+            if side not in ('buy', 'sell'):
+                raise ccxt.InvalidOrder(f"{self.id} invalid order side {side}")
+            if type not in ('market', 'limit'):
+                raise ccxt.InvalidOrder(f"{self.id} unsupported order type {type}")
+            amount = round(float(amount), self.amount_precision)
+            if amount <= 0 or (self.min_amount and amount < self.min_amount):
+                raise ccxt.InvalidOrder(f"{self.id} order amount {amount} below minimum {self.min_amount}")
+
+            last = self._price(symbol)
+            if type == 'market':
+                fill_price = last * (1 + self.slippage if side == 'buy' else 1 - self.slippage)
+                marketable = True
+            else:
+                if price is None:
+                    raise ccxt.ArgumentsRequired(f"{self.id} limit orders require a price")
+                fill_price = float(price)
+                marketable = (side == 'buy' and last <= fill_price) or (side == 'sell' and last >= fill_price)
+
+            order_id = str(next(self._order_ids))
+            order = {
+                'id': order_id,
+                'clientOrderId': (params or {}).get('clientOrderId'),
+                'timestamp': self.now_ms,
+                'datetime': _iso8601(self.now_ms),
+                'lastTradeTimestamp': None,
+                'symbol': symbol,
+                'type': type,
+                'side': side,
+                'price': fill_price if type == 'limit' else None,
+                'average': None,
+                'amount': amount,
+                'filled': 0.0,
+                'remaining': amount,
+                'cost': 0.0,
+                'status': 'open',
+                'fee': None,
+                'trades': [],
+                'info': {},
+            }
+            order['_reserved'] = self._reserve(symbol, side, amount, fill_price)
+            self._orders[order_id] = order
+
+            if marketable:
+                self._fill(order, fill_price, taker=True)
+            else:
+                self._open_order_ids.append(order_id)
+
+            public = self._public_order(order)
+
+        for listener in self.order_listeners:
+            listener(public)
+        return public
+
+    def cancel_order(self, id: str, symbol: Optional[str] = None,
+                     params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Cancel a resting order and release its reserved funds"""
+        self._api_call('cancel_order')
+        with self._lock:
+            order = self._orders.get(str(id))
+            if order is None or order['status'] != 'open':
+                raise ccxt.OrderNotFound(f"{self.id} order {id} not found or not open")
+            self._release(order['_reserved'])
+            order['_reserved'] = {}
+            order['status'] = 'canceled'
+            self._open_order_ids.remove(order['id'])
+            return self._public_order(order)
+
+    def fetch_open_orders(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                          limit: Optional[int] = None, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Fetch resting orders, optionally filtered by symbol"""
+        self._api_call('fetch_open_orders')
+        with self._lock:
+            orders = [
+                self._public_order(self._orders[order_id]) for order_id in self._open_order_ids
+                if symbol is None or self._orders[order_id]['symbol'] == symbol
+            ]
+        return orders[:limit] if limit else orders
+
+    def fetch_order(self, id: str, symbol: Optional[str] = None,
+                    params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Fetch a single order by id"""
+        self._api_call('fetch_order')
+        with self._lock:
+            order = self._orders.get(str(id))
+            if order is None:
+                raise ccxt.OrderNotFound(f"{self.id} order {id} not found")
+            return self._public_order(order)
+
+    def _match_resting_orders(self, start_ms: int, end_ms: int) -> None:
+        """Fill resting limit orders the price traded through between two times"""
+        for order_id in list(self._open_order_ids):
+            order = self._orders[order_id]
+            series = self._ohlcv[order['symbol']]
+            first = max(0, int(np.searchsorted(series[:, 0], start_ms, side='right')) - 1)
+            last = self._current_index(series)
+            if last < first:
+                continue
+            window = series[first:last + 1].copy()
+            window[-1] = self._partial_candle(window[-1])
+            if order['side'] == 'buy' and window[:, 3].min() <= order['price']:
+                self._fill(order, order['price'], taker=False)
+            elif order['side'] == 'sell' and window[:, 2].max() >= order['price']:
+                self._fill(order, order['price'], taker=False)
@@ -0,0 +1,483 @@
+# trading_bot/simulation/harness.py
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import yaml
+
+from trading_bot.simulation.exchange import TIMEFRAME_MS, SimulatedExchange
+from trading_bot.utils.clock import SimulatedClock, get_clock, set_clock
+from trading_bot.utils.queued_events import QueuedEventBus
+
+STRATEGIES = {
+    'spot': {
+        'type': 'moving_average_crossover_spot',
+        'params': {'short_period': 5, 'long_period': 20},
+    },
+    'futures': {
+        'type': 'moving_average_crossover_futures',
+        'params': {'short_period': 5, 'long_period': 20, 'leverage': 2},
+    },
+    'biased': {
+        'type': 'biased_spot_ma_crossover',
+        'params': {
+            'buy_short_period': 10, 'buy_long_period': 30,
+            'sell_short_period': 50, 'sell_long_period': 200,
+        },
+    },
+}
+
+RUNTIMES = ('sync', 'async', 'sharded', 'nodes')
+
+# Candles before the session start, enough for the slowest strategy preset
+WARMUP_CANDLES = 300
+
+def _current_rss_bytes() -> int:
+    """Current resident set size, falling back to the peak where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return _peak_rss_bytes()
+
+def _peak_rss_bytes() -> int:
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _percentiles(values: List[float], scale: float = 1.0) -> Dict[str, Optional[float]]:
+    if not values:
+        return {'p50': None, 'p90': None, 'p99': None, 'max': None}
+    array = np.asarray(values) * scale
+    return {
+        'p50': float(np.percentile(array, 50)),
+        'p90': float(np.percentile(array, 90)),
+        'p99': float(np.percentile(array, 99)),
+        'max': float(array.max()),
+    }
+
+def build_config(symbols: List[str], timeframe: str, strategy: str, market_type: str,
+                 parallel_workers: int = 0, shard_processes: int = 0,
+                 shard_transport: str = 'queue', event_workers: int = 0) -> Dict[str, Any]:
+    """
+    Build a bot configuration for a simulated run
+
+    Args:
+        symbols: Symbols to trade
+        timeframe: Trading timeframe
+        strategy: Key into STRATEGIES
+        market_type: Market type written to each symbol entry
+        parallel_workers: Symbol worker threads (0 = sequential)
+        shard_processes: Shard worker processes for ShardedTradingBot
+        shard_transport: How shard workers return signals: 'queue' or 'shm'
+        event_workers: Event handler threads (0 = handlers run inside publish)
+
+    Returns:
+        Configuration dictionary in the layout of the YAML config files
+    """
+    return {
+        'exchange': {'id': 'simulated', 'params': {}},
+        'trading': {
+            'enabled': True,
+            'symbols': [{'symbol': symbol, 'market_type': market_type} for symbol in symbols],
+            'timeframe': timeframe,
+            'parallel_workers': parallel_workers,
+            'shard_processes': shard_processes,
+            'shard_transport': shard_transport,
+        },
+        'strategy': STRATEGIES[strategy],
+        'risk': {
+            'max_drawdown': 0.05,
+            'drawdown_check_interval': 300,
+        },
+        'system': {'log_level': 'WARNING', 'events': {'workers': event_workers}},
+    }
+
+class MarketReplica:
+    """
+    Picklable factory for a SimulatedExchange with the same market data as
+    the harness's exchange, used by the shard worker processes of
+    ShardedTradingBot. The replica follows the worker's simulated clock;
+    orders are only ever placed on the coordinator's exchange.
+    """
+
+    def __init__(self, symbols: List[str], n_candles: int, timeframe: str, seed: int, latency: float):
+        self.symbols = symbols
+        self.n_candles = n_candles
+        self.timeframe = timeframe
+        self.seed = seed
+        self.latency = latency
+
+    def __call__(self) -> SimulatedExchange:
+        return SimulatedExchange.from_synthetic(
+            self.symbols,
+            n_candles=self.n_candles,
+            timeframe=self.timeframe,
+            seed=self.seed,
+            latency=self.latency,
+            clock=get_clock(),
+        )
+
+class ThroughputHarness:
+    """
+    Runs the real TradingBot (config, strategies, BasicRiskManager,
+    CCXTExecutor, PositionTracker) against a SimulatedExchange.
+
+    The harness installs a SimulatedClock shared by the bot and the
+    exchange: every step it advances the clock by ``step`` seconds and
+    calls TradingBot.run_once with the simulated time, so a session of many
+    candles runs as fast as the bot can process it. Candle closes are timestamped in both simulated and
+    wall-clock time so the delay from a candle close to the order it
+    triggers can be measured.
+    """
+
+    def __init__(self,
+                 n_symbols: int,
+                 timeframe: str = '1m',
+                 duration_candles: int = 10,
+                 step: float = 1.0,
+                 strategy: str = 'spot',
+                 latency: float = 0.0,
+                 workers: int = 0,
+                 runtime: str = 'sync',
+                 processes: int = 0,
+                 transport: str = 'queue',
+                 event_workers: int = 0,
+                 seed: int = 0,
+                 log_level: str = 'WARNING',
+                 workdir: Optional[str] = None):
+        """
+        Initialize the harness
+
+        Args:
+            n_symbols: Number of symbols to trade
+            timeframe: Trading timeframe (also the native timeframe of the data)
+            duration_candles: Length of the simulated session in candles
+            step: Simulated seconds per loop iteration (TradingBot.run sleeps 1s)
+            strategy: Strategy preset: 'spot', 'futures' or 'biased'
+            latency: Simulated API latency per call in seconds
+            workers: trading.parallel_workers for the bot (0 = sequential)
+            runtime: 'sync' for TradingBot, 'async' for AsyncTradingBot,
+                'sharded' for ShardedTradingBot or 'nodes' for
+                MultiNodeTradingBot with node processes on loopback TCP
+            processes: trading.shard_processes for the sharded runtime
+                (0 = one per CPU), or the number of worker nodes
+            transport: trading.shard_transport for the sharded runtime
+            event_workers: system.events.workers for the sync, sharded and
+                nodes runtimes (0 = handlers run inside publish)
+            seed: Random seed for the market data
+            log_level: Bot log level
+            workdir: Directory for the config, logs and positions file
+                (default: a new temporary directory)
+        """
+        if timeframe not in TIMEFRAME_MS:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy preset: {strategy}")
+        if runtime not in RUNTIMES:
+            raise ValueError(f"Unknown runtime: {runtime}")
+        self.n_symbols = n_symbols
+        self.timeframe = timeframe
+        self.duration_candles = duration_candles
+        self.step = step
+        self.strategy = strategy
+        self.latency = latency
+        self.workers = workers
+        self.runtime = runtime
+        self.processes = processes
+        self.transport = transport
+        self.event_workers = event_workers
+        self.seed = seed
+        self.log_level = log_level
+        self.workdir = workdir or tempfile.mkdtemp(prefix="trading_bot_harness_")
+        self.logger = logging.getLogger(__name__)
+
+    def _symbols(self) -> List[str]:
+        suffix = ':USDT' if self.strategy == 'futures' else ''
+        return [f"S{i:04d}/USDT{suffix}" for i in range(self.n_symbols)]
+
+    def _n_candles(self) -> int:
+        return WARMUP_CANDLES + self.duration_candles + 5
+
+    def _build_exchange(self, symbols: List[str], clock: SimulatedClock) -> SimulatedExchange:
+        n_candles = self._n_candles()
+        exchange = SimulatedExchange.from_synthetic(
+            symbols,
+            n_candles=n_candles,
+            timeframe=self.timeframe,
+            seed=self.seed,
+            latency=self.latency,
+            balances={'USDT': 1_000_000.0},
+            clock=clock,
+        )
+        # Start exactly on the close of the warmup candles
+        start_ms = int(exchange._ohlcv[symbols[0]][WARMUP_CANDLES, 0])
+        clock.set_time(start_ms / 1000)
+        exchange.set_time(start_ms)
+        return exchange
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run one scenario
+
+        Returns:
+            Dictionary of throughput, latency and resource metrics
+        """
+        # Imported here so the bot's logging setup happens inside the scenario
+        from trading_bot.main import TradingBot
+
+        symbols = self._symbols()
+        market_type = 'futures' if self.strategy == 'futures' else 'spot'
+        config_path = os.path.join(self.workdir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.safe_dump(build_config(symbols, self.timeframe, self.strategy, market_type,
+                                        self.workers, self.processes, self.transport,
+                                        self.event_workers), f)
+
+        clock = SimulatedClock()
+        exchange = self._build_exchange(symbols, clock)
+        tf_ms = TIMEFRAME_MS[self.timeframe]
+
+        # Wall-clock time at which the most recent candle closed
+        last_close_wall = time.perf_counter()
+        sim_latencies: List[float] = []
+        wall_latencies: List[float] = []
+
+        def on_order(order: Dict[str, Any]) -> None:
+            close_ms = (exchange.now_ms // tf_ms) * tf_ms
+            sim_latencies.append((exchange.now_ms - close_ms) / 1000)
+            wall_latencies.append(time.perf_counter() - last_close_wall)
+
+        exchange.order_listeners.append(on_order)
+
+        cwd = os.getcwd()
+        os.chdir(self.workdir)
+        previous_clock = set_clock(clock)
+        try:
+            if self.runtime == 'async':
+                from trading_bot.aio import AsyncTradingBot
+                bot = AsyncTradingBot(config_path, log_level=self.log_level, exchange=exchange)
+            elif self.runtime == 'sharded':
+                from trading_bot.distributed import ShardedTradingBot
+                replica = MarketReplica(symbols, self._n_candles(), self.timeframe, self.seed, self.latency)
+                bot = ShardedTradingBot(config_path, log_level=self.log_level, exchange=exchange,
+                                        exchange_factory=replica)
+                # Spawn the workers before the clock starts
+                bot.start_workers()
+            elif self.runtime == 'nodes':
+                from trading_bot.distributed import MultiNodeTradingBot, TcpListener
+                from trading_bot.distributed.node import run_node
+                bot = MultiNodeTradingBot(config_path, log_level=self.log_level, exchange=exchange,
+                                          listener=TcpListener('127.0.0.1', 0), token='')
+                context = multiprocessing.get_context('spawn')
+                n_nodes = self.processes or os.cpu_count() or 1
+                nodes = [
+                    context.Process(target=run_node, args=(bot.server.listener.address,),
+                                    kwargs={'name': f"node-{i}", 'log_level': self.log_level}, daemon=True)
+                    for i in range(n_nodes)
+                ]
+                for node in nodes:
+                    node.start()
+                if not bot.server.wait_for_nodes(n_nodes, timeout=60):
+                    raise RuntimeError("Worker nodes did not connect within 60s")
+            else:
+                bot = TradingBot(config_path, log_level=self.log_level, exchange=exchange)
+            exchange.reset_call_counts()
+
+            total_steps = int(self.duration_candles * tf_ms / 1000 / self.step)
+            loop_times: List[float] = []
+            rss_start = _current_rss_bytes()
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            last_close_wall = wall_start
+
+            def advance() -> None:
+                nonlocal last_close_wall
+                previous_candle = clock.milliseconds() // tf_ms
+                clock.advance(self.step)
+                if clock.milliseconds() // tf_ms != previous_candle:
+                    last_close_wall = time.perf_counter()
+
+            if self.runtime == 'async':
+                async def drive() -> None:
+                    await bot.start_async()
+                    try:
+                        for _ in range(total_steps):
+                            advance()
+                            loop_start = time.perf_counter()
+                            await bot.run_once_async(clock.time())
+                            loop_times.append(time.perf_counter() - loop_start)
+                    finally:
+                        await bot.shutdown_async()
+
+                asyncio.run(drive())
+            else:
+                try:
+                    for _ in range(total_steps):
+                        advance()
+                        loop_start = time.perf_counter()
+                        bot.run_once(clock.time())
+                        loop_times.append(time.perf_counter() - loop_start)
+                    if isinstance(bot.event_bus, QueuedEventBus):
+                        # Orders of the last signals are still being placed
+                        bot.event_bus.drain()
+                finally:
+                    if isinstance(bot.event_bus, QueuedEventBus):
+                        bot.event_bus.close()
+                    if self.runtime == 'sharded':
+                        bot.close()
+                    elif self.runtime == 'nodes':
+                        bot.close()
+                        for node in nodes:
+                            node.join(timeout=5)
+
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            rss_end = _current_rss_bytes()
+        finally:
+            set_clock(previous_clock)
+            os.chdir(cwd)
+
+        calls = dict(exchange.call_counts)
+        total_calls = sum(calls.values())
+        loops = max(1, len(loop_times))
+        sim_seconds = total_steps * self.step
+
+        return {
+            'symbols': self.n_symbols,
+            'timeframe': self.timeframe,
+            'strategy': self.strategy,
+            'workers': self.workers,
+            'runtime': self.runtime,
+            'processes': self.processes,
+            'transport': self.transport,
+            'event_workers': self.event_workers,
+            'loops': len(loop_times),
+            'sim_seconds': sim_seconds,
+            'wall_seconds': wall,
+            'speedup': sim_seconds / wall if wall > 0 else None,
+            'loops_per_second': len(loop_times) / wall if wall > 0 else None,
+            'loop_time_ms': _percentiles(loop_times, scale=1000),
+            'orders': len(sim_latencies),
+            'close_to_order_sim_s': _percentiles(sim_latencies),
+            'close_to_order_wall_ms': _percentiles(wall_latencies, scale=1000),
+            'api_calls': calls,
+            'api_calls_per_loop': total_calls / loops,
+            'cpu_seconds': cpu,
+            'cpu_percent': cpu / wall * 100 if wall > 0 else None,
+            'rss_mb': rss_end / 1024 / 1024,
+            'rss_growth_mb': (rss_end - rss_start) / 1024 / 1024,
+            'peak_rss_mb': _peak_rss_bytes() / 1024 / 1024,
+        }
+
+def sweep(symbol_counts: List[int], timeframes: List[str], **kwargs) -> List[Dict[str, Any]]:
+    """
+    Run the harness for every combination of symbol count and timeframe
+
+    Args:
+        symbol_counts: Symbol counts to test (e.g. [10, 100, 1000])
+        timeframes: Timeframes to test
+        **kwargs: Passed to ThroughputHarness
+
+    Returns:
+        List of per-scenario results
+    """
+    results = []
+    for timeframe in timeframes:
+        for count in symbol_counts:
+            result = ThroughputHarness(count, timeframe=timeframe, **kwargs).run()
+            results.append(result)
+            print(format_result(result), flush=True)
+    return results
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Format one scenario result as a table row"""
+    def fmt(value, spec='.1f'):
+        return '-' if value is None else format(value, spec)
+
+    return (
+        f"{result['symbols']:>6} {result['timeframe']:>4} "
+        f"{fmt(result['loops_per_second']):>10} "
+        f"{fmt(result['loop_time_ms']['p99'], '.2f'):>10} "
+        f"{result['orders']:>7} "
+        f"{fmt(result['close_to_order_sim_s']['p50']):>8} "
+        f"{fmt(result['close_to_order_sim_s']['p99']):>8} "
+        f"{fmt(result['close_to_order_wall_ms']['p99'], '.2f'):>10} "
+        f"{result['api_calls_per_loop']:>9.2f} "
+        f"{fmt(result['cpu_percent']):>6} "
+        f"{result['rss_mb']:>8.1f}"
+    )
+
+HEADER = (
+    f"{'syms':>6} {'tf':>4} {'loops/s':>10} {'loop p99':>10} {'orders':>7} "
+    f"{'lat p50':>8} {'lat p99':>8} {'wall p99':>10} {'calls/lp':>9} {'cpu%':>6} {'rss MB':>8}\n"
+    f"{'':>6} {'':>4} {'':>10} {'(ms)':>10} {'':>7} {'(sim s)':>8} {'(sim s)':>8} {'(ms)':>10}"
+)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Measure TradingBot throughput against a simulated exchange')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[10, 100, 1000],
+                        help='Symbol counts to sweep')
+    parser.add_argument('--timeframes', type=str, nargs='+', default=['1m', '5m'],
+                        help='Timeframes to sweep')
+    parser.add_argument('--duration-candles', type=int, default=10,
+                        help='Simulated session length in candles')
+    parser.add_argument('--step', type=float, default=1.0,
+                        help='Simulated seconds per loop iteration')
+    parser.add_argument('--strategy', type=str, default='spot', choices=sorted(STRATEGIES),
+                        help='Strategy preset')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Simulated API latency per call (seconds)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Symbol worker threads (trading.parallel_workers)')
+    parser.add_argument('--runtime', type=str, default='sync', choices=list(RUNTIMES),
+                        help='Bot runtime to measure')
+    parser.add_argument('--processes', type=int, default=0,
+                        help='Shard worker processes for --runtime sharded or worker nodes for '
+                             '--runtime nodes (0 = one per CPU)')
+    parser.add_argument('--transport', type=str, default='queue', choices=['queue', 'shm'],
+                        help='How shard workers return signals for --runtime sharded')
+    parser.add_argument('--event-workers', type=int, default=0,
+                        help='Event handler threads (system.events.workers, 0 = inline)')
+    parser.add_argument('--seed', type=int, default=0, help='Market data seed')
+    parser.add_argument('-o', '--output', type=str, default=None,
+                        help='Write results to this JSON file')
+    return parser.parse_args()
+
+def main() -> int:
+    """Main function"""
+    args = parse_args()
+    print(HEADER)
+    results = sweep(
+        args.symbols,
+        args.timeframes,
+        duration_candles=args.duration_candles,
+        step=args.step,
+        strategy=args.strategy,
+        latency=args.latency,
+        workers=args.workers,
+        runtime=args.runtime,
+        processes=args.processes,
+        transport=args.transport,
+        event_workers=args.event_workers,
+        seed=args.seed,
+    )
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
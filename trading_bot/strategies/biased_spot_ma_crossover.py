@@ -119,6 +119,16 @@ class BiasedSpotMACrossover(Strategy):
             condition_name: Name of the condition being evaluated
             condition_result: Result of the condition (True/False)
         """
+        # Also log to crossovers logger if this is a crossover condition
+        crossover_logger = None
+        if "CROSSOVER" in condition_name or "CONFIGURATION" in condition_name:
+            crossover_logger = logging.getLogger("crossovers")
+        
+        # Skip formatting the message when nobody would see it
+        if not self.logger.isEnabledFor(logging.DEBUG) and not (
+                crossover_logger is not None and crossover_logger.isEnabledFor(logging.DEBUG)):
+            return
+        
         message = (f"SIGNAL DIAGNOSTIC: {symbol} - {condition_name}: {condition_result}\n"
                   f"  Current Price: {data_dict.get('price', 'N/A')}\n"
                   f"  Buy MAs: Short({self.buy_short_period})={data_dict.get('buy_short_ma', 'N/A'):.6f}, "
@@ -132,10 +142,7 @@ class BiasedSpotMACrossover(Strategy):
                   f"  Position Amount: {data_dict.get('position_amount', 'N/A')}")
         
         self.logger.debug(message)
-        
-        # Also log to crossovers logger if this is a crossover condition
-        if "CROSSOVER" in condition_name or "CONFIGURATION" in condition_name:
-            crossover_logger = logging.getLogger("crossovers")
+        if crossover_logger is not None:
             crossover_logger.debug(message)
     
     def check_positions(self, symbol):
@@ -252,11 +259,12 @@ class BiasedSpotMACrossover(Strategy):
             
             # Also log to MA values CSV for data analysis
             ma_logger = logging.getLogger("ma_values")
-            ma_logger.debug(
-                f"{current['timestamp']},{symbol},{current_price:.6f},"
-                f"{current[buy_short_col]:.6f},{current[buy_long_col]:.6f},"
-                f"{current[sell_short_col]:.6f},{current[sell_long_col]:.6f}"
-            )
+            if ma_logger.isEnabledFor(logging.DEBUG):
+                ma_logger.debug(
+                    f"{current['timestamp']},{symbol},{current_price:.6f},"
+                    f"{current[buy_short_col]:.6f},{current[buy_long_col]:.6f},"
+                    f"{current[sell_short_col]:.6f},{current[sell_long_col]:.6f}"
+                )
             
             # Get current MA values
             current_buy_short_ma = current[buy_short_col]
@@ -273,15 +281,16 @@ class BiasedSpotMACrossover(Strategy):
             
             # Log detailed crossover check information
             crossover_logger = logging.getLogger("crossovers")
-            crossover_logger.debug(
-                f"CROSSOVER CHECK: {symbol} @ {current['timestamp']}\n"
-                f"Previous buy: short({previous[buy_short_col]:.6f}) {'>' if previous[buy_short_col] > previous[buy_long_col] else '<='} long({previous[buy_long_col]:.6f})\n"
-                f"Current buy: short({current_buy_short_ma:.6f}) {'>' if current_buy_short_ma > current_buy_long_ma else '<='} long({current_buy_long_ma:.6f})\n"
-                f"BUY CROSSOVER DETECTED: {buy_crossover}\n\n"
-                f"Previous sell: short({previous[sell_short_col]:.6f}) {'>' if previous[sell_short_col] > previous[sell_long_col] else '<='} long({previous[sell_long_col]:.6f})\n"
-                f"Current sell: short({current_sell_short_ma:.6f}) {'>' if current_sell_short_ma > current_sell_long_ma else '<='} long({current_sell_long_ma:.6f})\n"
-                f"SELL CROSSOVER DETECTED: {sell_crossover}"
-            )
+            if crossover_logger.isEnabledFor(logging.DEBUG):
+                crossover_logger.debug(
+                    f"CROSSOVER CHECK: {symbol} @ {current['timestamp']}\n"
+                    f"Previous buy: short({previous[buy_short_col]:.6f}) {'>' if previous[buy_short_col] > previous[buy_long_col] else '<='} long({previous[buy_long_col]:.6f})\n"
+                    f"Current buy: short({current_buy_short_ma:.6f}) {'>' if current_buy_short_ma > current_buy_long_ma else '<='} long({current_buy_long_ma:.6f})\n"
+                    f"BUY CROSSOVER DETECTED: {buy_crossover}\n\n"
+                    f"Previous sell: short({previous[sell_short_col]:.6f}) {'>' if previous[sell_short_col] > previous[sell_long_col] else '<='} long({previous[sell_long_col]:.6f})\n"
+                    f"Current sell: short({current_sell_short_ma:.6f}) {'>' if current_sell_short_ma > current_sell_long_ma else '<='} long({current_sell_long_ma:.6f})\n"
+                    f"SELL CROSSOVER DETECTED: {sell_crossover}"
+                )
             
             # Check for positions
             has_position, position_amount = self.check_positions(symbol)
@@ -2,9 +2,6 @@
 from typing import Dict, Any, List
 import logging  # Add logging import
 from trading_bot.interfaces.strategy import Strategy
-from trading_bot.strategies.moving_average_crossover_spot import MovingAverageCrossoverSpot
-from trading_bot.strategies.moving_average_crossover_futures import MovingAverageCrossoverFutures
-from trading_bot.strategies.biased_spot_ma_crossover import BiasedSpotMACrossover
 
 logger = logging.getLogger(__name__) # Initialize module-level logger
 
@@ -57,7 +54,10 @@ class StrategyFactory: # Remove LoggerMixin inheritance
         # Remove any position sizing parameters as they're now handled by risk manager
         params = {k: v for k, v in params.items() if k not in ['position_sizing', 'total_trading_pairs']}
         
+        # Strategy modules (and pandas with them) are imported only for the configured type
         if strategy_type == 'moving_average_crossover_spot':
+            from trading_bot.strategies.moving_average_crossover_spot import MovingAverageCrossoverSpot
+            
             # Extract required parameters that must be in config
             if 'short_period' not in params:
                 raise ValueError("Missing required parameter 'short_period' for moving_average_crossover_spot strategy")
@@ -80,6 +80,8 @@ class StrategyFactory: # Remove LoggerMixin inheritance
             return instance
             
         elif strategy_type == 'moving_average_crossover_futures':
+            from trading_bot.strategies.moving_average_crossover_futures import MovingAverageCrossoverFutures
+            
             # Extract required parameters that must be in config
             required_params = ['short_period', 'long_period', 'leverage']
             for param in required_params:
@@ -106,6 +108,8 @@ class StrategyFactory: # Remove LoggerMixin inheritance
             return instance
             
         elif strategy_type == 'biased_spot_ma_crossover':
+            from trading_bot.strategies.biased_spot_ma_crossover import BiasedSpotMACrossover
+            
             # Extract required parameters that must be in config
             required_params = ['buy_short_period', 'buy_long_period', 'sell_short_period', 'sell_long_period']
             for param in required_params:
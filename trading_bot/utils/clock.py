@@ -0,0 +1,150 @@
+# trading_bot/utils/clock.py
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+class Clock(ABC):
+    """
+    Source of time for the trading system.
+
+    Every module reads the current time and sleeps through the active clock
+    (see get_clock) instead of calling time.time, time.sleep or datetime.now
+    directly, so the production code path can run against simulated or
+    accelerated time.
+    """
+
+    @abstractmethod
+    def time(self) -> float:
+        """Current time in seconds since the epoch"""
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Wait for a number of seconds of clock time"""
+        pass
+
+    async def sleep_async(self, seconds: float) -> None:
+        """Wait for a number of seconds of clock time without blocking the event loop"""
+        # Imported here: only the asyncio runtime sleeps this way, and it has loaded asyncio already
+        import asyncio
+        await asyncio.sleep(max(0.0, seconds))
+
+    def now(self) -> datetime:
+        """Current local time as a naive datetime (like datetime.now())"""
+        return datetime.fromtimestamp(self.time())
+
+    def milliseconds(self) -> int:
+        """Current time in milliseconds since the epoch"""
+        return int(self.time() * 1000)
+
+class RealClock(Clock):
+    """Wall-clock time"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+class SimulatedClock(Clock):
+    """
+    Manually driven clock.
+
+    Time only moves when advance or set_time is called; sleep advances the
+    clock instantly instead of blocking, so loops run as fast as the code
+    allows.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Initialize the clock
+
+        Args:
+            start: Initial time in seconds since the epoch (default: now)
+        """
+        self._time = time.time() if start is None else float(start)
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._time
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        import asyncio
+        self.sleep(seconds)
+        # Still yield so other tasks get to run
+        await asyncio.sleep(0)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by a number of seconds"""
+        with self._lock:
+            self._time += seconds
+
+    def set_time(self, timestamp: float) -> None:
+        """Move the clock to a timestamp in seconds since the epoch"""
+        with self._lock:
+            self._time = float(timestamp)
+
+class ReplayClock(Clock):
+    """
+    Clock that runs a fixed multiple faster than wall-clock time from a
+    chosen start, e.g. to replay a recorded session at 1000x.
+
+    Sleeps block for the equivalent wall-clock time, so threads waiting on
+    each other keep the same relative timing as in a live session.
+    """
+
+    def __init__(self, start: float, speed: float = 1000.0):
+        """
+        Initialize the clock
+
+        Args:
+            start: Clock time at creation in seconds since the epoch
+            speed: Clock seconds per wall-clock second
+        """
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        self.start = float(start)
+        self.speed = speed
+        self._wall_start = time.monotonic()
+
+    def time(self) -> float:
+        return self.start + (time.monotonic() - self._wall_start) * self.speed
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+    async def sleep_async(self, seconds: float) -> None:
+        import asyncio
+        await asyncio.sleep(max(0.0, seconds) / self.speed)
+
+_clock: Clock = RealClock()
+
+def get_clock() -> Clock:
+    """Get the active clock"""
+    return _clock
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replace the active clock
+
+    Args:
+        clock: Clock used by all modules from now on
+
+    Returns:
+        The previously active clock, so callers can restore it
+    """
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
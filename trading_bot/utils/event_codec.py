@@ -0,0 +1,289 @@
+# trading_bot/utils/event_codec.py
+import pickle
+import struct
+import sys
+from datetime import datetime
+from typing import Any, List, Tuple
+
+from trading_bot.models.data_models import Signal
+from trading_bot.utils.events import CandleUpdate, Event, EventType, OrderBookUpdate, PriceUpdate, RiskLimitBreach
+
+CODEC_VERSION = 2
+
+# version, event type, timestamp
+_HEADER = struct.Struct('<BBd')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_LENGTH = struct.Struct('<I')
+# price, strength
+_SIGNAL = struct.Struct('<dd')
+
+_TYPE_BY_ID = {event_type.value: event_type for event_type in EventType}
+
+# Typed event payloads encoded as a one-byte id and their fields; append only
+_RECORD_TYPES = (PriceUpdate, CandleUpdate, OrderBookUpdate, RiskLimitBreach)
+_RECORD_IDS = {record_type: index for index, record_type in enumerate(_RECORD_TYPES)}
+
+# One-byte tags of the value encoding
+_NONE = b'N'
+_TRUE = b'T'
+_FALSE = b'F'
+_INT_TAG = b'i'
+_FLOAT_TAG = b'f'
+_STR = b's'
+_BYTES = b'b'
+_LIST = b'l'
+_DICT = b'd'
+_DATETIME = b't'
+_TIMESTAMP = b'p'
+_SIGNAL_TAG = b'S'
+_RECORD = b'r'
+_PICKLE = b'P'
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+class EventCodecError(ValueError):
+    """Raised when a buffer is not a valid encoded event"""
+
+def _loaded(module: str, name: str):
+    """
+    Look up a class of a library only if the library is already imported:
+    no value can be a pandas Timestamp or numpy scalar before that, so the
+    codec does not have to import them up front
+    """
+    library = sys.modules.get(module)
+    return getattr(library, name, None) if library is not None else None
+
+def _encode_str(value: str, out: List[bytes]) -> None:
+    raw = value.encode('utf-8')
+    out.append(_LENGTH.pack(len(raw)))
+    out.append(raw)
+
+def _encode_value(value: Any, out: List[bytes], allow_pickle: bool = True) -> None:
+    # Exact type checks: bool is an int and Enum members may subclass str
+    kind = type(value)
+    if value is None:
+        out.append(_NONE)
+    elif kind is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif kind is int and _INT_MIN <= value <= _INT_MAX:
+        out.append(_INT_TAG)
+        out.append(_INT.pack(value))
+    elif kind is float:
+        out.append(_FLOAT_TAG)
+        out.append(_FLOAT.pack(value))
+    elif kind is str:
+        out.append(_STR)
+        _encode_str(value, out)
+    elif kind is bytes:
+        out.append(_BYTES)
+        out.append(_LENGTH.pack(len(value)))
+        out.append(value)
+    elif kind is list or kind is tuple:
+        out.append(_LIST)
+        out.append(_LENGTH.pack(len(value)))
+        for item in value:
+            _encode_value(item, out, allow_pickle)
+    elif kind is dict and all(type(key) is str for key in value):
+        out.append(_DICT)
+        out.append(_LENGTH.pack(len(value)))
+        for key, item in value.items():
+            _encode_str(key, out)
+            _encode_value(item, out, allow_pickle)
+    elif kind is datetime and value.tzinfo is None:
+        out.append(_DATETIME)
+        out.append(_FLOAT.pack(value.timestamp()))
+    elif kind is _loaded('pandas', 'Timestamp') and value.tzinfo is None:
+        out.append(_TIMESTAMP)
+        out.append(_INT.pack(value.value))
+    elif kind is Signal:
+        out.append(_SIGNAL_TAG)
+        out.append(_SIGNAL.pack(float(value.price), float(value.strength)))
+        _encode_str(value.symbol, out)
+        _encode_str(value.signal_type, out)
+        _encode_str(value.strategy_name, out)
+        _encode_value(value.timestamp, out, allow_pickle)
+        _encode_value(value.params, out, allow_pickle)
+    elif kind in _RECORD_IDS:
+        out.append(_RECORD)
+        out.append(bytes((_RECORD_IDS[kind],)))
+        for item in value:
+            _encode_value(item, out, allow_pickle)
+    elif isinstance(value, _loaded('numpy', 'generic') or ()):
+        _encode_value(value.item(), out, allow_pickle)
+    elif not allow_pickle:
+        raise EventCodecError(f"Cannot encode {kind.__name__} without pickle")
+    else:
+        # Dataclasses, aware datetimes and anything else
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        out.append(_PICKLE)
+        out.append(_LENGTH.pack(len(raw)))
+        out.append(raw)
+
+def _decode_str(buffer, offset: int) -> Tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += 4
+    if offset + length > len(buffer):
+        raise EventCodecError(f"Truncated string at offset {offset - 4}")
+    return bytes(buffer[offset:offset + length]).decode('utf-8'), offset + length
+
+def _decode_value(buffer, offset: int, allow_pickle: bool = True) -> Tuple[Any, int]:
+    tag = bytes(buffer[offset:offset + 1])
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT_TAG:
+        return _INT.unpack_from(buffer, offset)[0], offset + 8
+    if tag == _FLOAT_TAG:
+        return _FLOAT.unpack_from(buffer, offset)[0], offset + 8
+    if tag == _STR:
+        return _decode_str(buffer, offset)
+    if tag == _BYTES or tag == _PICKLE:
+        if tag == _PICKLE and not allow_pickle:
+            raise EventCodecError("Pickled value in a message decoded without pickle")
+        (length,) = _LENGTH.unpack_from(buffer, offset)
+        offset += 4
+        if offset + length > len(buffer):
+            raise EventCodecError(f"Truncated bytes at offset {offset - 4}")
+        raw = bytes(buffer[offset:offset + length])
+        return (raw if tag == _BYTES else pickle.loads(raw)), offset + length
+    if tag == _LIST:
+        (count,) = _LENGTH.unpack_from(buffer, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(buffer, offset, allow_pickle)
+            items.append(item)
+        return items, offset
+    if tag == _DICT:
+        (count,) = _LENGTH.unpack_from(buffer, offset)
+        offset += 4
+        result = {}
+        for _ in range(count):
+            key, offset = _decode_str(buffer, offset)
+            result[key], offset = _decode_value(buffer, offset, allow_pickle)
+        return result, offset
+    if tag == _DATETIME:
+        return datetime.fromtimestamp(_FLOAT.unpack_from(buffer, offset)[0]), offset + 8
+    if tag == _TIMESTAMP:
+        import pandas as pd
+        return pd.Timestamp(_INT.unpack_from(buffer, offset)[0]), offset + 8
+    if tag == _SIGNAL_TAG:
+        price, strength = _SIGNAL.unpack_from(buffer, offset)
+        offset += _SIGNAL.size
+        symbol, offset = _decode_str(buffer, offset)
+        signal_type, offset = _decode_str(buffer, offset)
+        strategy_name, offset = _decode_str(buffer, offset)
+        timestamp, offset = _decode_value(buffer, offset, allow_pickle)
+        params, offset = _decode_value(buffer, offset, allow_pickle)
+        return Signal(
+            symbol=symbol,
+            timestamp=timestamp,
+            signal_type=signal_type,
+            price=price,
+            strategy_name=strategy_name,
+            params=params,
+            strength=strength
+        ), offset
+    if tag == _RECORD:
+        record_id = buffer[offset]
+        if record_id >= len(_RECORD_TYPES):
+            raise EventCodecError(f"Unknown record type {record_id}")
+        record_type = _RECORD_TYPES[record_id]
+        offset += 1
+        fields = []
+        for _ in record_type._fields:
+            item, offset = _decode_value(buffer, offset, allow_pickle)
+            fields.append(item)
+        return record_type(*fields), offset
+    raise EventCodecError(f"Unknown value tag {tag!r} at offset {offset - 1}")
+
+def encode_value(value: Any, allow_pickle: bool = True) -> bytes:
+    """
+    Encode a single value in the event payload format
+
+    Args:
+        value: Value to encode
+        allow_pickle: Pickle values without a native encoding; when False
+            they raise EventCodecError instead
+
+    Returns:
+        Encoded value
+    """
+    out: List[bytes] = []
+    _encode_value(value, out, allow_pickle)
+    return b''.join(out)
+
+def decode_value(buffer, allow_pickle: bool = True) -> Any:
+    """
+    Decode a value produced by encode_value
+
+    Args:
+        buffer: bytes, bytearray or memoryview holding one value
+        allow_pickle: Accept pickled values; keep False for data from
+            untrusted peers, since unpickling can run arbitrary code
+
+    Returns:
+        Decoded value
+
+    Raises:
+        EventCodecError: If the buffer is malformed or holds a pickled
+            value while allow_pickle is False
+    """
+    try:
+        return _decode_value(buffer, 0, allow_pickle)[0]
+    except (struct.error, IndexError, UnicodeDecodeError, pickle.UnpicklingError) as e:
+        raise EventCodecError(f"Malformed value: {e}") from e
+
+def encode_event(event: Event, allow_pickle: bool = True) -> bytes:
+    """
+    Encode an event into a compact binary message
+
+    Signals, typed event payloads (PriceUpdate etc.), dictionaries with
+    string keys, lists, strings, numbers (including numpy scalars) and
+    naive datetimes and pandas Timestamps are encoded natively; any other
+    value is pickled.
+
+    Args:
+        event: Event to encode
+        allow_pickle: Pickle values without a native encoding; when False
+            they raise EventCodecError instead
+
+    Returns:
+        Encoded message
+    """
+    out = [_HEADER.pack(CODEC_VERSION, event.type.value, event.timestamp)]
+    _encode_value(event.data, out, allow_pickle)
+    return b''.join(out)
+
+def decode_event(buffer, allow_pickle: bool = True) -> Event:
+    """
+    Decode a message produced by encode_event
+
+    Args:
+        buffer: bytes, bytearray or memoryview holding one message
+        allow_pickle: Accept pickled values; keep False for messages that
+            outlive the process or come from elsewhere
+
+    Returns:
+        Decoded Event
+
+    Raises:
+        EventCodecError: If the message is malformed, from another codec
+            version or holds a pickled value while allow_pickle is False
+    """
+    try:
+        version, type_id, timestamp = _HEADER.unpack_from(buffer, 0)
+        if version != CODEC_VERSION:
+            raise EventCodecError(f"Unsupported event codec version {version}")
+        if type_id not in _TYPE_BY_ID:
+            raise EventCodecError(f"Unknown event type id {type_id}")
+        data, _ = _decode_value(buffer, _HEADER.size, allow_pickle)
+    except (struct.error, IndexError, UnicodeDecodeError, pickle.UnpicklingError) as e:
+        raise EventCodecError(f"Malformed event message: {e}") from e
+    return Event(_TYPE_BY_ID[type_id], data, timestamp)
@@ -1,10 +1,10 @@
 # trading_bot/utils/events.py
 from enum import Enum, auto
-from typing import Dict, List, Callable, Any
-from dataclasses import dataclass
-import time
+from typing import Dict, List, Callable, Any, Iterable, NamedTuple, Optional, Set, Tuple
 import logging
 
+from trading_bot.utils.clock import get_clock
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -28,18 +28,63 @@ class EventType(Enum):
     STARTUP = auto()
     SHUTDOWN = auto()
     ERROR = auto()
+    
+    # Risk events
+    RISK_LIMIT_BREACHED = auto()
 
-@dataclass
+class PriceUpdate(NamedTuple):
+    """Data of a PRICE_UPDATE event"""
+    symbol: str
+    price: float
+    timestamp: float
+    
+class CandleUpdate(NamedTuple):
+    """Data of a NEW_CANDLE event; timestamp is the candle's open time in milliseconds"""
+    symbol: str
+    timeframe: str
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    
+class OrderBookUpdate(NamedTuple):
+    """Data of an ORDERBOOK_UPDATE event; bids and asks are [price, amount] levels"""
+    symbol: str
+    bids: List[List[float]]
+    asks: List[List[float]]
+    timestamp: float
+    
+class RiskLimitBreach(NamedTuple):
+    """Data of a RISK_LIMIT_BREACHED event"""
+    symbol: str
+    reason: str
+    
 class Event:
-    """Event object containing type and data"""
-    type: EventType
-    data: Dict[str, Any]
-    timestamp: float = None
+    """
+    Event object containing type and data
     
-    def __post_init__(self):
+    Market data and risk events carry the typed tuples above; order and
+    system events carry dictionaries and signals carry a Signal.
+    """
+    __slots__ = ('type', 'data', 'timestamp')
+    
+    def __init__(self, type: EventType, data: Any, timestamp: Optional[float] = None):
+        self.type = type
+        self.data = data
         # Set timestamp if not provided
-        if self.timestamp is None:
-            self.timestamp = time.time()
+        self.timestamp = get_clock().time() if timestamp is None else timestamp
+        
+    def __repr__(self) -> str:
+        return f"Event(type={self.type!r}, data={self.data!r}, timestamp={self.timestamp!r})"
+        
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not Event:
+            return NotImplemented
+        return (self.type, self.data, self.timestamp) == (other.type, other.data, other.timestamp)
+    
+    __hash__ = None
 
 class EventBus:
     """
@@ -49,8 +94,19 @@ class EventBus:
     and publish events to be processed by all subscribers.
     """
     
-    def __init__(self):
+    def __init__(self, max_subscribers: int = 100):
+        """
+        Initialize the event bus
+        
+        Args:
+            max_subscribers: Maximum number of callbacks per event type
+        """
         self._subscribers: Dict[EventType, List[Callable]] = {}
+        # Immutable copy of each subscriber list, rebuilt on (un)subscribe
+        # so publishing needs neither a copy nor a membership check
+        self._dispatch: Dict[EventType, Tuple[Callable, ...]] = {}
+        self.max_subscribers = max_subscribers
+        self._transports: List[Tuple[Any, Optional[Set[EventType]]]] = []
         
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """
@@ -59,10 +115,25 @@ class EventBus:
         Args:
             event_type: Type of event to subscribe to
             callback: Function to call when event is published
+            
+        Raises:
+            ValueError: If the event type already has max_subscribers callbacks
         """
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
+        
+        # Subscribing the same callback twice would call it twice per event
+        if callback in self._subscribers[event_type]:
+            logger.debug(f"Callback already subscribed to {event_type.name}")
+            return
+        
+        if len(self._subscribers[event_type]) >= self.max_subscribers:
+            raise ValueError(
+                f"Maximum number of subscribers reached for {event_type.name} ({self.max_subscribers})"
+            )
+        
         self._subscribers[event_type].append(callback)
+        self._dispatch[event_type] = tuple(self._subscribers[event_type])
         logger.debug(f"Subscribed to {event_type.name}")
         
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
@@ -75,20 +146,80 @@ class EventBus:
         """
         if event_type in self._subscribers and callback in self._subscribers[event_type]:
             self._subscribers[event_type].remove(callback)
+            self._dispatch[event_type] = tuple(self._subscribers[event_type])
             logger.debug(f"Unsubscribed from {event_type.name}")
         
+    def add_transport(self, transport, event_types: Optional[Iterable[EventType]] = None) -> None:
+        """
+        Forward published events to another process
+        
+        Args:
+            transport: Object with a send(event) method, e.g. a
+                SharedMemoryEventChannel; the receiving side delivers the
+                events with publish_local so they are not forwarded again
+            event_types: Event types to forward (default: all)
+        """
+        types = set(event_types) if event_types is not None else None
+        self._transports.append((transport, types))
+        
+    def remove_transport(self, transport) -> None:
+        """
+        Stop forwarding events to a transport
+        
+        Args:
+            transport: Transport passed to add_transport
+        """
+        self._transports = [entry for entry in self._transports if entry[0] is not transport]
+        
     def publish(self, event: Event) -> None:
         """
-        Publish an event to all subscribers
+        Publish an event to all subscribers and transports
         
         Args:
             event: Event object to publish
         """
-        if event.type in self._subscribers:
-            for callback in self._subscribers[event.type]:
+        if self._transports:
+            self._forward(event)
+        self.publish_local(event)
+        
+    def _forward(self, event: Event) -> None:
+        """Send an event to the transports that want its type"""
+        for transport, types in self._transports:
+            if types is None or event.type in types:
                 try:
-                    callback(event)
+                    transport.send(event)
                 except Exception as e:
-                    logger.error(f"Error in event handler for {event.type.name}: {e}")
-                    
-            logger.debug(f"Published {event.type.name} event to {len(self._subscribers[event.type])} subscribers")
\ No newline at end of file
+                    logger.error(f"Error forwarding {event.type.name} event: {e}")
+        
+    def publish_local(self, event: Event) -> None:
+        """
+        Publish an event to the subscribers of this bus only
+        
+        Args:
+            event: Event object to publish
+        """
+        callbacks = self._dispatch.get(event.type)
+        if not callbacks:
+            return
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Error in event handler for {event.type.name}: {e}")
+                
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Published {event.type.name} event to {len(callbacks)} subscribers")
+            
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report the size of the subscriber tables
+        
+        Returns:
+            Dictionary with the number of event types and subscriptions
+        """
+        return {
+            'event_types': len(self._subscribers),
+            'subscriptions': sum(len(callbacks) for callbacks in self._subscribers.values()),
+            'max_subscribers': self.max_subscribers,
+            'transports': len(self._transports),
+        }
\ No newline at end of file
@@ -0,0 +1,320 @@
+# trading_bot/utils/journal.py
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from trading_bot.utils.event_codec import EventCodecError, decode_event, encode_event
+from trading_bot.utils.events import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length, CRC32 of the payload, record offset
+_RECORD = struct.Struct('<IIQ')
+_SUFFIX = '.journal'
+_PAGE_MASK = ~(mmap.PAGESIZE - 1)
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+def _segment_path(directory: str, base_offset: int) -> str:
+    return os.path.join(directory, f"{base_offset:020d}{_SUFFIX}")
+
+def list_segments(directory: str) -> List[int]:
+    """
+    List the segments of a journal
+
+    Args:
+        directory: Journal directory
+
+    Returns:
+        Base offsets of the segments, oldest first
+    """
+    if not os.path.isdir(directory):
+        return []
+    bases = []
+    for name in os.listdir(directory):
+        stem = name[:-len(_SUFFIX)]
+        if name.endswith(_SUFFIX) and stem.isdigit():
+            bases.append(int(stem))
+    return sorted(bases)
+
+def _scan(buf, base_offset: int, limit: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Walk the valid records of a segment
+
+    Yields (offset, payload position, payload length) and stops at the
+    first zero, torn or out-of-sequence record, which marks the end of
+    the data written so far.
+    """
+    position = 0
+    expected = base_offset
+    while position + _RECORD.size <= limit:
+        length, crc, offset = _RECORD.unpack_from(buf, position)
+        start = position + _RECORD.size
+        if length == 0 or offset != expected or start + length > limit:
+            return
+        if zlib.crc32(buf[start:start + length]) != crc:
+            return
+        yield offset, start, length
+        position = start + length
+        expected += 1
+
+def read_journal(directory: str, start_offset: int = 0,
+                 event_types: Optional[Iterable[EventType]] = None) -> Iterator[Tuple[int, Event]]:
+    """
+    Replay the events of a journal
+
+    Safe to call while an EventJournal appends to the same directory; the
+    replay ends at the last record written when it reaches that segment.
+
+    Args:
+        directory: Journal directory
+        start_offset: Offset of the first event to return
+        event_types: Event types to return (default: all); records of other
+            types are skipped without decoding them
+
+    Yields:
+        Tuples of (offset, event) in append order
+    """
+    # The event type id is the second byte of an encoded event
+    type_ids = {event_type.value for event_type in event_types} if event_types is not None else None
+    bases = list_segments(directory)
+    # Start in the segment holding start_offset
+    first = max(bisect.bisect_right(bases, start_offset) - 1, 0)
+    for base_offset in bases[first:]:
+        path = _segment_path(directory, base_offset)
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    continue
+                buf = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # Removed by retention while replaying
+            continue
+        try:
+            for offset, start, length in _scan(buf, base_offset, size):
+                if offset < start_offset or (type_ids is not None and buf[start + 1] not in type_ids):
+                    continue
+                try:
+                    event = decode_event(buf[start:start + length], allow_pickle=False)
+                except EventCodecError as e:
+                    logger.warning(f"Skipping unreadable journal record {offset}: {e}")
+                    continue
+                yield offset, event
+        finally:
+            buf.close()
+
+class EventJournal:
+    """
+    Append-only journal of events in memory-mapped segment files.
+
+    Every event is appended as a record of (length, CRC32, offset) followed
+    by its event codec encoding. Records are written and read without
+    pickle, so a journal file can never run code on replay; events with
+    values the codec cannot encode natively are refused. Offsets number the events from 0 across
+    segments; each segment file is named after the offset of its first
+    record and is preallocated and mapped, so appending is a memory copy.
+    A segment that cannot take the next record is trimmed to its used size
+    and a new one is started; with max_segments set the oldest segments
+    are deleted.
+
+    Written records live in the page cache as soon as send() returns, so
+    they survive a crash of the process. msync calls are batched: the
+    mapping is flushed to disk once sync_interval seconds have passed since
+    the last flush, or after sync_batch records, which bounds what a power
+    loss can take.
+
+    Attach it with EventBus.add_transport(journal) so events are journaled
+    before the subscribers run. Reopening a directory resumes after its
+    last intact record.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 sync_interval: float = 1.0,
+                 sync_batch: int = 0,
+                 max_segments: int = 0):
+        """
+        Open or create a journal
+
+        Args:
+            directory: Directory holding the segment files
+            segment_size: Preallocated size of a segment in bytes
+            sync_interval: Seconds between flushes to disk (0 flushes every record)
+            sync_batch: Records between flushes to disk (0 = by time only)
+            max_segments: Segments to keep (0 keeps all)
+        """
+        if segment_size <= _RECORD.size:
+            raise ValueError(f"segment_size must be larger than {_RECORD.size}, got {segment_size}")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+        self.sync_batch = sync_batch
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._stats = {'records': 0, 'bytes': 0, 'syncs': 0, 'segments': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._file = None
+        self._buf: Optional[mmap.mmap] = None
+        self._base_offset = 0
+        self._next_offset = 0
+        self._position = 0
+        self._synced = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        bases = list_segments(directory)
+        if bases:
+            self._open_segment(bases[-1], recover=True)
+        else:
+            self._open_segment(0)
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next appended event will get"""
+        return self._next_offset
+
+    def _open_segment(self, base_offset: int, recover: bool = False, size: Optional[int] = None) -> None:
+        path = _segment_path(self.directory, base_offset)
+        self._file = open(path, 'r+b' if recover else 'w+b')
+        used = os.fstat(self._file.fileno()).st_size if recover else 0
+        size = max(size or self.segment_size, used)
+        if used < size:
+            # Trimmed on close: grow it back for appending
+            self._file.truncate(size)
+        self._buf = mmap.mmap(self._file.fileno(), size)
+        self._base_offset = base_offset
+        self._next_offset = base_offset
+        self._position = 0
+
+        if recover:
+            for offset, start, length in _scan(self._buf, base_offset, size):
+                self._next_offset = offset + 1
+                self._position = start + length
+            end = self._position + _RECORD.size
+            if end <= size and any(self._buf[self._position:end]):
+                # A torn record from a crash: clear everything after the last intact one
+                logger.warning(f"Discarding torn journal data after offset {self._next_offset - 1} in {path}")
+                self._buf[self._position:] = bytes(size - self._position)
+            logger.info(f"Journal {self.directory} resumes at offset {self._next_offset}")
+        self._synced = self._position
+
+    def _close_segment(self) -> None:
+        self._buf.flush()
+        self._buf.close()
+        # Trim the unused preallocation so only written records stay on disk
+        self._file.truncate(self._position)
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._buf = None
+        self._file = None
+
+    def _rotate(self, record_size: int) -> None:
+        self._close_segment()
+        self._open_segment(self._next_offset, size=max(self.segment_size, record_size))
+        self._stats['segments'] += 1
+        if self.max_segments:
+            bases = list_segments(self.directory)
+            for base_offset in bases[:max(len(bases) - self.max_segments, 0)]:
+                os.remove(_segment_path(self.directory, base_offset))
+
+    def _flush(self) -> None:
+        # msync takes a page-aligned start
+        start = self._synced & _PAGE_MASK
+        self._buf.flush(start, self._position - start)
+        self._synced = self._position
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._stats['syncs'] += 1
+
+    def append(self, event: Event) -> int:
+        """
+        Append an event
+
+        Args:
+            event: Event to journal
+
+        Returns:
+            Offset of the event
+
+        Raises:
+            EventCodecError: If the event holds a value that needs pickle
+        """
+        payload = encode_event(event, allow_pickle=False)
+        record_size = _RECORD.size + len(payload)
+        with self._lock:
+            if self._buf is None:
+                raise ValueError("Journal is closed")
+            if self._position + record_size > len(self._buf):
+                self._rotate(record_size)
+
+            offset = self._next_offset
+            start = self._position + _RECORD.size
+            # Payload first: a reader only accepts the record once its header is in place
+            self._buf[start:start + len(payload)] = payload
+            _RECORD.pack_into(self._buf, self._position, len(payload), zlib.crc32(payload), offset)
+            self._position = start + len(payload)
+            self._next_offset = offset + 1
+            self._pending += 1
+            self._stats['records'] += 1
+            self._stats['bytes'] += record_size
+
+            if (self.sync_interval <= 0
+                    or (self.sync_batch and self._pending >= self.sync_batch)
+                    or time.monotonic() - self._last_sync >= self.sync_interval):
+                self._flush()
+        return offset
+
+    def send(self, event: Event) -> None:
+        """Transport interface for EventBus.add_transport"""
+        self.append(event)
+
+    def sync(self) -> None:
+        """Flush the records appended since the last flush to disk"""
+        with self._lock:
+            if self._buf is not None and self._pending:
+                self._flush()
+
+    def sync_if_due(self) -> None:
+        """Flush to disk if records are pending for longer than sync_interval"""
+        if self._pending and time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def replay(self, start_offset: int = 0,
+               event_types: Optional[Iterable[EventType]] = None) -> Iterator[Tuple[int, Event]]:
+        """
+        Replay the journaled events
+
+        Args:
+            start_offset: Offset of the first event to return
+            event_types: Event types to return (default: all)
+
+        Yields:
+            Tuples of (offset, event) in append order
+        """
+        return read_journal(self.directory, start_offset, event_types)
+
+    def metrics(self) -> dict:
+        """
+        Get journal counters
+
+        Returns:
+            Dictionary with records, bytes, syncs and segments written since
+            opening, and the next offset
+        """
+        with self._lock:
+            return dict(self._stats, next_offset=self._next_offset)
+
+    def close(self) -> None:
+        """Flush, trim the open segment and close the journal"""
+        with self._lock:
+            if self._buf is not None:
+                self._close_segment()
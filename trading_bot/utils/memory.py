@@ -0,0 +1,126 @@
+# trading_bot/utils/memory.py
+import logging
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+class MemoryMonitor:
+    """
+    On-demand memory accounting for long-running processes.
+
+    Components register a sizer callback that reports the size of a
+    structure they own (candle buffers, position history, event queues, ...).
+    A snapshot combines those figures with a tracemalloc snapshot of the
+    process so growth can be attributed to a structure or a source line.
+    """
+
+    def __init__(self, nframes: int = 1, top_n: int = 10):
+        """
+        Initialize the memory monitor
+
+        Args:
+            nframes: Number of stack frames tracemalloc stores per allocation
+            top_n: Number of top allocation sites to include in a snapshot
+        """
+        self.nframes = nframes
+        self.top_n = top_n
+        self._sizers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def register(self, name: str, sizer: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Register a structure to include in memory reports
+
+        Args:
+            name: Name shown in reports (e.g. 'candle_store')
+            sizer: Callable returning a dictionary of size figures
+        """
+        self._sizers[name] = sizer
+
+    def unregister(self, name: str) -> None:
+        """Remove a structure from memory reports"""
+        self._sizers.pop(name, None)
+
+    def start(self) -> None:
+        """Start tracemalloc tracing if it is not already running"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            logger.info(f"Started tracemalloc tracing ({self.nframes} frame(s))")
+
+    def stop(self) -> None:
+        """Stop tracemalloc tracing"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Take a memory snapshot
+
+        Tracing is started on first use, so allocations made before the
+        first snapshot are not attributed to a source line.
+
+        Returns:
+            Dictionary with traced totals, top allocation sites and the
+            figures reported by each registered structure
+        """
+        self.start()
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().statistics('lineno')
+
+        top: List[Dict[str, Any]] = []
+        for stat in stats[:self.top_n]:
+            frame = stat.traceback[0]
+            top.append({
+                'location': f"{frame.filename}:{frame.lineno}",
+                'size': stat.size,
+                'count': stat.count,
+            })
+
+        structures: Dict[str, Dict[str, Any]] = {}
+        for name, sizer in self._sizers.items():
+            try:
+                structures[name] = sizer()
+            except Exception as e:
+                structures[name] = {'error': str(e)}
+
+        return {
+            'traced_current': current,
+            'traced_peak': peak,
+            'top_allocations': top,
+            'structures': structures,
+        }
+
+    def format_report(self, snapshot: Dict[str, Any]) -> str:
+        """
+        Format a snapshot as a human readable report
+
+        Args:
+            snapshot: Snapshot returned by snapshot()
+
+        Returns:
+            Multi-line report string
+        """
+        lines = [
+            f"Memory report: traced={snapshot['traced_current'] / 1024 / 1024:.2f} MiB, "
+            f"peak={snapshot['traced_peak'] / 1024 / 1024:.2f} MiB"
+        ]
+        for name, figures in snapshot['structures'].items():
+            details = ", ".join(f"{key}={value}" for key, value in figures.items())
+            lines.append(f"  {name}: {details}")
+        for entry in snapshot['top_allocations']:
+            lines.append(f"  {entry['size'] / 1024:.1f} KiB in {entry['count']} blocks at {entry['location']}")
+        return "\n".join(lines)
+
+    def log_report(self, level: int = logging.INFO) -> Dict[str, Any]:
+        """
+        Take a snapshot and log it
+
+        Args:
+            level: Logging level for the report
+
+        Returns:
+            The snapshot that was logged
+        """
+        snapshot = self.snapshot()
+        logger.log(level, self.format_report(snapshot))
+        return snapshot
@@ -0,0 +1,245 @@
+# trading_bot/utils/position_store.py
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class PositionStore:
+    """
+    Write-behind persistence of position state in a JSON snapshot plus an
+    append-only delta log.
+
+    Opened and closed positions are appended to the delta log (the snapshot
+    path with a .log suffix) by a background writer as soon as they are
+    recorded. Other changes, such as prices refreshed by an update, only
+    mark the state dirty; the writer coalesces them into one snapshot
+    written flush_interval seconds after the first change. Writing a
+    snapshot compacts the log, which also happens once it holds
+    compact_after entries.
+
+    Snapshots are written to a temporary file and renamed over the previous
+    one, so a crash leaves either snapshot intact. Every delta carries a
+    sequence number and the snapshot records the last one it covers, so
+    loading replays exactly the deltas written after it.
+    """
+
+    def __init__(self,
+                 path: str,
+                 snapshot: Callable[[], Dict[str, Any]],
+                 lock,
+                 flush_interval: float = 5.0,
+                 compact_after: int = 1000):
+        """
+        Initialize the store
+
+        Args:
+            path: Snapshot file; the delta log is written next to it
+            snapshot: Returns the state to write as a dictionary with
+                'positions' and 'closed_positions' lists; called on the
+                writer thread while holding lock
+            lock: Lock guarding the state; append must be called holding it
+            flush_interval: Seconds a change may wait before a snapshot is written
+            compact_after: Delta log entries that trigger a snapshot
+        """
+        self.path = os.path.abspath(path)
+        self.log_path = f"{self.path}.log"
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+        self._snapshot = snapshot
+        self._state_lock = lock
+
+        self._cond = threading.Condition()
+        self._deltas: List[Dict[str, Any]] = []
+        self._sequence = 0  # Sequence number of the last delta
+        self._covered = 0  # Last sequence number included in the snapshot on disk
+        self._logged = 0  # Entries in the delta log
+        self._dirty_since: Optional[float] = None
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'snapshots': 0, 'deltas': 0, 'errors': 0}
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Read the snapshot and replay the delta log written after it
+
+        Returns:
+            Dictionary with 'positions' and 'closed_positions' lists of
+            position dictionaries
+
+        Raises:
+            OSError, ValueError: If the snapshot exists but cannot be read
+        """
+        state: Dict[str, Any] = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        covered = state.get('sequence', 0)
+        positions = {data['symbol']: data for data in state.get('positions', [])}
+        closed = list(state.get('closed_positions', []))
+
+        sequence = covered
+        logged = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        # Torn last line from a crash
+                        logger.warning(f"Ignoring incomplete entry at the end of {self.log_path}")
+                        break
+                    logged += 1
+                    if delta['seq'] <= covered:
+                        continue
+                    sequence = delta['seq']
+                    data = delta['position']
+                    if delta['op'] == 'open':
+                        positions[data['symbol']] = data
+                    else:
+                        positions.pop(data['symbol'], None)
+                        closed.append(data)
+            if sequence > covered:
+                logger.info(f"Replayed {sequence - covered} position changes from {self.log_path}")
+
+        with self._cond:
+            self._sequence = self._covered = sequence
+            self._logged = logged
+        return {'positions': list(positions.values()), 'closed_positions': closed}
+
+    def _start(self) -> None:
+        # Called holding _cond; the writer starts with the first change
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="position-store", daemon=True)
+            self._thread.start()
+
+    def mark_dirty(self) -> None:
+        """Schedule a snapshot within flush_interval seconds"""
+        with self._cond:
+            if self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+                self._start()
+                # Let the writer set its timer
+                self._cond.notify()
+
+    def append(self, op: str, position: Dict[str, Any]) -> None:
+        """
+        Log an opened or closed position
+
+        Args:
+            op: 'open' (added or replaced by symbol) or 'close' (moved to the
+                closed positions)
+            position: Position dictionary
+        """
+        with self._cond:
+            self._sequence += 1
+            self._deltas.append({'seq': self._sequence, 'op': op, 'position': position})
+            self._start()
+            self._cond.notify()
+
+    def _snapshot_due(self, now: float) -> bool:
+        return self._dirty_since is not None and now - self._dirty_since >= self.flush_interval
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    if self._closing or self._deltas or self._snapshot_due(now):
+                        break
+                    timeout = None
+                    if self._dirty_since is not None:
+                        timeout = self._dirty_since + self.flush_interval - now
+                    self._cond.wait(timeout)
+                closing = self._closing
+                deltas, self._deltas = self._deltas, []
+                compact = closing or self._snapshot_due(now) or self._logged + len(deltas) >= self.compact_after
+                if compact:
+                    self._dirty_since = None
+            self._write(deltas, compact)
+            if closing:
+                return
+
+    def _write(self, deltas: List[Dict[str, Any]], compact: bool) -> None:
+        # Deltas already covered by the snapshot (queued while it was taken) are dropped
+        deltas = [delta for delta in deltas if delta['seq'] > self._covered]
+        try:
+            if deltas:
+                with open(self.log_path, 'a') as f:
+                    f.write(''.join(json.dumps(delta, separators=(',', ':')) + '\n' for delta in deltas))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._logged += len(deltas)
+                self._stats['deltas'] += len(deltas)
+            if compact:
+                self._write_snapshot()
+        except (OSError, TypeError, ValueError) as e:
+            self._stats['errors'] += 1
+            logger.error(f"Error saving positions to {self.path}: {e}")
+            with self._cond:
+                # Retry with the next snapshot
+                if self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
+
+    def _write_snapshot(self) -> None:
+        with self._state_lock:
+            state = self._snapshot()
+            # Deltas are appended holding the same lock, so none is in flight
+            covered = self._sequence
+        state['sequence'] = covered
+        body = json.dumps(state, separators=(',', ':'))
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+        self._covered = covered
+        self._stats['snapshots'] += 1
+
+        if self._logged:
+            # Every logged delta is covered now
+            open(self.log_path, 'w').close()
+            self._logged = 0
+        logger.debug(f"Saved positions to {self.path}")
+
+    def close(self) -> None:
+        """
+        Write pending changes and a final snapshot, then stop the writer
+
+        A change made after closing starts a new writer.
+        """
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                if self._dirty_since is None and not self._deltas:
+                    return
+            else:
+                self._closing = True
+                self._cond.notify()
+        if thread is not None:
+            thread.join()
+        else:
+            with self._cond:
+                deltas, self._deltas = self._deltas, []
+                self._dirty_since = None
+            self._write(deltas, compact=True)
+        with self._cond:
+            self._thread = None
+            self._closing = False
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get persistence counters
+
+        Returns:
+            Dictionary with snapshots and deltas written, write errors and
+            entries in the delta log
+        """
+        with self._cond:
+            return dict(self._stats, logged=self._logged)
@@ -0,0 +1,427 @@
+# trading_bot/utils/queued_events.py
+import itertools
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from trading_bot.utils.events import Event, EventBus, EventType
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ('block', 'drop_newest', 'drop_oldest')
+
+# Dropping one of these would leave orders or positions out of sync, so
+# they wait for room whatever the backpressure policy
+LOSSLESS_EVENT_TYPES = frozenset({
+    EventType.SIGNAL_GENERATED,
+    EventType.ORDER_PLACED,
+    EventType.ORDER_FILLED,
+    EventType.ORDER_CANCELLED,
+    EventType.ORDER_REJECTED,
+    EventType.STARTUP,
+    EventType.SHUTDOWN,
+    EventType.ERROR,
+    EventType.RISK_LIMIT_BREACHED,
+})
+
+# Dispatch lanes, highest first: risk and system events, orders, signals,
+# market data. A worker always takes from the highest non-empty lane, so
+# risk events never wait behind ticks.
+EVENT_PRIORITIES = {
+    EventType.RISK_LIMIT_BREACHED: 0,
+    EventType.SHUTDOWN: 0,
+    EventType.ERROR: 0,
+    EventType.STARTUP: 0,
+    EventType.ORDER_PLACED: 1,
+    EventType.ORDER_FILLED: 1,
+    EventType.ORDER_CANCELLED: 1,
+    EventType.ORDER_REJECTED: 1,
+    EventType.SIGNAL_GENERATED: 2,
+    EventType.PRICE_UPDATE: 3,
+    EventType.NEW_CANDLE: 3,
+    EventType.ORDERBOOK_UPDATE: 3,
+}
+
+# Market data where only the latest value matters: per symbol for prices and
+# order books, per candle (symbol, timeframe and open time) for candles
+COALESCED_EVENT_TYPES = frozenset({
+    EventType.PRICE_UPDATE,
+    EventType.NEW_CANDLE,
+    EventType.ORDERBOOK_UPDATE,
+})
+
+# Fields of ORDER_PLACED and ORDER_FILLED data that hold the symbol
+ORDER_FIELDS = ('order', 'trade', 'signal')
+
+def event_key(event: Event) -> Any:
+    """
+    Ordering key of an event
+
+    Args:
+        event: Event to route
+
+    Returns:
+        The event's symbol (from a Signal, a data dictionary or the order,
+        trade or signal nested in one), or its type for events without one
+    """
+    data = event.data
+    if not isinstance(data, dict):
+        symbol = getattr(data, 'symbol', None)
+        return symbol if symbol is not None else event.type
+    symbol = data.get('symbol')
+    if symbol is None:
+        # Order events carry the symbol in their order, fill or signal
+        for field in ORDER_FIELDS:
+            nested = data.get(field)
+            symbol = nested.get('symbol') if isinstance(nested, dict) else getattr(nested, 'symbol', None)
+            if symbol is not None:
+                break
+    return symbol if symbol is not None else event.type
+
+def coalescing_key(event: Event) -> Any:
+    """
+    Key under which a queued event is replaced by a newer one
+
+    Args:
+        event: Event of a coalesced type
+
+    Returns:
+        The (symbol, timeframe, open time) of a candle, so only updates of
+        the same still-forming candle replace each other and closed bars
+        are never lost; the ordering key for other events
+    """
+    data = event.data
+    if event.type == EventType.NEW_CANDLE:
+        if isinstance(data, dict):
+            return (data.get('symbol'), data.get('timeframe'), data.get('timestamp'))
+        return (getattr(data, 'symbol', None), getattr(data, 'timeframe', None), getattr(data, 'timestamp', None))
+    return event_key(event)
+
+class _Worker:
+    """Per-type queues of one dispatch thread"""
+
+    def __init__(self, lock: threading.Lock):
+        # Entries are [sequence, event, coalescing key or None]
+        self.lanes: Dict[EventType, Deque[List[Any]]] = {}
+        self.pending = 0
+        self.ready = threading.Condition(lock)
+        self.thread: Optional[threading.Thread] = None
+
+class QueuedEventBus(EventBus):
+    """
+    Event bus that runs subscribers on worker threads.
+
+    publish() forwards the event to the transports, appends it to the
+    bounded queue of its event type and returns; worker threads run the
+    subscribers. Events with the same symbol (or, without a symbol, of the
+    same type) always go to the same worker. A worker handles the events of
+    the highest priority lane first (EVENT_PRIORITIES: risk and system >
+    orders > signals > market data) and events of one lane in publish
+    order, so ordering per symbol holds within a lane with any number of
+    workers. Subscribers run concurrently for different symbols when
+    workers > 1 and must then be thread-safe.
+
+    Events of the coalesced types replace a queued event with the same
+    type and symbol in its queue position, so a burst of price updates
+    costs subscribers one call per symbol with the latest value. Candles
+    only replace queued updates of the same candle (see coalescing_key).
+
+    When an event type's queue is full, the backpressure policy decides:
+    'block' waits for room, 'drop_newest' discards the new event and
+    'drop_oldest' discards the oldest queued event of that type. Types in
+    lossless_types always block. Events published by a subscriber never
+    block, since its worker may be the one that has to make room; they may
+    exceed the bound instead.
+    """
+
+    def __init__(self,
+                 max_subscribers: int = 100,
+                 workers: int = 1,
+                 queue_size: int = 10000,
+                 queue_sizes: Optional[Dict[EventType, int]] = None,
+                 backpressure: str = 'block',
+                 lossless_types: Iterable[EventType] = LOSSLESS_EVENT_TYPES,
+                 coalesce_types: Iterable[EventType] = COALESCED_EVENT_TYPES,
+                 priorities: Optional[Dict[EventType, int]] = None):
+        """
+        Initialize the event bus and start its worker threads
+
+        Args:
+            max_subscribers: Maximum number of callbacks per event type
+            workers: Number of dispatch threads
+            queue_size: Queued events allowed per event type
+            queue_sizes: Per-type overrides of queue_size
+            backpressure: Policy for full queues: 'block', 'drop_newest' or 'drop_oldest'
+            lossless_types: Event types that always block instead of being dropped
+            coalesce_types: Event types where a new event replaces a queued
+                one with the same coalescing_key
+            priorities: Per-type overrides of EVENT_PRIORITIES (lower runs first)
+        """
+        super().__init__(max_subscribers=max_subscribers)
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+        self.backpressure = backpressure
+        self.lossless_types = frozenset(lossless_types)
+        self.coalesce_types = frozenset(coalesce_types)
+        self._priority = dict(EVENT_PRIORITIES)
+        self._priority.update(priorities or {})
+        # Types in the order a worker looks at their queues
+        self._dispatch_order = sorted(EventType, key=lambda event_type: self._priority.get(event_type, 0))
+        self._capacity = {event_type: queue_size for event_type in EventType}
+        self._capacity.update(queue_sizes or {})
+
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._local = threading.local()
+        self._sequence = itertools.count()
+        self._depth = {event_type: 0 for event_type in EventType}
+        self._latest: Dict[Tuple[EventType, Any], List[Any]] = {}
+        self._stats = {
+            event_type: {'published': 0, 'handled': 0, 'coalesced': 0, 'dropped': 0, 'blocked': 0, 'max_depth': 0}
+            for event_type in EventType
+        }
+        self._unfinished = 0
+        self._closed = False
+
+        self._workers = [_Worker(self._lock) for _ in range(workers)]
+        for index, worker in enumerate(self._workers):
+            worker.thread = threading.Thread(
+                target=self._run_worker,
+                args=(worker,),
+                name=f"event-worker-{index}",
+                daemon=True
+            )
+            worker.thread.start()
+
+    def _on_worker(self) -> bool:
+        return getattr(self._local, 'worker', False)
+
+    def publish(self, event: Event) -> None:
+        """
+        Forward an event to the transports and queue it for the subscribers
+
+        Returns without waiting for the subscribers; only a full queue of a
+        blocking event type makes the caller wait.
+
+        Args:
+            event: Event object to publish
+        """
+        if self._transports:
+            self._forward(event)
+        event_type = event.type
+        key = event_key(event)
+        workers = self._workers
+        worker = workers[hash(key) % len(workers)] if len(workers) > 1 else workers[0]
+        coalesce_key = (event_type, coalescing_key(event)) if event_type in self.coalesce_types else None
+
+        with self._lock:
+            stats = self._stats[event_type]
+            stats['published'] += 1
+            if coalesce_key is not None:
+                entry = self._latest.get(coalesce_key)
+                if entry is not None:
+                    # Latest value wins, in the queued event's position
+                    entry[1] = event
+                    stats['coalesced'] += 1
+                    return
+            if self._depth[event_type] >= self._capacity[event_type] and not self._on_worker():
+                if not self._make_room(event_type, stats):
+                    return
+            if not self._closed:
+                self._enqueue(worker, event, coalesce_key)
+                return
+
+        # Closed: nobody is left to dispatch
+        self.publish_local(event)
+
+    def _enqueue(self, worker: _Worker, event: Event, coalesce_key: Optional[Tuple[EventType, Any]]) -> None:
+        """Append an event to a worker's queue (lock held)"""
+        lane = worker.lanes.get(event.type)
+        if lane is None:
+            lane = worker.lanes[event.type] = deque()
+        entry = [next(self._sequence), event, coalesce_key]
+        lane.append(entry)
+        if coalesce_key is not None:
+            self._latest[coalesce_key] = entry
+        worker.pending += 1
+        self._unfinished += 1
+        depth = self._depth[event.type] = self._depth[event.type] + 1
+        stats = self._stats[event.type]
+        if depth > stats['max_depth']:
+            stats['max_depth'] = depth
+        worker.ready.notify()
+
+    def _make_room(self, event_type: EventType, stats: Dict[str, int]) -> bool:
+        """
+        Apply the backpressure policy to a full queue (lock held)
+
+        Returns:
+            False if the new event is dropped
+        """
+        policy = 'block' if event_type in self.lossless_types else self.backpressure
+        if policy != 'block':
+            if stats['dropped'] == 0:
+                logger.warning(
+                    f"{event_type.name} queue full ({self._capacity[event_type]} events), "
+                    f"applying {policy}; see metrics() for counts"
+                )
+            stats['dropped'] += 1
+            if policy == 'drop_newest':
+                return False
+            self._drop_oldest(event_type)
+            return True
+
+        stats['blocked'] += 1
+        while self._depth[event_type] >= self._capacity[event_type] and not self._closed:
+            self._space.wait()
+        return True
+
+    def _drop_oldest(self, event_type: EventType) -> None:
+        """Discard the oldest queued event of a type (lock held)"""
+        oldest = None
+        for worker in self._workers:
+            lane = worker.lanes.get(event_type)
+            if lane and (oldest is None or lane[0][0] < oldest.lanes[event_type][0][0]):
+                oldest = worker
+        if oldest is None:
+            return
+        entry = oldest.lanes[event_type].popleft()
+        if entry[2] is not None:
+            del self._latest[entry[2]]
+        oldest.pending -= 1
+        self._depth[event_type] -= 1
+        self._finish()
+
+    def _next_event(self, worker: _Worker) -> Event:
+        """Take the earliest event of the highest priority lane off a worker's queues (lock held)"""
+        best = None
+        best_priority = None
+        for event_type in self._dispatch_order:
+            lane = worker.lanes.get(event_type)
+            if not lane:
+                continue
+            priority = self._priority.get(event_type, 0)
+            if best is not None and priority != best_priority:
+                break
+            if best is None or lane[0][0] < best[0][0]:
+                best = lane
+                best_priority = priority
+        _, event, coalesce_key = best.popleft()
+        if coalesce_key is not None:
+            del self._latest[coalesce_key]
+        worker.pending -= 1
+        self._depth[event.type] -= 1
+        self._space.notify_all()
+        return event
+
+    def _finish(self) -> None:
+        """Account for an event leaving the bus (lock held)"""
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._idle.notify_all()
+
+    def _run_worker(self, worker: _Worker) -> None:
+        self._local.worker = True
+        while True:
+            with self._lock:
+                while worker.pending == 0 and not self._closed:
+                    worker.ready.wait()
+                if worker.pending == 0:
+                    return
+                event = self._next_event(worker)
+
+            self.publish_local(event)
+
+            with self._lock:
+                self._stats[event.type]['handled'] += 1
+                self._finish()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been handled
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            True if the queues drained within the timeout
+        """
+        if self._on_worker():
+            raise RuntimeError("drain() cannot be called from an event subscriber")
+        with self._lock:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Handle the queued events and stop the worker threads
+
+        Events published afterwards are dispatched inline.
+
+        Args:
+            timeout: Seconds to wait for each worker thread
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for worker in self._workers:
+                worker.ready.notify_all()
+            self._space.notify_all()
+        for worker in self._workers:
+            if worker.thread is not threading.current_thread():
+                worker.thread.join(timeout)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Current number of queued events per event type
+
+        Returns:
+            Dictionary of event type name to queued events, for non-empty queues
+        """
+        with self._lock:
+            return {event_type.name: depth for event_type, depth in self._depth.items() if depth}
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Queue depth and throughput counters
+
+        Returns:
+            Dictionary with totals and, per published event type, the
+            current depth, capacity, high-water mark and the published,
+            handled, coalesced, dropped and blocked counts
+        """
+        with self._lock:
+            event_types: Dict[str, Dict[str, int]] = {}
+            for event_type, stats in self._stats.items():
+                if stats['published']:
+                    event_types[event_type.name] = dict(
+                        stats, depth=self._depth[event_type], capacity=self._capacity[event_type]
+                    )
+            return {
+                'workers': len(self._workers),
+                'backpressure': self.backpressure,
+                'queued': sum(self._depth.values()),
+                'in_flight': self._unfinished,
+                'event_types': event_types,
+            }
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report the size of the subscriber tables and queues
+
+        Returns:
+            Dictionary with the number of event types, subscriptions,
+            queued events, the deepest queue seen, and dropped and
+            coalesced events
+        """
+        usage = super().memory_usage()
+        with self._lock:
+            usage['queued_events'] = sum(self._depth.values())
+            usage['max_queue_depth'] = max(stats['max_depth'] for stats in self._stats.values())
+            usage['dropped_events'] = sum(stats['dropped'] for stats in self._stats.values())
+            usage['coalesced_events'] = sum(stats['coalesced'] for stats in self._stats.values())
+        return usage
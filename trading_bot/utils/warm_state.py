@@ -0,0 +1,69 @@
+# trading_bot/utils/warm_state.py
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from trading_bot.utils.event_codec import EventCodecError, decode_value, encode_value
+
+logger = logging.getLogger(__name__)
+
+WARM_STATE_VERSION = 1
+_MAGIC = b'TBWS'
+
+def save_warm_state(path: str, state: Dict[str, Any]) -> int:
+    """
+    Write a warm-state snapshot
+
+    The snapshot is written to a temporary file and renamed over the
+    previous one, so a crash while saving leaves the old snapshot intact.
+
+    Args:
+        path: Snapshot file
+        state: Dictionary of values the event codec encodes natively
+
+    Returns:
+        Size of the snapshot in bytes
+
+    Raises:
+        EventCodecError: If the state holds a value without a native encoding
+        OSError: If the file cannot be written
+    """
+    body = _MAGIC + bytes((WARM_STATE_VERSION,)) + encode_value(state, allow_pickle=False)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return len(body)
+
+def load_warm_state(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a snapshot written by save_warm_state
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        The saved state, or None if there is no usable snapshot
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Cannot read warm state {path}: {e}")
+        return None
+
+    header = len(_MAGIC) + 1
+    if not data.startswith(_MAGIC) or len(data) < header or data[len(_MAGIC)] != WARM_STATE_VERSION:
+        logger.warning(f"Ignoring warm state {path}: not a version {WARM_STATE_VERSION} snapshot")
+        return None
+    try:
+        state = decode_value(memoryview(data)[header:], allow_pickle=False)
+    except EventCodecError as e:
+        logger.warning(f"Ignoring corrupt warm state {path}: {e}")
+        return None
+    return state if isinstance(state, dict) else None